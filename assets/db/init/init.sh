@@ -39,6 +39,27 @@ else
   echo "Schema already applied. Skipping."
 fi
 
+# Migrations bring databases created from an older schema.sql up to date.
+# Each file is idempotent (fresh databases already have the objects) and is
+# recorded so it runs once.
+sh -c "${MYSQL_BASE_CMD}" <<'SQL'
+CREATE TABLE IF NOT EXISTS _db_migrations (
+  name       VARCHAR(255) PRIMARY KEY,
+  applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+SQL
+
+for migration in /opt/sql/migrations/*.sql; do
+  [ -e "${migration}" ] || continue
+  name="$(basename "${migration}")"
+  APPLIED="$(sh -c "${MYSQL_BASE_CMD} -N -s -e \"SELECT COUNT(*) FROM _db_migrations WHERE name='${name}';\"")"
+  if [ "${APPLIED}" = "0" ]; then
+    echo "Applying migration ${name}..."
+    sh -c "${MYSQL_BASE_CMD}" < "${migration}"
+    sh -c "${MYSQL_BASE_CMD} -e \"INSERT INTO _db_migrations (name) VALUES ('${name}');\""
+  fi
+done
+
 if [ "${DB_MODE}" = "dev" ]; then
   SEED_DONE="$(sh -c "${MYSQL_BASE_CMD} -N -s -e 'SELECT seed_applied FROM _db_init_lock WHERE id=1;'")"
 
@@ -0,0 +1,17 @@
+-- Adds revoked_token to databases created before it was part of schema.sql.
+CREATE TABLE IF NOT EXISTS revoked_token (
+  id             BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  token_hash     CHAR(64)        NOT NULL,
+  account_id     BIGINT UNSIGNED NOT NULL,
+  expires_at     DATETIME        NOT NULL,
+  revoked_at     DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (id),
+  UNIQUE KEY uq_revoked_token_hash (token_hash),
+  KEY idx_revoked_token_expires (expires_at),
+
+  CONSTRAINT fk_revoked_token_account
+    FOREIGN KEY (account_id) REFERENCES account(id)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE
+) ENGINE=InnoDB;
@@ -0,0 +1,21 @@
+-- Adds the background job table to databases created before it was part of schema.sql.
+CREATE TABLE IF NOT EXISTS job (
+  id             BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  queue          VARCHAR(64)     NOT NULL,
+  -- selects the handler registered with the API's JobQueue
+  kind           VARCHAR(64)     NOT NULL,
+  payload        JSON            NOT NULL,
+  status         ENUM('pending', 'running', 'done', 'failed') NOT NULL DEFAULT 'pending',
+  attempts       INT UNSIGNED    NOT NULL DEFAULT 0,
+  max_attempts   INT UNSIGNED    NOT NULL DEFAULT 5,
+  -- UTC; pending: earliest run time, running: end of the worker's lease
+  run_after      DATETIME(3)     NOT NULL,
+  locked_by      VARCHAR(64)     NULL,
+  last_error     VARCHAR(255)    NULL,
+  created_at     DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  finished_at    DATETIME(3)     NULL,
+
+  PRIMARY KEY (id),
+  KEY idx_job_claim (queue, status, run_after),
+  KEY idx_job_finished (status, finished_at)
+) ENGINE=InnoDB;
@@ -0,0 +1,33 @@
+-- Makes email_verification_tokens.token_hash unique (replacing the plain
+-- idx_email_token_hash index) on databases created before schema.sql had it.
+-- Duplicate hashes are collapsed to their oldest row first. Safe to re-run.
+DELETE newer
+FROM email_verification_tokens AS newer
+JOIN email_verification_tokens AS older
+  ON older.token_hash = newer.token_hash
+ AND older.id < newer.id;
+
+SET @has_unique := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'email_verification_tokens'
+    AND index_name = 'uq_email_token_hash'
+);
+SET @has_plain := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'email_verification_tokens'
+    AND index_name = 'idx_email_token_hash'
+);
+SET @ddl := CASE
+  WHEN @has_unique = 0 AND @has_plain > 0 THEN
+    'ALTER TABLE email_verification_tokens ADD UNIQUE KEY uq_email_token_hash (token_hash), DROP KEY idx_email_token_hash'
+  WHEN @has_unique = 0 THEN
+    'ALTER TABLE email_verification_tokens ADD UNIQUE KEY uq_email_token_hash (token_hash)'
+  ELSE 'DO 0'
+END;
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
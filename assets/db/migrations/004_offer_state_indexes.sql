@@ -0,0 +1,54 @@
+-- Widens the offer lookup indexes with the state columns, so badge counts
+-- (unseen / pending received, pending sent) are answered from the index
+-- without reading offer rows. The new keys still lead with listing_id /
+-- sender_id, so they replace the old ones for lookups and foreign keys.
+-- Safe to re-run.
+SET @has_listing_state := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'offer'
+    AND index_name = 'idx_offer_listing_state'
+);
+SET @has_listing := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'offer'
+    AND index_name = 'idx_offer_listing'
+);
+SET @ddl := CASE
+  WHEN @has_listing_state = 0 AND @has_listing > 0 THEN
+    'ALTER TABLE offer ADD KEY idx_offer_listing_state (listing_id, accepted, seen), DROP KEY idx_offer_listing'
+  WHEN @has_listing_state = 0 THEN
+    'ALTER TABLE offer ADD KEY idx_offer_listing_state (listing_id, accepted, seen)'
+  ELSE 'DO 0'
+END;
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @has_sender_state := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'offer'
+    AND index_name = 'idx_offer_sender_state'
+);
+SET @has_sender := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'offer'
+    AND index_name = 'idx_offer_sender'
+);
+SET @ddl := CASE
+  WHEN @has_sender_state = 0 AND @has_sender > 0 THEN
+    'ALTER TABLE offer ADD KEY idx_offer_sender_state (sender_id, accepted), DROP KEY idx_offer_sender'
+  WHEN @has_sender_state = 0 THEN
+    'ALTER TABLE offer ADD KEY idx_offer_sender_state (sender_id, accepted)'
+  ELSE 'DO 0'
+END;
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
@@ -0,0 +1,42 @@
+-- Adds listing.location_key (canonical location) and its index on databases
+-- created before schema.sql had them, then backfills the key for existing
+-- rows. The expression mirrors Listing.location_key_of. Safe to re-run.
+SET @has_column := (
+  SELECT COUNT(*)
+  FROM information_schema.columns
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND column_name = 'location_key'
+);
+SET @ddl := IF(
+  @has_column = 0,
+  'ALTER TABLE listing ADD COLUMN location_key VARCHAR(120) NULL AFTER location',
+  'DO 0'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @has_index := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND index_name = 'idx_listing_unsold_location'
+);
+SET @ddl := IF(
+  @has_index = 0,
+  'ALTER TABLE listing ADD KEY idx_listing_unsold_location (is_sold, location_key, price)',
+  'DO 0'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+UPDATE listing
+SET location_key = NULLIF(
+  TRIM(LEFT(TRIM(REGEXP_REPLACE(LOWER(location), '[^[:alnum:]]+', ' ')), 120)),
+  ''
+)
+WHERE location IS NOT NULL
+  AND location_key IS NULL;
@@ -0,0 +1,70 @@
+-- Composite indexes for GET /listings/query (listing_query_plan.py):
+-- (seller_id, created_at) replaces idx_listing_seller_id for seller lookups
+-- and the foreign key, (is_sold, created_at) replaces idx_listing_is_sold
+-- for the newest-first feed, and (is_sold, price) serves price ranges and
+-- price sorts. Safe to re-run.
+SET @has_seller_created := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND index_name = 'idx_listing_seller_created'
+);
+SET @has_seller := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND index_name = 'idx_listing_seller_id'
+);
+SET @ddl := CASE
+  WHEN @has_seller_created = 0 AND @has_seller > 0 THEN
+    'ALTER TABLE listing ADD KEY idx_listing_seller_created (seller_id, created_at), DROP KEY idx_listing_seller_id'
+  WHEN @has_seller_created = 0 THEN
+    'ALTER TABLE listing ADD KEY idx_listing_seller_created (seller_id, created_at)'
+  ELSE 'DO 0'
+END;
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @has_sold_created := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND index_name = 'idx_listing_sold_created'
+);
+SET @has_sold := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND index_name = 'idx_listing_is_sold'
+);
+SET @ddl := CASE
+  WHEN @has_sold_created = 0 AND @has_sold > 0 THEN
+    'ALTER TABLE listing ADD KEY idx_listing_sold_created (is_sold, created_at), DROP KEY idx_listing_is_sold'
+  WHEN @has_sold_created = 0 THEN
+    'ALTER TABLE listing ADD KEY idx_listing_sold_created (is_sold, created_at)'
+  ELSE 'DO 0'
+END;
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @has_sold_price := (
+  SELECT COUNT(*)
+  FROM information_schema.statistics
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND index_name = 'idx_listing_sold_price'
+);
+SET @ddl := IF(
+  @has_sold_price = 0,
+  'ALTER TABLE listing ADD KEY idx_listing_sold_price (is_sold, price)',
+  'DO 0'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
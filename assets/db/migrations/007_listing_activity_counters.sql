@@ -0,0 +1,37 @@
+-- Adds the listing activity counters (comment_count, offer_count,
+-- pending_offer_count) on databases created before schema.sql had them,
+-- then recounts every listing. Safe to re-run; the recount can also be
+-- repeated in batches by the reconcile_listing_counters job.
+SET @has_columns := (
+  SELECT COUNT(*)
+  FROM information_schema.columns
+  WHERE table_schema = DATABASE()
+    AND table_name = 'listing'
+    AND column_name = 'comment_count'
+);
+SET @ddl := IF(
+  @has_columns = 0,
+  'ALTER TABLE listing
+     ADD COLUMN comment_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER sold_to_id,
+     ADD COLUMN offer_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER comment_count,
+     ADD COLUMN pending_offer_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER offer_count',
+  'DO 0'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+UPDATE listing l
+LEFT JOIN (
+  SELECT listing_id, COUNT(*) AS n
+  FROM comment
+  GROUP BY listing_id
+) c ON c.listing_id = l.id
+LEFT JOIN (
+  SELECT listing_id, COUNT(*) AS n, SUM(accepted IS NULL) AS pending
+  FROM offer
+  GROUP BY listing_id
+) o ON o.listing_id = l.id
+SET l.comment_count = COALESCE(c.n, 0),
+    l.offer_count = COALESCE(o.n, 0),
+    l.pending_offer_count = COALESCE(o.pending, 0);
@@ -0,0 +1,21 @@
+-- Adds job.unique_key and its unique index on databases created before
+-- schema.sql had them. Recurring jobs are inserted with one key per
+-- (kind, slot), so several API processes scheduling them enqueue each
+-- run once. Safe to re-run.
+SET @has_column := (
+  SELECT COUNT(*)
+  FROM information_schema.columns
+  WHERE table_schema = DATABASE()
+    AND table_name = 'job'
+    AND column_name = 'unique_key'
+);
+SET @ddl := IF(
+  @has_column = 0,
+  'ALTER TABLE job
+     ADD COLUMN unique_key VARCHAR(128) NULL AFTER finished_at,
+     ADD UNIQUE KEY uq_job_unique_key (unique_key)',
+  'DO 0'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
@@ -80,6 +80,10 @@ CREATE TABLE listing (
   image_url   TEXT,
   price       DECIMAL(10,2) NOT NULL,
   location    TEXT,
+  -- Canonical location (Listing.location_key_of: lower case, punctuation and
+  -- whitespace runs collapsed to one space). Written with location; used for
+  -- prefix lookups and location facets, which cannot index the TEXT column.
+  location_key VARCHAR(120) NULL,
   created_at  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
   -- Marks whether the listing has been sold
   is_sold     BOOLEAN NOT NULL DEFAULT FALSE,
@@ -87,16 +91,33 @@ CREATE TABLE listing (
   -- Buyer account id (must be set when is_sold is TRUE; enforced by trigger)
   sold_to_id  BIGINT UNSIGNED NULL,
 
+  -- Activity counters for listing cards, so a list page never counts
+  -- comment / offer rows. Kept exact in the same transaction as every
+  -- comment and offer write (MySQLCommentDB, MySQLOfferDB), and
+  -- MySQLAccountDB.remove decrements them before the account's comments
+  -- and offers cascade away. The reconcile_listing_counters job
+  -- (ListingDB.reconcile_activity_counts) is only a safety net.
+  comment_count       INT UNSIGNED NOT NULL DEFAULT 0,
+  offer_count         INT UNSIGNED NOT NULL DEFAULT 0,
+  -- offers with accepted IS NULL
+  pending_offer_count INT UNSIGNED NOT NULL DEFAULT 0,
+
   PRIMARY KEY (id),
 
   -- Indexes to speed up common queries:
-  -- - Fetch all listings by seller
+  -- - Fetch all listings by seller, newest first
   -- - Fetch all listings bought by a buyer
-  -- - Sort or filter by created time and sold state
-  KEY idx_listing_seller_id (seller_id),
+  -- - Sort by created time
+  -- - Listings of one sold state, newest first or by price
+  -- - Unsold listings by location prefix; location/price facet counts
+  --   (covering: the grouped facet query never reads the listing rows)
+  -- GET /listings/query picks among the composite ones (listing_query_plan.py).
+  KEY idx_listing_seller_created (seller_id, created_at),
   KEY idx_listing_sold_to_id (sold_to_id),
   KEY idx_listing_created_at (created_at),
-  KEY idx_listing_is_sold (is_sold),
+  KEY idx_listing_sold_created (is_sold, created_at),
+  KEY idx_listing_sold_price (is_sold, price),
+  KEY idx_listing_unsold_location (is_sold, location_key, price),
 
   -- If a seller account is deleted, delete their listings
   CONSTRAINT fk_listing_seller
@@ -131,9 +152,10 @@ CREATE TABLE offer (
 
   PRIMARY KEY (id),
 
-  -- Indexes for fast lookups by listing and sender
-  KEY idx_offer_listing (listing_id),
-  KEY idx_offer_sender (sender_id),
+  -- Lookups by listing and sender; the state columns let badge counts
+  -- (unseen / pending) be answered from the index alone
+  KEY idx_offer_listing_state (listing_id, accepted, seen),
+  KEY idx_offer_sender_state (sender_id, accepted),
 
   -- If a listing is deleted, delete its offers
   CONSTRAINT fk_offer_listing
@@ -214,6 +236,34 @@ CREATE TABLE rating (
 -- Triggers for business rules enforcement
 -- =========================================================
 
+-- Background jobs (side effects run after the request, see server/src/jobs).
+-- API processes claim rows with SELECT ... FOR UPDATE SKIP LOCKED, so any
+-- number of them can work the same queue without claiming a job twice.
+CREATE TABLE job (
+  id             BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  queue          VARCHAR(64)     NOT NULL,
+  -- selects the handler registered with the API's JobQueue
+  kind           VARCHAR(64)     NOT NULL,
+  payload        JSON            NOT NULL,
+  status         ENUM('pending', 'running', 'done', 'failed') NOT NULL DEFAULT 'pending',
+  attempts       INT UNSIGNED    NOT NULL DEFAULT 0,
+  max_attempts   INT UNSIGNED    NOT NULL DEFAULT 5,
+  -- UTC; pending: earliest run time, running: end of the worker's lease
+  run_after      DATETIME(3)     NOT NULL,
+  locked_by      VARCHAR(64)     NULL,
+  last_error     VARCHAR(255)    NULL,
+  created_at     DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  finished_at    DATETIME(3)     NULL,
+  -- set on recurring jobs ("kind@slot"): every API process schedules them,
+  -- and only the first insert of a slot becomes a row
+  unique_key     VARCHAR(128)    NULL,
+
+  PRIMARY KEY (id),
+  UNIQUE KEY uq_job_unique_key (unique_key),
+  KEY idx_job_claim (queue, status, run_after),
+  KEY idx_job_finished (status, finished_at)
+) ENGINE=InnoDB;
+
 DELIMITER $$
 
 -- Enforce: listing must be sold AND rater must be the buyer before inserting a rating
@@ -276,8 +326,8 @@ CREATE TABLE email_verification_tokens (
 
   PRIMARY KEY (id),
 
-  -- Index for fast auth_token lookups
-  KEY idx_email_token_hash (token_hash),
+  -- One row per token: lookups by hash are a single-row probe
+  UNIQUE KEY uq_email_token_hash (token_hash),
   -- Index for finding unused tokens by account
   KEY idx_email_token_account (account_id, used),
 
@@ -288,6 +338,26 @@ CREATE TABLE email_verification_tokens (
     ON UPDATE CASCADE
 ) ENGINE=InnoDB;
 
+-- Revoked (logged-out) JWTs. Rows are only needed until the token's own
+-- expiry; the API loads active rows incrementally by id.
+CREATE TABLE revoked_token (
+  id             BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  -- SHA-256 hex digest of the raw JWT (the token itself is never stored)
+  token_hash     CHAR(64)        NOT NULL,
+  account_id     BIGINT UNSIGNED NOT NULL,
+  expires_at     DATETIME        NOT NULL,
+  revoked_at     DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (id),
+  UNIQUE KEY uq_revoked_token_hash (token_hash),
+  KEY idx_revoked_token_expires (expires_at),
+
+  CONSTRAINT fk_revoked_token_account
+    FOREIGN KEY (account_id) REFERENCES account(id)
+    ON DELETE CASCADE
+    ON UPDATE CASCADE
+) ENGINE=InnoDB;
+
 DELIMITER $$
 
 -- Enforce: if a listing is marked sold, a buyer must be provided
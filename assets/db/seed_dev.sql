@@ -170,4 +170,30 @@ SELECT
   l.sold_to_id
 FROM listing l
 WHERE l.is_sold = TRUE
-  AND l.sold_to_id IS NOT NULL;
\ No newline at end of file
+  AND l.sold_to_id IS NOT NULL;
+
+-- Canonical location keys (the app writes them; the inserts above do not)
+UPDATE listing
+SET location_key = NULLIF(
+  TRIM(LEFT(TRIM(REGEXP_REPLACE(LOWER(location), '[^[:alnum:]]+', ' ')), 120)),
+  ''
+)
+WHERE location IS NOT NULL
+  AND location_key IS NULL;
+
+-- Activity counters (the app keeps them with each comment / offer write;
+-- the inserts above do not)
+UPDATE listing l
+LEFT JOIN (
+  SELECT listing_id, COUNT(*) AS n
+  FROM comment
+  GROUP BY listing_id
+) c ON c.listing_id = l.id
+LEFT JOIN (
+  SELECT listing_id, COUNT(*) AS n, SUM(accepted IS NULL) AS pending
+  FROM offer
+  GROUP BY listing_id
+) o ON o.listing_id = l.id
+SET l.comment_count = COALESCE(c.n, 0),
+    l.offer_count = COALESCE(o.n, 0),
+    l.pending_offer_count = COALESCE(o.pending, 0);
@@ -1,5 +1,5 @@
-import { ComponentFixture, TestBed } from '@angular/core/testing';
-import { of } from 'rxjs';
+import { ComponentFixture, TestBed, fakeAsync, tick } from '@angular/core/testing';
+import { Subject, of } from 'rxjs';
 import { HeaderComponent } from './header.component';
 import { Router } from '@angular/router';
 import { provideNoopAnimations } from '@angular/platform-browser/animations';
@@ -7,6 +7,7 @@ import { AccountsApiService } from '../../shared/services/accounts-api.service';
 import { ListingsApiService } from '../../shared/services/listings-api.service';
 import { OffersApiService } from '../../shared/services/offers-api.service';
 import { BuyerOfferNotificationsService } from '../../shared/services/buyer-offer-notifications.service';
+import { OfferEventType, OfferEventsService } from '../../shared/services/offer-events.service';
 
 describe('HeaderComponent', () => {
   let headerComponent: HeaderComponent;
@@ -16,12 +17,14 @@ describe('HeaderComponent', () => {
   let listingsApiSpy: jasmine.SpyObj<ListingsApiService>;
   let offersApiSpy: jasmine.SpyObj<OffersApiService>;
   let buyerOfferNotificationsSpy: jasmine.SpyObj<BuyerOfferNotificationsService>;
+  let offerEvents: Subject<OfferEventType>;
 
   beforeEach(async () => {
     localStorage.clear();
     const payload = btoa(JSON.stringify({ sub: '7' }));
     localStorage.setItem('access_token', `x.${payload}.y`);
 
+    offerEvents = new Subject<OfferEventType>();
     routerSpy = jasmine.createSpyObj('Router', ['navigate']);
     accountsApiSpy = jasmine.createSpyObj<AccountsApiService>('AccountsApiService', ['getMe']);
     listingsApiSpy = jasmine.createSpyObj<ListingsApiService>(
@@ -30,7 +33,7 @@ describe('HeaderComponent', () => {
     );
     offersApiSpy = jasmine.createSpyObj<OffersApiService>(
       'OffersApiService',
-      ['getReceived', 'getReceivedUnseen', 'getSent', 'markSeen'],
+      ['getReceived', 'getCounts', 'getSent', 'markSeenMany'],
     );
     buyerOfferNotificationsSpy = jasmine.createSpyObj<BuyerOfferNotificationsService>(
       'BuyerOfferNotificationsService',
@@ -48,9 +51,9 @@ describe('HeaderComponent', () => {
     listingsApiSpy.getMine.and.returnValue(of([]));
     listingsApiSpy.getAll.and.returnValue(of([]));
     offersApiSpy.getReceived.and.returnValue(of([]));
-    offersApiSpy.getReceivedUnseen.and.returnValue(of([]));
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 0, pending: 0, sentPending: 0 }));
     offersApiSpy.getSent.and.returnValue(of([]));
-    offersApiSpy.markSeen.and.returnValue(of({}));
+    offersApiSpy.markSeenMany.and.returnValue(of({}));
     buyerOfferNotificationsSpy.syncResolvedOffers.and.returnValue(new Set<number>());
 
     await TestBed.configureTestingModule({
@@ -61,6 +64,7 @@ describe('HeaderComponent', () => {
         { provide: AccountsApiService, useValue: accountsApiSpy },
         { provide: ListingsApiService, useValue: listingsApiSpy },
         { provide: OffersApiService, useValue: offersApiSpy },
+        { provide: OfferEventsService, useValue: { changes$: offerEvents } },
         { provide: BuyerOfferNotificationsService, useValue: buyerOfferNotificationsSpy },
       ],
     }).compileComponents();
@@ -97,20 +101,7 @@ describe('HeaderComponent', () => {
   });
 
   it('ngOnInit_ShouldCombineSellerAndBuyerUnreadCounts', () => {
-    offersApiSpy.getReceivedUnseen.and.returnValue(
-      of([
-        {
-          id: 1,
-          listingId: 10,
-          senderId: 50,
-          offeredPrice: 20,
-          locationOffered: 'Campus',
-          seen: false,
-          accepted: null,
-          createdDate: '2026-03-24T12:00:00Z',
-        },
-      ]),
-    );
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 1, pending: 1, sentPending: 0 }));
     buyerOfferNotificationsSpy.syncResolvedOffers.and.returnValue(new Set([99]));
 
     fixture = TestBed.createComponent(HeaderComponent);
@@ -118,6 +109,7 @@ describe('HeaderComponent', () => {
     fixture.detectChanges();
 
     expect(headerComponent.unseenCount()).toBe(2);
+    expect(offersApiSpy.getCounts).toHaveBeenCalled();
     expect(buyerOfferNotificationsSpy.syncResolvedOffers).toHaveBeenCalledWith([], 7);
   });
 
@@ -146,4 +138,16 @@ describe('HeaderComponent', () => {
 
     expect(buyerOfferNotificationsSpy.markResolvedOffersSeen).toHaveBeenCalledWith([5], 7);
   });
+
+  it('offerEvent_ShouldRefetchOffersWithoutLoadingState', fakeAsync(() => {
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 4, pending: 4, sentPending: 0 }));
+
+    offerEvents.next('offer.created');
+    offerEvents.next('offers.changed');
+    tick(250);
+
+    expect(offersApiSpy.getCounts).toHaveBeenCalledTimes(2);
+    expect(headerComponent.unseenCount()).toBe(4);
+    expect(headerComponent.isLoadingOffers()).toBeFalse();
+  }));
 });
@@ -1,12 +1,14 @@
 import {
   ChangeDetectionStrategy,
   Component,
+  DestroyRef,
   OnInit,
   inject,
   signal,
 } from '@angular/core';
+import { takeUntilDestroyed } from '@angular/core/rxjs-interop';
 import { CommonModule } from '@angular/common';
-import { forkJoin } from 'rxjs';
+import { debounceTime, forkJoin } from 'rxjs';
 import { MatCardModule } from '@angular/material/card';
 import { MatIcon } from '@angular/material/icon';
 import { MatMenuModule } from '@angular/material/menu';
@@ -16,6 +18,7 @@ import { AccountsApiService } from '../../shared/services/accounts-api.service';
 import { ListingsApiService } from '../../shared/services/listings-api.service';
 import { Offer, OffersApiService } from '../../shared/services/offers-api.service';
 import { BuyerOfferNotificationsService } from '../../shared/services/buyer-offer-notifications.service';
+import { OfferEventsService } from '../../shared/services/offer-events.service';
 import { Listing } from '../../shared/models/listing.models';
 
 interface HeaderOfferPreview {
@@ -43,6 +46,8 @@ export class HeaderComponent implements OnInit {
   private readonly offersApi = inject(OffersApiService);
   private readonly listingsApi = inject(ListingsApiService);
   private readonly buyerOfferNotifications = inject(BuyerOfferNotificationsService);
+  private readonly offerEvents = inject(OfferEventsService);
+  private readonly destroyRef = inject(DestroyRef);
   private readonly currentUserId = this.getCurrentUserIdFromToken();
 
   readonly displayName = signal('Someone');
@@ -63,6 +68,10 @@ export class HeaderComponent implements OnInit {
     });
 
     this.loadOffers();
+    // Refetch when the offer stream reports a change (it polls if the stream is down).
+    this.offerEvents.changes$
+      .pipe(debounceTime(250), takeUntilDestroyed(this.destroyRef))
+      .subscribe(() => this.loadOffers(false));
   }
 
   onLogout(): void {
@@ -106,7 +115,7 @@ export class HeaderComponent implements OnInit {
       return;
     }
 
-    forkJoin(unseenOffers.map((offer) => this.offersApi.markSeen(offer.id))).subscribe({
+    this.offersApi.markSeenMany(unseenOffers.map((offer) => offer.id)).subscribe({
       next: () => {
         this.offers.update((offers) =>
           offers.map((offer) => ({
@@ -130,20 +139,20 @@ export class HeaderComponent implements OnInit {
     return new Date(value).toLocaleString();
   }
 
-  private loadOffers(): void {
-    this.isLoadingOffers.set(true);
+  private loadOffers(showLoading = true): void {
+    this.isLoadingOffers.set(showLoading);
     this.offersError.set(null);
 
     forkJoin({
       receivedOffers: this.offersApi.getReceived(),
-      unseenOffers: this.offersApi.getReceivedUnseen(),
+      counts: this.offersApi.getCounts(),
       sentOffers: this.offersApi.getSent(),
       myListings: this.listingsApi.getMine(),
-      allListings: this.listingsApi.getAll(),
+      allListings: this.listingsApi.getAll({ fields: ['title'] }),
     }).subscribe({
       next: ({
         receivedOffers,
-        unseenOffers,
+        counts,
         sentOffers,
         myListings,
         allListings,
@@ -161,7 +170,7 @@ export class HeaderComponent implements OnInit {
             unseenBuyerResolutionIds,
           ),
         );
-        this.unseenCount.set(unseenOffers.length + unseenBuyerResolutionIds.size);
+        this.unseenCount.set(counts.unseen + unseenBuyerResolutionIds.size);
         this.isLoadingOffers.set(false);
       },
       error: (error) => {
@@ -1,7 +1,7 @@
-import { ComponentFixture, TestBed } from '@angular/core/testing';
+import { ComponentFixture, TestBed, fakeAsync, tick } from '@angular/core/testing';
 import { provideNoopAnimations } from '@angular/platform-browser/animations';
 import { RouterTestingModule } from '@angular/router/testing';
-import { of, throwError } from 'rxjs';
+import { Subject, of, throwError } from 'rxjs';
 
 import { AllOffersPageComponent } from './all-offers-page.component';
 import { AccountsApiService } from '../../shared/services/accounts-api.service';
@@ -10,6 +10,7 @@ import { Offer, OffersApiService } from '../../shared/services/offers-api.servic
 import { Listing } from '../../shared/models/listing.models';
 import { RatingsApiService } from '../../shared/services/ratings-api.service';
 import { BuyerOfferNotificationsService } from '../../shared/services/buyer-offer-notifications.service';
+import { OfferEventType, OfferEventsService } from '../../shared/services/offer-events.service';
 
 describe('AllOffersPageComponent', () => {
   let fixture: ComponentFixture<AllOffersPageComponent>;
@@ -19,6 +20,7 @@ describe('AllOffersPageComponent', () => {
   let offersApiSpy: jasmine.SpyObj<OffersApiService>;
   let ratingsApiSpy: jasmine.SpyObj<RatingsApiService>;
   let buyerOfferNotificationsSpy: jasmine.SpyObj<BuyerOfferNotificationsService>;
+  let offerEvents: Subject<OfferEventType>;
 
   const listing: Listing = {
     id: 5,
@@ -58,6 +60,7 @@ describe('AllOffersPageComponent', () => {
     localStorage.clear();
     const payload = btoa(JSON.stringify({ sub: '10' }));
     localStorage.setItem('access_token', `x.${payload}.y`);
+    offerEvents = new Subject<OfferEventType>();
 
     accountsApiSpy = jasmine.createSpyObj<AccountsApiService>(
       'AccountsApiService',
@@ -91,11 +94,11 @@ describe('AllOffersPageComponent', () => {
 
     offersApiSpy = jasmine.createSpyObj<OffersApiService>(
       'OffersApiService',
-      ['getReceived', 'getReceivedUnseen', 'getSent', 'markSeen', 'resolve'],
+      ['getReceived', 'getReceivedUnseen', 'getCounts', 'getSent', 'markSeenMany', 'resolve'],
     );
     ratingsApiSpy = jasmine.createSpyObj<RatingsApiService>(
       'RatingsApiService',
-      ['create', 'getByListingId'],
+      ['create', 'getByListingIds'],
     );
     buyerOfferNotificationsSpy = jasmine.createSpyObj<BuyerOfferNotificationsService>(
       'BuyerOfferNotificationsService',
@@ -103,8 +106,9 @@ describe('AllOffersPageComponent', () => {
     );
     offersApiSpy.getReceived.and.returnValue(of([pendingOffer]));
     offersApiSpy.getReceivedUnseen.and.returnValue(of([pendingOffer]));
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 1, pending: 1, sentPending: 0 }));
     offersApiSpy.getSent.and.returnValue(of([]));
-    offersApiSpy.markSeen.and.returnValue(of({}));
+    offersApiSpy.markSeenMany.and.returnValue(of({}));
     offersApiSpy.resolve.and.returnValue(of({}));
     ratingsApiSpy.create.and.returnValue(
       of({
@@ -114,7 +118,7 @@ describe('AllOffersPageComponent', () => {
         transactionRating: 5,
       }),
     );
-    ratingsApiSpy.getByListingId.and.returnValue(of(null));
+    ratingsApiSpy.getByListingIds.and.returnValue(of(new Map()));
     buyerOfferNotificationsSpy.syncResolvedOffers.and.returnValue(new Set<number>());
 
     await TestBed.configureTestingModule({
@@ -124,6 +128,7 @@ describe('AllOffersPageComponent', () => {
         { provide: AccountsApiService, useValue: accountsApiSpy },
         { provide: ListingsApiService, useValue: listingsApiSpy },
         { provide: OffersApiService, useValue: offersApiSpy },
+        { provide: OfferEventsService, useValue: { changes$: offerEvents } },
         { provide: RatingsApiService, useValue: ratingsApiSpy },
         { provide: BuyerOfferNotificationsService, useValue: buyerOfferNotificationsSpy },
       ],
@@ -144,12 +149,34 @@ describe('AllOffersPageComponent', () => {
     expect(offersApiSpy.getReceived).toHaveBeenCalled();
     expect(offersApiSpy.getReceivedUnseen).toHaveBeenCalled();
     expect(accountsApiSpy.getById).toHaveBeenCalledWith(pendingOffer.senderId);
-    expect(offersApiSpy.markSeen).toHaveBeenCalledWith(pendingOffer.id);
+    expect(offersApiSpy.markSeenMany).toHaveBeenCalledOnceWith([pendingOffer.id]);
     expect(component.offers[0].listingTitle).toBe('Desk Lamp');
     expect(component.offers[0].buyerName).toBe('Jamie Buyer');
     expect(component.offers[0].seen).toBeTrue();
   });
 
+  it('offerEvent_ShouldReloadOffersWithoutLoadingState', fakeAsync(() => {
+    fixture.detectChanges();
+    const newOffer: Offer = { ...pendingOffer, id: 12 };
+    offersApiSpy.getReceived.and.returnValue(of([pendingOffer, newOffer]));
+
+    offerEvents.next('offer.created');
+    tick(250);
+
+    expect(offersApiSpy.getReceivedUnseen).toHaveBeenCalledTimes(2);
+    expect(component.receivedOffers.map((offer) => offer.id)).toContain(12);
+    expect(component.isLoading).toBeFalse();
+  }));
+
+  it('offersSeenEvent_ShouldNotReloadThePage', fakeAsync(() => {
+    fixture.detectChanges();
+
+    offerEvents.next('offers.seen');
+    tick(250);
+
+    expect(offersApiSpy.getReceivedUnseen).toHaveBeenCalledTimes(1);
+  }));
+
   it('resolveOffer_Accepted_ShouldUpdateOfferStatus', () => {
     fixture.detectChanges();
 
@@ -191,7 +218,7 @@ describe('AllOffersPageComponent', () => {
 
     expect(component.sentOffers.length).toBe(1);
     expect(component.sentOffers[0].sellerName).toBe('Seller User');
-    expect(ratingsApiSpy.getByListingId).toHaveBeenCalledWith(acceptedSentOffer.listingId);
+    expect(ratingsApiSpy.getByListingIds).toHaveBeenCalledOnceWith([acceptedSentOffer.listingId]);
   });
 
   it('submitSellerRating_ShouldPersistRatingAndUpdateOfferState', () => {
@@ -1,7 +1,8 @@
-import { Component, OnInit, inject } from '@angular/core';
+import { Component, DestroyRef, OnInit, inject } from '@angular/core';
+import { takeUntilDestroyed } from '@angular/core/rxjs-interop';
 import { CommonModule } from '@angular/common';
 import { forkJoin, of } from 'rxjs';
-import { catchError } from 'rxjs/operators';
+import { catchError, debounceTime, filter } from 'rxjs/operators';
 import { Router } from '@angular/router';
 import { HttpErrorResponse } from '@angular/common/http';
 import { MatButtonModule } from '@angular/material/button';
@@ -17,6 +18,7 @@ import { AccountsApiService } from '../../shared/services/accounts-api.service';
 import { OffersApiService, Offer } from '../../shared/services/offers-api.service';
 import { RatingsApiService } from '../../shared/services/ratings-api.service';
 import { BuyerOfferNotificationsService } from '../../shared/services/buyer-offer-notifications.service';
+import { OfferEventsService } from '../../shared/services/offer-events.service';
 
 interface OfferViewModel {
   id: number;
@@ -62,6 +64,8 @@ export class AllOffersPageComponent
   private readonly offersApi = inject(OffersApiService);
   private readonly ratingsApi = inject(RatingsApiService);
   private readonly buyerOfferNotifications = inject(BuyerOfferNotificationsService);
+  private readonly offerEvents = inject(OfferEventsService);
+  private readonly destroyRef = inject(DestroyRef);
   private readonly router = inject(Router);
 
   offers: OfferViewModel[] = [];
@@ -73,6 +77,15 @@ export class AllOffersPageComponent
   ngOnInit(): void {
     this.initializeSidebarListingActions();
     this.loadOffersPage();
+    // Refetch when the offer stream reports a change (it polls if the stream is down).
+    // offers.seen only echoes this page marking the received offers seen.
+    this.offerEvents.changes$
+      .pipe(
+        filter((type) => type !== 'offers.seen'),
+        debounceTime(250),
+        takeUntilDestroyed(this.destroyRef),
+      )
+      .subscribe(() => this.loadOffersPage(false));
   }
 
   openListing(listingId: number): void {
@@ -188,13 +201,13 @@ export class AllOffersPageComponent
     });
   }
 
-  private loadOffersPage(): void {
-    this.isLoading = true;
+  private loadOffersPage(showLoading = true): void {
+    this.isLoading = showLoading;
     this.errorMessage = null;
 
     forkJoin({
       listings: this.listingsApi.getMine(),
-      allListings: this.listingsApi.getAll(),
+      allListings: this.listingsApi.getAll({ fields: ['title', 'seller_id'] }),
       offers: this.offersApi.getReceived(),
       unseenOffers: this.offersApi.getReceivedUnseen(),
       sentOffers: this.offersApi.getSent(),
@@ -383,7 +396,7 @@ export class AllOffersPageComponent
       return;
     }
 
-    forkJoin(unseenOffers.map((offer) => this.offersApi.markSeen(offer.id))).subscribe({
+    this.offersApi.markSeenMany(unseenOffers.map((offer) => offer.id)).subscribe({
       next: () => {
         this.offers = this.offers.map((offer) => ({
           ...offer,
@@ -422,32 +435,25 @@ export class AllOffersPageComponent
       return;
     }
 
-    forkJoin(
-      acceptedSentOffers.map((offer) =>
-        this.ratingsApi.getByListingId(offer.listingId).pipe(
-          catchError((error) => {
-            console.error(`Failed to load rating for listing ${offer.listingId}:`, error);
-            return of(null);
-          }),
-        ),
-      ),
-    ).subscribe({
-      next: (ratings) => {
-        acceptedSentOffers.forEach((offer, index) => {
-          const rating = ratings[index];
-          if (rating) {
-            this.updateSentOffer(offer.id, {
-              hasRatedSeller: true,
-              pendingRating: rating.transactionRating,
-              ratingMessage: 'You already rated this seller.',
-            });
-          }
-        });
-      },
-      error: (error) => {
-        console.error('Failed to load sent offer ratings:', error);
-      },
-    });
+    this.ratingsApi
+      .getByListingIds(acceptedSentOffers.map((offer) => offer.listingId))
+      .subscribe({
+        next: (ratings) => {
+          acceptedSentOffers.forEach((offer) => {
+            const rating = ratings.get(offer.listingId);
+            if (rating) {
+              this.updateSentOffer(offer.id, {
+                hasRatedSeller: true,
+                pendingRating: rating.transactionRating,
+                ratingMessage: 'You already rated this seller.',
+              });
+            }
+          });
+        },
+        error: (error) => {
+          console.error('Failed to load sent offer ratings:', error);
+        },
+      });
   }
 
   private updateSentOffer(
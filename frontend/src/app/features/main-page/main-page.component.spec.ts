@@ -2,7 +2,7 @@ import { ComponentFixture, TestBed } from '@angular/core/testing';
 import { fakeAsync, tick } from '@angular/core/testing';
 import { RouterTestingModule } from '@angular/router/testing';
 import { provideNoopAnimations } from '@angular/platform-browser/animations';
-import { of } from 'rxjs';
+import { NEVER, of } from 'rxjs';
 import { ActivatedRoute, Router, convertToParamMap } from '@angular/router';
 
 import { MatDialog, MatDialogRef } from '@angular/material/dialog';
@@ -13,6 +13,7 @@ import { AccountsApiService } from '../../shared/services/accounts-api.service';
 import { Listing } from '../../shared/models/listing.models';
 import { CommentApiService } from '../../shared/services/comments-api.service';
 import { Offer, OffersApiService } from '../../shared/services/offers-api.service';
+import { OfferEventsService } from '../../shared/services/offer-events.service';
 import { SendOfferDialogComponent } from '../send-offer/send-offer.component';
 
 describe('MainPageComponent', () => {
@@ -105,14 +106,14 @@ describe('MainPageComponent', () => {
       'create',
       'getSent',
       'getReceived',
-      'getReceivedUnseen',
-      'markSeen',
+      'getCounts',
+      'markSeenMany',
     ]);
     offersApiSpy.create.and.returnValue(of({}));
     offersApiSpy.getSent.and.returnValue(of([]));
     offersApiSpy.getReceived.and.returnValue(of([]));
-    offersApiSpy.getReceivedUnseen.and.returnValue(of([]));
-    offersApiSpy.markSeen.and.returnValue(of({}));
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 0, pending: 0, sentPending: 0 }));
+    offersApiSpy.markSeenMany.and.returnValue(of({}));
 
     dialogRefSpy = jasmine.createSpyObj<MatDialogRef<SendOfferDialogComponent>>(
       'MatDialogRef',
@@ -129,6 +130,7 @@ describe('MainPageComponent', () => {
         { provide: AccountsApiService, useValue: accountsApiSpy },
         { provide: CommentApiService, useValue: commentApiSpy },
         { provide: OffersApiService, useValue: offersApiSpy },
+        { provide: OfferEventsService, useValue: { changes$: NEVER } },
         { provide: ActivatedRoute, useValue: activatedRouteStub },
       ],
     })
@@ -1,5 +1,5 @@
 import { ComponentFixture, TestBed } from '@angular/core/testing';
-import { Observable, of } from 'rxjs';
+import { NEVER, Observable, of } from 'rxjs';
 import { RouterTestingModule } from '@angular/router/testing';
 import { ActivatedRoute, ParamMap, convertToParamMap } from '@angular/router';
 import { MatDialog, MatDialogRef } from '@angular/material/dialog';
@@ -7,6 +7,7 @@ import { ProfilePageComponent } from './profile.page';
 import { AccountsApiService } from '../../shared/services/accounts-api.service';
 import { ListingsApiService } from '../../shared/services/listings-api.service';
 import { Offer, OffersApiService } from '../../shared/services/offers-api.service';
+import { OfferEventsService } from '../../shared/services/offer-events.service';
 
 import { Account } from '../../shared/models/account.models';
 import { Listing } from '../../shared/models/listing.models';
@@ -74,14 +75,14 @@ describe('ProfilePageComponent', () => {
       'create',
       'getSent',
       'getReceived',
-      'getReceivedUnseen',
-      'markSeen',
+      'getCounts',
+      'markSeenMany',
     ]);
     offersApiSpy.create.and.returnValue(of({}));
     offersApiSpy.getSent.and.returnValue(of([]));
     offersApiSpy.getReceived.and.returnValue(of([]));
-    offersApiSpy.getReceivedUnseen.and.returnValue(of([]));
-    offersApiSpy.markSeen.and.returnValue(of({}));
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 0, pending: 0, sentPending: 0 }));
+    offersApiSpy.markSeenMany.and.returnValue(of({}));
     matDialogSpy = jasmine.createSpyObj<MatDialog>('MatDialog', ['open']);
     dialogRefSpy = jasmine.createSpyObj<MatDialogRef<SendOfferDialogComponent>>(
       'MatDialogRef',
@@ -99,6 +100,7 @@ describe('ProfilePageComponent', () => {
         { provide: AccountsApiService, useValue: accountsApiSpy },
         { provide: ListingsApiService, useValue: listingsApiSpy },
         { provide: OffersApiService, useValue: offersApiSpy },
+        { provide: OfferEventsService, useValue: { changes$: NEVER } },
         { provide: MatDialog, useValue: matDialogSpy },
         { provide: ActivatedRoute, useValue: activatedRouteStub },
       ],
@@ -3,7 +3,7 @@ import { ComponentFixture, TestBed } from '@angular/core/testing';
 import { Router } from '@angular/router';
 import { RouterTestingModule } from '@angular/router/testing';
 import { provideNoopAnimations } from '@angular/platform-browser/animations';
-import { of } from 'rxjs';
+import { NEVER, of } from 'rxjs';
 
 import { MatDialog, MatDialogRef } from '@angular/material/dialog';
 
@@ -12,6 +12,7 @@ import { AccountsApiService } from '../../shared/services/accounts-api.service';
 import { ListingsApiService } from '../../shared/services/listings-api.service';
 import { Listing } from '../../shared/models/listing.models';
 import { Offer, OffersApiService } from '../../shared/services/offers-api.service';
+import { OfferEventsService } from '../../shared/services/offer-events.service';
 import { SendOfferDialogComponent } from '../send-offer/send-offer.component';
 
 @Component({ template: '' })
@@ -67,14 +68,14 @@ describe('SearchPageComponent', () => {
       'create',
       'getSent',
       'getReceived',
-      'getReceivedUnseen',
-      'markSeen',
+      'getCounts',
+      'markSeenMany',
     ]);
     offersApiSpy.create.and.returnValue(of({}));
     offersApiSpy.getSent.and.returnValue(of([]));
     offersApiSpy.getReceived.and.returnValue(of([]));
-    offersApiSpy.getReceivedUnseen.and.returnValue(of([]));
-    offersApiSpy.markSeen.and.returnValue(of({}));
+    offersApiSpy.getCounts.and.returnValue(of({ unseen: 0, pending: 0, sentPending: 0 }));
+    offersApiSpy.markSeenMany.and.returnValue(of({}));
 
     accountsApiSpy = jasmine.createSpyObj<AccountsApiService>('AccountsApiService', ['getMe']);
     accountsApiSpy.getMe.and.returnValue(
@@ -103,6 +104,7 @@ describe('SearchPageComponent', () => {
         { provide: ListingsApiService, useValue: listingsApiSpy },
         { provide: AccountsApiService, useValue: accountsApiSpy },
         { provide: OffersApiService, useValue: offersApiSpy },
+        { provide: OfferEventsService, useValue: { changes$: NEVER } },
       ],
     })
       .overrideComponent(SearchPageComponent, {
@@ -16,4 +16,5 @@ export const API_URLS = {
   accounts: `${APP_URLS.backendBaseUrl}/accounts`,
   listings: `${APP_URLS.backendBaseUrl}/listings`,
   offers: `${APP_URLS.backendBaseUrl}/offers`,
+  ratings: `${APP_URLS.backendBaseUrl}/ratings`,
 } as const;
@@ -80,6 +80,23 @@ describe('ListingsApiService', () => {
     expect(result[0].imageUrl).toBe('https://cdn.example.com/lamp.png');
   });
 
+  it('getAll_ShouldSendSparseFieldsAndSummaryView', () => {
+    let result: Listing[] = [];
+
+    service.getAll({ fields: ['title', 'seller_id'], view: 'summary' }).subscribe((listings) => {
+      result = listings;
+    });
+
+    const req = httpMock.expectOne((r) => r.url === 'http://localhost:8000/listings');
+    expect(req.request.params.get('fields')).toBe('title,seller_id');
+    expect(req.request.params.get('view')).toBe('summary');
+    req.flush([{ id: 3, seller_id: 9, title: 'Chair' }]);
+
+    expect(result[0].id).toBe(3);
+    expect(result[0].sellerId).toBe(9);
+    expect(result[0].title).toBe('Chair');
+  });
+
   it('create_WithPicture_ShouldPostToUploadEndpoint', () => {
     const file = new File(['img'], 'photo.png', { type: 'image/png' });
 
@@ -15,6 +15,20 @@ interface ListingApiResponse {
   location: string | null;
   created_at: string | null;
   is_sold: boolean;
+  comment_count?: number | null;
+  offer_count?: number | null;
+  pending_offer_count?: number | null;
+}
+
+/**
+ * Sparse fieldsets for listing collections: `fields` limits the columns the
+ * server selects and sends (id is always included), `view: 'summary'`
+ * truncates the description server-side. Fields left out are undefined on
+ * the mapped Listing, so only request what the caller reads.
+ */
+export interface ListingCollectionOptions {
+  fields?: Array<keyof ListingApiResponse>;
+  view?: 'full' | 'summary';
 }
 
 export interface CreateListingRequest {
@@ -32,10 +46,11 @@ export class ListingsApiService {
   private readonly apiUrl = API_URLS.listings;
   private readonly backendBaseUrl = APP_URLS.backendBaseUrl;
 
-  getAll(): Observable<Listing[]> {
+  getAll(options: ListingCollectionOptions = {}): Observable<Listing[]> {
     return this.http
       .get<ListingApiResponse[]>(this.apiUrl, {
         headers: this.authHeaders(false),
+        params: this.collectionParams(options),
       })
       .pipe(map((items) => items.map((item) => this.toListing(item))));
   }
@@ -102,6 +117,17 @@ export class ListingsApiService {
     });
   }
 
+  private collectionParams(options: ListingCollectionOptions): HttpParams {
+    let params = new HttpParams();
+    if (options.fields?.length) {
+      params = params.set('fields', options.fields.join(','));
+    }
+    if (options.view && options.view !== 'full') {
+      params = params.set('view', options.view);
+    }
+    return params;
+  }
+
   private authHeaders(includeJsonContentType: boolean): HttpHeaders {
     const token = localStorage.getItem('access_token');
     const headers: Record<string, string> = {
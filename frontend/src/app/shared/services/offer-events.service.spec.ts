@@ -0,0 +1,129 @@
+import { TestBed, fakeAsync, tick } from '@angular/core/testing';
+import { Subscription, of, throwError } from 'rxjs';
+
+import { OfferEventType, OfferEventsService } from './offer-events.service';
+import { OffersApiService } from './offers-api.service';
+
+class FakeEventSource {
+  static instances: FakeEventSource[] = [];
+
+  onerror: (() => void) | null = null;
+  closed = false;
+  private readonly listeners = new Map<string, ((event: MessageEvent) => void)[]>();
+
+  constructor(readonly url: string) {
+    FakeEventSource.instances.push(this);
+  }
+
+  addEventListener(type: string, listener: (event: MessageEvent) => void): void {
+    this.listeners.set(type, [...(this.listeners.get(type) ?? []), listener]);
+  }
+
+  emit(type: string, data: unknown = {}): void {
+    for (const listener of this.listeners.get(type) ?? []) {
+      listener(new MessageEvent(type, { data: JSON.stringify(data) }));
+    }
+  }
+
+  fail(): void {
+    this.onerror?.();
+  }
+
+  close(): void {
+    this.closed = true;
+  }
+}
+
+describe('OfferEventsService', () => {
+  let service: OfferEventsService;
+  let offersApiSpy: jasmine.SpyObj<OffersApiService>;
+  let originalEventSource: typeof EventSource;
+  let received: OfferEventType[];
+  let subscription: Subscription;
+
+  beforeEach(() => {
+    FakeEventSource.instances = [];
+    originalEventSource = window.EventSource;
+    (window as unknown as { EventSource: unknown }).EventSource = FakeEventSource;
+
+    offersApiSpy = jasmine.createSpyObj<OffersApiService>('OffersApiService', [
+      'getStreamTicket',
+      'streamUrl',
+    ]);
+    offersApiSpy.getStreamTicket.and.returnValue(of('ticket-1'));
+    offersApiSpy.streamUrl.and.callFake((ticket: string) => `/stream?ticket=${ticket}`);
+
+    TestBed.configureTestingModule({
+      providers: [{ provide: OffersApiService, useValue: offersApiSpy }],
+    });
+    service = TestBed.inject(OfferEventsService);
+    received = [];
+  });
+
+  afterEach(() => {
+    subscription?.unsubscribe();
+    window.EventSource = originalEventSource;
+  });
+
+  const subscribe = () => {
+    subscription = service.changes$.subscribe((type) => received.push(type));
+  };
+
+  it('changes$_ShouldOpenTheStreamWithATicketAndEmitOfferEvents', () => {
+    subscribe();
+    const stream = FakeEventSource.instances[0];
+
+    stream.emit('ready', { offers_version: 'v1' });
+    stream.emit('offer.created', { offer_id: 1, listing_id: 2 });
+    stream.emit('offers.changed', { offers_version: 'v2' });
+
+    expect(stream.url).toBe('/stream?ticket=ticket-1');
+    expect(received).toEqual(['offer.created', 'offers.changed']);
+  });
+
+  it('changes$_ShouldShareOneStreamAndCloseItWithTheLastSubscriber', () => {
+    subscribe();
+    const second = service.changes$.subscribe();
+
+    expect(FakeEventSource.instances.length).toBe(1);
+    second.unsubscribe();
+    expect(FakeEventSource.instances[0].closed).toBeFalse();
+    subscription.unsubscribe();
+    expect(FakeEventSource.instances[0].closed).toBeTrue();
+  });
+
+  it('changes$_ShouldReconnectWithAFreshTicketAndCatchUp', fakeAsync(() => {
+    subscribe();
+    const first = FakeEventSource.instances[0];
+    first.emit('ready', { offers_version: 'v1' });
+    offersApiSpy.getStreamTicket.and.returnValue(of('ticket-2'));
+
+    first.fail();
+    tick(3000);
+    const second = FakeEventSource.instances[1];
+    second.emit('ready', { offers_version: 'v2' });
+
+    expect(first.closed).toBeTrue();
+    expect(second.url).toBe('/stream?ticket=ticket-2');
+    expect(received).toEqual(['resync']);
+  }));
+
+  it('changes$_ShouldPollWhileTheStreamCannotBeOpened', fakeAsync(() => {
+    offersApiSpy.getStreamTicket.and.returnValue(throwError(() => new Error('down')));
+    subscribe();
+
+    tick(3000 + 6000);
+    expect(offersApiSpy.getStreamTicket).toHaveBeenCalledTimes(3);
+    tick(30000);
+    expect(received).toContain('offers.changed');
+
+    offersApiSpy.getStreamTicket.and.returnValue(of('ticket-2'));
+    tick(9000);
+    FakeEventSource.instances[0].emit('ready', { offers_version: 'v1' });
+    const polled = received.length;
+    tick(60000);
+
+    expect(received[polled - 1]).toBe('resync');
+    expect(received.length).toBe(polled);
+  }));
+});
@@ -0,0 +1,142 @@
+import { Injectable, NgZone, inject } from '@angular/core';
+import { Observable, Subscription, share } from 'rxjs';
+
+import { OffersApiService } from './offers-api.service';
+
+// Server events after which the offers a page shows may be stale.
+export const OFFER_EVENT_TYPES = [
+  'offer.created',
+  'offer.resolved',
+  'offer.seen',
+  'offer.deleted',
+  'offers.seen',
+  'offers.changed',
+  'resync',
+] as const;
+
+export type OfferEventType = (typeof OFFER_EVENT_TYPES)[number];
+
+const RECONNECT_DELAY_MS = 3000;
+const MAX_RECONNECT_DELAY_MS = 60000;
+// Failed stream attempts in a row before falling back to polling.
+const FAILURES_BEFORE_POLLING = 3;
+const FALLBACK_POLL_MS = 30000;
+
+/**
+ * Offer notifications for the signed-in user, shared by every subscriber.
+ *
+ * Opens GET /accounts/offers/stream with a short-lived ticket (EventSource
+ * cannot send the Authorization header) and emits the type of each offer
+ * event. The server ends a stream every few minutes and a dropped stream
+ * would reconnect with an expired ticket, so every reconnect fetches a new
+ * ticket. While the stream cannot be opened it emits 'offers.changed' every
+ * FALLBACK_POLL_MS instead, so subscribers refetch as they used to poll.
+ */
+@Injectable({ providedIn: 'root' })
+export class OfferEventsService {
+  private readonly offersApi = inject(OffersApiService);
+  private readonly zone = inject(NgZone);
+
+  readonly changes$: Observable<OfferEventType> = new Observable<OfferEventType>(
+    (subscriber) => {
+      let source: EventSource | null = null;
+      let ticketRequest: Subscription | null = null;
+      let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+      let pollTimer: ReturnType<typeof setInterval> | undefined;
+      let failures = 0;
+      let lastVersion: string | null = null;
+      let closed = false;
+
+      const emit = (type: OfferEventType) => this.zone.run(() => subscriber.next(type));
+
+      const startPolling = () => {
+        if (pollTimer === undefined) {
+          pollTimer = setInterval(() => emit('offers.changed'), FALLBACK_POLL_MS);
+        }
+      };
+
+      const stopPolling = () => {
+        clearInterval(pollTimer);
+        pollTimer = undefined;
+      };
+
+      const reconnect = (opened: boolean) => {
+        failures = opened ? 0 : failures + 1;
+        if (failures >= FAILURES_BEFORE_POLLING) {
+          startPolling();
+        }
+        reconnectTimer = setTimeout(
+          connect,
+          Math.min(MAX_RECONNECT_DELAY_MS, RECONNECT_DELAY_MS * Math.max(1, failures)),
+        );
+      };
+
+      const trackVersion = (event: MessageEvent): boolean => {
+        const version = (JSON.parse(event.data) as { offers_version?: string }).offers_version;
+        const changed = lastVersion !== null && version !== lastVersion;
+        lastVersion = version ?? lastVersion;
+        return changed;
+      };
+
+      const open = (ticket: string) => {
+        let opened = false;
+        const stream = new EventSource(this.offersApi.streamUrl(ticket));
+        source = stream;
+
+        stream.addEventListener('ready', (event) => {
+          opened = true;
+          failures = 0;
+          const wasPolling = pollTimer !== undefined;
+          stopPolling();
+          // Catch up on changes made while no stream was open.
+          if (trackVersion(event as MessageEvent) || wasPolling) {
+            emit('resync');
+          }
+        });
+        for (const type of OFFER_EVENT_TYPES) {
+          stream.addEventListener(type, (event) => {
+            if (type === 'offers.changed' || type === 'resync') {
+              trackVersion(event as MessageEvent);
+            }
+            emit(type);
+          });
+        }
+        stream.onerror = () => {
+          stream.close();
+          source = null;
+          if (!closed) {
+            reconnect(opened);
+          }
+        };
+      };
+
+      const connect = () => {
+        if (closed) {
+          return;
+        }
+        if (typeof EventSource === 'undefined') {
+          startPolling();
+          return;
+        }
+        ticketRequest = this.offersApi.getStreamTicket().subscribe({
+          next: (ticket) => {
+            if (!closed) {
+              open(ticket);
+            }
+          },
+          error: () => reconnect(false),
+        });
+      };
+
+      this.zone.runOutsideAngular(connect);
+
+      return () => {
+        closed = true;
+        source?.close();
+        ticketRequest?.unsubscribe();
+        clearTimeout(reconnectTimer);
+        stopPolling();
+      };
+    },
+  ).pipe(share());
+}
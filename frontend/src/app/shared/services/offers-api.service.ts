@@ -26,6 +26,23 @@ interface OfferApiResponse {
   created_date?: string | null;
 }
 
+interface OfferCountsApiResponse {
+  unseen: number;
+  pending: number;
+  sent_pending: number;
+}
+
+interface StreamTicketApiResponse {
+  ticket: string;
+  expires_in: number;
+}
+
+export interface OfferCounts {
+  unseen: number;
+  pending: number;
+  sentPending: number;
+}
+
 export interface Offer {
   id: number;
   listingId: number;
@@ -81,12 +98,49 @@ export class OffersApiService {
       .pipe(map((offers) => offers.map((offer) => this.toOffer(offer))));
   }
 
+  getCounts(): Observable<OfferCounts> {
+    return this.http
+      .get<OfferCountsApiResponse>(`${API_URLS.accounts}/offers/counts`, {
+        headers: this.authHeaders(),
+      })
+      .pipe(
+        map((counts) => ({
+          unseen: counts.unseen,
+          pending: counts.pending,
+          sentPending: counts.sent_pending,
+        })),
+      );
+  }
+
+  /** Short-lived ticket for opening the offer event stream with EventSource. */
+  getStreamTicket(): Observable<string> {
+    return this.http
+      .post<StreamTicketApiResponse>(`${API_URLS.accounts}/offers/ticket`, null, {
+        headers: this.authHeaders(),
+      })
+      .pipe(map((response) => response.ticket));
+  }
+
+  streamUrl(ticket: string): string {
+    return `${API_URLS.accounts}/offers/stream?ticket=${encodeURIComponent(ticket)}`;
+  }
+
   markSeen(offerId: number): Observable<unknown> {
     return this.http.patch(`${this.apiUrl}/${offerId}/seen`, null, {
       headers: this.authHeaders(),
     });
   }
 
+  markSeenMany(offerIds: number[]): Observable<unknown> {
+    return this.http.patch(
+      `${this.apiUrl}/seen`,
+      { offer_ids: offerIds },
+      {
+        headers: this.authHeaders(),
+      },
+    );
+  }
+
   resolve(offerId: number, accepted: boolean): Observable<unknown> {
     return this.http.post(`${this.apiUrl}/${offerId}/resolve`, null, {
       headers: this.authHeaders(),
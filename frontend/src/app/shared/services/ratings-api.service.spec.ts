@@ -66,4 +66,32 @@ describe('RatingsApiService', () => {
 
     expect(result).toBeNull();
   });
+
+  it('getByListingIds_ShouldFetchAllListingsInOneRequest', () => {
+    let result: Map<number, Rating | null> | undefined;
+
+    service.getByListingIds([15, 22, 15]).subscribe((ratings) => {
+      result = ratings;
+    });
+
+    const req = httpMock.expectOne(
+      (request) => request.url === 'http://localhost:8000/ratings',
+    );
+    expect(req.request.method).toBe('GET');
+    expect(req.request.params.getAll('listing_ids')).toEqual(['15', '22']);
+    req.flush({
+      ratings: {
+        '15': { id: 8, listing_id: 15, rater_id: 3, transaction_rating: 4 },
+        '22': null,
+      },
+    });
+
+    expect(result?.get(15)).toEqual({
+      id: 8,
+      listingId: 15,
+      raterId: 3,
+      transactionRating: 4,
+    });
+    expect(result?.get(22)).toBeNull();
+  });
 });
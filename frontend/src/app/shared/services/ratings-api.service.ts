@@ -1,6 +1,6 @@
 import { HttpClient, HttpHeaders } from '@angular/common/http';
 import { Injectable, inject } from '@angular/core';
-import { map, Observable } from 'rxjs';
+import { forkJoin, map, Observable, of } from 'rxjs';
 
 import { API_URLS } from '../app-urls';
 
@@ -11,6 +11,13 @@ interface RatingApiResponse {
   transaction_rating: number;
 }
 
+interface RatingBatchApiResponse {
+  ratings: Record<string, RatingApiResponse | null>;
+}
+
+// Server-side cap on listing ids per GET /ratings request
+const MAX_BATCH_LISTING_IDS = 100;
+
 export interface Rating {
   id: number;
   listingId: number;
@@ -40,6 +47,37 @@ export class RatingsApiService {
       .pipe(map((rating) => (rating ? this.toRating(rating) : null)));
   }
 
+  getByListingIds(listingIds: number[]): Observable<Map<number, Rating | null>> {
+    const uniqueIds = [...new Set(listingIds)];
+    if (uniqueIds.length === 0) {
+      return of(new Map());
+    }
+
+    const chunks: number[][] = [];
+    for (let i = 0; i < uniqueIds.length; i += MAX_BATCH_LISTING_IDS) {
+      chunks.push(uniqueIds.slice(i, i + MAX_BATCH_LISTING_IDS));
+    }
+
+    return forkJoin(
+      chunks.map((chunk) =>
+        this.http.get<RatingBatchApiResponse>(API_URLS.ratings, {
+          headers: this.authHeaders(false),
+          params: { listing_ids: chunk },
+        }),
+      ),
+    ).pipe(
+      map((responses) => {
+        const ratings = new Map<number, Rating | null>();
+        for (const response of responses) {
+          for (const [listingId, rating] of Object.entries(response.ratings)) {
+            ratings.set(Number(listingId), rating ? this.toRating(rating) : null);
+          }
+        }
+        return ratings;
+      }),
+    );
+  }
+
   private toRating(rating: RatingApiResponse): Rating {
     return {
       id: rating.id ?? 0,
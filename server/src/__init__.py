@@ -1 +0,0 @@
-from .config import SECRET_KEY
\ No newline at end of file
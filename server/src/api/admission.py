@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.api.errors.exception_handlers import app_error_handler
+from src.auth.token_authenticator import TokenAuthenticator
+from src.db import DBUtility
+from src.utils import ConfigurationError, RateLimitedError, ServiceOverloadedError
+
+CHEAP = "cheap"
+EXPENSIVE = "expensive"
+
+# Used when the DB pool is not initialized yet (DBUtility defaults 5 + 10).
+_DEFAULT_MAX_IN_FLIGHT = 15
+
+
+class AdmissionController:
+    """
+    Decides whether a request may run now, wait briefly, or be shed.
+
+    Global in-flight limit:
+    - At most max_in_flight requests run at once. The default is the DB
+      pool capacity (pool_size + max_overflow), so an admitted request
+      never waits in DBUtility.connect() for a connection.
+    - Requests beyond the limit wait in a queue for at most
+      queue_timeout_seconds, then fail with ServiceOverloadedError (503 +
+      Retry-After) instead of piling up on pool_timeout.
+
+    Priority lanes:
+    - EXPENSIVE paths (listing search, query, facets and export, and the
+      offer export) may use at most
+      expensive_max_in_flight slots and wait at most
+      expensive_queue_timeout_seconds (0 by default: never queue).
+    - A freed slot goes to a waiting CHEAP request first, and an EXPENSIVE
+      request is shed outright while any CHEAP request is waiting. Under
+      pressure search is rejected first and cheap reads keep flowing.
+
+    Per-user rate:
+    - A token bucket per caller (user id, or client address for anonymous
+      calls) refills at user_rate per second up to user_burst. An empty
+      bucket is answered with RateLimitedError (429 + Retry-After).
+    - At most max_tracked_users buckets are kept; the least recently used
+      is dropped first. user_rate <= 0 disables the limit.
+
+    exempt_paths bypass all of the above. The offer event stream is one:
+    it stays open for minutes holding no DB connection, so it would only
+    pin a slot; EventHub bounds the number of open streams instead.
+
+    All state is touched only from the event loop (AdmissionMiddleware),
+    so no locks are needed.
+    """
+
+    _instance: Optional["AdmissionController"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        expensive_max_in_flight: Optional[int] = None,
+        queue_timeout_seconds: float = 0.5,
+        expensive_queue_timeout_seconds: float = 0.0,
+        user_rate: float = 20.0,
+        user_burst: float = 40.0,
+        max_tracked_users: int = 10_000,
+        expensive_paths: Sequence[str] = (
+            "/listings/search", "/listings/query", "/listings/facets", "/listings/export",
+            "/accounts/offers/export",
+        ),
+        exempt_paths: Sequence[str] = (
+            "/metrics", "/health", "/docs", "/redoc", "/openapi.json", "/uploads",
+            "/accounts/offers/stream",
+        ),
+        retry_after_seconds: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self._max_in_flight = max_in_flight
+        self._expensive_max = (
+            expensive_max_in_flight
+            if expensive_max_in_flight is not None
+            else max(1, max_in_flight // 4)
+        )
+        self._queue_timeout = {CHEAP: queue_timeout_seconds, EXPENSIVE: expensive_queue_timeout_seconds}
+        self._user_rate = user_rate
+        self._user_burst = user_burst
+        self._max_tracked_users = max_tracked_users
+        self._expensive_paths = tuple(expensive_paths)
+        self._exempt_paths = tuple(exempt_paths)
+        self._retry_after_seconds = retry_after_seconds
+        self._clock = clock
+
+        self._in_flight = 0
+        self._lane_in_flight = {CHEAP: 0, EXPENSIVE: 0}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {CHEAP: deque(), EXPENSIVE: deque()}
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        self._admitted = {CHEAP: 0, EXPENSIVE: 0}
+        self._queued = {CHEAP: 0, EXPENSIVE: 0}
+        self._shed = {CHEAP: 0, EXPENSIVE: 0}
+        self._rate_limited = 0
+
+    @classmethod
+    def instance(cls) -> "AdmissionController":
+        """
+        Process-wide controller configured from the environment:
+        ADMISSION_MAX_IN_FLIGHT (default: DB pool capacity),
+        ADMISSION_EXPENSIVE_MAX_IN_FLIGHT (default: a quarter of that),
+        ADMISSION_QUEUE_TIMEOUT_MS (default 500),
+        ADMISSION_USER_RATE (requests/second, default 20),
+        ADMISSION_USER_BURST (default 40).
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    max_in_flight = os.getenv("ADMISSION_MAX_IN_FLIGHT")
+                    expensive = os.getenv("ADMISSION_EXPENSIVE_MAX_IN_FLIGHT")
+                    cls._instance = AdmissionController(
+                        max_in_flight=int(max_in_flight) if max_in_flight else _pool_capacity(),
+                        expensive_max_in_flight=int(expensive) if expensive else None,
+                        queue_timeout_seconds=int(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "500")) / 1000,
+                        user_rate=float(os.getenv("ADMISSION_USER_RATE", "20")),
+                        user_burst=float(os.getenv("ADMISSION_USER_BURST", "40")),
+                    )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+    # -----------------------------
+    # Classification
+    # -----------------------------
+    def lane_for(self, path: str) -> Optional[str]:
+        """Lane for a request path, or None if the path bypasses admission."""
+        if path.startswith(self._exempt_paths):
+            return None
+        if path.startswith(self._expensive_paths):
+            return EXPENSIVE
+        return CHEAP
+
+    # -----------------------------
+    # Per-user rate
+    # -----------------------------
+    def check_rate(self, key: str) -> Optional[int]:
+        """Take one token from key's bucket. Returns None, or seconds to wait."""
+        if self._user_rate <= 0:
+            return None
+
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self._max_tracked_users:
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[key] = [self._user_burst, now]
+        else:
+            self._buckets.move_to_end(key)
+
+        tokens = min(self._user_burst, bucket[0] + (now - bucket[1]) * self._user_rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return None
+
+        bucket[0] = tokens
+        self._rate_limited += 1
+        return max(1, math.ceil((1 - tokens) / self._user_rate))
+
+    # -----------------------------
+    # In-flight slots
+    # -----------------------------
+    async def acquire(self, lane: str) -> None:
+        """Take a slot in lane, waiting up to the lane's queue budget."""
+        if self._can_admit(lane):
+            self._admit(lane)
+            return
+
+        timeout = self._queue_timeout[lane]
+        if timeout <= 0 or (lane == EXPENSIVE and self._waiters[CHEAP]):
+            raise self._overloaded(lane)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        self._queued[lane] += 1
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise self._overloaded(lane) from None
+        except asyncio.CancelledError:
+            # Granted a slot just as the client went away: hand it on.
+            if waiter.done() and not waiter.cancelled():
+                self.release(lane)
+            raise
+        finally:
+            try:
+                self._waiters[lane].remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self, lane: str) -> None:
+        self._in_flight -= 1
+        self._lane_in_flight[lane] -= 1
+        self._wake()
+
+    def _can_admit(self, lane: str) -> bool:
+        if self._in_flight >= self._max_in_flight:
+            return False
+        if lane == CHEAP:
+            return not self._waiters[CHEAP]
+        return (
+            self._lane_in_flight[EXPENSIVE] < self._expensive_max
+            and not self._waiters[CHEAP]
+            and not self._waiters[EXPENSIVE]
+        )
+
+    def _admit(self, lane: str) -> None:
+        self._in_flight += 1
+        self._lane_in_flight[lane] += 1
+        self._admitted[lane] += 1
+
+    def _wake(self) -> None:
+        """Hand freed slots to waiters, CHEAP lane first."""
+        while self._in_flight < self._max_in_flight:
+            lane = self._next_waiting_lane()
+            if lane is None:
+                return
+            waiter = self._waiters[lane].popleft()
+            if waiter.done():
+                continue  # timed out or cancelled
+            self._admit(lane)
+            waiter.set_result(None)
+
+    def _next_waiting_lane(self) -> Optional[str]:
+        if self._waiters[CHEAP]:
+            return CHEAP
+        if self._waiters[EXPENSIVE] and self._lane_in_flight[EXPENSIVE] < self._expensive_max:
+            return EXPENSIVE
+        return None
+
+    def _overloaded(self, lane: str) -> ServiceOverloadedError:
+        self._shed[lane] += 1
+        return ServiceOverloadedError(
+            message="Server is busy; retry shortly.",
+            details={"lane": lane},
+            retry_after_seconds=self._retry_after_seconds,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self._max_in_flight,
+            "expensive_max_in_flight": self._expensive_max,
+            "in_flight": dict(self._lane_in_flight),
+            "waiting": {lane: len(q) for lane, q in self._waiters.items()},
+            "admitted": dict(self._admitted),
+            "queued": dict(self._queued),
+            "shed": dict(self._shed),
+            "rate_limited": self._rate_limited,
+            "tracked_users": len(self._buckets),
+        }
+
+
+def _pool_capacity() -> int:
+    try:
+        return DBUtility.instance().pool_capacity
+    except ConfigurationError:
+        return _DEFAULT_MAX_IN_FLIGHT
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware applying AdmissionController to every HTTP request.
+
+    Runs before routing and before any thread-pool hop, so a shed request
+    costs a few microseconds on the event loop and never reaches the DB
+    pool. Errors are rendered by app_error_handler, the same as errors
+    raised inside routes.
+
+    The rate-limit key is the bearer token's user id (from
+    TokenAuthenticator's verified cache, falling back to a signature
+    check) or the client address. CORS preflight requests are not counted.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: Optional[AdmissionController] = None,
+        authenticator: Optional[TokenAuthenticator] = None,
+    ) -> None:
+        self.app = app
+        self._controller = controller
+        self._authenticator = authenticator
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        controller = self._controller or AdmissionController.instance()
+        lane = controller.lane_for(scope["path"])
+        if lane is None:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        retry_after = controller.check_rate(self._caller_key(request))
+        if retry_after is not None:
+            error = RateLimitedError(
+                message="Too many requests; slow down.",
+                retry_after_seconds=retry_after,
+            )
+            await (await app_error_handler(request, error))(scope, receive, send)
+            return
+
+        try:
+            await controller.acquire(lane)
+        except ServiceOverloadedError as error:
+            await (await app_error_handler(request, error))(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(lane)
+
+    def _caller_key(self, request: Request) -> str:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            authenticator = self._authenticator or TokenAuthenticator.instance()
+            user_id = authenticator.peek_user_id(token)
+            if user_id is not None:
+                return f"user:{user_id}"
+        client = request.client
+        return f"ip:{client.host if client else 'unknown'}"
@@ -0,0 +1,40 @@
+from typing import Callable
+
+from fastapi import Request, Response
+
+# Browsers may store the body but must revalidate (If-None-Match) before reuse.
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak ETag from scope/version parts, e.g. W/"listings-1a2b3c4d.7"."""
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of etag against the request's If-None-Match header."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    expected = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == expected for candidate in header.split(","))
+
+
+def conditional_json(request: Request, etag: str, render: Callable[[], bytes]) -> Response:
+    """Answer 304 when the client already holds etag; otherwise render the JSON body.
+
+    render is only called on a miss, so a 304 skips the collection query and
+    serialization entirely.
+    """
+    headers = {"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=render(), media_type="application/json", headers=headers)
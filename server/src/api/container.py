@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from src.auth.password_hasher import PasswordHasher
+from src.business_logic.managers.account import AccountManager
+from src.business_logic.managers.comment import CommentManager
+from src.business_logic.managers.listing import ListingManager
+from src.business_logic.managers.offer import OfferManager
+from src.business_logic.managers.rating import RatingManager
+from src.business_logic.services import AccountService, CommentService, ListingService, OfferService
+from src.db.account import AccountDB
+from src.db.account.mysql import MySQLAccountDB
+from src.db.cache import (
+    CacheBackend,
+    CachedAccountDB,
+    CachedCommentDB,
+    CachedListingDB,
+    CachedRatingDB,
+    RepositoryCache,
+)
+from src.db.comment import CommentDB
+from src.db.comment.mysql import MySQLCommentDB
+from src.db.email_verification_token.mysql import MySQLEmailVerificationTokenDB
+from src.db.job.mysql import MySQLJobDB
+from src.db.listing import ListingDB
+from src.db.listing.mysql import MySQLListingDB
+from src.db.offer.mysql import MySQLOfferDB
+from src.db.rating import RatingDB
+from src.db.rating.mysql import MySQLRatingDB
+from src.db.utils import DBUtility
+from src.jobs import (
+    PURGE_EMAIL_TOKENS_JOB,
+    RECONCILE_LISTING_COUNTERS_JOB,
+    EmailTokenSweeper,
+    JobQueue,
+    ListingCounterReconciler,
+)
+from src.utils import ChangeVersions, EventHub
+
+
+class ServiceContainer:
+    """
+    The app's DB wrappers, managers and services, built once.
+
+    Each object is stateless apart from references to process-wide
+    singletons (the DBUtility pool, the repository cache, ChangeVersions,
+    PasswordHasher), so one instance serves every request and thread.
+    The lifespan builds the container at startup and stores it on
+    app.state.services; the get_*_service dependencies only read from it.
+
+    job_queue runs the recurring maintenance jobs; their handlers and
+    schedules are registered here and the lifespan starts and stops it.
+    event_hub carries offer notifications to the open event streams.
+
+    Tests either override those dependencies (app.dependency_overrides) or
+    put a container built from fakes on app.state.services.
+    """
+
+    def __init__(
+        self,
+        *,
+        db: DBUtility,
+        cache: Optional[CacheBackend],
+        change_versions: ChangeVersions,
+        password_hasher: PasswordHasher,
+        job_queue: Optional[JobQueue] = None,
+        event_hub: Optional[EventHub] = None,
+    ) -> None:
+        # DB layer (reads of listings and ratings go through the cache when enabled;
+        # comment writes and account deletes drop what they change). Accounts are
+        # never cached: the row carries the password hash. Listing reads that
+        # decide a write use the uncached listing_source_db.
+        account_db: AccountDB = MySQLAccountDB(db=db)
+        listing_source_db: ListingDB = MySQLListingDB(db=db)
+        listing_db: ListingDB = listing_source_db
+        rating_db: RatingDB = MySQLRatingDB(db=db)
+        comment_db: CommentDB = MySQLCommentDB(db=db)
+        if cache is not None:
+            account_db = CachedAccountDB(account_db, cache)
+            listing_db = CachedListingDB(
+                listing_source_db,
+                cache,
+                detail_ttl_seconds=float(os.getenv("LISTING_DETAIL_CACHE_TTL_SECONDS") or 5),
+            )
+            rating_db = CachedRatingDB(rating_db, cache)
+            comment_db = CachedCommentDB(comment_db, cache)
+        self.account_db = account_db
+        self.listing_db = listing_db
+        self.listing_source_db = listing_source_db
+        self.rating_db = rating_db
+        self.comment_db = comment_db
+        self.email_token_db = MySQLEmailVerificationTokenDB(db=db)
+        self.offer_db = MySQLOfferDB(db=db)
+        self.job_queue = job_queue if job_queue is not None else JobQueue.from_environment(MySQLJobDB(db=db))
+        self.event_hub = event_hub if event_hub is not None else EventHub.instance()
+
+        # Manager layer
+        self.account_manager = AccountManager(
+            account_db=self.account_db,
+            change_versions=change_versions,
+        )
+        self.comment_manager = CommentManager(
+            comment_db=self.comment_db,
+            change_versions=change_versions,
+            listing_db=self.listing_source_db,
+        )
+        self.rating_manager = RatingManager(rating_db=self.rating_db)
+        self.listing_manager = ListingManager(
+            listing_db=self.listing_db,
+            comment_db=self.comment_db,
+            change_versions=change_versions,
+            source_listing_db=self.listing_source_db,
+        )
+        self.offer_manager = OfferManager(
+            offer_db=self.offer_db,
+            listing_db=self.listing_source_db,
+            change_versions=change_versions,
+            events=self.event_hub,
+        )
+
+        # Service layer
+        self.account_service = AccountService(
+            account_manager=self.account_manager,
+            token_db=self.email_token_db,
+            rating_manager=self.rating_manager,
+            password_hasher=password_hasher,
+        )
+        self.comment_service = CommentService(
+            comment_manager=self.comment_manager,
+            listing_manager=self.listing_manager,
+            account_manager=self.account_manager,
+        )
+        self.listing_service = ListingService(
+            listing_manager=self.listing_manager,
+            rating_manager=self.rating_manager,
+        )
+        self.offer_service = OfferService(
+            offer_manager=self.offer_manager,
+            listing_manager=self.listing_manager,
+            account_manager=self.account_manager,
+        )
+
+        # Background jobs
+        self.email_token_sweeper = EmailTokenSweeper.from_environment(self.email_token_db)
+        self.job_queue.register(
+            PURGE_EMAIL_TOKENS_JOB, self.email_token_sweeper.run, queue="maintenance", max_attempts=1
+        )
+        self.job_queue.schedule(
+            PURGE_EMAIL_TOKENS_JOB, float(os.getenv("EMAIL_TOKEN_PURGE_INTERVAL_SECONDS") or 3600)
+        )
+        self.listing_counter_reconciler = ListingCounterReconciler.from_environment(
+            self.listing_db, change_versions=change_versions
+        )
+        self.job_queue.register(
+            RECONCILE_LISTING_COUNTERS_JOB, self.listing_counter_reconciler.run, queue="maintenance", max_attempts=1
+        )
+        self.job_queue.schedule(
+            RECONCILE_LISTING_COUNTERS_JOB,
+            float(os.getenv("LISTING_COUNTER_RECONCILE_INTERVAL_SECONDS") or 86400),
+        )
+
+    @classmethod
+    def from_environment(cls) -> "ServiceContainer":
+        """Container over the process-wide singletons (DBUtility must be initialized)."""
+        return cls(
+            db=DBUtility.instance(),
+            cache=RepositoryCache.instance(),
+            change_versions=ChangeVersions.instance(),
+            password_hasher=PasswordHasher.instance(),
+        )
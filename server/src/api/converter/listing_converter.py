@@ -1,5 +1,13 @@
+from typing import Any, Dict, Iterable
+
+import orjson
 from pydantic import BaseModel, Field
 
+from src.api.converter.account_converter import AccountResponse
+from src.api.converter.comment_converter import CommentResponse
+from src.api.converter.rating_converter import RatingResponse
+from src.db import ListingRow
+from src.db.listing import ListingDetail, ListingFacets, ListingPage, SellerDashboard
 from src.domain_models import Listing
 from src.minio.media_storage_utility import MediaStorageUtility
 
@@ -36,6 +44,11 @@ class ListingResponse(BaseModel):
     location: str | None = None
     created_at: str | None = None
     is_sold: bool
+    # Activity counters; list endpoints (ListingRow) fill them, responses
+    # built from a domain Listing leave them None.
+    comment_count: int | None = None
+    offer_count: int | None = None
+    pending_offer_count: int | None = None
 
     @staticmethod
     def from_domain(
@@ -57,4 +70,236 @@ class ListingResponse(BaseModel):
             location=listing.location,
             created_at=listing.created_at.isoformat() if listing.created_at else None,
             is_sold=listing.is_sold,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def json_from_rows(
+        rows: Iterable[ListingRow],
+        media_storage: MediaStorageUtility | None = None,
+    ) -> bytes:
+        """Serialize read-model rows straight to a JSON array.
+
+        Produces the same shape as a list of from_domain() results, but skips
+        building (and re-validating) one Pydantic model per row. orjson
+        writes datetimes in the same ISO 8601 form as datetime.isoformat().
+        """
+        return orjson.dumps(ListingResponse._row_dicts(rows, media_storage))
+
+    @staticmethod
+    def json_page_from_rows(
+        page: ListingPage,
+        media_storage: MediaStorageUtility | None = None,
+    ) -> bytes:
+        """Serialize a ListingPage as {"items": [...], "next_cursor": ...} (ListingPageResponse).
+
+        items have the same form as json_from_rows().
+        """
+        return orjson.dumps({
+            "items": ListingResponse._row_dicts(page.rows, media_storage),
+            "next_cursor": page.next_cursor,
+        })
+
+    @staticmethod
+    def _row_dicts(
+        rows: Iterable[ListingRow],
+        media_storage: MediaStorageUtility | None,
+    ) -> list[dict[str, Any]]:
+        public_url = media_storage.public_url if media_storage is not None else None
+
+        return [
+            {
+                "id": row.id,
+                "seller_id": row.seller_id,
+                "title": row.title,
+                "description": row.description,
+                "price": row.price,
+                "image_url": (
+                    public_url(row.image_url)
+                    if row.image_url and public_url is not None
+                    else row.image_url
+                ),
+                "location": row.location,
+                "created_at": row.created_at,
+                "is_sold": row.is_sold,
+                "comment_count": row.comment_count,
+                "offer_count": row.offer_count,
+                "pending_offer_count": row.pending_offer_count,
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def json_from_projections(
+        rows: Iterable[Dict[str, Any]],
+        media_storage: MediaStorageUtility | None = None,
+    ) -> bytes:
+        """Serialize sparse listing rows (ListingProjection) to a JSON array.
+
+        Each object holds only the selected fields, in the same form as
+        json_from_rows(); image_url is rewritten to its public URL when
+        selected. Rows are modified in place.
+        """
+        public_url = media_storage.public_url if media_storage is not None else None
+
+        rows = list(rows)
+        if public_url is not None:
+            for row in rows:
+                if row.get("image_url"):
+                    row["image_url"] = public_url(row["image_url"])
+        return orjson.dumps(rows)
+
+
+class ListingPageResponse(BaseModel):
+    """One page of GET /listings/query; pass next_cursor back as cursor= for the next."""
+
+    items: list[ListingResponse]
+    next_cursor: str | None = None
+
+
+class LocationFacetResponse(BaseModel):
+    key: str
+    location: str
+    count: int
+
+
+class PriceBucketResponse(BaseModel):
+    min_price: float
+    max_price: float | None
+    count: int
+
+
+class ListingFacetsResponse(BaseModel):
+    """Filter facets of unsold listings: per-location and price-bucket counts."""
+
+    total: int
+    locations: list[LocationFacetResponse]
+    price_buckets: list[PriceBucketResponse]
+
+    @staticmethod
+    def from_facets(facets: ListingFacets) -> "ListingFacetsResponse":
+        return ListingFacetsResponse(
+            total=facets.total,
+            locations=[
+                LocationFacetResponse(key=f.key, location=f.location, count=f.count)
+                for f in facets.locations
+            ],
+            price_buckets=[
+                PriceBucketResponse(min_price=b.min_price, max_price=b.max_price, count=b.count)
+                for b in facets.price_buckets
+            ],
+        )
+
+
+class PendingOfferSummaryResponse(BaseModel):
+    id: int
+    listing_id: int
+    sender_id: int
+    sender_fname: str
+    sender_lname: str
+    offered_price: float
+    location_offered: str | None = None
+    created_date: str | None = None
+    seen: bool
+
+
+class DashboardListingResponse(ListingResponse):
+    """A seller's listing with its buyer's rating and the offers still awaiting a decision."""
+
+    rating: int | None = None
+    highest_pending_offer: float | None = None
+    pending_offers: list[PendingOfferSummaryResponse]
+
+
+class SellerDashboardResponse(BaseModel):
+    """GET /accounts/me/dashboard: the seller's account, listings and pending offers."""
+
+    account: AccountResponse
+    listings: list[DashboardListingResponse]
+    pending_offer_count: int
+    unseen_pending_offer_count: int
+
+    @staticmethod
+    def json_from_dashboard(
+        dashboard: SellerDashboard,
+        media_storage: MediaStorageUtility | None = None,
+    ) -> bytes:
+        """Serialize a SellerDashboard in the SellerDashboardResponse shape.
+
+        Listings have the form of ListingResponse.json_from_rows(); pending
+        offers are grouped under their listing, newest first.
+        """
+        by_listing: dict[int, list[dict[str, Any]]] = {}
+        for offer in dashboard.pending_offers:
+            by_listing.setdefault(offer.listing_id, []).append({
+                "id": offer.id,
+                "listing_id": offer.listing_id,
+                "sender_id": offer.sender_id,
+                "sender_fname": offer.sender_fname,
+                "sender_lname": offer.sender_lname,
+                "offered_price": offer.offered_price,
+                "location_offered": offer.location_offered,
+                "created_date": offer.created_date,
+                "seen": offer.seen,
+            })
+
+        rows = [listing.row for listing in dashboard.listings]
+        listings = ListingResponse._row_dicts(rows, media_storage)
+        for item, listing in zip(listings, dashboard.listings):
+            pending = by_listing.get(listing.row.id, [])
+            item["rating"] = listing.rating
+            item["highest_pending_offer"] = max((o["offered_price"] for o in pending), default=None)
+            item["pending_offers"] = pending
+
+        return orjson.dumps({
+            "account": {
+                "id": dashboard.account_id,
+                "email": dashboard.email,
+                "fname": dashboard.fname,
+                "lname": dashboard.lname,
+                "verified": dashboard.verified,
+                "average_rating_received": dashboard.average_rating,
+                "sum_of_ratings_received": dashboard.rating_sum,
+                "rating_count": dashboard.rating_count,
+            },
+            "listings": listings,
+            "pending_offer_count": len(dashboard.pending_offers),
+            "unseen_pending_offer_count": sum(1 for o in dashboard.pending_offers if not o.seen),
+        })
+
+
+class ListingDetailResponse(ListingResponse):
+    """GET /listings/{id}: a listing with its rating and comments (with author names)."""
+
+    rating: RatingResponse | None = None
+    comments: list[CommentResponse]
+
+    @staticmethod
+    def json_from_detail(
+        detail: ListingDetail,
+        media_storage: MediaStorageUtility | None = None,
+    ) -> bytes:
+        """Serialize a ListingDetail in the ListingDetailResponse shape.
+
+        The listing fields have the form of ListingResponse.json_from_rows();
+        comments have the CommentResponse form, oldest first.
+        """
+        [item] = ListingResponse._row_dicts([detail.row], media_storage)
+        rating = detail.rating
+        item["rating"] = None if rating is None else {
+            "id": rating.id,
+            "listing_id": rating.listing_id,
+            "rater_id": rating.rater_id,
+            "transaction_rating": rating.transaction_rating,
+        }
+        item["comments"] = [
+            {
+                "id": c.id,
+                "listing_id": c.listing_id,
+                "author_id": c.author_id,
+                "author_name": c.author_fname + " " + c.author_lname,
+                "body": c.body,
+                "created_date": c.created_date,
+            }
+            for c in detail.comments
+        ]
+        return orjson.dumps(item)
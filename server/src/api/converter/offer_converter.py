@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+from src.db.offer import OfferCounts
 from src.domain_models import Offer
 
 
@@ -17,6 +18,19 @@ class OfferCreate(BaseModel):
         )
 
 
+class OfferSeenUpdate(BaseModel):
+    """Bulk mark-seen request: the given offer ids, or all=True for every unseen offer."""
+
+    offer_ids: list[int] | None = Field(default=None, max_length=1000)
+    all: bool = False
+
+    @model_validator(mode="after")
+    def _one_mode(self) -> "OfferSeenUpdate":
+        if (self.offer_ids is None) == (not self.all):
+            raise ValueError("Provide either offer_ids or all=true, not both.")
+        return self
+
+
 class OfferResponse(BaseModel):
     """Data model for offer response."""
 
@@ -40,4 +54,27 @@ class OfferResponse(BaseModel):
             seen=offer.seen,
             accepted=offer.accepted,
             created_date=offer.created_date.isoformat() if offer.created_date else None,
-        )
\ No newline at end of file
+        )
+
+
+class OfferCountsResponse(BaseModel):
+    """Offer badge counters of the caller."""
+
+    unseen: int
+    pending: int
+    sent_pending: int
+
+    @staticmethod
+    def from_counts(counts: OfferCounts) -> "OfferCountsResponse":
+        return OfferCountsResponse(
+            unseen=counts.unseen,
+            pending=counts.pending,
+            sent_pending=counts.sent_pending,
+        )
+
+
+class StreamTicketResponse(BaseModel):
+    """Credential for GET /accounts/offers/stream?ticket=..."""
+
+    ticket: str
+    expires_in: int
@@ -25,3 +25,18 @@ class RatingResponse(BaseModel):
             rater_id=rating.rater_id,
             transaction_rating=rating.transaction_rating,
         )
+
+
+class RatingBatchResponse(BaseModel):
+    """Ratings of many listings, keyed by listing id; null = no rating (or no such listing)."""
+
+    ratings: dict[int, RatingResponse | None]
+
+    @staticmethod
+    def from_domain(ratings: dict[int, Rating | None]) -> "RatingBatchResponse":
+        return RatingBatchResponse(
+            ratings={
+                listing_id: None if rating is None else RatingResponse.from_domain(rating)
+                for listing_id, rating in ratings.items()
+            }
+        )
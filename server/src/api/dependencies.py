@@ -1,28 +1,47 @@
 import os
+from typing import Optional
+
+from fastapi import FastAPI, Request
 
 from src.db.utils import DBUtility
+from src.db.utils.transaction_retry import TransactionRetrier
 from src.business_logic.services import ListingService, CommentService, AccountService, OfferService
-from src.business_logic.managers.listing import ListingManager
-from src.business_logic.managers.comment import CommentManager
-from src.business_logic.managers.account import AccountManager
-from src.business_logic.managers.offer import OfferManager
-from src.business_logic.managers.rating import RatingManager
-from src.db.email_verification_token.mysql import MySQLEmailVerificationTokenDB
-from src.db.account.mysql import MySQLAccountDB
-from src.db.listing.mysql import MySQLListingDB
-from src.db.comment.mysql import MySQLCommentDB
-from src.db.offer.mysql import MySQLOfferDB
-from src.db.rating.mysql import MySQLRatingDB
-
-from fastapi import Depends, Request
-
+from src.db.cache import CacheBackend, RepositoryCache
 from src.minio import MediaStorageUtility
+from src.auth.password_hasher import PasswordHasher
+from src.api.admission import AdmissionController
+from src.api.container import ServiceContainer
+from src.api.health import DependencyProbe, ReadinessChecker
+from src.jobs import JobQueue
+from src.utils import ChangeVersions, CircuitBreakerRegistry, EventHub
 
 
 def get_db() -> DBUtility:
     return DBUtility.instance()
 
-def get_media_storage(request: Request) -> MediaStorageUtility:
+
+def get_change_versions() -> ChangeVersions:
+    return ChangeVersions.instance()
+
+
+def get_repository_cache() -> Optional[CacheBackend]:
+    return RepositoryCache.instance()
+
+
+def get_password_hasher() -> PasswordHasher:
+    return PasswordHasher.instance()
+
+def get_admission_controller() -> AdmissionController:
+    return AdmissionController.instance()
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    return CircuitBreakerRegistry.instance()
+
+def get_transaction_retrier() -> TransactionRetrier:
+    return TransactionRetrier.instance()
+
+def create_media_storage() -> MediaStorageUtility:
+    """MinIO client from the environment; checks the bucket once on creation."""
     return MediaStorageUtility(
         endpoint=os.getenv("MINIO_ENDPOINT", "localhost:9000"),
         access_key=os.getenv("MINIO_ROOT_USER", "minioadmin"),
@@ -34,100 +53,79 @@ def get_media_storage(request: Request) -> MediaStorageUtility:
         ensure_bucket_on_startup=True,
         make_bucket_public_on_startup=True,
     )
-# -----------------------------
-# DB layer dependencies
-# -----------------------------
-def get_account_db(db: DBUtility = Depends(get_db)) -> MySQLAccountDB:
-    return MySQLAccountDB(db=db)
 
 
-def get_listing_db(db: DBUtility = Depends(get_db)) -> MySQLListingDB:
-    return MySQLListingDB(db=db)
+def media_storage_for(app: FastAPI) -> MediaStorageUtility:
+    """
+    The app's shared media client. Normally created by the lifespan
+    warm-up; if that failed (MinIO down at startup) the next request
+    tries again. The client is thread-safe and keeps its HTTP connections.
+    """
+    storage = getattr(app.state, "media_storage", None)
+    if storage is None:
+        storage = app.state.media_storage = create_media_storage()
+    return storage
+
 
+def get_media_storage(request: Request) -> MediaStorageUtility:
+    return media_storage_for(request.app)
 
-def get_comment_db(db: DBUtility = Depends(get_db)) -> MySQLCommentDB:
-    return MySQLCommentDB(db=db)
 
+def create_readiness_checker(app: FastAPI) -> ReadinessChecker:
+    """MySQL (critical) and MinIO probes, cached for HEALTH_PROBE_TTL_SECONDS (default 5)."""
+    ttl_seconds = float(os.getenv("HEALTH_PROBE_TTL_SECONDS", "5"))
+    return ReadinessChecker([
+        DependencyProbe("mysql", lambda: DBUtility.instance().ping(), ttl_seconds=ttl_seconds),
+        DependencyProbe(
+            "minio", lambda: media_storage_for(app).ping(), critical=False, ttl_seconds=ttl_seconds
+        ),
+    ])
 
-def get_email_token_db(db: DBUtility = Depends(get_db)) -> MySQLEmailVerificationTokenDB:
-    return MySQLEmailVerificationTokenDB(db=db)
 
+def get_readiness_checker(request: Request) -> ReadinessChecker:
+    checker = getattr(request.app.state, "readiness", None)
+    if checker is None:
+        checker = request.app.state.readiness = create_readiness_checker(request.app)
+    return checker
 
-def get_offer_db(db: DBUtility = Depends(get_db)) -> MySQLOfferDB:
-    return MySQLOfferDB(db=db)
 
+def services_for(app: FastAPI) -> ServiceContainer:
+    """
+    The app's service container. Normally built by the lifespan at
+    startup; built here on first use when the lifespan did not run
+    (e.g. a TestClient used without a with-block).
+    """
+    services = getattr(app.state, "services", None)
+    if services is None:
+        services = app.state.services = ServiceContainer.from_environment()
+    return services
 
-def get_rating_db(db: DBUtility = Depends(get_db)) -> MySQLRatingDB:
-    return MySQLRatingDB(db=db)
 
 # -----------------------------
-# Manager layer dependencies
+# Service layer dependencies
+#
+# One node each, read from the app-scoped container. They are async so
+# FastAPI calls them inline instead of handing each one to the threadpool.
 # -----------------------------
-def get_account_manager(
-    account_db: MySQLAccountDB = Depends(get_account_db),
-) -> AccountManager:
-    return AccountManager(account_db=account_db)
+async def get_account_service(request: Request) -> AccountService:
+    return services_for(request.app).account_service
 
 
-def get_comment_manager(
-    comment_db: MySQLCommentDB = Depends(get_comment_db),
-) -> CommentManager:
-    return CommentManager(comment_db=comment_db)
+async def get_comment_service(request: Request) -> CommentService:
+    return services_for(request.app).comment_service
 
 
-def get_listing_manager(
-    listing_db: MySQLListingDB = Depends(get_listing_db),
-    comment_db: MySQLCommentDB = Depends(get_comment_db),
-) -> ListingManager:
-    return ListingManager(listing_db=listing_db, comment_db=comment_db)
+async def get_listing_service(request: Request) -> ListingService:
+    return services_for(request.app).listing_service
 
-def get_rating_manager(
-    rating_db: MySQLRatingDB = Depends(get_rating_db),
-) -> RatingManager:
-    return RatingManager(rating_db=rating_db)
 
+async def get_offer_service(request: Request) -> OfferService:
+    return services_for(request.app).offer_service
 
-def get_offer_manager(
-    offer_db: MySQLOfferDB = Depends(get_offer_db),
-    listing_db: MySQLListingDB = Depends(get_listing_db),
-) -> OfferManager:
-    return OfferManager(offer_db=offer_db, listing_db=listing_db)
 
-# -----------------------------
-# Service layer dependencies
-# -----------------------------
-def get_account_service(
-    account_manager: AccountManager = Depends(get_account_manager),
-    token_db: MySQLEmailVerificationTokenDB = Depends(get_email_token_db),
-    rating_manager: RatingManager = Depends(get_rating_manager),
-) -> AccountService:
-    return AccountService(account_manager=account_manager, token_db=token_db, rating_manager=rating_manager)
-
-
-def get_comment_service(
-    comment_manager: CommentManager = Depends(get_comment_manager),
-    listing_manager: ListingManager = Depends(get_listing_manager),
-    account_manager: AccountManager = Depends(get_account_manager),
-) -> CommentService:
-    return CommentService(comment_manager=comment_manager, 
-                          listing_manager=listing_manager, 
-                          account_manager=account_manager
-                          )
-
-
-def get_listing_service(
-    listing_manager: ListingManager = Depends(get_listing_manager),
-    rating_manager: RatingManager = Depends(get_rating_manager),
-) -> ListingService:
-    return ListingService(listing_manager=listing_manager, rating_manager=rating_manager)
-
-
-def get_offer_service(
-    offer_manager: OfferManager = Depends(get_offer_manager),
-    listing_manager: ListingManager = Depends(get_listing_manager),
-    account_manager: AccountManager = Depends(get_account_manager), 
-) -> OfferService:
-    return OfferService(offer_manager=offer_manager,
-                        listing_manager=listing_manager, 
-                        account_manager=account_manager
-                        )
\ No newline at end of file
+async def get_job_queue(request: Request) -> JobQueue:
+    return services_for(request.app).job_queue
+
+
+async def get_event_hub(request: Request) -> EventHub:
+    return services_for(request.app).event_hub
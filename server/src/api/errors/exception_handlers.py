@@ -40,9 +40,15 @@ async def app_error_handler(request: Request, error: AppError) -> JSONResponse:
     if error.details is not None:
         payload["details"] = error.details
 
+    headers = None
+    retry_after = getattr(error, "retry_after_seconds", None)
+    if retry_after is not None:
+        headers = {"Retry-After": str(retry_after)}
+
     return JSONResponse(
         status_code=error.status_code,
         content=payload,
+        headers=headers,
     )
 
 
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class DependencyProbe:
+    """
+    One dependency check (e.g. MySQL SELECT 1) with its result cached.
+
+    Load balancers and orchestrators poll /health/ready every few seconds
+    from several places; the check runs at most once per ttl_seconds and
+    every other poll gets the cached result. Only one thread runs the
+    check at a time; the others wait for it and reuse its result.
+
+    critical=False probes are reported but do not make the app unready
+    (e.g. MinIO: listing reads keep working while uploads fail).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        check: Callable[[], None],
+        critical: bool = True,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._check = check
+        self._critical = critical
+        self._ttl = ttl_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._ok = False
+        self._error: Optional[str] = None
+        self._latency_ms = 0.0
+        self._runs = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def critical(self) -> bool:
+        return self._critical
+
+    @property
+    def runs(self) -> int:
+        """How many times the check has actually run."""
+        return self._runs
+
+    def _fresh(self) -> bool:
+        return self._checked_at is not None and self._clock() - self._checked_at < self._ttl
+
+    def result(self) -> Dict[str, Any]:
+        if not self._fresh():
+            with self._lock:
+                if not self._fresh():
+                    self._run()
+        return {
+            "ok": self._ok,
+            "critical": self._critical,
+            "error": self._error,
+            "latency_ms": self._latency_ms,
+            "age_seconds": round(self._clock() - self._checked_at, 3),
+        }
+
+    def _run(self) -> None:
+        started = self._clock()
+        try:
+            self._check()
+        except Exception as e:
+            self._ok = False
+            self._error = type(e).__name__
+        else:
+            self._ok = True
+            self._error = None
+        self._checked_at = self._clock()
+        self._latency_ms = round((self._checked_at - started) * 1000, 3)
+        self._runs += 1
+
+
+class ReadinessChecker:
+    """Ready when every critical probe passes."""
+
+    def __init__(self, probes: List[DependencyProbe]) -> None:
+        self._probes = probes
+
+    def check(self) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
+        results = {probe.name: probe.result() for probe in self._probes}
+        ready = all(r["ok"] for r in results.values() if r["critical"])
+        return ready, results
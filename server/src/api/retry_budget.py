@@ -0,0 +1,28 @@
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.db.utils.transaction_retry import TransactionRetrier
+
+
+class RetryBudgetMiddleware:
+    """
+    Gives every HTTP request its own deadlock-retry budget.
+
+    The budget lives in a ContextVar set here, on the event loop; sync
+    routes run in the thread pool with a copy of this context, so every
+    transaction the request runs draws from the same budget.
+    """
+
+    def __init__(self, app: ASGIApp, retrier: Optional[TransactionRetrier] = None) -> None:
+        self.app = app
+        self._retrier = retrier
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        retrier = self._retrier or TransactionRetrier.instance()
+        with retrier.request_budget():
+            await self.app(scope, receive, send)
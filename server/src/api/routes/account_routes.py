@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 import logging
 
-from src.api.dependencies import get_account_service
-from src.auth.dependencies import get_current_user_id
+from src.api.dependencies import get_account_service, get_listing_service, get_media_storage
+from src.auth.dependencies import get_current_user_id, get_token_authenticator, security
+from src.auth.token_authenticator import TokenAuthenticator
 from src.api.converter.account_converter import LoginRequest
+from src.api.converter.listing_converter import SellerDashboardResponse
 from src.config import FRONTEND_URL
 from src.api.converter import (
     AccountResponse,
@@ -14,12 +16,13 @@ from src.api.converter import (
     SignupResponse,
     VerifyEmailResponse,
 )
-from src.business_logic.services import AccountService
+from src.business_logic.services import AccountService, ListingService
 from src.business_logic.managers.account import AccountManager
 from src.db.account.mysql import MySQLAccountDB
 from src.db import DBUtility
 from src.db.email_verification_token.mysql import MySQLEmailVerificationTokenDB
 from src.domain_models import Account
+from src.minio.media_storage_utility import MediaStorageUtility
 from src.utils import (
     TokenNotFoundError,
     TokenExpiredError,
@@ -53,10 +56,8 @@ def create_account(
             lname=request.lname,
         )
 
-        # Generate verification auth_token and create link
-        # NOTE: In production, this would be done after saving to DB
-        # For now, using a mock account_id for demonstration
-        raw_token = account_service.generate_and_store_verification_token(account_id=1)
+        # Store the token before handing out the link, so the link works at once
+        raw_token = account_service.generate_and_store_verification_token(account_id=account.id)
 
         # Create verification link
         verification_link = f"{FRONTEND_URL}/verify-email?auth_token={raw_token}"
@@ -94,6 +95,21 @@ def login_account(
     return {"access_token": token, "token_type": "bearer"}
 
 
+@router.post("/logout", status_code=204)
+def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    authenticator: TokenAuthenticator = Depends(get_token_authenticator),
+):
+    """
+    Revokes the bearer token used for this request.
+
+    The token is rejected by every API process from then on (by other
+    processes within their revocation refresh interval).
+    """
+    authenticator.revoke(credentials.credentials)
+    return Response(status_code=204)
+
+
 @router.get("/me", response_model=AccountResponse)
 def get_account(
     user_id: int = Depends(get_current_user_id),
@@ -113,6 +129,29 @@ def get_account(
     )
 
 
+@router.get("/me/dashboard", response_model=SellerDashboardResponse)
+def get_seller_dashboard(
+    user_id: int = Depends(get_current_user_id),
+    listing_service: ListingService = Depends(get_listing_service),
+    media_storage: MediaStorageUtility = Depends(get_media_storage),
+):
+    """
+    The signed-in seller's account (with rating summary), listings (with
+    offer counters and buyer ratings) and pending received offers, in one
+    response read with at most two queries. Replaces /accounts/me,
+    /listings/me, /accounts/offers/received(/pending) and per-listing
+    rating lookups on the seller's own pages.
+
+    Not conditional: ratings carry no change version, so no ETag can
+    cover them.
+    """
+    dashboard = listing_service.get_seller_dashboard(user_id)
+    return Response(
+        content=SellerDashboardResponse.json_from_dashboard(dashboard, media_storage),
+        media_type="application/json",
+    )
+
+
 @router.get("/verify-email", response_model=VerifyEmailResponse)
 def verify_email(
     auth_token: str | None = Query(None, min_length=10),
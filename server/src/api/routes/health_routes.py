@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Response
+
+from src.api.dependencies import get_readiness_checker
+from src.api.health import ReadinessChecker
+
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live")
+async def get_liveness():
+    """The process is up and its event loop answers. Touches no dependency."""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def get_readiness(response: Response, readiness: ReadinessChecker = Depends(get_readiness_checker)):
+    """
+    200 when MySQL answers, 503 otherwise. Probe results are cached for a
+    few seconds, so frequent polling does not load the database.
+    """
+    ready, checks = readiness.check()
+    if not ready:
+        response.status_code = 503
+    return {"status": "ready" if ready else "unavailable", "checks": checks}
@@ -1,6 +1,6 @@
 import uuid
 from pathlib import Path
-from typing import List
+from typing import List, Literal
 
 from fastapi import (
     APIRouter,
@@ -9,15 +9,24 @@ from fastapi import (
     Form,
     HTTPException,
     Query,
+    Request,
+    Response,
     UploadFile,
     status,
 )
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
 
 from src.auth.dependencies import get_current_user_id
 from src.domain_models import Listing
 from src.domain_models.comment import Comment
-from src.api.converter.listing_converter import ListingCreate, ListingResponse
+from src.api.converter.listing_converter import (
+    ListingCreate,
+    ListingDetailResponse,
+    ListingFacetsResponse,
+    ListingPageResponse,
+    ListingResponse,
+)
 from src.api.converter.comment_converter import CommentCreate, CommentResponse
 from src.api.converter.rating_converter import RatingCreate, RatingResponse
 from src.business_logic.services import (
@@ -29,11 +38,42 @@ from src.api.dependencies import (
     get_listing_service,
     get_comment_service,
     get_media_storage,
+    get_change_versions,
 )
+from src.api.conditional import conditional_json, weak_etag
+from src.api.streaming import NDJSON_MEDIA_TYPE, ndjson_lines
+from src.db import ListingProjection, ListingQuery
 from src.minio.media_storage_utility import MediaStorageUtility
+from src.utils import ChangeVersions
 
 router = APIRouter(prefix="/listings")
 
+ListingView = Literal["full", "summary"]
+ListingSort = Literal["newest", "price_asc", "price_desc"]
+
+_FIELDS_QUERY = Query(
+    default=None,
+    description="Comma-separated listing fields to return (id is always included).",
+)
+_VIEW_QUERY = Query(
+    default="full",
+    description="summary truncates the description server-side for feed cards.",
+)
+
+
+def _listing_projection(fields: str | None, view: ListingView) -> ListingProjection | None:
+    """Projection for fields= / view=, or None for the full listing rows."""
+    if fields is None and view == "full":
+        return None
+    requested = (
+        [name.strip() for name in fields.split(",") if name.strip()]
+        if fields is not None
+        else None
+    )
+    if view == "summary":
+        return ListingProjection.summary(requested)
+    return ListingProjection.of(requested)
+
 
 def _normalized_image_extension(upload: UploadFile) -> str:
     allowed = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
@@ -70,22 +110,58 @@ async def _upload_listing_image(
 
 @router.get("", response_model=List[ListingResponse])
 def get_all_listing(
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    view: ListingView = _VIEW_QUERY,
     _: int = Depends(get_current_user_id),
     listing_service: ListingService = Depends(get_listing_service),
     media_storage: MediaStorageUtility = Depends(get_media_storage),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    listings: List[Listing] = listing_service.get_all_listing()
-    return [ListingResponse.from_domain(listing, media_storage) for listing in listings]
+    projection = _listing_projection(fields, view)
+    if projection is not None:
+        return conditional_json(
+            request,
+            weak_etag("listings", change_versions.listings(), projection.key),
+            lambda: ListingResponse.json_from_projections(
+                listing_service.get_listing_projections(projection), media_storage
+            ),
+        )
+    return conditional_json(
+        request,
+        weak_etag("listings", change_versions.listings()),
+        lambda: ListingResponse.json_from_rows(
+            listing_service.get_all_listing_rows(), media_storage
+        ),
+    )
 
 
 @router.get("/me", response_model=List[ListingResponse])
 def get_my_listing(
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    view: ListingView = _VIEW_QUERY,
     user_id: int = Depends(get_current_user_id),
     listing_service: ListingService = Depends(get_listing_service),
     media_storage: MediaStorageUtility = Depends(get_media_storage),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    listings: List[Listing] = listing_service.get_listing_by_user_id(user_id=user_id)
-    return [ListingResponse.from_domain(listing, media_storage) for listing in listings]
+    projection = _listing_projection(fields, view)
+    if projection is not None:
+        return conditional_json(
+            request,
+            weak_etag("seller", user_id, change_versions.seller_listings(user_id), projection.key),
+            lambda: ListingResponse.json_from_projections(
+                listing_service.get_listing_projections(projection, user_id=user_id), media_storage
+            ),
+        )
+    return conditional_json(
+        request,
+        weak_etag("seller", user_id, change_versions.seller_listings(user_id)),
+        lambda: ListingResponse.json_from_rows(
+            listing_service.get_listing_rows_by_user_id(user_id=user_id), media_storage
+        ),
+    )
 
 
 @router.get("/search", response_model=List[ListingResponse])
@@ -99,15 +175,122 @@ def search_listings(
     return [ListingResponse.from_domain(listing, media_storage) for listing in listings]
 
 
+@router.get("/query", response_model=ListingPageResponse)
+def query_listings(
+    request: Request,
+    min_price: float | None = Query(default=None),
+    max_price: float | None = Query(default=None),
+    location: str | None = Query(default=None, description="Prefix of the location, e.g. winn."),
+    seller_id: int | None = Query(default=None),
+    sold: bool | None = Query(default=None, description="Omit for any sold state."),
+    q: str | None = Query(default=None, description="Keyword contained in the title."),
+    sort: ListingSort = Query(default="newest"),
+    limit: int = Query(default=ListingQuery.DEFAULT_LIMIT),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page."),
+    _: int = Depends(get_current_user_id),
+    listing_service: ListingService = Depends(get_listing_service),
+    media_storage: MediaStorageUtility = Depends(get_media_storage),
+    change_versions: ChangeVersions = Depends(get_change_versions),
+):
+    query = ListingQuery.of(
+        min_price=min_price,
+        max_price=max_price,
+        location=location,
+        seller_id=seller_id,
+        is_sold=sold,
+        keyword=q,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+    )
+    return conditional_json(
+        request,
+        weak_etag("query", change_versions.listings(), query.key),
+        lambda: ListingResponse.json_page_from_rows(
+            listing_service.query_listings(query), media_storage
+        ),
+    )
+
+
+@router.get("/facets", response_model=ListingFacetsResponse)
+def get_listing_facets(
+    request: Request,
+    _: int = Depends(get_current_user_id),
+    listing_service: ListingService = Depends(get_listing_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
+):
+    return conditional_json(
+        request,
+        weak_etag("facets", change_versions.listings()),
+        lambda: ListingFacetsResponse.from_facets(
+            listing_service.get_listing_facets()
+        ).model_dump_json().encode(),
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_listings(
+    seller_id: int | None = Query(default=None),
+    _: int = Depends(get_current_user_id),
+    listing_service: ListingService = Depends(get_listing_service),
+    media_storage: MediaStorageUtility = Depends(get_media_storage),
+):
+    listings = listing_service.export_listings(seller_id=seller_id)
+    return StreamingResponse(
+        ndjson_lines(listings, lambda listing: ListingResponse.from_domain(listing, media_storage)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
 @router.get("/seller/{seller_id}", response_model=List[ListingResponse])
 def get_listings_by_seller(
     seller_id: int,
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    view: ListingView = _VIEW_QUERY,
     _: int = Depends(get_current_user_id),
     listing_service: ListingService = Depends(get_listing_service),
     media_storage: MediaStorageUtility = Depends(get_media_storage),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    listings: List[Listing] = listing_service.get_listing_by_user_id(user_id=seller_id)
-    return [ListingResponse.from_domain(listing, media_storage) for listing in listings]
+    projection = _listing_projection(fields, view)
+    if projection is not None:
+        return conditional_json(
+            request,
+            weak_etag("seller", seller_id, change_versions.seller_listings(seller_id), projection.key),
+            lambda: ListingResponse.json_from_projections(
+                listing_service.get_listing_projections(projection, user_id=seller_id), media_storage
+            ),
+        )
+    return conditional_json(
+        request,
+        weak_etag("seller", seller_id, change_versions.seller_listings(seller_id)),
+        lambda: ListingResponse.json_from_rows(
+            listing_service.get_listing_rows_by_user_id(user_id=seller_id), media_storage
+        ),
+    )
+
+
+@router.get("/{listing_id}", response_model=ListingDetailResponse)
+def get_listing_detail(
+    listing_id: int,
+    _: int = Depends(get_current_user_id),
+    listing_service: ListingService = Depends(get_listing_service),
+    media_storage: MediaStorageUtility = Depends(get_media_storage),
+):
+    """
+    One listing with its rating and comments (with author names), read in
+    at most two queries and cached for a few seconds. Replaces the
+    collection lookup, /{listing_id}/comments (and its author lookups) and
+    /{listing_id}/ratings on the listing page.
+
+    Not conditional: ratings and comments carry no change version.
+    """
+    detail = listing_service.get_listing_detail(listing_id)
+    return Response(
+        content=ListingDetailResponse.json_from_detail(detail, media_storage),
+        media_type="application/json",
+    )
 
 
 @router.post("", response_model=ListingResponse)
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from src.api.admission import AdmissionController
+from src.api.dependencies import (
+    get_admission_controller,
+    get_circuit_breakers,
+    get_event_hub,
+    get_job_queue,
+    get_repository_cache,
+    get_transaction_retrier,
+)
+from src.auth.dependencies import get_current_user_id, get_token_authenticator
+from src.auth.token_authenticator import TokenAuthenticator
+from src.db.cache import CacheBackend
+from src.db.utils.transaction_retry import TransactionRetrier
+from src.jobs import JobQueue
+from src.utils import CircuitBreakerRegistry, EventHub
+
+
+# Counters describe traffic, failures and backlog of the whole service, so
+# every endpoint requires a signed-in caller.
+router = APIRouter(prefix="/metrics", tags=["metrics"], dependencies=[Depends(get_current_user_id)])
+
+
+@router.get("/cache")
+def get_cache_metrics(cache: Optional[CacheBackend] = Depends(get_repository_cache)):
+    """Hit/miss counters of the repository read cache (no keys or values)."""
+    if cache is None:
+        return {"backend": "off"}
+    return cache.stats()
+
+
+@router.get("/auth")
+def get_auth_metrics(authenticator: TokenAuthenticator = Depends(get_token_authenticator)):
+    """Verified-token cache and revocation set counters."""
+    return authenticator.stats()
+
+
+@router.get("/admission")
+def get_admission_metrics(controller: AdmissionController = Depends(get_admission_controller)):
+    """In-flight, queued, shed and rate-limited request counters per lane."""
+    return controller.stats()
+
+
+@router.get("/circuits")
+def get_circuit_metrics(breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers)):
+    """State (closed / open / half_open) and counters of each dependency's circuit breaker."""
+    return breakers.stats()
+
+
+@router.get("/transactions")
+def get_transaction_metrics(retrier: TransactionRetrier = Depends(get_transaction_retrier)):
+    """Deadlock / lock-wait-timeout conflicts and the retries spent on them."""
+    return retrier.stats()
+
+
+@router.get("/jobs")
+def get_job_metrics(jobs: JobQueue = Depends(get_job_queue)):
+    """Outbox and per-queue worker counters of this process, plus the job table backlog."""
+    stats = jobs.stats()
+    stats["backlog"] = jobs.backlog()
+    return stats
+
+
+@router.get("/events")
+def get_event_metrics(hub: EventHub = Depends(get_event_hub)):
+    """Open event streams of this process and the events published, delivered and dropped."""
+    return hub.stats()
@@ -1,18 +1,113 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import AsyncIterator, Callable, List, Literal
 
+from pydantic import TypeAdapter
+
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
+from starlette.background import BackgroundTask
 
-from src.auth.dependencies import get_current_user_id
-from src.api.dependencies import get_offer_service
+from src.auth.dependencies import get_current_user_id, get_stream_user_id
+from src.auth.jwt import STREAM_TICKET_TTL_SECONDS, issue_stream_ticket
+from src.api.dependencies import get_offer_service, get_change_versions, get_event_hub
+from src.api.conditional import conditional_json, weak_etag
 from src.business_logic.services import OfferService
-from src.api.converter.offer_converter import OfferCreate, OfferResponse
+from src.api.converter.offer_converter import (
+    OfferCountsResponse,
+    OfferCreate,
+    OfferResponse,
+    OfferSeenUpdate,
+    StreamTicketResponse,
+)
+from src.api.streaming import (
+    NDJSON_MEDIA_TYPE,
+    SSE_HEADERS,
+    SSE_HEARTBEAT,
+    SSE_MEDIA_TYPE,
+    ndjson_lines,
+    sse_event,
+    sse_retry,
+)
 from src.domain_models import Offer
+from src.utils import ChangeVersions, EventHub, Subscription
 
 
 router = APIRouter()
 security = HTTPBearer()
 
+_OFFER_LIST = TypeAdapter(List[OfferResponse])
+
+# Client reconnect delay after a stream ends or drops
+_SSE_RETRY_MS = 3000
+
+
+def _offers_json(offers: List[Offer]) -> bytes:
+    return _OFFER_LIST.dump_json([OfferResponse.from_domain(o) for o in offers])
+
+
+def _sent_etag(name: str, user_id: int, change_versions: ChangeVersions) -> str:
+    # Deleting a listing cascades to its offers, and that write does not know
+    # the senders, so sent-offer tags also follow the global listing version.
+    return weak_etag(
+        name, user_id, change_versions.account_offers(user_id), change_versions.listings()
+    )
+
+
+def _received_etag(name: str, user_id: int, change_versions: ChangeVersions) -> str:
+    return weak_etag(
+        name,
+        user_id,
+        change_versions.account_offers(user_id),
+        change_versions.seller_listings(user_id),
+    )
+
+
+async def _offer_events(
+    subscription: Subscription,
+    offers_version: Callable[[], str],
+    hub: EventHub,
+    clock: Callable[[], float] = time.monotonic,
+) -> AsyncIterator[bytes]:
+    """
+    The SSE body of one offer stream.
+
+    Sends "ready" first, then each event the hub delivers. Between events
+    it polls the account's offer version every hub.poll_seconds; a change
+    nobody announced (a write in another worker) is sent as
+    "offers.changed". "resync" means events were dropped because the
+    client fell behind. Messages carry ids only; on any of them the
+    client refetches the offer lists it shows. An idle stream
+    gets a heartbeat comment every hub.heartbeat_seconds, and the stream
+    ends after hub.max_stream_seconds so the client reconnects, possibly
+    to another worker.
+    """
+    try:
+        seen = offers_version()
+        yield sse_retry(_SSE_RETRY_MS) + sse_event("ready", {"offers_version": seen})
+        started = last_sent = clock()
+        while clock() - started < hub.max_stream_seconds:
+            event = await subscription.next(hub.poll_seconds)
+            if subscription.take_overflow():
+                seen = offers_version()
+                chunk = sse_event("resync", {"offers_version": seen})
+            elif event is not None:
+                seen = offers_version()
+                chunk = sse_event(event.type, event.data)
+            else:
+                current = offers_version()
+                if current != seen:
+                    seen = current
+                    chunk = sse_event("offers.changed", {"offers_version": current})
+                elif clock() - last_sent >= hub.heartbeat_seconds:
+                    chunk = SSE_HEARTBEAT
+                else:
+                    continue
+            last_sent = clock()
+            yield chunk
+    finally:
+        subscription.close()
+
 # -------------------------------------------------------
 # 1. create_offer
 # -------------------------------------------------------
@@ -65,11 +160,16 @@ def get_offers_by_listing(
 # -------------------------------------------------------
 @router.get("/accounts/offers/sent", response_model=List[OfferResponse])
 def get_offers_sent(
+    request: Request,
     user_id: int = Depends(get_current_user_id),
     offer_service: OfferService = Depends(get_offer_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    offers = offer_service.get_offers_by_sender_id(user_id)
-    return [OfferResponse.from_domain(o) for o in offers]
+    return conditional_json(
+        request,
+        _sent_etag("offers-sent", user_id, change_versions),
+        lambda: _offers_json(offer_service.get_offers_by_sender_id(user_id)),
+    )
 
 
 # -------------------------------------------------------
@@ -77,11 +177,16 @@ def get_offers_sent(
 # -------------------------------------------------------
 @router.get("/accounts/offers/received", response_model=List[OfferResponse])
 def get_offers_received(
+    request: Request,
     user_id: int = Depends(get_current_user_id),
     offer_service: OfferService = Depends(get_offer_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    offers = offer_service.get_offers_sellers(user_id)
-    return [OfferResponse.from_domain(o) for o in offers]
+    return conditional_json(
+        request,
+        _received_etag("offers-received", user_id, change_versions),
+        lambda: _offers_json(offer_service.get_offers_sellers(user_id)),
+    )
 
 
 # -------------------------------------------------------
@@ -89,11 +194,16 @@ def get_offers_received(
 # -------------------------------------------------------
 @router.get("/accounts/offers/received/pending", response_model=List[OfferResponse])
 def get_pending_received_offers(
+    request: Request,
     user_id: int = Depends(get_current_user_id),
     offer_service: OfferService = Depends(get_offer_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    offers = offer_service.get_offer_sellers_pending(user_id)
-    return [OfferResponse.from_domain(o) for o in offers]
+    return conditional_json(
+        request,
+        _received_etag("offers-received-pending", user_id, change_versions),
+        lambda: _offers_json(offer_service.get_offer_sellers_pending(user_id)),
+    )
 
 
 # -------------------------------------------------------
@@ -101,11 +211,16 @@ def get_pending_received_offers(
 # -------------------------------------------------------
 @router.get("/accounts/offers/received/unseen", response_model=List[OfferResponse])
 def get_unseen_received_offers(
+    request: Request,
     user_id: int = Depends(get_current_user_id),
     offer_service: OfferService = Depends(get_offer_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    offers = offer_service.get_offer_sellers_unseen(user_id)
-    return [OfferResponse.from_domain(o) for o in offers]
+    return conditional_json(
+        request,
+        _received_etag("offers-received-unseen", user_id, change_versions),
+        lambda: _offers_json(offer_service.get_offer_sellers_unseen(user_id)),
+    )
 
 
 # -------------------------------------------------------
@@ -113,11 +228,94 @@ def get_unseen_received_offers(
 # -------------------------------------------------------
 @router.get("/accounts/offers/sent/pending", response_model=List[OfferResponse])
 def get_pending_sent_offers(
+    request: Request,
     user_id: int = Depends(get_current_user_id),
     offer_service: OfferService = Depends(get_offer_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
 ):
-    offers = offer_service.get_pending_offers_with_listing_by_sender(user_id)
-    return [OfferResponse.from_domain(o) for o in offers]
+    return conditional_json(
+        request,
+        _sent_etag("offers-sent-pending", user_id, change_versions),
+        lambda: _offers_json(offer_service.get_pending_offers_with_listing_by_sender(user_id)),
+    )
+
+
+# -------------------------------------------------------
+# 8a. get_offer_counts (badge)
+# -------------------------------------------------------
+@router.get("/accounts/offers/counts", response_model=OfferCountsResponse)
+def get_offer_counts(
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
+    offer_service: OfferService = Depends(get_offer_service),
+    change_versions: ChangeVersions = Depends(get_change_versions),
+):
+    # Received counts change with the user's offer version (and their listing
+    # deletes, which bump listings()); sent counts as in _sent_etag.
+    etag = weak_etag(
+        "offer-counts", user_id, change_versions.account_offers(user_id), change_versions.listings()
+    )
+    return conditional_json(
+        request,
+        etag,
+        lambda: OfferCountsResponse.from_counts(
+            offer_service.get_offer_counts(user_id)
+        ).model_dump_json().encode(),
+    )
+
+
+# -------------------------------------------------------
+# 8b. export_offers (NDJSON stream)
+# -------------------------------------------------------
+@router.get("/accounts/offers/export", response_class=StreamingResponse)
+def export_offers(
+    scope: Literal["received", "sent"] = Query(default="received"),
+    user_id: int = Depends(get_current_user_id),
+    offer_service: OfferService = Depends(get_offer_service),
+):
+    offers = offer_service.export_offers(user_id, scope=scope)
+    return StreamingResponse(
+        ndjson_lines(offers, OfferResponse.from_domain),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+# -------------------------------------------------------
+# 8c. stream_offer_events (Server-Sent Events)
+# -------------------------------------------------------
+@router.get("/accounts/offers/stream", response_class=StreamingResponse)
+async def stream_offer_events(
+    user_id: int = Depends(get_stream_user_id),
+    hub: EventHub = Depends(get_event_hub),
+    change_versions: ChangeVersions = Depends(get_change_versions),
+):
+    """
+    Offer notifications for the caller's sent and received offers, replacing polling.
+
+    Browsers open it with EventSource, which cannot send headers, so it
+    takes a ?ticket= from POST /accounts/offers/ticket as well as a
+    bearer token.
+    """
+    subscription = hub.subscribe(user_id)
+    return StreamingResponse(
+        _offer_events(subscription, lambda: change_versions.account_offers(user_id), hub),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+        # Also close when the body never started (client gone before the first chunk)
+        background=BackgroundTask(subscription.close),
+    )
+
+
+# -------------------------------------------------------
+# 8d. issue_stream_ticket
+# -------------------------------------------------------
+@router.post("/accounts/offers/ticket", response_model=StreamTicketResponse)
+def issue_offer_stream_ticket(user_id: int = Depends(get_current_user_id)):
+    """A ticket for opening the offer event stream, valid for a minute."""
+    return StreamTicketResponse(
+        ticket=issue_stream_ticket(user_id),
+        expires_in=STREAM_TICKET_TTL_SECONDS,
+    )
 
 
 # -------------------------------------------------------
@@ -133,6 +331,20 @@ def mark_offer_seen(
     return {"message": "Offer marked as seen"}
 
 
+# -------------------------------------------------------
+# 9a. set_offers_seen (bulk)
+# -------------------------------------------------------
+@router.patch("/offers/seen")
+def mark_offers_seen(
+    update: OfferSeenUpdate,
+    user_id: int = Depends(get_current_user_id),
+    offer_service: OfferService = Depends(get_offer_service),
+):
+    """Mark the caller's received offers seen in one transaction; ids of other sellers' offers are skipped."""
+    marked = offer_service.set_offers_seen(user_id, None if update.all else update.offer_ids)
+    return {"message": "Offers marked as seen", "offer_ids": [offer.id for offer in marked]}
+
+
 # -------------------------------------------------------
 # 10. resolve_offer
 # -------------------------------------------------------
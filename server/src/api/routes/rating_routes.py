@@ -0,0 +1,23 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from src.auth.dependencies import get_current_user_id
+from src.api.converter.rating_converter import RatingBatchResponse
+from src.api.dependencies import get_listing_service
+from src.business_logic.services import ListingService
+
+router = APIRouter(prefix="/ratings")
+
+# Upper bound on listing ids per batch lookup (one IN list)
+MAX_BATCH_LISTING_IDS = 100
+
+
+@router.get("", response_model=RatingBatchResponse)
+def get_ratings_by_listing_ids(
+    listing_ids: List[int] = Query(..., min_length=1, max_length=MAX_BATCH_LISTING_IDS),
+    _: int = Depends(get_current_user_id),
+    listing_service: ListingService = Depends(get_listing_service),
+):
+    """Ratings of many listings in one query (?listing_ids=1&listing_ids=2...)."""
+    return RatingBatchResponse.from_domain(listing_service.get_listing_ratings(listing_ids))
@@ -0,0 +1,52 @@
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+import orjson
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Proxies must neither cache nor buffer an event stream (X-Accel-Buffering: nginx).
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Comment line sent on an idle stream so proxies and clients keep it open.
+SSE_HEARTBEAT = b": ping\n\n"
+
+# Flush to the client once this many bytes are buffered, so large exports
+# are sent as a handful of ASGI messages instead of one per row.
+NDJSON_FLUSH_BYTES = 64 * 1024
+
+
+def ndjson_lines(
+    items: Iterable[T],
+    to_response: Callable[[T], BaseModel],
+    flush_bytes: int = NDJSON_FLUSH_BYTES,
+) -> Iterator[bytes]:
+    """Serialize domain objects to newline-delimited JSON, lazily.
+
+    Only one buffer (~flush_bytes) is held in memory at a time, so memory
+    stays flat no matter how many rows the underlying iterator yields.
+    """
+    buffer = bytearray()
+    for item in items:
+        buffer += to_response(item).model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= flush_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """One Server-Sent Events message: a named event with a JSON data line."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def sse_retry(milliseconds: int) -> bytes:
+    """Tell the client how long to wait before reconnecting a dropped stream."""
+    return f"retry: {milliseconds}\n\n".encode()
@@ -1,13 +1,35 @@
-from fastapi import Depends
+from typing import Optional
+
+from fastapi import Depends, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from src.auth import jwt
+from src.api.errors.api_error import ApiError
+from src.auth.jwt import decode_stream_ticket
+from src.auth.token_authenticator import TokenAuthenticator
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+def get_token_authenticator() -> TokenAuthenticator:
+    return TokenAuthenticator.instance()
 
 
 def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
+    authenticator: TokenAuthenticator = Depends(get_token_authenticator),
+) -> int:
+    return authenticator.authenticate(credentials.credentials)
+
+
+def get_stream_user_id(
+    ticket: Optional[str] = Query(default=None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    authenticator: TokenAuthenticator = Depends(get_token_authenticator),
 ) -> int:
-    token = credentials.credentials
-    return jwt.get_user_id_from_token(token)
+    """Caller of an event stream: a ?ticket= (browser EventSource) or a bearer token."""
+    if ticket is not None:
+        return decode_stream_ticket(ticket)
+    if credentials is None:
+        raise ApiError(status_code=401, message="Missing authentication auth_token")
+    return authenticator.authenticate(credentials.credentials)
@@ -1,10 +1,19 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
 import jwt
 
 from src.api.errors.api_error import ApiError
 from src.config import SECRET_KEY
 
+# Stream tickets carry this audience and login tokens none, so neither is
+# accepted in place of the other.
+STREAM_TICKET_AUDIENCE = "offer-stream"
+STREAM_TICKET_TTL_SECONDS = 60
 
-def get_user_id_from_token(token: str) -> int:
+
+def decode_token(token: str) -> Tuple[int, Optional[float]]:
+    """Verify token and return (user_id, exp) where exp is a Unix timestamp or None."""
     if not token:
         raise ApiError(status_code=401, message="Missing authentication auth_token")
 
@@ -15,7 +24,8 @@ def get_user_id_from_token(token: str) -> int:
         if not user_id:
             raise ApiError(status_code=401, message="Invalid auth_token payload")
 
-        return int(user_id)
+        exp = payload.get("exp")
+        return int(user_id), None if exp is None else float(exp)
 
     except jwt.ExpiredSignatureError:
         raise ApiError(status_code=401, message="Token has expired")
@@ -25,3 +35,46 @@ def get_user_id_from_token(token: str) -> int:
 
     except ValueError:
         raise ApiError(status_code=401, message="Invalid user ID in auth_token")
+
+
+def get_user_id_from_token(token: str) -> int:
+    user_id, _ = decode_token(token)
+    return user_id
+
+
+def issue_stream_ticket(user_id: int, ttl_seconds: float = STREAM_TICKET_TTL_SECONDS) -> str:
+    """
+    Short-lived credential for opening the offer event stream as ?ticket=.
+
+    A browser EventSource cannot send an Authorization header, and putting
+    the login token in the URL would leak it into access logs for as long
+    as it lives; a ticket is only good for the stream, for ttl_seconds.
+    """
+    expiration = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+    return jwt.encode(
+        {"sub": str(user_id), "aud": STREAM_TICKET_AUDIENCE, "exp": expiration},
+        SECRET_KEY,
+        algorithm="HS256",
+    )
+
+
+def decode_stream_ticket(ticket: str) -> int:
+    """Verify a stream ticket and return its user id, or raise ApiError(401)."""
+    if not ticket:
+        raise ApiError(status_code=401, message="Missing stream ticket")
+
+    try:
+        payload = jwt.decode(
+            ticket,
+            SECRET_KEY,
+            algorithms=["HS256"],
+            audience=STREAM_TICKET_AUDIENCE,
+            options={"require": ["exp", "sub"]},
+        )
+        return int(payload["sub"])
+
+    except jwt.ExpiredSignatureError:
+        raise ApiError(status_code=401, message="Stream ticket has expired")
+
+    except (jwt.InvalidTokenError, ValueError):
+        raise ApiError(status_code=401, message="Invalid stream ticket")
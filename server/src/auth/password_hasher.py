@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from src.utils import ServiceOverloadedError
+
+# PHC-style encoding: $scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<hash>
+_PREFIX = "$scrypt$"
+_SALT_BYTES = 16
+_HASH_BYTES = 32
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def _scrypt(password: str, salt: bytes, log_n: int, r: int, p: int) -> bytes:
+    n = 1 << log_n
+    return hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=256 * n * r + (1 << 20),
+        dklen=_HASH_BYTES,
+    )
+
+
+def _parse(encoded: str) -> Tuple[int, int, int, bytes, bytes]:
+    params, salt, digest = encoded[len(_PREFIX):].split("$")
+    values = dict(item.split("=") for item in params.split(","))
+    return int(values["ln"]), int(values["r"]), int(values["p"]), _b64decode(salt), _b64decode(digest)
+
+
+# Worker entry points: module-level so a process pool can pickle them.
+def _hash_password(password: str, log_n: int, r: int, p: int) -> str:
+    salt = os.urandom(_SALT_BYTES)
+    digest = _scrypt(password, salt, log_n, r, p)
+    return f"{_PREFIX}ln={log_n},r={r},p={p}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def _verify_password(password: str, encoded: str) -> bool:
+    try:
+        log_n, r, p, salt, expected = _parse(encoded)
+    except (ValueError, KeyError):
+        return False
+    return hmac.compare_digest(_scrypt(password, salt, log_n, r, p), expected)
+
+
+class PasswordHasher:
+    """
+    scrypt password hashing on a bounded process pool.
+
+    Why a process pool:
+    - A hash costs tens of milliseconds of CPU by design. Run inside a sync
+      route's worker thread it competes for the GIL and the thread pool
+      with every other request; in a separate process it only uses a core.
+    - max_workers bounds how many cores logins may take.
+    - max_pending bounds work in flight (running + queued). When it is
+      full, hash/verify fail fast with ServiceOverloadedError (503 +
+      Retry-After) instead of queueing without limit during a login storm.
+
+    Legacy rows:
+    - Accounts created before hashing store the plaintext password.
+      verify() still accepts those (constant-time compare, no pool) and
+      needs_rehash() reports them so login can upgrade the row.
+
+    scrypt (hashlib, stdlib) needs no extra dependency; cost is log2(N).
+    """
+
+    _instance: Optional["PasswordHasher"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cost: int = 15,
+        block_size: int = 8,
+        parallelism: int = 1,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        retry_after_seconds: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if not 1 <= cost <= 24:
+            raise ValueError("cost must be between 1 and 24")
+        if max_workers <= 0 or max_pending <= 0:
+            raise ValueError("max_workers and max_pending must be positive")
+        self._cost = cost
+        self._block_size = block_size
+        self._parallelism = parallelism
+        self._max_workers = max_workers
+        self._retry_after_seconds = retry_after_seconds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = executor
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "PasswordHasher":
+        """
+        Process-wide hasher configured from the environment:
+        PASSWORD_HASH_COST (default 15), PASSWORD_HASH_WORKERS (default 2),
+        PASSWORD_HASH_MAX_PENDING (default 32).
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = PasswordHasher(
+                        cost=int(os.getenv("PASSWORD_HASH_COST", "15")),
+                        max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "2")),
+                        max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32")),
+                    )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        if cls._instance is not None:
+            cls._instance.shutdown()
+        cls._instance = None
+
+    # -----------------------------
+    # Public API
+    # -----------------------------
+    @staticmethod
+    def is_hashed(stored: str) -> bool:
+        return stored.startswith(_PREFIX)
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash_password, password, self._cost, self._block_size, self._parallelism)
+
+    def verify(self, password: str, stored: str) -> bool:
+        if not self.is_hashed(stored):
+            # Legacy plaintext row.
+            return hmac.compare_digest(stored.encode("utf-8"), password.encode("utf-8"))
+        return self._run(_verify_password, password, stored)
+
+    def needs_rehash(self, stored: str) -> bool:
+        """True for plaintext rows and hashes made with other parameters."""
+        if not self.is_hashed(stored):
+            return True
+        try:
+            log_n, r, p, _, _ = _parse(stored)
+        except (ValueError, KeyError):
+            return True
+        return (log_n, r, p) != (self._cost, self._block_size, self._parallelism)
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    # -----------------------------
+    # Pool
+    # -----------------------------
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    # spawn: forking a process that runs server threads is unsafe.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self._max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise ServiceOverloadedError(
+                message="Too many login requests in progress; retry shortly.",
+                details={"op": fn.__name__},
+                retry_after_seconds=self._retry_after_seconds,
+            )
+        try:
+            return self._pool().submit(fn, *args).result()
+        finally:
+            self._slots.release()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.api.errors.api_error import ApiError
+from src.auth import jwt
+from src.auth.revocation_set import RevocationSet
+from src.db import DBUtility
+from src.db.revoked_token import RevokedTokenDB
+from src.db.revoked_token.mysql import MySQLRevokedTokenDB
+
+logger = logging.getLogger(__name__)
+
+# Tokens without an exp claim are revoked for as long as a login token lives.
+_NO_EXP_REVOCATION = timedelta(days=30)
+
+
+class TokenAuthenticator:
+    """
+    Authenticates bearer tokens with a verified-token cache and revocation.
+
+    Verified-token cache:
+    - Keyed by the SHA-256 digest of the raw token; the value is
+      (user_id, exp). A repeat request skips jwt.decode entirely.
+    - An entry never outlives the token: a hit past exp is evicted and
+      answered with "Token has expired". Tokens without exp are not cached.
+    - Bounded by max_entries; the oldest entry is evicted first.
+
+    Revocation:
+    - Checked before the cache, so a revoked token is rejected even if it
+      was verified a moment ago.
+    - Revocations made by this process apply immediately. Revocations made
+      by other processes are picked up from revoked_token every
+      refresh_interval_seconds, incrementally by id.
+    - If the refresh query fails, the last known set is kept and the
+      failure is logged; the next refresh is attempted after the interval.
+    """
+
+    _instance: Optional["TokenAuthenticator"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        revoked_token_db: RevokedTokenDB,
+        max_entries: int = 100_000,
+        refresh_interval_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+        revocations: Optional[RevocationSet] = None,
+    ) -> None:
+        self._revoked_token_db = revoked_token_db
+        self._max_entries = max_entries
+        self._refresh_interval = refresh_interval_seconds
+        self._clock = clock
+        self._revocations = revocations if revocations is not None else RevocationSet()
+
+        self._verified: Dict[bytes, Tuple[int, float]] = {}
+        self._insert_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._last_refresh = float("-inf")
+        self._last_revocation_id = 0
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def instance(cls) -> "TokenAuthenticator":
+        """Process-wide authenticator backed by MySQL."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = TokenAuthenticator(MySQLRevokedTokenDB(DBUtility.instance()))
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    # -----------------------------
+    # Authenticate
+    # -----------------------------
+    def authenticate(self, token: str) -> int:
+        """Return the user id for token, or raise ApiError(401)."""
+        if not token:
+            raise ApiError(status_code=401, message="Missing authentication auth_token")
+
+        now = self._clock()
+        if now - self._last_refresh >= self._refresh_interval:
+            self.refresh()
+
+        digest = self.digest(token)
+        if digest in self._revocations:
+            raise ApiError(status_code=401, message="Token has been revoked")
+
+        entry = self._verified.get(digest)
+        if entry is not None:
+            user_id, exp = entry
+            if exp > now:
+                self._hits += 1
+                return user_id
+            self._verified.pop(digest, None)
+            raise ApiError(status_code=401, message="Token has expired")
+
+        self._misses += 1
+        user_id, exp = jwt.decode_token(token)
+        if exp is not None:
+            self._remember(digest, user_id, exp)
+        return user_id
+
+    def peek_user_id(self, token: str) -> Optional[int]:
+        """
+        Best-effort user id for token, or None if it does not verify.
+
+        Never refreshes revocations or touches the database, so it is safe
+        to call from async middleware. For keying rate limits only; use
+        authenticate() to authorize.
+        """
+        entry = self._verified.get(self.digest(token))
+        if entry is not None and entry[1] > self._clock():
+            return entry[0]
+        try:
+            user_id, _ = jwt.decode_token(token)
+        except ApiError:
+            return None
+        return user_id
+
+    def _remember(self, digest: bytes, user_id: int, exp: float) -> None:
+        with self._insert_lock:
+            while len(self._verified) >= self._max_entries:
+                self._verified.pop(next(iter(self._verified)), None)
+            self._verified[digest] = (user_id, exp)
+
+    # -----------------------------
+    # Revoke
+    # -----------------------------
+    def revoke(self, token: str) -> int:
+        """
+        Revoke a valid token (logout). Returns its user id.
+
+        The row is written before the local set is updated, so a failed
+        write leaves the token usable and the caller sees the error.
+        """
+        user_id, exp = jwt.decode_token(token)
+        if exp is None:
+            exp = self._clock() + _NO_EXP_REVOCATION.total_seconds()
+
+        digest = self.digest(token)
+        expires_at = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None)
+        self._revoked_token_db.add(digest.hex(), user_id, expires_at)
+
+        self._revocations.add(digest, exp)
+        self._verified.pop(digest, None)
+        return user_id
+
+    # -----------------------------
+    # Refresh
+    # -----------------------------
+    def refresh(self, page_size: int = 1000) -> None:
+        """Load revocations recorded since the last refresh."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # another request is already refreshing
+        try:
+            now = self._clock()
+            self._last_refresh = now
+            while True:
+                rows = self._revoked_token_db.get_active_since(self._last_revocation_id, page_size)
+                for row in rows:
+                    expires_at = row.expires_at.replace(tzinfo=timezone.utc).timestamp()
+                    self._revocations.add(bytes.fromhex(row.token_hash), expires_at)
+                    self._last_revocation_id = max(self._last_revocation_id, row.id)
+                if len(rows) < page_size:
+                    break
+            self._revocations.purge_expired(now)
+        except Exception:
+            logger.warning("Failed to refresh revoked tokens; keeping the last known set", exc_info=True)
+        finally:
+            self._refresh_lock.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "verified_cache_entries": len(self._verified),
+            "verified_cache_hits": self._hits,
+            "verified_cache_misses": self._misses,
+            "revoked_tokens": len(self._revocations),
+        }
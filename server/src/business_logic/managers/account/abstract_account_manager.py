@@ -160,6 +160,28 @@ class IAccountManager(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def set_password_hash(self, account_id: int, password_hash: str) -> None:
+        """
+        PURPOSE:
+            Store a new password hash for an account.
+
+        EXPECTED BEHAVIOR:
+            - Replace the stored password with password_hash.
+            - password_hash must already be produced by PasswordHasher;
+              the manager never hashes or inspects it.
+            - If account_id does not exist -> raise AccountNotFoundError.
+
+        RETURNS:
+            None
+
+        RAISES (typical):
+            - AccountNotFoundError: account_id does not exist.
+            - ValidationError: if inputs are invalid.
+            - DatabaseUnavailableError / DatabaseQueryError: on infrastructure failures.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete_account(self, account_id: int) -> bool:
         """
@@ -171,6 +193,8 @@ class IAccountManager(ABC):
             - Return True if a row was deleted.
             - Return False if no account matched the ID.
             - Must NOT raise AccountNotFoundError for missing row (delete is idempotent).
+            - On delete, bump the listing versions of every seller and the
+              offer versions of every account in account_db.get_footprint.
 
         RETURNS:
             bool:
@@ -8,7 +8,13 @@ from src.db.account import AccountDB
 from src.db.listing import ListingDB
 from src.db.rating import BaseRatingDB
 from src.domain_models import Account
-from src.utils import Validation, AccountAlreadyExistsError, AccountNotFoundError, ConfigurationError
+from src.utils import (
+    Validation,
+    AccountAlreadyExistsError,
+    AccountNotFoundError,
+    ConfigurationError,
+    ChangeVersions,
+)
 
 
 class AccountManager(IAccountManager):
@@ -23,6 +29,9 @@ class AccountManager(IAccountManager):
         * average_rating_received
         * sum_of_ratings_received
       when BaseRatingDB dependency is provided
+
+     - Bumps the listing and offer ChangeVersions of every account a delete
+       touches (change_versions, defaults to the process-wide instance)
     """
 
     def __init__(
@@ -30,8 +39,10 @@ class AccountManager(IAccountManager):
             account_db: AccountDB,
             listing_db: Optional[ListingDB] = None,
             rating_db: Optional[BaseRatingDB] = None,
+            change_versions: Optional[ChangeVersions] = None,
     ) -> None:
         super().__init__(account_db, listing_db, rating_db)
+        self._versions = change_versions or ChangeVersions.instance()
 
     @override
     def create_account(self, account: Account) -> Account:
@@ -92,10 +103,23 @@ class AccountManager(IAccountManager):
         Validation.is_boolean(verified, "verified")
         self._account_db.set_verified_by_email(email, verified)
 
+    @override
+    def set_password_hash(self, account_id: int, password_hash: str) -> None:
+        Validation.require_int(account_id, "account_id")
+        Validation.require_str(password_hash, "password_hash")
+        self._account_db.set_password(account_id, password_hash)
+
     @override
     def delete_account(self, account_id: int) -> bool:
         Validation.require_int(account_id, "account_id")
-        return self._account_db.remove(account_id)
+        # read before the delete: the cascade takes the rows that name them
+        footprint = self._account_db.get_footprint(account_id)
+        removed = self._account_db.remove(account_id)
+        if removed:
+            for seller_id in sorted(footprint.sellers):
+                self._versions.bump_listings(seller_id)
+            self._versions.bump_offers(footprint.offer_accounts)
+        return removed
 
     def require_account_by_id(self, account_id: int) -> Account:
         acc = self.get_account_by_id(account_id)
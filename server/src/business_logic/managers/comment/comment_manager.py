@@ -1,11 +1,13 @@
 from src.business_logic.managers.comment import ICommentManager
 from src.db.comment import CommentDB
+from src.db.listing import ListingDB
 from src.domain_models import Account, Listing, Comment
 from src.utils import (
     Validation,
     ValidationError,
     UnapprovedBehaviorError,
     CommentNotFoundError,
+    ChangeVersions,
 )
 
 from typing_extensions import override
@@ -23,6 +25,11 @@ class CommentManager(ICommentManager):
 
     Dependencies:
     - comment_db: CommentDB (required)
+    - change_versions: ChangeVersions (optional, defaults to the process-wide
+      instance); comments change listing.comment_count, so comment writes
+      bump the listing collection versions.
+    - listing_db: ListingDB (optional); resolves a deleted comment's listing
+      so the delete also bumps that seller's scope.
 
     Notes:
     - Assumes routing/service layer already authenticated the user (JWT -> Account).
@@ -30,8 +37,15 @@ class CommentManager(ICommentManager):
     - Delegates persistence to CommentDB.
     """
 
-    def __init__(self, comment_db: CommentDB) -> None:
+    def __init__(
+        self,
+        comment_db: CommentDB,
+        change_versions: Optional[ChangeVersions] = None,
+        listing_db: Optional[ListingDB] = None,
+    ) -> None:
         super().__init__(comment_db)
+        self._versions = change_versions or ChangeVersions.instance()
+        self._listing_db = listing_db
 
     # --------------------------------------------------
     # CREATE
@@ -67,7 +81,9 @@ class CommentManager(ICommentManager):
         if bool(listing.is_sold):
             raise UnapprovedBehaviorError("Cannot comment on a sold listing.")
 
-        return self._comment_db.add(comment)
+        created = self._comment_db.add(comment)
+        self._versions.bump_listings(listing.seller_id)
+        return created
 
     # --------------------------------------------------
     # READ
@@ -149,4 +165,14 @@ class CommentManager(ICommentManager):
                 "Only the comment author can delete this comment."
             )
 
-        return self._comment_db.remove(comment_id)
+        removed = self._comment_db.remove(comment_id)
+        if removed:
+            self._versions.bump_listings(self._seller_id_for(existing.listing_id))
+        return removed
+
+    def _seller_id_for(self, listing_id: int) -> Optional[int]:
+        # the comment does not carry its listing's seller
+        if self._listing_db is None:
+            return None
+        listing = self._listing_db.get_by_id(listing_id)
+        return listing.seller_id if listing is not None else None
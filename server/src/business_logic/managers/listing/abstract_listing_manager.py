@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from src.db.listing import ListingDB
+from src.db import ListingProjection, ListingQuery, ListingRow
+from src.db.listing import ListingDB, ListingDetail, ListingFacets, ListingPage, SellerDashboard
 from src.db.comment import CommentDB
 from src.db.rating import BaseRatingDB
 from src.domain_models import Listing, Account
@@ -99,6 +100,31 @@ class IListingManager(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_listing_for_write(self, listing_id: int) -> Optional[Listing]:
+        """
+        PURPOSE:
+            Fetch a listing whose state decides a write (sold checks,
+            buyer checks before rating or commenting).
+
+        EXPECTED BEHAVIOR:
+            - Same result as get_listing_by_id(), but never served from a
+              read cache, so is_sold / sold_to_id are current.
+            - Does not populate listing.rating.
+
+        IMPLEMENTATION NOTES:
+            - Calls source_listing_db.get_by_id(listing_id) (the uncached
+              ListingDB; listing_db when none was given).
+
+        RETURNS:
+            Listing | None
+
+        RAISES (typical):
+            - ValidationError: if listing_id invalid
+            - DatabaseUnavailableError / DatabaseQueryError: on infrastructure failures
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_listings(self) -> List[Listing]:
         """
@@ -233,6 +259,25 @@ class IListingManager(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_unsold_facets(self) -> ListingFacets:
+        """
+        PURPOSE:
+            Location and price-bucket counts of unsold listings (filter facets).
+
+        EXPECTED BEHAVIOR:
+            - Repeated calls between two listing writes return the same
+              counts without querying again.
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_unsold_facets() once per listings version
+              (ChangeVersions.listings()).
+
+        RAISES (typical):
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_unsold_by_title_keyword(
         self, keyword: str, limit: int = 50, offset: int = 0
@@ -295,6 +340,173 @@ class IListingManager(ABC):
         """
         raise NotImplementedError
 
+    # --------------------------------------------------
+    # READ (projections for list endpoints)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def list_listing_rows(self) -> List[ListingRow]:
+        """
+        PURPOSE:
+            Return every listing as a read-only projection for list views.
+
+        EXPECTED BEHAVIOR:
+            - Same rows and order as list_listings().
+            - No domain re-validation and no rating enrichment
+              (list responses do not expose ratings).
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_all_rows()
+
+        RAISES (typical):
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_listing_rows_by_seller(self, seller_id: int) -> List[ListingRow]:
+        """
+        PURPOSE:
+            Return a seller's listings as read-only projections for list views.
+
+        EXPECTED BEHAVIOR:
+            - Validate seller_id.
+            - Same rows and order as list_listings_by_seller().
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_rows_by_seller_id(seller_id)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_listing_projections(self, projection: ListingProjection) -> List[Dict[str, Any]]:
+        """
+        PURPOSE:
+            Return every listing with only the projection's fields
+            (sparse fieldsets / summary view of list endpoints).
+
+        EXPECTED BEHAVIOR:
+            - Same rows and order as list_listing_rows().
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_all_projected(projection)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_listing_projections_by_seller(
+        self, seller_id: int, projection: ListingProjection
+    ) -> List[Dict[str, Any]]:
+        """
+        PURPOSE:
+            Return a seller's listings with only the projection's fields.
+
+        EXPECTED BEHAVIOR:
+            - Validate seller_id.
+            - Same rows and order as list_listing_rows_by_seller().
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_projected_by_seller_id(seller_id, projection)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_listing_rows(self, query: ListingQuery) -> ListingPage:
+        """
+        PURPOSE:
+            Return one page of listings matching a composable query
+            (price range, location, seller, sold state, keyword, sort, cursor).
+
+        EXPECTED BEHAVIOR:
+            - query was validated when built (ListingQuery.of).
+            - Rows and next_cursor as listing_db.query_rows().
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.query_rows(query)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_seller_dashboard(self, seller_id: int) -> Optional[SellerDashboard]:
+        """
+        PURPOSE:
+            Return a seller's account, listings with offer counters and
+            ratings, and pending received offers, for the seller's own pages.
+
+        EXPECTED BEHAVIOR:
+            - seller_id must be an int.
+            - None if the account does not exist.
+            - Contents as listing_db.get_seller_dashboard().
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_seller_dashboard(seller_id)
+            - Callers must only pass the authenticated user's own id; the
+              result holds their email and the names of offer senders.
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    # --------------------------------------------------
+    # READ (streaming exports)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def iter_listings(self) -> Iterator[Listing]:
+        """
+        PURPOSE:
+            Stream every listing for bulk export (moderation dumps).
+
+        EXPECTED BEHAVIOR:
+            - Yield listings lazily; never materialize the full result.
+            - Ratings are NOT populated (one extra query per row would
+              defeat the purpose of streaming).
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.iter_all()
+
+        RAISES (typical):
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_listings_by_seller(self, seller_id: int) -> Iterator[Listing]:
+        """
+        PURPOSE:
+            Stream every listing posted by a seller for bulk export.
+
+        EXPECTED BEHAVIOR:
+            - seller_id is validated before the iterator is returned.
+            - Yield listings lazily; ratings are NOT populated.
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.iter_by_seller_id(seller_id)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
     # --------------------------------------------------
     # READ (orchestrated / aggregated)
     # --------------------------------------------------
@@ -379,6 +591,29 @@ class IListingManager(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_listing_detail(self, listing_id: int) -> Optional[ListingDetail]:
+        """
+        PURPOSE:
+            Return one listing with its rating and comments (with author
+            names) for the listing page.
+
+        EXPECTED BEHAVIOR:
+            - listing_id must be an int.
+            - None if the listing does not exist.
+            - Contents as listing_db.get_listing_detail().
+
+        IMPLEMENTATION NOTES:
+            - Calls listing_db.get_listing_detail(listing_id): at most two
+              queries, instead of get_listing_with_comments_and_rating()
+              plus one author lookup per comment.
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_listing_with_comments_and_rating(self, listing_id: int) -> Optional[Listing]:
         """
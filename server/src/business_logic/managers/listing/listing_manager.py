@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from typing_extensions import override
 
 from src.business_logic.managers.listing.abstract_listing_manager import IListingManager
-from src.db.listing import ListingDB
+from src.db import ListingProjection, ListingQuery, ListingRow
+from src.db.listing import ListingDB, ListingDetail, ListingFacets, ListingPage, SellerDashboard
 from src.db.comment import CommentDB
 from src.db.rating import BaseRatingDB
 from src.domain_models import Listing, Account
-from src.utils import Validation, ListingNotFoundError, UnapprovedBehaviorError, ConfigurationError
+from src.utils import (
+    Validation,
+    ListingNotFoundError,
+    UnapprovedBehaviorError,
+    ConfigurationError,
+    ChangeVersions,
+)
 
 
 class ListingManager(IListingManager):
@@ -25,6 +32,10 @@ class ListingManager(IListingManager):
        - listing_db: ListingDB (required)
        - comment_db: CommentDB (required for get_listing_with_comments)
        - rating_db: BaseRatingDB (optional, used for rating enrichment)
+       - change_versions: ChangeVersions (optional, defaults to the process-wide
+         registry; every listing write bumps it so conditional GETs see it)
+       - source_listing_db: ListingDB (optional, the uncached ListingDB behind
+         listing_db; get_listing_for_write() reads through it)
        """
 
     def __init__(
@@ -32,8 +43,14 @@ class ListingManager(IListingManager):
             listing_db: ListingDB,
             comment_db: CommentDB,
             rating_db: Optional[BaseRatingDB] = None,
+            change_versions: Optional[ChangeVersions] = None,
+            source_listing_db: Optional[ListingDB] = None,
     ) -> None:
         super().__init__(listing_db, comment_db, rating_db)
+        self._versions = change_versions or ChangeVersions.instance()
+        self._source_listing_db = source_listing_db if source_listing_db is not None else listing_db
+        # (listings version, facets) of the last get_unsold_facets() query
+        self._facets: Optional[Tuple[str, ListingFacets]] = None
 
         # -----------------------------
         # CREATE
@@ -43,6 +60,7 @@ class ListingManager(IListingManager):
     def create_listing(self, listing: Listing) -> Listing:
         Validation.require_not_none(listing, "listing")
         created = self._listing_db.add(listing)
+        self._versions.bump_listings(created.seller_id)
         return self._populate_rating_if_available(created)
 
     # -----------------------------
@@ -54,6 +72,11 @@ class ListingManager(IListingManager):
         listing = self._listing_db.get_by_id(listing_id)
         return self._populate_rating_if_available(listing)
 
+    @override # pragma: no mutate
+    def get_listing_for_write(self, listing_id: int) -> Optional[Listing]:
+        listing_id = Validation.require_int(listing_id, "listing_id")
+        return self._source_listing_db.get_by_id(listing_id)
+
     @override # pragma: no mutate
     def list_listings(self) -> List[Listing]:
         listings = self._listing_db.get_all()
@@ -90,6 +113,18 @@ class ListingManager(IListingManager):
         listings = self._listing_db.get_unsold_by_location_and_max_price(location, max_price)
         return self._populate_ratings_if_available(listings)
 
+    @override # pragma: no mutate
+    def get_unsold_facets(self) -> ListingFacets:
+        # Read the version before querying: counts computed while a write
+        # lands are filed under the older version, so the next read recomputes.
+        version = self._versions.listings()
+        cached = self._facets
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        facets = self._listing_db.get_unsold_facets()
+        self._facets = (version, facets)
+        return facets
+
     @override # pragma: no mutate
     def find_unsold_by_title_keyword(self, keyword: str, limit: int = 50, offset: int = 0) -> List[Listing]:
         keyword = Validation.require_str(keyword, "keyword")
@@ -110,6 +145,53 @@ class ListingManager(IListingManager):
         listings = self._listing_db.get_by_buyer_id(buyer_id)
         return self._populate_ratings_if_available(listings)
 
+    # -----------------------------
+    # READ (projections for list endpoints)
+    # -----------------------------
+    @override # pragma: no mutate
+    def list_listing_rows(self) -> List[ListingRow]:
+        return self._listing_db.get_all_rows()
+
+    @override # pragma: no mutate
+    def list_listing_rows_by_seller(self, seller_id: int) -> List[ListingRow]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        return self._listing_db.get_rows_by_seller_id(seller_id)
+
+    @override # pragma: no mutate
+    def list_listing_projections(self, projection: ListingProjection) -> List[Dict[str, Any]]:
+        projection = Validation.require_not_none(projection, "projection")
+        return self._listing_db.get_all_projected(projection)
+
+    @override # pragma: no mutate
+    def list_listing_projections_by_seller(
+        self, seller_id: int, projection: ListingProjection
+    ) -> List[Dict[str, Any]]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        projection = Validation.require_not_none(projection, "projection")
+        return self._listing_db.get_projected_by_seller_id(seller_id, projection)
+
+    @override # pragma: no mutate
+    def query_listing_rows(self, query: ListingQuery) -> ListingPage:
+        query = Validation.require_not_none(query, "query")
+        return self._listing_db.query_rows(query)
+
+    @override # pragma: no mutate
+    def get_seller_dashboard(self, seller_id: int) -> Optional[SellerDashboard]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        return self._listing_db.get_seller_dashboard(seller_id)
+
+    # -----------------------------
+    # READ (streaming exports)
+    # -----------------------------
+    @override # pragma: no mutate
+    def iter_listings(self) -> Iterator[Listing]:
+        return self._listing_db.iter_all()
+
+    @override # pragma: no mutate
+    def iter_listings_by_seller(self, seller_id: int) -> Iterator[Listing]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        return self._listing_db.iter_by_seller_id(seller_id)
+
     # -----------------------------
     # READ (orchestrated / aggregated)
     # -----------------------------
@@ -177,6 +259,11 @@ class ListingManager(IListingManager):
 
         return self.fill_listing_rating_value(listing)
 
+    @override # pragma: no mutate
+    def get_listing_detail(self, listing_id: int) -> Optional[ListingDetail]:
+        listing_id = Validation.require_int(listing_id, "listing_id")
+        return self._listing_db.get_listing_detail(listing_id)
+
     @override # pragma: no mutate
     def get_listing_with_comments_and_rating(self, listing_id: int) -> Optional[Listing]:
         """
@@ -208,6 +295,7 @@ class ListingManager(IListingManager):
         Validation.require_not_none(listing, "listing")
         Validation.require_int(listing.id, "listing_id")
         updated = self._listing_db.update(listing)
+        self._versions.bump_listings(updated.seller_id)
         return self._populate_rating_if_available(updated)
 
     @override # pragma: no mutate
@@ -254,12 +342,15 @@ class ListingManager(IListingManager):
             is_sold=True,
             sold_to_id=buyer_id,
         )
+        self._versions.bump_listings(listing.seller_id)
 
     @override # pragma: no mutate
     def update_listing_price(self, listing_id: int, price: float) -> None:
         listing_id = Validation.require_int(listing_id, "listing_id")
         price = Validation.is_positive_number(price, "price")
+        seller_id = self._seller_id_of(listing_id)
         self._listing_db.set_price(listing_id, price)
+        self._versions.bump_listings(seller_id)
 
     # -----------------------------
     # DELETE
@@ -267,12 +358,21 @@ class ListingManager(IListingManager):
     @override # pragma: no mutate
     def delete_listing(self, listing_id: int) -> bool:
         listing_id = Validation.require_int(listing_id, "listing_id")
-        return self._listing_db.remove(listing_id)
+        seller_id = self._seller_id_of(listing_id)
+        deleted = self._listing_db.remove(listing_id)
+        if deleted:
+            self._versions.bump_listings(seller_id)
+        return deleted
 
     # ==================================================
     # INTERNAL HELPERS
     # ==================================================
 
+    def _seller_id_of(self, listing_id: int) -> Optional[int]:
+        """Seller of a listing, for version bumps on writes that only carry an id."""
+        listing = self._listing_db.get_by_id(listing_id)
+        return None if listing is None else listing.seller_id
+
     def _populate_rating_if_available(self, listing: Optional[Listing]) -> Optional[Listing]:
         """
         Populate listing.rating if RatingDB is available.
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from src.utils.validation import Validation
-from src.db.offer.offer_db import OfferDB
+from src.db.offer.offer_db import OfferCounts, OfferDB
 from src.db.listing.listing_db import ListingDB
 from src.domain_models.offer import Offer
 
@@ -339,6 +339,72 @@ class IOffermanager(ABC):
         """
         raise NotImplementedError
 
+    # --------------------------------------------------
+    # READ (streaming exports)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def iter_offers_by_sender_id(self, sender_id: int) -> Iterator[Offer]:
+        """
+        PURPOSE:
+            Stream every offer a user has sent, for bulk export.
+
+        EXPECTED BEHAVIOR:
+            - sender_id is validated before the iterator is returned.
+            - Yield offers lazily; never materialize the full result.
+
+        IMPLEMENTATION NOTES:
+            - Calls OfferDB.iter_by_sender_id(sender_id)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_offers_received_by_seller(self, seller_id: int) -> Iterator[Offer]:
+        """
+        PURPOSE:
+            Stream every offer received on a seller's listings, for bulk export.
+
+        EXPECTED BEHAVIOR:
+            - seller_id is validated before the iterator is returned.
+            - Offers across all listings come from ONE streamed query,
+              not one query per listing.
+
+        IMPLEMENTATION NOTES:
+            - Resolve the seller's listing ids via ListingDB.get_by_seller_id().
+            - Calls OfferDB.iter_by_listing_ids(listing_ids)
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_offer_counts(self, account_id: int) -> OfferCounts:
+        """
+        PURPOSE:
+            Badge counters of an account: unseen and pending offers received
+            on its listings, and pending offers it sent.
+
+        EXPECTED BEHAVIOR:
+            - Counts match the lengths of get_offer_sellers_unseen(),
+              get_offer_sellers_pending() and the sender's pending offers.
+            - No offer rows are loaded.
+
+        IMPLEMENTATION NOTES:
+            - Calls OfferDB.count_by_state(account_id) once; the account's
+              listings are joined in that statement, not loaded first.
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
     # --------------------------------------------------
     # UPDATE
     # --------------------------------------------------
@@ -364,6 +430,31 @@ class IOffermanager(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def set_offers_seen(self, seller_id: int, offer_ids: Optional[List[int]] = None) -> List[Offer]:
+        """
+        PURPOSE:
+            Mark many offers received by a seller as seen at once
+            (offer_ids=None: every unseen offer on the seller's listings).
+
+        EXPECTED BEHAVIOR:
+            - Only offers on listings of seller_id are marked; other ids,
+              already-seen and missing offers are skipped, not errors.
+            - One OfferDB write transaction regardless of how many offers.
+
+        IMPLEMENTATION NOTES:
+            - Calls OfferDB.set_seen_many(seller_id, offer_ids) once; the
+              ownership check is part of that write.
+
+        RETURNS:
+            List[Offer]: the offers this call marked as seen
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def set_offer_accepted(self, offer_id: int, accepted: bool, actor_id: int) -> None:
         """
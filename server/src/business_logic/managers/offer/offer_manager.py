@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from typing_extensions import override
 
 from src.domain_models.listing import Listing
 from src.business_logic.managers.offer.abstract_offer_manager import IOffermanager
-from src.db.offer.offer_db import OfferDB
+from src.db.offer.offer_db import OfferCounts, OfferDB
 from src.db.listing.listing_db import ListingDB
 from src.domain_models.offer import Offer
 from src.utils import (
@@ -15,8 +15,18 @@ from src.utils import (
     UnapprovedBehaviorError,
     ListingNotFoundError,
     OfferNotFoundError,
+    ChangeVersions,
+    EventHub,
 )
 
+# Events published to the offer's parties (see EventHub)
+OFFER_CREATED = "offer.created"
+OFFER_RESOLVED = "offer.resolved"
+OFFER_SEEN = "offer.seen"
+OFFER_DELETED = "offer.deleted"
+# Published once to the seller by a bulk mark-seen, instead of one OFFER_SEEN per offer
+OFFERS_SEEN = "offers.seen"
+
 
 class OfferManager(IOffermanager):
     """
@@ -27,10 +37,24 @@ class OfferManager(IOffermanager):
     - Delegates persistence work to OfferDB and ListingDB.
     - Orchestrates aggregated reads across both DBs.
     - Does not write SQL.
+    - Bumps the sender's and seller's offer versions (ChangeVersions) on
+      every offer write, then publishes the matching event to them (EventHub).
+    - Offer writes change the listing's offer counters, so they also bump
+      the listing collection versions.
+    - listing_db should be the uncached ListingDB: every listing read here
+      decides a write (sold and ownership checks) or whose offers are shown.
     """
 
-    def __init__(self, offer_db: OfferDB, listing_db: ListingDB) -> None:
+    def __init__(
+        self,
+        offer_db: OfferDB,
+        listing_db: ListingDB,
+        change_versions: Optional[ChangeVersions] = None,
+        events: Optional[EventHub] = None,
+    ) -> None:
         super().__init__(offer_db, listing_db)
+        self._versions = change_versions or ChangeVersions.instance()
+        self._events = events or EventHub.instance()
 
     @override # pragma: no mutate
     def create_offer(self, offer: Offer) -> Offer:
@@ -64,7 +88,12 @@ class OfferManager(IOffermanager):
                 )
             # existing.accepted is False (rejected) — allow re-offer
 
-        return self._offer_db.add(offer)
+        created = self._offer_db.add(offer)
+        parties = (offer.sender_id, listing.seller_id)
+        self._versions.bump_offers(parties)
+        self._versions.bump_listings(listing.seller_id)
+        self._publish(parties, OFFER_CREATED, created.id, offer.listing_id, sender_id=offer.sender_id)
+        return created
 
     @override # pragma: no mutate
     def get_offer_by_id(self, offer_id: int) -> Optional[Offer]:
@@ -141,10 +170,45 @@ class OfferManager(IOffermanager):
         all_offers = self._offer_db.get_by_sender_id(sender_id)
         return [offer for offer in all_offers if offer.is_pending]
 
+    @override # pragma: no mutate
+    def iter_offers_by_sender_id(self, sender_id: int) -> Iterator[Offer]:
+        sender_id = Validation.require_int(sender_id, "sender_id")
+        return self._offer_db.iter_by_sender_id(sender_id)
+
+    @override # pragma: no mutate
+    def iter_offers_received_by_seller(self, seller_id: int) -> Iterator[Offer]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        listing_ids = [listing.id for listing in self._listing_db.get_by_seller_id(seller_id)]
+        return self._offer_db.iter_by_listing_ids(listing_ids)
+
+    @override # pragma: no mutate
+    def get_offer_counts(self, account_id: int) -> OfferCounts:
+        account_id = Validation.require_int(account_id, "account_id")
+        return self._offer_db.count_by_state(account_id)
+
     @override # pragma: no mutate
     def set_offer_seen(self, offer_id: int) -> None:
         offer_id = Validation.require_int(offer_id, "offer_id")
         self._offer_db.set_seen(offer_id)
+        offer = self._offer_db.get_by_id(offer_id)
+        parties = self._bump_offer_parties(offer)
+        if offer is not None:
+            self._publish(parties, OFFER_SEEN, offer.id, offer.listing_id)
+
+    @override # pragma: no mutate
+    def set_offers_seen(self, seller_id: int, offer_ids: Optional[List[int]] = None) -> List[Offer]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        if offer_ids is not None:
+            offer_ids = [Validation.require_int(i, "offer_id") for i in offer_ids]
+        marked = self._offer_db.set_seen_many(seller_id, offer_ids)
+        if not marked:
+            return marked
+
+        self._versions.bump_offers([seller_id, *(offer.sender_id for offer in marked)])
+        for offer in marked:
+            self._publish((offer.sender_id,), OFFER_SEEN, offer.id, offer.listing_id)
+        self._events.publish((seller_id,), OFFERS_SEEN, {"offer_ids": [offer.id for offer in marked]})
+        return marked
 
     @override # pragma: no mutate
     def set_offer_accepted(self, offer_id: int, accepted: bool, actor_id: int) -> None:
@@ -171,15 +235,50 @@ class OfferManager(IOffermanager):
             )
 
         self._offer_db.set_accepted(offer_id, accepted)
+        affected = [offer.sender_id, listing.seller_id]
+        declined: List[Offer] = []
 
         if accepted:
             pending_offers = self._offer_db.get_pending_by_listing_id(offer.listing_id)
             for other in pending_offers:
                 if other.id != offer_id:
                     self._offer_db.set_accepted(other.id, False)
+                    affected.append(other.sender_id)
+                    declined.append(other)
 
+        self._versions.bump_offers(affected)
+        self._versions.bump_listings(listing.seller_id)
+        self._publish(
+            (offer.sender_id, listing.seller_id), OFFER_RESOLVED, offer_id, offer.listing_id, accepted=accepted
+        )
+        for other in declined:
+            self._publish((other.sender_id,), OFFER_RESOLVED, other.id, offer.listing_id, accepted=False)
 
     @override # pragma: no mutate
     def delete_offer(self, offer_id: int) -> bool:
         offer_id = Validation.require_int(offer_id, "offer_id")
-        return self._offer_db.remove(offer_id)
+        offer = self._offer_db.get_by_id(offer_id)
+        deleted = self._offer_db.remove(offer_id)
+        if deleted:
+            parties = self._bump_offer_parties(offer)
+            self._versions.bump_listings(parties[1] if parties else None)
+            if offer is not None:
+                self._publish(parties, OFFER_DELETED, offer_id, offer.listing_id)
+        return deleted
+
+    def _bump_offer_parties(self, offer: Optional[Offer]) -> Tuple[Optional[int], ...]:
+        """Bump offer versions for the offer's sender and its listing's seller; returns them."""
+        if offer is None:
+            return ()
+        listing = self._listing_db.get_by_id(offer.listing_id)
+        seller_id = None if listing is None else listing.seller_id
+        parties = (offer.sender_id, seller_id)
+        self._versions.bump_offers(parties)
+        return parties
+
+    def _publish(self, account_ids: Iterable[Optional[int]], event_type: str,
+                 offer_id: int, listing_id: int, **extra: object) -> None:
+        """Publish event_type about one offer; ids only, clients refetch what they show."""
+        self._events.publish(
+            account_ids, event_type, {"offer_id": offer_id, "listing_id": listing_id, **extra}
+        )
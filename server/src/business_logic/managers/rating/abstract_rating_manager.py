@@ -102,6 +102,26 @@ class IRatingManager(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_ratings_by_listing_ids(self, listing_ids: List[int]) -> List[Rating]:
+        """
+        PURPOSE:
+            Fetch the ratings of many listings at once.
+
+        EXPECTED BEHAVIOR:
+            - One RatingDB.get_by_listing_ids() call, whatever the number of ids.
+            - Listings without a rating are absent from the result.
+            - Return empty list if none exist.
+
+        RETURNS:
+            list[Rating]
+
+        RAISES (typical):
+            - ValidationError
+            - DatabaseUnavailableError / DatabaseQueryError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_ratings_by_rater(self, rater_id: int) -> List[Rating]:
         """
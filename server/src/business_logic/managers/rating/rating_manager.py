@@ -42,6 +42,12 @@ class RatingManager(IRatingManager):
         listing_id = Validation.require_int(listing_id, "listing_id")
         return self._rating_db.get_by_listing_id(listing_id)
 
+    @override # pragma: no mutate
+    def get_ratings_by_listing_ids(self, listing_ids: List[int]) -> List[Rating]:
+        Validation.require_not_none(listing_ids, "listing_ids")
+        listing_ids = [Validation.require_int(i, "listing_id") for i in listing_ids]
+        return self._rating_db.get_by_listing_ids(listing_ids)
+
     @override # pragma: no mutate
     def list_ratings_by_rater(self, rater_id: int) -> List[Rating]:
         rater_id = Validation.require_int(rater_id, "rater_id")
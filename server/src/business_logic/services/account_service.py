@@ -5,6 +5,7 @@ import re
 
 from src.business_logic.managers.account.account_manager import AccountManager
 from src.business_logic.managers.rating import RatingManager
+from src.auth.password_hasher import PasswordHasher
 from src.api.errors import ApiError
 from src.domain_models import Account, VerificationToken
 from src.db.email_verification_token.mysql import MySQLEmailVerificationTokenDB
@@ -40,6 +41,7 @@ class AccountService:
         account_manager: AccountManager = None,
         token_db: MySQLEmailVerificationTokenDB = None,
         rating_manager: RatingManager = None,
+        password_hasher: PasswordHasher = None,
     ):
         """
         Initialize AccountService.
@@ -48,10 +50,15 @@ class AccountService:
             account_manager: Manager for account database operations (optional)
             token_db: Database layer for email verification tokens (optional)
             rating_manager: Manager for rating database operations (optional)
+            password_hasher: Hashes/verifies passwords off the request thread
+                             (optional, defaults to the process-wide hasher)
         """
         self.account_manager = account_manager
         self.token_db = token_db
         self.rating_manager = rating_manager
+        self.password_hasher = (
+            password_hasher if password_hasher is not None else PasswordHasher.instance()
+        )
 
     def create_account(
         self, email: str, password: str, fname: str, lname: str
@@ -71,7 +78,12 @@ class AccountService:
         email, password, fname, lname = self.validate_account(
             email, password, fname, lname
         )
-        account = Account(email=email, password=password, fname=fname, lname=lname)
+        account = Account(
+            email=email,
+            password=self.password_hasher.hash(password),
+            fname=fname,
+            lname=lname,
+        )
 
         try:
             created = self.account_manager.create_account(account)
@@ -270,12 +282,11 @@ class AccountService:
         if account is None:
             raise ApiError(status_code=401, message="Invalid email or password")
 
-        if account.password != password:
+        if not self.password_hasher.verify(password, account.password):
             raise ApiError(status_code=401, message="Invalid email or password")
 
-        # for when we implement password hashing
-        ## if not bcrypt.checkpw(password.encode(), account.password.encode()):
-        # raise ApiError(status_code=401, message="Invalid email or password")
+        if self.password_hasher.needs_rehash(account.password):
+            self._upgrade_password_hash(account, password)
 
         expiration = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=30) # pragma: no mutate
 
@@ -284,6 +295,17 @@ class AccountService:
         )
         return token
 
+    def _upgrade_password_hash(self, account: Account, password: str) -> None:
+        """Re-store a legacy plaintext (or outdated) password as a current hash.
+
+        Best effort: the login already succeeded, so a failure here is logged
+        and retried on the next login.
+        """
+        try:
+            self.account_manager.set_password_hash(account.id, self.password_hasher.hash(password))
+        except Exception as e:
+            logger.warning(f"Could not upgrade password hash for account {account.id}: {e}")
+
     def get_account_by_userid(self, userid: int) -> Account:
         if userid is None:
             raise ApiError(status_code=400, message="User ID cannot be None")
@@ -54,7 +54,7 @@ class CommentService:
         """
         actor: Account = self._account_manager.get_account_by_id(account_id=actor_id)
 
-        listing: Listing = self._listing_manager.get_listing_by_id(
+        listing: Listing = self._listing_manager.get_listing_for_write(
             listing_id=listing_id
         )
 
@@ -1,3 +1,5 @@
+from src.db import ListingProjection, ListingQuery, ListingRow
+from src.db.listing import ListingDetail, ListingFacets, ListingPage, SellerDashboard
 from src.domain_models.listing import Listing
 from src.domain_models.rating import Rating
 from src.utils.errors import (
@@ -5,10 +7,10 @@ from src.utils.errors import (
     DatabaseUnavailableError,
     DatabaseQueryError,
 )
-from src.utils import ListingNotFoundError, UnapprovedBehaviorError
+from src.utils import AccountNotFoundError, ListingNotFoundError, UnapprovedBehaviorError
 from src.api.errors import ApiError
 from urllib.parse import urlparse
-from typing import List
+from typing import Any, Dict, Iterator, List
 from src.business_logic.managers.listing import IListingManager
 from src.business_logic.managers.rating import RatingManager
 
@@ -38,9 +40,114 @@ class ListingService:
         """
         return self._listing_manager.list_listings_by_seller(user_id)
 
+    def get_all_listing_rows(self) -> List[ListingRow]:
+        """Get all listings as read-only row projections (list endpoints).
+
+        Returns:
+            List[ListingRow]: list of ListingRow
+        """
+        return self._listing_manager.list_listing_rows()
+
+    def get_listing_rows_by_user_id(self, user_id) -> List[ListingRow]:
+        """Get a seller's listings as read-only row projections (list endpoints).
+
+        Returns:
+            List[ListingRow]: list of ListingRow
+        """
+        return self._listing_manager.list_listing_rows_by_seller(user_id)
+
+    def get_listing_projections(
+        self, projection: ListingProjection, user_id: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """Get listings with only the projection's fields (sparse fieldsets / summary view).
+
+        Args:
+            projection (ListingProjection): columns to select, and description truncation.
+            user_id (int | None): Restrict to one seller. When None, every listing.
+
+        Returns:
+            List[Dict[str, Any]]: one dict per listing, holding only the projected fields
+        """
+        if user_id is None:
+            return self._listing_manager.list_listing_projections(projection)
+        return self._listing_manager.list_listing_projections_by_seller(user_id, projection)
+
+    def query_listings(self, query: ListingQuery) -> ListingPage:
+        """Get one page of listings matching a composable query.
+
+        Args:
+            query (ListingQuery): filters, sort and cursor, validated by ListingQuery.of.
+
+        Returns:
+            ListingPage: rows of the page, and the cursor of the next one (None on the last page)
+        """
+        return self._listing_manager.query_listing_rows(query)
+
+    def get_listing_facets(self) -> ListingFacets:
+        """Get per-location and price-bucket counts of unsold listings.
+
+        Returns:
+            ListingFacets: counts, cached until a listing changes
+        """
+        return self._listing_manager.get_unsold_facets()
+
+    def get_seller_dashboard(self, user_id: int) -> SellerDashboard:
+        """Get the signed-in seller's account, listings, ratings and pending offers.
+
+        Args:
+            user_id (int): The authenticated user; the dashboard is always their own.
+
+        Returns:
+            SellerDashboard: read in at most two queries
+
+        Raises:
+            AccountNotFoundError: the account no longer exists
+        """
+        dashboard = self._listing_manager.get_seller_dashboard(user_id)
+        if dashboard is None:
+            raise AccountNotFoundError(
+                message=f"Account not found for id: {user_id}",
+                details={"account_id": user_id},
+            )
+        return dashboard
+
+    def export_listings(self, seller_id: int | None = None) -> Iterator[Listing]:
+        """Stream listings for bulk export.
+
+        Args:
+            seller_id (int | None): Restrict the export to one seller. When None,
+                every listing is exported.
+
+        Returns:
+            Iterator[Listing]: lazily streamed listings (server-side cursor).
+        """
+        if seller_id is None:
+            return self._listing_manager.iter_listings()
+        return self._listing_manager.iter_listings_by_seller(seller_id)
+
     def get_listing_by_id(self, listing_id: int) -> Listing | None:
         return self._listing_manager.get_listing_by_id(listing_id)
 
+    def get_listing_detail(self, listing_id: int) -> ListingDetail:
+        """Get a listing with its rating and its comments' authors for the listing page.
+
+        Args:
+            listing_id (int): The listing to show.
+
+        Returns:
+            ListingDetail: read in at most two queries
+
+        Raises:
+            ListingNotFoundError: no listing has this id
+        """
+        detail = self._listing_manager.get_listing_detail(listing_id)
+        if detail is None:
+            raise ListingNotFoundError(
+                message=f"Listing not found for id: {listing_id}",
+                details={"listing_id": listing_id},
+            )
+        return detail
+
     def get_listing_rating(self, listing_id: int) -> Rating | None:
         listing = self._listing_manager.get_listing_by_id(listing_id)
         if listing is None:
@@ -51,6 +158,18 @@ class ListingService:
 
         return self._rating_manager.get_rating_by_listing_id(listing_id)
 
+    def get_listing_ratings(self, listing_ids: List[int]) -> Dict[int, Rating | None]:
+        """Ratings of many listings in one query, keyed by every requested id.
+
+        Unlike get_listing_rating, listing existence is not checked: a listing
+        that is unrated and one that does not exist both map to None.
+        """
+        ratings = {
+            rating.listing_id: rating
+            for rating in self._rating_manager.get_ratings_by_listing_ids(list(dict.fromkeys(listing_ids)))
+        }
+        return {listing_id: ratings.get(listing_id) for listing_id in listing_ids}
+
     def search_listings(self, query: str) -> List[Listing]:
         """Search listings by keywords across title, description, and location.
 
@@ -164,7 +283,7 @@ class ListingService:
         Returns:
             Rating: The created rating domain model.
         """
-        listing = self._listing_manager.get_listing_by_id(listing_id)
+        listing = self._listing_manager.get_listing_for_write(listing_id)
         if listing is None:
             raise ListingNotFoundError(
                 message=f"Listing not found for id: {listing_id}",
@@ -337,13 +456,17 @@ class ListingService:
             ValidationError: If the location is empty.
 
         Returns:
-            str: The validated location.
+            str: The validated location, whitespace runs collapsed to one space.
         """
         if not location:
             self._add_error(errors, "location", "Location cannot be empty.")
             return ""
 
-        normalized_location = location.strip()
+        normalized_location = " ".join(location.split())
+        if Listing.location_key_of(normalized_location) is None:
+            # Nothing to match or facet on (e.g. "---")
+            self._add_error(errors, "location", "Location must contain letters or digits.")
+            return ""
         if len(normalized_location) > self.MAX_LOCATION_LENGTH:
             self._add_error(
                 errors,
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List, Optional
 
 from src.business_logic.managers.offer.abstract_offer_manager import IOffermanager
 from src.business_logic.managers.listing.abstract_listing_manager import IListingManager
 from src.business_logic.managers.account.abstract_account_manager import IAccountManager
+from src.db.offer import OfferCounts
 from src.domain_models.offer import Offer
-from src.utils import OfferNotFoundError, ListingNotFoundError, UnapprovedBehaviorError
+from src.utils import (
+    OfferNotFoundError,
+    ListingNotFoundError,
+    UnapprovedBehaviorError,
+    ValidationError,
+)
 
 
 class OfferService:
@@ -53,9 +59,32 @@ class OfferService:
     def get_pending_offers_with_listing_by_sender(self, sender_id: int) -> List[Offer]:
         return self._offer_manager.get_pending_offers_with_listing_by_sender(sender_id)
 
+    def get_offer_counts(self, account_id: int) -> OfferCounts:
+        return self._offer_manager.get_offer_counts(account_id)
+
+    def export_offers(self, user_id: int, scope: str = "received") -> Iterator[Offer]:
+        """
+        Stream a user's offer history for bulk export.
+
+        scope:
+        - "received": offers on listings the user is selling.
+        - "sent": offers the user has sent.
+        """
+        if scope == "received":
+            return self._offer_manager.iter_offers_received_by_seller(user_id)
+        if scope == "sent":
+            return self._offer_manager.iter_offers_by_sender_id(user_id)
+        raise ValidationError(
+            message="scope must be 'received' or 'sent'.",
+            details={"scope": scope},
+        )
+
     def set_offer_seen(self, offer_id: int) -> None:
         self._offer_manager.set_offer_seen(offer_id)
 
+    def set_offers_seen(self, seller_id: int, offer_ids: Optional[List[int]] = None) -> List[Offer]:
+        return self._offer_manager.set_offers_seen(seller_id, offer_ids)
+
     def resolve_offer(self, offer_id: int, accepted: bool, actor_id: int) -> None:
         """
         Accept or decline an offer.
@@ -72,7 +101,7 @@ class OfferService:
 
         if accepted:
             actor = self._account_manager.get_account_by_id(actor_id)
-            listing = self._listing_manager.get_listing_by_id(offer.listing_id)
+            listing = self._listing_manager.get_listing_for_write(offer.listing_id)
             if listing is None:
                 raise ListingNotFoundError(
                     message=f"Listing {offer.listing_id} not found."
@@ -1,6 +1,8 @@
 from .utils.db_utils import DBUtility
 from .utils.account_mapper import AccountMapper
 from .email_verification_token import EmailVerificationTokenDB
+from .utils.listing_row import LISTING_ROW_FIELDS, ListingProjection, ListingRow
+from .utils.listing_query import LISTING_SORTS, ListingCursor, ListingQuery
 from .utils.listing_mapper import ListingMapper
 from .utils.comment_mapper import CommentMapper
 from .utils.offer_mapper import OfferMapper
@@ -1 +1 @@
-from .account_db import AccountDB
\ No newline at end of file
+from .account_db import AccountDB, AccountFootprint
\ No newline at end of file
@@ -1,12 +1,21 @@
 # src/persistence/account_db.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, List
 
 from src.db import DBUtility
 from src.domain_models import Account
 
 
+@dataclass(frozen=True, slots=True)
+class AccountFootprint:
+    """Accounts whose listing / offer views change when one account is deleted."""
+
+    sellers: FrozenSet[int]         # sellers whose listings are deleted or lose counts
+    offer_accounts: FrozenSet[int]  # accounts whose sent or received offers are deleted
+
+
 class AccountDB(ABC):
     """
     Contract for Account table persistence.
@@ -81,6 +90,9 @@ class AccountDB(ABC):
         - Return None if no matching row exists.
         - Must NOT raise exception for "not found".
         - Must raise exception for database errors.
+        - The delete cascades to the account's comments and offers; in the
+          same transaction, before the DELETE, decrement comment_count,
+          offer_count and pending_offer_count of every listing they were on.
         """
         raise NotImplementedError
 
@@ -124,6 +136,39 @@ class AccountDB(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def set_password(self, account_id: int, password_hash: str) -> None:
+        """
+        Replace the stored password hash.
+
+        Expected behavior:
+        - Update the password column for given ID.
+        - If ID does not exist:
+               raise AccountNotFoundError
+        - Must raise an exception if a database error occurs.
+
+        Constraints / notes:
+        - password_hash must already be hashed (see PasswordHasher);
+          this layer stores whatever it is given.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_footprint(self, account_id: int) -> AccountFootprint:
+        """
+        Collect the accounts a remove(account_id) would affect.
+
+        Expected behavior:
+        - sellers: account_id itself, the sellers of listings the account
+          commented or offered on, and the sellers of listings it bought
+          (those cascade away with it).
+        - offer_accounts: account_id itself, the sellers of listings it
+          offered on, and the senders of offers on listings it sold or bought.
+        - An unknown account_id yields only account_id in both sets.
+        - Must raise an exception if a database error occurs.
+        """
+        raise NotImplementedError
+
     # --------------------------------------------------
     # DELETE
     # --------------------------------------------------
@@ -138,5 +183,8 @@ class AccountDB(ABC):
         - Return False if no row matched the ID.
         - Must NOT raise exception for "not found".
         - Must raise exception for database errors.
+        - The delete cascades to the account's comments and offers; in the
+          same transaction, before the DELETE, decrement comment_count,
+          offer_count and pending_offer_count of every listing they were on.
         """
         raise NotImplementedError
@@ -6,6 +6,7 @@ and converted into DatabaseUnavailableError.
 This class only handles query-level failures.
 """
 from __future__ import annotations
+from collections import Counter
 from typing import Optional, List
 
 from sqlalchemy import text
@@ -13,9 +14,10 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing_extensions import override
 
 from src.db import DBUtility, AccountMapper
-from src.db.account import AccountDB
+from src.db.account import AccountDB, AccountFootprint
 from src.domain_models import Account
 from src.utils import (Validation, AccountAlreadyExistsError, DatabaseQueryError, AccountNotFoundError)
+from src.db.utils.transaction_retry import transactional
 
 
 class MySQLAccountDB(AccountDB):
@@ -26,6 +28,7 @@ class MySQLAccountDB(AccountDB):
     # CREATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def add(self, account: Account) -> Account:
         Validation.require_not_none(account, "account")
 
@@ -134,6 +137,7 @@ class MySQLAccountDB(AccountDB):
     # UPDATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def set_verified(self, account_id: int, verified: bool) -> None:
         Validation.require_int(account_id, "account_id")
         Validation.is_boolean(verified, "verified")
@@ -160,6 +164,33 @@ class MySQLAccountDB(AccountDB):
             ) from e
 
     @override
+    @transactional(retry_safe=True)
+    def set_password(self, account_id: int, password_hash: str) -> None:
+        Validation.require_int(account_id, "account_id")
+        password_hash = Validation.require_str(password_hash, "password_hash")
+
+        sql = text("""
+                   UPDATE account
+                   SET password = :password
+                   WHERE id = :id
+                   """)
+
+        try:
+            with self._db.transaction() as conn:
+                result = conn.execute(sql, {"password": password_hash, "id": account_id})
+                if int(result.rowcount or 0) == 0:
+                    raise AccountNotFoundError(
+                        message=f"Account not found for id: {account_id}",
+                        details={"account_id": account_id},
+                    )
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to update account password.",
+                details={"op": "set_password", "table": "account"},
+            ) from e
+
+    @override
+    @transactional(retry_safe=True)
     def set_verified_by_email(self, email: str, verified: bool) -> None:
         email = Validation.valid_email(email)
         Validation.is_boolean(verified, "verified")
@@ -184,13 +215,87 @@ class MySQLAccountDB(AccountDB):
                 details={"op": "set_verified_by_email", "table": "account"},
             ) from e
 
+    @override
+    def get_footprint(self, account_id: int) -> AccountFootprint:
+        Validation.require_int(account_id, "account_id")
+
+        sellers_sql = text("""
+                           SELECT l.seller_id
+                           FROM comment c
+                                    JOIN listing l ON l.id = c.listing_id
+                           WHERE c.author_id = :id
+                           UNION
+                           SELECT l.seller_id
+                           FROM offer o
+                                    JOIN listing l ON l.id = o.listing_id
+                           WHERE o.sender_id = :id
+                           UNION
+                           SELECT seller_id
+                           FROM listing
+                           WHERE sold_to_id = :id
+                           """)
+        offer_accounts_sql = text("""
+                                  SELECT l.seller_id
+                                  FROM offer o
+                                           JOIN listing l ON l.id = o.listing_id
+                                  WHERE o.sender_id = :id
+                                     OR l.sold_to_id = :id
+                                  UNION
+                                  SELECT o.sender_id
+                                  FROM offer o
+                                           JOIN listing l ON l.id = o.listing_id
+                                  WHERE l.seller_id = :id
+                                     OR l.sold_to_id = :id
+                                  """)
+
+        try:
+            with self._db.connect() as conn:
+                sellers = {int(i) for i in conn.execute(sellers_sql, {"id": account_id}).scalars()}
+                offer_accounts = {
+                    int(i) for i in conn.execute(offer_accounts_sql, {"id": account_id}).scalars()
+                }
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch account footprint.",
+                details={"op": "get_footprint", "table": "account"},
+            ) from e
+
+        return AccountFootprint(
+            sellers=frozenset(sellers | {account_id}),
+            offer_accounts=frozenset(offer_accounts | {account_id}),
+        )
+
     # -----------------------------
     # DELETE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def remove(self, account_id: int) -> bool:
         Validation.require_int(account_id, "account_id")
 
+        # The DELETE cascades to the account's comments and offers on other
+        # sellers' listings, which bypasses the counter upkeep in the comment
+        # and offer writes. Lock those rows first (the order MySQLCommentDB /
+        # MySQLOfferDB.remove use), then decrement each listing in id order.
+        comments_sql = text("""
+                            SELECT listing_id
+                            FROM comment
+                            WHERE author_id = :id
+                            FOR UPDATE
+                            """)
+        offers_sql = text("""
+                          SELECT listing_id, accepted
+                          FROM offer
+                          WHERE sender_id = :id
+                          FOR UPDATE
+                          """)
+        count_sql = text("""
+                         UPDATE listing
+                         SET comment_count = GREATEST(comment_count, :comments) - :comments,
+                             offer_count = GREATEST(offer_count, :offers) - :offers,
+                             pending_offer_count = GREATEST(pending_offer_count, :pending) - :pending
+                         WHERE id = :listing_id
+                         """)
         sql = text("""
                    DELETE
                    FROM account
@@ -199,6 +304,27 @@ class MySQLAccountDB(AccountDB):
 
         try:
             with self._db.transaction() as conn:
+                comments = Counter(
+                    int(listing_id) for listing_id in conn.execute(comments_sql, {"id": account_id}).scalars()
+                )
+                offers: Counter = Counter()
+                pending: Counter = Counter()
+                for row in conn.execute(offers_sql, {"id": account_id}).mappings():
+                    offers[int(row["listing_id"])] += 1
+                    if row["accepted"] is None:
+                        pending[int(row["listing_id"])] += 1
+
+                for listing_id in sorted(comments.keys() | offers.keys()):
+                    conn.execute(
+                        count_sql,
+                        {
+                            "listing_id": listing_id,
+                            "comments": comments[listing_id],
+                            "offers": offers[listing_id],
+                            "pending": pending[listing_id],
+                        },
+                    )
+
                 result = conn.execute(sql, {"id": account_id})
                 return (result.rowcount or 0) > 0
         except SQLAlchemyError as e:
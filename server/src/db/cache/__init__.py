@@ -0,0 +1,8 @@
+from .cache_backend import CacheBackend
+from .memory_cache import InMemoryCacheBackend
+from .shared_cache import SharedCacheBackend
+from .repository_cache import RepositoryCache
+from .cached_listing_db import CachedListingDB
+from .cached_account_db import CachedAccountDB
+from .cached_rating_db import CachedRatingDB
+from .cached_comment_db import CachedCommentDB
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import pickle
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheBackend(ABC):
+    """
+    Byte-valued key/value store behind the Cached*DB decorators.
+
+    Design:
+    - Values are opaque bytes (the decorators pickle domain objects), so a
+      hit always hands back a fresh copy. Callers mutate the entities they
+      read (e.g. listing.mark_sold()), and a shared cached instance would
+      leak those edits into other requests.
+    - Keys are "<namespace>:<...>" (e.g. "listing:42"). Hits and misses are
+      counted per namespace and reported by stats().
+    - A backend must never raise on a lookup or an invalidation just because
+      the cache is unreachable; the DB remains the source of truth.
+    """
+
+    name = "cache"
+
+    def __init__(self, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._ttl_seconds = ttl_seconds
+        self._stats_lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._invalidations = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    # -----------------------------
+    # Public API (counts metrics)
+    # -----------------------------
+    def get(self, key: str) -> Optional[bytes]:
+        value = self._get(key)
+        counter = self._misses if value is None else self._hits
+        namespace = key.split(":", 1)[0]
+        with self._stats_lock:
+            counter[namespace] = counter.get(namespace, 0) + 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store value; ttl_seconds shortens (never extends) the backend TTL for this entry."""
+        ttl = self._ttl_seconds if ttl_seconds is None else min(ttl_seconds, self._ttl_seconds)
+        self._set(key, value, ttl)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        self._delete(keys)
+        with self._stats_lock:
+            self._invalidations += len(keys)
+
+    def clear(self) -> None:
+        self._clear()
+        with self._stats_lock:
+            self._invalidations += 1
+
+    def read_through(
+        self, key: str, load: Callable[[], Optional[T]], ttl_seconds: Optional[float] = None
+    ) -> Optional[T]:
+        """
+        Return the cached value for key, or call load() and cache its result.
+
+        None results ("not found") are not cached, so a row created later is
+        visible immediately. ttl_seconds is passed on to set().
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+
+        value = load()
+        if value is not None:
+            self.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ttl_seconds)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters per namespace."""
+        with self._stats_lock:
+            hits = dict(self._hits)
+            misses = dict(self._misses)
+            invalidations = self._invalidations
+
+        namespaces = {}
+        for namespace in sorted(set(hits) | set(misses)):
+            h, m = hits.get(namespace, 0), misses.get(namespace, 0)
+            namespaces[namespace] = {
+                "hits": h,
+                "misses": m,
+                "hit_ratio": round(h / (h + m), 4) if h + m else 0.0,
+            }
+
+        return {
+            "backend": self.name,
+            "ttl_seconds": self._ttl_seconds,
+            "invalidations": invalidations,
+            "namespaces": namespaces,
+        }
+
+    # -----------------------------
+    # Storage (implemented by backends)
+    # -----------------------------
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, keys: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _clear(self) -> None:
+        raise NotImplementedError
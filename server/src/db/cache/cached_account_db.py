@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from typing_extensions import override
+
+from src.db.account import AccountDB, AccountFootprint
+from src.db.cache.cache_backend import CacheBackend
+from src.domain_models import Account
+
+
+class CachedAccountDB(AccountDB):
+    """
+    Cache invalidation in front of another AccountDB.
+
+    Account rows are NOT cached: every Account carries the password hash,
+    and copying it into a shared cache (Redis) widens where it can leak.
+    All reads and writes go straight to the wrapped DB.
+
+    Invalidation:
+    - remove() clears the whole cache: the row cascades to the account's
+      listings, ratings and comments, whose ids this layer does not know.
+      Account deletion is rare enough for that to be cheap.
+    """
+
+    def __init__(self, inner: AccountDB, cache: CacheBackend) -> None:
+        super().__init__(inner._db)
+        self._inner = inner
+        self._cache = cache
+
+    @override
+    def add(self, account: Account) -> Account:
+        return self._inner.add(account)
+
+    @override
+    def get_by_id(self, account_id: int) -> Optional[Account]:
+        return self._inner.get_by_id(account_id)
+
+    @override
+    def get_by_email(self, email: str) -> Optional[Account]:
+        return self._inner.get_by_email(email)
+
+    @override
+    def get_all(self) -> List[Account]:
+        return self._inner.get_all()
+
+    @override
+    def set_verified(self, account_id: int, verified: bool) -> None:
+        self._inner.set_verified(account_id, verified)
+
+    @override
+    def set_verified_by_email(self, email: str, verified: bool) -> None:
+        self._inner.set_verified_by_email(email, verified)
+
+    @override
+    def set_password(self, account_id: int, password_hash: str) -> None:
+        self._inner.set_password(account_id, password_hash)
+
+    @override
+    def get_footprint(self, account_id: int) -> AccountFootprint:
+        return self._inner.get_footprint(account_id)
+
+    @override
+    def remove(self, account_id: int) -> bool:
+        try:
+            return self._inner.remove(account_id)
+        finally:
+            self._cache.clear()
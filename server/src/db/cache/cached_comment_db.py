@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from typing_extensions import override
+
+from src.db.cache import keys
+from src.db.cache.cache_backend import CacheBackend
+from src.db.comment import CommentDB
+from src.domain_models import Comment
+
+
+class CachedCommentDB(CommentDB):
+    """
+    Invalidating wrapper around another CommentDB.
+
+    No comment read is cached on its own; comments are only cached inside
+    the listing detail (CachedListingDB.get_listing_detail). Every write
+    drops the detail of the listing it touches; writes addressed by comment
+    id look the comment up first to learn its listing.
+    """
+
+    def __init__(self, inner: CommentDB, cache: CacheBackend) -> None:
+        super().__init__(inner._db)
+        self._inner = inner
+        self._cache = cache
+
+    def _listing_id_of(self, comment_id: int) -> Optional[int]:
+        comment = self._inner.get_by_id(comment_id)
+        return None if comment is None else comment.listing_id
+
+    def _invalidate(self, listing_id: Optional[int]) -> None:
+        if listing_id is not None:
+            self._cache.delete([keys.listing_detail(listing_id)])
+
+    # -----------------------------
+    # CREATE
+    # -----------------------------
+    @override
+    def add(self, comment: Comment) -> Comment:
+        try:
+            return self._inner.add(comment)
+        finally:
+            self._invalidate(getattr(comment, "listing_id", None))
+
+    # -----------------------------
+    # READ (pass-through)
+    # -----------------------------
+    @override
+    def get_by_id(self, comment_id: int) -> Optional[Comment]:
+        return self._inner.get_by_id(comment_id)
+
+    @override
+    def get_by_listing_id(self, listing_id: int) -> List[Comment]:
+        return self._inner.get_by_listing_id(listing_id)
+
+    @override
+    def get_by_author_id(self, author_id: int) -> List[Comment]:
+        return self._inner.get_by_author_id(author_id)
+
+    # -----------------------------
+    # UPDATE
+    # -----------------------------
+    @override
+    def update_body(self, comment_id: int, body: str | None) -> None:
+        listing_id = self._listing_id_of(comment_id)
+        try:
+            self._inner.update_body(comment_id, body)
+        finally:
+            self._invalidate(listing_id)
+
+    # -----------------------------
+    # DELETE
+    # -----------------------------
+    @override
+    def remove(self, comment_id: int) -> bool:
+        listing_id = self._listing_id_of(comment_id)
+        try:
+            return self._inner.remove(comment_id)
+        finally:
+            self._invalidate(listing_id)
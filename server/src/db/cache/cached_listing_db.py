@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from typing_extensions import override
+
+from src.db import ListingProjection, ListingQuery, ListingRow
+from src.db.cache.cache_backend import CacheBackend
+from src.db.cache import keys
+from src.db.listing import ListingDB, ListingDetail, ListingFacets, ListingPage, SellerDashboard
+from src.domain_models import Listing
+
+
+class CachedListingDB(ListingDB):
+    """
+    Read-through cache in front of another ListingDB.
+
+    Cached reads:
+    - get_by_id          -> keys.listing(listing_id)
+    - get_by_seller_id   -> keys.seller_listings(seller_id)
+    - get_listing_detail -> keys.listing_detail(listing_id), for at most
+      detail_ttl_seconds. The entry also holds the rating and comments, so
+      CachedRatingDB and CachedCommentDB drop it on their writes; offer
+      writes only move its counters and are left to the short TTL.
+
+    Every other read goes straight to the wrapped DB. Writes go to the
+    wrapped DB first and then drop exactly the keys they can have changed,
+    even if the write raised. Deleting a listing cascades to its rating, so
+    remove() also drops the rating cached for that listing.
+
+    A read that races a write can still store the pre-write row; the TTL
+    bounds how long that copy survives.
+    """
+
+    def __init__(self, inner: ListingDB, cache: CacheBackend, detail_ttl_seconds: float = 5.0) -> None:
+        super().__init__(inner._db)
+        self._inner = inner
+        self._cache = cache
+        self._detail_ttl_seconds = detail_ttl_seconds
+
+    def _seller_id_of(self, listing_id: int) -> Optional[int]:
+        listing = self.get_by_id(listing_id)
+        return None if listing is None else listing.seller_id
+
+    def _invalidate(self, listing_id: Optional[int], seller_id: Optional[int]) -> None:
+        stale = []
+        if listing_id is not None:
+            stale.append(keys.listing(listing_id))
+            stale.append(keys.listing_detail(listing_id))
+        if seller_id is not None:
+            stale.append(keys.seller_listings(seller_id))
+        self._cache.delete(stale)
+
+    # -----------------------------
+    # CREATE
+    # -----------------------------
+    @override
+    def add(self, listing: Listing) -> Listing:
+        try:
+            return self._inner.add(listing)
+        finally:
+            self._invalidate(None, getattr(listing, "seller_id", None))
+
+    # -----------------------------
+    # READ (cached)
+    # -----------------------------
+    @override
+    def get_by_id(self, listing_id: int) -> Optional[Listing]:
+        return self._cache.read_through(
+            keys.listing(listing_id), lambda: self._inner.get_by_id(listing_id)
+        )
+
+    @override
+    def get_by_seller_id(self, seller_id: int) -> List[Listing]:
+        return self._cache.read_through(
+            keys.seller_listings(seller_id), lambda: self._inner.get_by_seller_id(seller_id)
+        )
+
+    @override
+    def get_listing_detail(self, listing_id: int) -> Optional[ListingDetail]:
+        return self._cache.read_through(
+            keys.listing_detail(listing_id),
+            lambda: self._inner.get_listing_detail(listing_id),
+            ttl_seconds=self._detail_ttl_seconds,
+        )
+
+    # -----------------------------
+    # READ (pass-through)
+    # -----------------------------
+    @override
+    def get_all(self) -> List[Listing]:
+        return self._inner.get_all()
+
+    @override
+    def get_by_buyer_id(self, buyer_id: int) -> List[Listing]:
+        return self._inner.get_by_buyer_id(buyer_id)
+
+    @override
+    def get_unsold(self) -> List[Listing]:
+        return self._inner.get_unsold()
+
+    @override
+    def get_recent_unsold(self, limit: int = 50, offset: int = 0) -> List[Listing]:
+        return self._inner.get_recent_unsold(limit=limit, offset=offset)
+
+    @override
+    def get_unsold_by_location(self, location: str) -> List[Listing]:
+        return self._inner.get_unsold_by_location(location)
+
+    @override
+    def get_unsold_by_max_price(self, max_price: float) -> List[Listing]:
+        return self._inner.get_unsold_by_max_price(max_price)
+
+    @override
+    def get_unsold_by_location_and_max_price(self, location: str, max_price: float) -> List[Listing]:
+        return self._inner.get_unsold_by_location_and_max_price(location, max_price)
+
+    @override
+    def get_unsold_facets(self) -> ListingFacets:
+        # Memoized per listings version by ListingManager, which sees every
+        # write (this decorator only sees its own process's writes).
+        return self._inner.get_unsold_facets()
+
+    @override
+    def find_unsold_by_title_keyword(self, keyword: str, limit: int = 50, offset: int = 0) -> List[Listing]:
+        return self._inner.find_unsold_by_title_keyword(keyword, limit=limit, offset=offset)
+
+    @override
+    def get_all_rows(self) -> List[ListingRow]:
+        return self._inner.get_all_rows()
+
+    @override
+    def get_rows_by_seller_id(self, seller_id: int) -> List[ListingRow]:
+        return self._inner.get_rows_by_seller_id(seller_id)
+
+    @override
+    def get_all_projected(self, projection: ListingProjection) -> List[Dict[str, Any]]:
+        return self._inner.get_all_projected(projection)
+
+    @override
+    def get_projected_by_seller_id(
+        self, seller_id: int, projection: ListingProjection
+    ) -> List[Dict[str, Any]]:
+        return self._inner.get_projected_by_seller_id(seller_id, projection)
+
+    @override
+    def query_rows(self, query: ListingQuery) -> ListingPage:
+        return self._inner.query_rows(query)
+
+    @override
+    def get_seller_dashboard(self, seller_id: int) -> Optional[SellerDashboard]:
+        return self._inner.get_seller_dashboard(seller_id)
+
+    @override
+    def iter_all(self) -> Iterator[Listing]:
+        return self._inner.iter_all()
+
+    @override
+    def iter_by_seller_id(self, seller_id: int) -> Iterator[Listing]:
+        return self._inner.iter_by_seller_id(seller_id)
+
+    # -----------------------------
+    # UPDATE
+    # -----------------------------
+    @override
+    def update(self, listing: Listing) -> Listing:
+        try:
+            return self._inner.update(listing)
+        finally:
+            self._invalidate(getattr(listing, "id", None), getattr(listing, "seller_id", None))
+
+    @override
+    def set_sold(self, listing_id: int, is_sold: bool, sold_to_id: Optional[int]) -> None:
+        seller_id = self._seller_id_of(listing_id)
+        try:
+            self._inner.set_sold(listing_id, is_sold, sold_to_id)
+        finally:
+            self._invalidate(listing_id, seller_id)
+
+    @override
+    def set_price(self, listing_id: int, price: float) -> None:
+        seller_id = self._seller_id_of(listing_id)
+        try:
+            self._inner.set_price(listing_id, price)
+        finally:
+            self._invalidate(listing_id, seller_id)
+
+    @override
+    def reconcile_activity_counts(self, after_id: int, limit: int) -> Tuple[int, Optional[int]]:
+        # Cached Listing objects carry no counters; nothing to drop
+        return self._inner.reconcile_activity_counts(after_id, limit)
+
+    # -----------------------------
+    # DELETE
+    # -----------------------------
+    @override
+    def remove(self, listing_id: int) -> bool:
+        seller_id = self._seller_id_of(listing_id)
+        try:
+            return self._inner.remove(listing_id)
+        finally:
+            self._invalidate(listing_id, seller_id)
+            self._cache.delete([keys.listing_rating(listing_id)])
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from typing_extensions import override
+
+from src.db.cache import keys
+from src.db.cache.cache_backend import CacheBackend
+from src.db.rating import RatingDB
+from src.domain_models import Rating
+
+
+class CachedRatingDB(RatingDB):
+    """
+    Read-through cache in front of another RatingDB.
+
+    Cached reads:
+    - get_by_listing_id -> keys.listing_rating(listing_id)
+
+    Aggregates (averages, sums, counts) and list reads pass straight
+    through. Every write drops the rating key (and the listing detail,
+    which embeds the rating) of each listing it touches;
+    writes addressed by rating id look the rating up first to learn its
+    listing, and update() drops both the old and the new listing.
+    """
+
+    def __init__(self, inner: RatingDB, cache: CacheBackend) -> None:
+        super().__init__(inner._db)
+        self._inner = inner
+        self._cache = cache
+
+    def _listing_id_of(self, rating_id: int) -> Optional[int]:
+        rating = self._inner.get_by_id(rating_id)
+        return None if rating is None else rating.listing_id
+
+    def _invalidate(self, *listing_ids: Optional[int]) -> None:
+        self._cache.delete(
+            {
+                key
+                for listing_id in listing_ids
+                if listing_id is not None
+                for key in (keys.listing_rating(listing_id), keys.listing_detail(listing_id))
+            }
+        )
+
+    # -----------------------------
+    # Stats (pass-through)
+    # -----------------------------
+    @override
+    def get_average_rating_by_account_id(self, account_id: int) -> float | None:
+        return self._inner.get_average_rating_by_account_id(account_id)
+
+    @override
+    def get_sum_of_ratings_given_by_account_id(self, account_id: int) -> int:
+        return self._inner.get_sum_of_ratings_given_by_account_id(account_id)
+
+    @override
+    def count_ratings_received_by_account_id(self, account_id: int) -> int:
+        return self._inner.count_ratings_received_by_account_id(account_id)
+
+    @override
+    def get_sum_of_ratings_received_by_account_id(self, account_id: int) -> int:
+        return self._inner.get_sum_of_ratings_received_by_account_id(account_id)
+
+    @override
+    def get_average_for_rater(self, rater_id: int) -> Optional[float]:
+        return self._inner.get_average_for_rater(rater_id)
+
+    @override
+    def count_by_rater(self, rater_id: int) -> int:
+        return self._inner.count_by_rater(rater_id)
+
+    # -----------------------------
+    # CREATE
+    # -----------------------------
+    @override
+    def add(self, rating: Rating) -> Rating:
+        try:
+            return self._inner.add(rating)
+        finally:
+            self._invalidate(getattr(rating, "listing_id", None))
+
+    # -----------------------------
+    # READ
+    # -----------------------------
+    @override
+    def get_by_listing_id(self, listing_id: int) -> Optional[Rating]:
+        return self._cache.read_through(
+            keys.listing_rating(listing_id), lambda: self._inner.get_by_listing_id(listing_id)
+        )
+
+    @override
+    def get_by_listing_ids(self, listing_ids: List[int]) -> List[Rating]:
+        return self._inner.get_by_listing_ids(listing_ids)
+
+    @override
+    def get_by_id(self, rating_id: int) -> Optional[Rating]:
+        return self._inner.get_by_id(rating_id)
+
+    @override
+    def get_by_rater_id(self, rater_id: int) -> List[Rating]:
+        return self._inner.get_by_rater_id(rater_id)
+
+    @override
+    def get_all(self) -> List[Rating]:
+        return self._inner.get_all()
+
+    @override
+    def get_recent(self, limit: int = 50, offset: int = 0) -> List[Rating]:
+        return self._inner.get_recent(limit=limit, offset=offset)
+
+    @override
+    def get_by_score(self, transaction_rating: int) -> List[Rating]:
+        return self._inner.get_by_score(transaction_rating)
+
+    # -----------------------------
+    # UPDATE
+    # -----------------------------
+    @override
+    def update(self, rating: Rating) -> Rating:
+        rating_id = getattr(rating, "id", None)
+        old_listing_id = None if rating_id is None else self._listing_id_of(rating_id)
+        try:
+            return self._inner.update(rating)
+        finally:
+            self._invalidate(old_listing_id, getattr(rating, "listing_id", None))
+
+    @override
+    def set_score(self, rating_id: int, transaction_rating: int) -> None:
+        listing_id = self._listing_id_of(rating_id)
+        try:
+            self._inner.set_score(rating_id, transaction_rating)
+        finally:
+            self._invalidate(listing_id)
+
+    # -----------------------------
+    # DELETE
+    # -----------------------------
+    @override
+    def remove(self, rating_id: int) -> bool:
+        listing_id = self._listing_id_of(rating_id)
+        try:
+            return self._inner.remove(rating_id)
+        finally:
+            self._invalidate(listing_id)
+
+    @override
+    def remove_by_listing_id(self, listing_id: int) -> bool:
+        try:
+            return self._inner.remove_by_listing_id(listing_id)
+        finally:
+            self._invalidate(listing_id)
@@ -0,0 +1,20 @@
+"""Cache key builders shared by the Cached*DB decorators.
+
+The first ":"-separated segment is the namespace used for hit/miss stats.
+"""
+
+
+def listing(listing_id: int) -> str:
+    return f"listing:{listing_id}"
+
+
+def listing_detail(listing_id: int) -> str:
+    return f"listing_detail:{listing_id}"
+
+
+def seller_listings(seller_id: int) -> str:
+    return f"listing:seller:{seller_id}"
+
+
+def listing_rating(listing_id: int) -> str:
+    return f"rating:listing:{listing_id}"
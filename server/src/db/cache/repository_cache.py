@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Optional
+
+from src.db.cache.cache_backend import CacheBackend
+from src.db.cache.memory_cache import InMemoryCacheBackend
+from src.db.cache.shared_cache import SharedCacheBackend
+from src.utils import ConfigurationError
+
+
+class RepositoryCache:
+    """
+    Process-wide cache backend used by the Cached*DB decorators.
+
+    Configured from the environment on first use:
+    - REPO_CACHE_BACKEND      memory (default) | shared | off
+    - REPO_CACHE_TTL_SECONDS  entry lifetime, default 30
+    - REPO_CACHE_MAX_ENTRIES  memory backend bound, default 10000
+    - REPO_CACHE_URL          shared backend, e.g. redis://localhost:6379/0
+
+    The shared backend needs the optional `redis` package; any
+    Redis-compatible server (Redis, Valkey, KeyDB, ...) can serve it.
+    """
+
+    _backend: Optional[CacheBackend] = None
+    _configured = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> Optional[CacheBackend]:
+        """The shared backend, or None when caching is switched off."""
+        if not cls._configured:
+            with cls._lock:
+                if not cls._configured:
+                    cls._backend = cls.from_env()
+                    cls._configured = True
+        return cls._backend
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._backend = None
+        cls._configured = False
+
+    @staticmethod
+    def from_env() -> Optional[CacheBackend]:
+        kind = os.getenv("REPO_CACHE_BACKEND", "memory").strip().lower()
+        ttl_seconds = float(os.getenv("REPO_CACHE_TTL_SECONDS", "30"))
+
+        if kind == "off":
+            return None
+        if kind == "memory":
+            return InMemoryCacheBackend(
+                max_entries=int(os.getenv("REPO_CACHE_MAX_ENTRIES", "10000")),
+                ttl_seconds=ttl_seconds,
+            )
+        if kind == "shared":
+            url = os.getenv("REPO_CACHE_URL")
+            if not url:
+                raise ConfigurationError(
+                    message="REPO_CACHE_URL must be set when REPO_CACHE_BACKEND=shared.",
+                    details={"variable": "REPO_CACHE_URL"},
+                )
+            try:
+                import redis
+            except ImportError as e:
+                raise ConfigurationError(
+                    message="REPO_CACHE_BACKEND=shared requires the 'redis' package.",
+                    details={"variable": "REPO_CACHE_BACKEND"},
+                ) from e
+            return SharedCacheBackend(redis.Redis.from_url(url), ttl_seconds=ttl_seconds)
+
+        raise ConfigurationError(
+            message=f"Unknown REPO_CACHE_BACKEND '{kind}'.",
+            details={"variable": "REPO_CACHE_BACKEND"},
+        )
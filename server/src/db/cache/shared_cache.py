@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from src.db.cache.cache_backend import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCacheBackend(CacheBackend):
+    """
+    Cache shared by every worker, served by a Redis-compatible client.
+
+    The client only needs get(key), set(key, value, ex=seconds) and
+    delete(*keys), so redis-py, a Valkey/KeyDB server or a local stand-in
+    all work. Keys are namespaced with key_prefix so one server can be
+    shared with other data.
+
+    The cache is an optimisation, never the source of truth: if the server
+    cannot be reached a lookup is reported as a miss and the caller falls
+    back to MySQL. A failed invalidation is logged and left to the TTL.
+
+    Values are pickled domain objects; only point this at a server that
+    the API alone can write to.
+    """
+
+    name = "shared"
+
+    def __init__(self, client: Any, ttl_seconds: float = 30.0, key_prefix: str = "marketsafe:") -> None:
+        super().__init__(ttl_seconds)
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def _key(self, key: str) -> str:
+        return self._key_prefix + key
+
+    def _get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get(self._key(key))
+        except Exception:
+            logger.warning("Shared cache get failed for %s", key, exc_info=True)
+            return None
+
+    def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        try:
+            self._client.set(self._key(key), value, ex=max(1, int(ttl_seconds)))
+        except Exception:
+            logger.warning("Shared cache set failed for %s", key, exc_info=True)
+
+    def _delete(self, keys: list[str]) -> None:
+        try:
+            self._client.delete(*(self._key(k) for k in keys))
+        except Exception:
+            logger.warning("Shared cache delete failed for %s", keys, exc_info=True)
+
+    def _clear(self) -> None:
+        # Only our own keys; the server may hold other data.
+        try:
+            keys = list(self._client.scan_iter(match=self._key_prefix + "*"))
+            if keys:
+                self._client.delete(*keys)
+        except Exception:
+            logger.warning("Shared cache clear failed", exc_info=True)
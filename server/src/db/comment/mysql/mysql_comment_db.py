@@ -18,6 +18,7 @@ from src.domain_models import Comment
 from src.db import DBUtility, CommentMapper
 from src.utils import Validation, DatabaseQueryError, CommentNotFoundError
 from src.db.comment import CommentDB
+from src.db.utils.transaction_retry import transactional
 
 
 class MySQLCommentDB(CommentDB):
@@ -28,6 +29,7 @@ class MySQLCommentDB(CommentDB):
     # CREATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def add(self, comment: Comment) -> Comment:
         Validation.require_not_none(comment, "comment")
 
@@ -39,6 +41,16 @@ class MySQLCommentDB(CommentDB):
             else Validation.require_str(comment.body, "body")
         )
 
+        # listing.comment_count is kept exact in the same transaction. The
+        # counter row is locked (X) before the INSERT takes its FK share lock
+        # on it, so two concurrent comments queue instead of deadlocking.
+        count_sql = text(
+            """
+            UPDATE listing
+            SET comment_count = comment_count + 1
+            WHERE id = :listing_id
+        """
+        )
         sql = text(
             """
             INSERT INTO comment (body, listing_id, author_id)
@@ -48,6 +60,7 @@ class MySQLCommentDB(CommentDB):
 
         try:
             with self._db.transaction() as conn:
+                conn.execute(count_sql, {"listing_id": listing_id})
                 result = conn.execute(
                     sql,
                     {
@@ -155,6 +168,7 @@ class MySQLCommentDB(CommentDB):
     # UPDATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def update_body(self, comment_id: int, body: str | None) -> None:
         comment_id = Validation.require_int(comment_id, "comment_id")
         if body is not None:
@@ -186,20 +200,42 @@ class MySQLCommentDB(CommentDB):
     # DELETE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def remove(self, comment_id: int) -> bool:
         comment_id = Validation.require_int(comment_id, "comment_id")
 
+        # Lock the comment first to learn its listing; a concurrent remove of
+        # the same comment then waits here and finds nothing to decrement.
+        lock_sql = text(
+            """
+            SELECT listing_id
+            FROM comment
+            WHERE id = :id
+            FOR UPDATE
+        """
+        )
         sql = text(
             """
             DELETE FROM comment
             WHERE id = :id
         """
         )
+        count_sql = text(
+            """
+            UPDATE listing
+            SET comment_count = GREATEST(comment_count, 1) - 1
+            WHERE id = :listing_id
+        """
+        )
 
         try:
             with self._db.transaction() as conn:
-                result = conn.execute(sql, {"id": comment_id})
-                return (result.rowcount or 0) > 0
+                listing_id = conn.execute(lock_sql, {"id": comment_id}).scalar()
+                if listing_id is None:
+                    return False
+                conn.execute(sql, {"id": comment_id})
+                conn.execute(count_sql, {"listing_id": int(listing_id)})
+                return True
         except SQLAlchemyError as e:
             raise DatabaseQueryError(
                 message="Failed to delete comment.",
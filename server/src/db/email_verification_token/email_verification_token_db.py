@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
 from src.db import DBUtility
 from src.domain_models import VerificationToken
@@ -105,3 +106,27 @@ class EmailVerificationTokenDB(ABC):
             DatabaseQueryError: If deletion fails
         """
         pass
+
+    @abstractmethod
+    def purge_chunk(self, cutoff: datetime, after_id: int, limit: int) -> Tuple[int, Optional[int]]:
+        """
+        Delete one chunk of tokens that expired, or were used, before cutoff.
+
+        Looks at the first limit such rows with id > after_id, in id order,
+        and deletes them in one short transaction. Callers walk the table
+        by passing the returned id back as after_id.
+
+        Args:
+            cutoff (datetime): Tokens with expires_at (or used_at) before it go
+            after_id (int): Highest id already handled (0 to start)
+            limit (int): Chunk size
+
+        Returns:
+            Tuple[int, Optional[int]]: (rows deleted, highest id of the chunk),
+                                       or (0, None) when no such rows are left
+
+        Raises:
+            ValidationError: If an argument is invalid
+            DatabaseQueryError: If the query fails
+        """
+        pass
@@ -1,8 +1,8 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing_extensions import override
 
@@ -10,6 +10,7 @@ from src.db import DBUtility
 from src.db.email_verification_token import EmailVerificationTokenDB
 from src.domain_models import VerificationToken
 from src.utils import (Validation, DatabaseQueryError, TokenNotFoundError)
+from src.db.utils.transaction_retry import transactional
 
 
 class MySQLEmailVerificationTokenDB(EmailVerificationTokenDB):
@@ -29,6 +30,7 @@ class MySQLEmailVerificationTokenDB(EmailVerificationTokenDB):
     # CREATE
     # -------------------------
     @override
+    @transactional(retry_safe=True)
     def add(self, token: VerificationToken) -> VerificationToken:
         Validation.require_not_none(token, "auth_token")
 
@@ -75,6 +77,7 @@ class MySQLEmailVerificationTokenDB(EmailVerificationTokenDB):
     def get_by_hash(self, token_hash: str) -> Optional[VerificationToken]:
         token_hash = Validation.require_str(token_hash, "token_hash")
 
+        # token_hash is unique: a single-row probe of uq_email_token_hash
         sql = text("""
                    SELECT id, account_id, token_hash, created_at, expires_at, used, used_at
                    FROM email_verification_tokens
@@ -117,6 +120,7 @@ class MySQLEmailVerificationTokenDB(EmailVerificationTokenDB):
     # UPDATE
     # -------------------------
     @override
+    @transactional(retry_safe=True)
     def mark_used(self, token_id: int) -> None:
         token_id = Validation.require_int(token_id, "token_id")
 
@@ -144,6 +148,7 @@ class MySQLEmailVerificationTokenDB(EmailVerificationTokenDB):
     # DELETE
     # -------------------------
     @override
+    @transactional(retry_safe=True)
     def clear_used_tokens(self, account_id: int) -> int:
         account_id = Validation.require_int(account_id, "account_id")
 
@@ -162,6 +167,47 @@ class MySQLEmailVerificationTokenDB(EmailVerificationTokenDB):
                 details={"op": "clear_used_tokens", "table": "email_verification_tokens"},
             ) from e
 
+    @override
+    @transactional(retry_safe=True)
+    def purge_chunk(self, cutoff: datetime, after_id: int, limit: int) -> Tuple[int, Optional[int]]:
+        Validation.require_not_none(cutoff, "cutoff")
+        after_id = Validation.require_int(after_id, "after_id")
+        limit = Validation.require_positive_int(limit, "limit")
+
+        # Candidates come from a plain (non-locking) read; the DELETE then
+        # locks only those primary keys and re-checks the condition.
+        select_sql = text("""
+                   SELECT id
+                   FROM email_verification_tokens
+                   WHERE id > :after_id
+                     AND (expires_at < :cutoff OR (used = TRUE AND used_at < :cutoff))
+                   ORDER BY id
+                   LIMIT :limit
+                   """)
+        delete_sql = text("""
+                   DELETE FROM email_verification_tokens
+                   WHERE id IN :ids
+                     AND (expires_at < :cutoff OR (used = TRUE AND used_at < :cutoff))
+                   """).bindparams(bindparam("ids", expanding=True))
+
+        try:
+            with self._db.connect() as conn:
+                ids = [int(r[0]) for r in conn.execute(select_sql, {
+                    "after_id": after_id,
+                    "cutoff": cutoff,
+                    "limit": limit,
+                }).all()]
+            if not ids:
+                return 0, None
+            with self._db.transaction() as conn:
+                result = conn.execute(delete_sql, {"ids": ids, "cutoff": cutoff})
+                return int(result.rowcount or 0), ids[-1]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to purge verification tokens.",
+                details={"op": "purge_chunk", "table": "email_verification_tokens"},
+            ) from e
+
     # -------------------------
     # HELPERS
     # -------------------------
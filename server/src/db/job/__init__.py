@@ -0,0 +1 @@
+from .job_db import Job, JobDB, NewJob
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.db import DBUtility
+
+
+@dataclass(frozen=True, slots=True)
+class NewJob:
+    """
+    A job to insert. kind selects the handler; payload must be JSON-serializable.
+
+    unique_key, when set, makes the insert a no-op if a row with the same
+    key already exists (until that row is purged).
+    """
+
+    queue: str
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    max_attempts: int = 5
+    delay_seconds: float = 0.0
+    unique_key: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """
+    A claimed job row.
+
+    attempts already counts the current run, so (id, attempts) identifies
+    one claim: complete() and fail() only apply while that claim holds.
+    """
+
+    id: int
+    queue: str
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+class JobDB(ABC):
+    """
+    Contract for job table persistence.
+
+    IMPORTANT DESIGN RULES:
+
+    - This layer is responsible ONLY for database access.
+    - A row is pending, running (claimed under a lease), done or failed.
+    - Claims never block on rows another process is claiming; a running
+      row whose lease ran out is claimable again, so a crashed worker's
+      jobs run again (at-least-once delivery).
+    """
+
+    def __init__(self, db: DBUtility) -> None:
+        """
+        The DBUtility instance must be injected.
+        This allows connection pooling reuse across instances.
+        """
+        self._db = db
+
+    @abstractmethod
+    def add_many(self, jobs: Sequence[NewJob]) -> None:
+        """
+        Insert pending jobs in one transaction.
+
+        A job whose unique_key is already in the table is skipped; the
+        other jobs are still inserted.
+
+        Args:
+            jobs (Sequence[NewJob]): Jobs to insert (empty is a no-op)
+
+        Raises:
+            ValidationError: If a job is invalid
+            DatabaseQueryError: If insertion fails
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, queue: str, worker_id: str, limit: int, lease_seconds: float) -> List[Job]:
+        """
+        Claim up to limit runnable jobs of a queue, oldest first.
+
+        Runnable: pending and due, or running with an expired lease. Each
+        claimed row becomes running under a lease of lease_seconds and its
+        attempts count goes up by one. Expired rows that have no attempts
+        left are marked failed instead of being returned.
+
+        Args:
+            queue (str): Queue name
+            worker_id (str): Recorded in locked_by, for diagnosis only
+            limit (int): Maximum number of jobs to claim
+            lease_seconds (float): How long the claim holds without completion
+
+        Returns:
+            List[Job]: Possibly empty
+
+        Raises:
+            ValidationError: If an argument is invalid
+            DatabaseQueryError: If the query fails
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: int, attempts: int) -> bool:
+        """
+        Mark a claimed job done.
+
+        Args:
+            job_id (int): The job
+            attempts (int): Job.attempts of the claim being completed
+
+        Returns:
+            bool: False if the claim no longer holds (lease expired and the
+                  job was claimed again)
+
+        Raises:
+            DatabaseQueryError: If the update fails
+        """
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: int, attempts: int, error: str, retry_in_seconds: Optional[float]) -> bool:
+        """
+        Record a failed run of a claimed job.
+
+        Args:
+            job_id (int): The job
+            attempts (int): Job.attempts of the claim that failed
+            error (str): Short description, truncated to 255 characters
+            retry_in_seconds (Optional[float]): Make the job pending again
+                after this delay; None marks it failed for good
+
+        Returns:
+            bool: False if the claim no longer holds
+
+        Raises:
+            DatabaseQueryError: If the update fails
+        """
+        pass
+
+    @abstractmethod
+    def purge_finished(self, older_than_seconds: float, limit: int = 1000) -> int:
+        """
+        Delete up to limit done jobs that finished more than older_than_seconds ago.
+
+        Failed jobs are kept for inspection.
+
+        Returns:
+            int: Number of rows deleted
+
+        Raises:
+            DatabaseQueryError: If the delete fails
+        """
+        pass
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[str, Dict[str, int]]:
+        """
+        Number of pending, running and failed jobs per queue.
+
+        Returns:
+            Dict[str, Dict[str, int]]: queue -> status -> count (only non-zero counts)
+
+        Raises:
+            DatabaseQueryError: If the query fails
+        """
+        pass
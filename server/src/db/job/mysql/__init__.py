@@ -0,0 +1 @@
+from .mysql_job_db import MySQLJobDB
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import orjson
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+from typing_extensions import override
+
+from src.db import DBUtility
+from src.db.job import Job, JobDB, NewJob
+from src.utils import DatabaseQueryError, Validation, ValidationError
+from src.db.utils.transaction_retry import transactional
+
+
+def _micros(seconds: float) -> int:
+    # INTERVAL n SECOND rounds fractions; microseconds keep sub-second delays.
+    return max(0, int(seconds * 1_000_000))
+
+
+class MySQLJobDB(JobDB):
+    """
+    MySQL implementation of job persistence.
+
+    run_after is a naive UTC DATETIME(3) compared against UTC_TIMESTAMP(3):
+    for a pending row it is when the job may run, for a running row it is
+    when the lease ends. One index (queue, status, run_after) serves both
+    cases of the claim query.
+
+    Claims lock candidate rows with FOR UPDATE SKIP LOCKED (MySQL 8.0+):
+    processes polling the same queue skip each other's rows instead of
+    waiting on them, and never claim the same row twice.
+    """
+
+    def __init__(self, db: DBUtility) -> None:
+        super().__init__(db)
+
+    @override
+    @transactional(retry_safe=True)
+    def add_many(self, jobs: Sequence[NewJob]) -> None:
+        rows = []
+        for job in jobs:
+            Validation.require_not_none(job, "job")
+            if not isinstance(job.payload, dict):
+                raise ValidationError("payload must be a dict")
+            rows.append({
+                "queue": Validation.require_str(job.queue, "queue"),
+                "kind": Validation.require_str(job.kind, "kind"),
+                "payload": orjson.dumps(job.payload).decode(),
+                "max_attempts": Validation.require_positive_int(job.max_attempts, "max_attempts"),
+                "delay_us": _micros(job.delay_seconds),
+                "unique_key": (
+                    None if job.unique_key is None else Validation.require_str(job.unique_key, "unique_key")
+                ),
+            })
+        if not rows:
+            return
+
+        # A duplicate unique_key leaves the existing row untouched; NULL keys
+        # never collide. (Not INSERT IGNORE: that would also hide bad data.)
+        sql = text("""
+            INSERT INTO job (queue, kind, payload, max_attempts, run_after, unique_key)
+            VALUES (:queue, :kind, :payload, :max_attempts,
+                    UTC_TIMESTAMP(3) + INTERVAL :delay_us MICROSECOND, :unique_key)
+            ON DUPLICATE KEY UPDATE id = id
+        """)
+
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(sql, rows)
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to enqueue jobs.",
+                details={"op": "add_many", "table": "job"},
+            ) from e
+
+    @override
+    @transactional(retry_safe=True)
+    def claim(self, queue: str, worker_id: str, limit: int, lease_seconds: float) -> List[Job]:
+        queue = Validation.require_str(queue, "queue")
+        worker_id = Validation.require_str(worker_id, "worker_id")
+        limit = Validation.require_positive_int(limit, "limit")
+
+        # ORDER BY follows the index, so no filesort under the row locks.
+        select_sql = text("""
+            SELECT id, kind, payload, status, attempts, max_attempts
+            FROM job
+            WHERE queue = :queue
+              AND status IN ('pending', 'running')
+              AND run_after <= UTC_TIMESTAMP(3)
+            ORDER BY status, run_after
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        """)
+        claim_sql = text("""
+            UPDATE job
+            SET status = 'running',
+                attempts = attempts + 1,
+                locked_by = :worker_id,
+                run_after = UTC_TIMESTAMP(3) + INTERVAL :lease_us MICROSECOND
+            WHERE id IN :ids
+        """).bindparams(bindparam("ids", expanding=True))
+        expire_sql = text("""
+            UPDATE job
+            SET status = 'failed',
+                locked_by = NULL,
+                last_error = 'lease expired on the last attempt',
+                finished_at = UTC_TIMESTAMP(3)
+            WHERE id IN :ids
+        """).bindparams(bindparam("ids", expanding=True))
+
+        try:
+            with self._db.transaction() as conn:
+                rows = conn.execute(select_sql, {"queue": queue, "limit": limit}).mappings().all()
+                exhausted = [
+                    int(r["id"]) for r in rows
+                    if r["status"] == "running" and int(r["attempts"]) >= int(r["max_attempts"])
+                ]
+                claimed = [r for r in rows if int(r["id"]) not in exhausted]
+                if exhausted:
+                    conn.execute(expire_sql, {"ids": exhausted})
+                if claimed:
+                    conn.execute(claim_sql, {
+                        "ids": [int(r["id"]) for r in claimed],
+                        "worker_id": worker_id[:64],
+                        "lease_us": _micros(lease_seconds),
+                    })
+                return [
+                    Job(
+                        id=int(r["id"]),
+                        queue=queue,
+                        kind=str(r["kind"]),
+                        payload=self._load_payload(r["payload"]),
+                        attempts=int(r["attempts"]) + 1,
+                        max_attempts=int(r["max_attempts"]),
+                    )
+                    for r in claimed
+                ]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to claim jobs.",
+                details={"op": "claim", "table": "job"},
+            ) from e
+
+    @override
+    @transactional(retry_safe=True)
+    def complete(self, job_id: int, attempts: int) -> bool:
+        job_id = Validation.require_int(job_id, "job_id")
+        attempts = Validation.require_int(attempts, "attempts")
+
+        sql = text("""
+            UPDATE job
+            SET status = 'done',
+                locked_by = NULL,
+                last_error = NULL,
+                finished_at = UTC_TIMESTAMP(3)
+            WHERE id = :job_id
+              AND attempts = :attempts
+              AND status = 'running'
+        """)
+
+        try:
+            with self._db.transaction() as conn:
+                result = conn.execute(sql, {"job_id": job_id, "attempts": attempts})
+                return result.rowcount == 1
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to complete job.",
+                details={"op": "complete", "table": "job"},
+            ) from e
+
+    @override
+    @transactional(retry_safe=True)
+    def fail(self, job_id: int, attempts: int, error: str, retry_in_seconds: Optional[float]) -> bool:
+        job_id = Validation.require_int(job_id, "job_id")
+        attempts = Validation.require_int(attempts, "attempts")
+
+        if retry_in_seconds is None:
+            sql = text("""
+                UPDATE job
+                SET status = 'failed',
+                    locked_by = NULL,
+                    last_error = :error,
+                    finished_at = UTC_TIMESTAMP(3)
+                WHERE id = :job_id
+                  AND attempts = :attempts
+                  AND status = 'running'
+            """)
+            params: Dict[str, Any] = {}
+        else:
+            sql = text("""
+                UPDATE job
+                SET status = 'pending',
+                    locked_by = NULL,
+                    last_error = :error,
+                    run_after = UTC_TIMESTAMP(3) + INTERVAL :delay_us MICROSECOND
+                WHERE id = :job_id
+                  AND attempts = :attempts
+                  AND status = 'running'
+            """)
+            params = {"delay_us": _micros(retry_in_seconds)}
+        params.update({"job_id": job_id, "attempts": attempts, "error": (error or "")[:255]})
+
+        try:
+            with self._db.transaction() as conn:
+                result = conn.execute(sql, params)
+                return result.rowcount == 1
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to record job failure.",
+                details={"op": "fail", "table": "job"},
+            ) from e
+
+    @override
+    @transactional(retry_safe=True)
+    def purge_finished(self, older_than_seconds: float, limit: int = 1000) -> int:
+        limit = Validation.require_positive_int(limit, "limit")
+
+        sql = text("""
+            DELETE FROM job
+            WHERE status = 'done'
+              AND finished_at < UTC_TIMESTAMP(3) - INTERVAL :age_us MICROSECOND
+            LIMIT :limit
+        """)
+
+        try:
+            with self._db.transaction() as conn:
+                result = conn.execute(sql, {"age_us": _micros(older_than_seconds), "limit": limit})
+                return int(result.rowcount)
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to purge finished jobs.",
+                details={"op": "purge_finished", "table": "job"},
+            ) from e
+
+    @override
+    def count_by_status(self) -> Dict[str, Dict[str, int]]:
+        sql = text("""
+            SELECT queue, status, COUNT(*) AS n
+            FROM job
+            WHERE status IN ('pending', 'running', 'failed')
+            GROUP BY queue, status
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                counts: Dict[str, Dict[str, int]] = {}
+                for r in conn.execute(sql).mappings().all():
+                    counts.setdefault(str(r["queue"]), {})[str(r["status"])] = int(r["n"])
+                return counts
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to count jobs.",
+                details={"op": "count_by_status", "table": "job"},
+            ) from e
+
+    @staticmethod
+    def _load_payload(raw: Any) -> Dict[str, Any]:
+        # pymysql returns JSON columns as str; other drivers may decode them.
+        if isinstance(raw, dict):
+            return raw
+        return orjson.loads(raw)
@@ -1 +1,14 @@
-from .listing_db import ListingDB
\ No newline at end of file
+from .listing_db import (
+    PRICE_BUCKET_EDGES,
+    DashboardListing,
+    DetailComment,
+    DetailRating,
+    ListingDB,
+    ListingDetail,
+    ListingFacets,
+    ListingPage,
+    LocationFacet,
+    PendingOfferSummary,
+    PriceBucketFacet,
+    SellerDashboard,
+)
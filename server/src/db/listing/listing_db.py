@@ -2,12 +2,134 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from src.db import DBUtility
+from src.db import DBUtility, ListingProjection, ListingQuery, ListingRow
 from src.domain_models import Listing
 
 
+# Upper bounds of the facet price buckets; the last bucket is open-ended
+PRICE_BUCKET_EDGES: Tuple[float, ...] = (25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+
+@dataclass(frozen=True, slots=True)
+class LocationFacet:
+    """Unsold listings in one canonical location."""
+
+    key: str       # listing.location_key
+    location: str  # a display spelling stored for that key
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class PriceBucketFacet:
+    """Unsold listings with min_price <= price < max_price (None: no upper bound)."""
+
+    min_price: float
+    max_price: Optional[float]
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class ListingFacets:
+    """Facet counts over unsold listings."""
+
+    total: int
+    locations: Tuple[LocationFacet, ...]       # most listings first
+    price_buckets: Tuple[PriceBucketFacet, ...]  # every bucket, ascending
+
+
+@dataclass(frozen=True, slots=True)
+class ListingPage:
+    """One page of a ListingQuery."""
+
+    rows: Tuple[ListingRow, ...]
+    next_cursor: Optional[str]  # ListingCursor token of the next page; None on the last page
+
+
+@dataclass(frozen=True, slots=True)
+class PendingOfferSummary:
+    """An undecided offer on one of a seller's listings, with its sender's name."""
+
+    id: int
+    listing_id: int
+    sender_id: int
+    sender_fname: str
+    sender_lname: str
+    offered_price: float
+    location_offered: Optional[str]
+    created_date: Optional[datetime]
+    seen: bool
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardListing:
+    """One of the seller's listings and the rating its buyer left (None: not rated)."""
+
+    row: ListingRow
+    rating: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class SellerDashboard:
+    """Everything the seller's own pages show, read in at most two statements."""
+
+    account_id: int
+    email: str
+    fname: str
+    lname: str
+    verified: bool
+    listings: Tuple[DashboardListing, ...]            # newest first
+    pending_offers: Tuple[PendingOfferSummary, ...]   # newest first
+
+    @property
+    def rating_count(self) -> int:
+        return sum(1 for listing in self.listings if listing.rating is not None)
+
+    @property
+    def rating_sum(self) -> int:
+        return sum(listing.rating for listing in self.listings if listing.rating is not None)
+
+    @property
+    def average_rating(self) -> Optional[float]:
+        count = self.rating_count
+        return self.rating_sum / count if count else None
+
+
+@dataclass(frozen=True, slots=True)
+class DetailComment:
+    """A comment on a listing with its author's name."""
+
+    id: int
+    listing_id: int
+    author_id: int
+    author_fname: str
+    author_lname: str
+    body: Optional[str]
+    created_date: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class DetailRating:
+    """The rating the buyer left on a listing."""
+
+    id: int
+    listing_id: int
+    rater_id: int
+    transaction_rating: int
+
+
+@dataclass(frozen=True, slots=True)
+class ListingDetail:
+    """Everything the listing page shows, read in at most two statements."""
+
+    row: ListingRow
+    rating: Optional[DetailRating]            # None: not rated
+    comments: Tuple[DetailComment, ...]       # oldest first
+
+
 class ListingDB(ABC):
     """
     Contract for Listing table persistence.
@@ -24,6 +146,9 @@ class ListingDB(ABC):
       Even if parameterized (SQL-safe), broad search surfaces often cause
       data-leak bugs at higher layers (e.g., forgetting authorization filters).
     - Prefer narrow, intention-revealing query methods that match real UI use-cases.
+    - The one exception is query_rows(): its filters are a validated
+      ListingQuery, and every listing row is readable by any signed-in user,
+      so no filter carries authorization.
 
     Return conventions:
     - Methods that fetch a single row return Optional[Listing]:
@@ -218,7 +343,7 @@ class ListingDB(ABC):
     @abstractmethod
     def get_unsold_by_location(self, location: str) -> List[Listing]:
         """
-        Fetch unsold listings filtered by location (LIKE match).
+        Fetch unsold listings whose location starts with location.
 
         Expected behavior:
         - Return empty list when no rows match.
@@ -226,7 +351,11 @@ class ListingDB(ABC):
 
         Constraints / notes:
         - location must be a non-empty string.
-        - Uses LIKE semantics (partial match), not exact equality.
+        - Prefix match on the canonical key (Listing.location_key_of), so
+          case, punctuation and spacing are ignored: "winnipeg, mb" and
+          "Winnipeg MB" match "Winnipeg,  MB". The lookup uses the
+          (is_sold, location_key) index; no LIKE '%...%' scan.
+        - A location with no letters or digits matches nothing.
 
         Raises:
             ValidationError
@@ -259,7 +388,7 @@ class ListingDB(ABC):
         - Must raise an exception if a database error occurs.
 
         Constraints / notes:
-        - location must be non-empty string.
+        - location must be non-empty string; matched as in get_unsold_by_location().
         - max_price must be positive number (> 0).
         - Intended to support common UI filters without exposing broad search.
 
@@ -270,6 +399,26 @@ class ListingDB(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_unsold_facets(self) -> ListingFacets:
+        """
+        Count unsold listings per canonical location and per price bucket.
+
+        Expected behavior:
+        - One grouped statement over the (is_sold, location_key, price)
+          index; listing rows are counted, never loaded.
+        - locations: one entry per location_key, most listings first (ties
+          by key). Listings without a location only count toward total
+          and price_buckets.
+        - price_buckets: one entry per PRICE_BUCKET_EDGES bucket, ascending,
+          including empty buckets.
+
+        Raises:
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_unsold_by_title_keyword(self, keyword: str, limit: int = 50, offset: int = 0) -> List[Listing]:
         """
@@ -291,6 +440,204 @@ class ListingDB(ABC):
         """
         raise NotImplementedError
 
+    # --------------------------------------------------
+    # READ PROJECTIONS (list endpoints)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def get_all_rows(self) -> List[ListingRow]:
+        """
+        Fetch all listings as read-only ListingRow projections.
+
+        Expected behavior:
+        - Same rows and order as get_all().
+        - Rows are NOT re-validated through the Listing constructor.
+        - Return an empty list if the table is empty.
+
+        Constraints / notes:
+        - Read path only. Never feed a ListingRow back into a write method.
+
+        Raises:
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_rows_by_seller_id(self, seller_id: int) -> List[ListingRow]:
+        """
+        Fetch all listings posted by a seller as ListingRow projections.
+
+        Expected behavior:
+        - Same rows and order as get_by_seller_id().
+        - Return empty list if none exist.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_all_projected(self, projection: ListingProjection) -> List[Dict[str, Any]]:
+        """
+        Fetch all listings with only the projection's columns.
+
+        Expected behavior:
+        - Same rows and order as get_all_rows().
+        - Only projection.fields are selected; each row is a dict keyed by them.
+        - When projection.description_chars is set, description is truncated
+          in the SELECT itself (the full TEXT never leaves the database).
+        - Return an empty list if the table is empty.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_projected_by_seller_id(
+        self, seller_id: int, projection: ListingProjection
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a seller's listings with only the projection's columns.
+
+        Expected behavior:
+        - Same rows and order as get_rows_by_seller_id().
+        - Column selection and truncation as get_all_projected().
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    # --------------------------------------------------
+    # COMPOSABLE QUERY (GET /listings/query)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def query_rows(self, query: ListingQuery) -> ListingPage:
+        """
+        Fetch one page of listings matching a ListingQuery, as ListingRow projections.
+
+        Expected behavior:
+        - Apply every filter that is set; rows in query.sort order, id as
+          the tie-breaker.
+        - At most query.limit rows, starting strictly after query.after.
+        - next_cursor is set only when more rows match.
+        - One statement; it must run on a composite index chosen for the
+          filter combination, never a full table scan.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    # --------------------------------------------------
+    # SELLER DASHBOARD (GET /accounts/me/dashboard)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def get_seller_dashboard(self, seller_id: int) -> Optional[SellerDashboard]:
+        """
+        Fetch a seller's account, listings (with counters and ratings) and
+        pending received offers.
+
+        Expected behavior:
+        - Return None if no account has id seller_id.
+        - listings: every listing of the seller, newest first, each with the
+          rating left by its buyer (None if not rated). A seller without
+          listings gets an empty tuple.
+        - pending_offers: every offer with accepted IS NULL on those
+          listings, newest first, with the sender's first and last name.
+        - Two statements on one connection: one for account + listings +
+          ratings, one for the pending offers. The second always runs:
+          pending_offer_count is denormalized and may drift, so it never
+          decides whether pending offers exist.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    # --------------------------------------------------
+    # LISTING DETAIL (GET /listings/{id})
+    # --------------------------------------------------
+
+    @abstractmethod
+    def get_listing_detail(self, listing_id: int) -> Optional[ListingDetail]:
+        """
+        Fetch one listing with its rating and its comments (with author names).
+
+        Expected behavior:
+        - Return None if no listing has id listing_id.
+        - rating: the buyer's rating, None if not rated.
+        - comments: every comment on the listing, oldest first (as
+          CommentDB.get_by_listing_id), each with its author's first and
+          last name.
+        - Two statements on one connection: one for listing + rating, one
+          for the comments with their authors. The second always runs:
+          comment_count is denormalized and may drift, so it never decides
+          whether comments exist.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    # --------------------------------------------------
+    # STREAMING READS (exports)
+    # --------------------------------------------------
+
+    @abstractmethod
+    def iter_all(self) -> Iterator[Listing]:
+        """
+        Stream all listings, one Listing at a time.
+
+        Expected behavior:
+        - Yield listings in the same order as get_all().
+        - Rows must be fetched through a server-side cursor so memory
+          stays flat regardless of table size.
+        - Yield nothing if the table is empty.
+
+        Constraints / notes:
+        - The connection is held until the iterator is exhausted or closed.
+          Callers must consume it promptly (e.g., inside a StreamingResponse).
+
+        Raises:
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_by_seller_id(self, seller_id: int) -> Iterator[Listing]:
+        """
+        Stream all listings posted by a seller, one Listing at a time.
+
+        Expected behavior:
+        - Yield listings in the same order as get_by_seller_id().
+        - seller_id is validated eagerly (before the iterator is returned).
+        - Yield nothing if the seller has no listings.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
     # --------------------------------------------------
     # UPDATE
     # --------------------------------------------------
@@ -361,6 +708,35 @@ class ListingDB(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def reconcile_activity_counts(self, after_id: int, limit: int) -> Tuple[int, Optional[int]]:
+        """
+        Recount comment_count, offer_count and pending_offer_count for one
+        chunk of listings.
+
+        Expected behavior:
+        - Take the first limit listings with id > after_id, in id order.
+        - Set their three counters to the real number of comments, offers and
+          undecided (accepted IS NULL) offers, in one short transaction.
+        - Return (listings whose counters were wrong, highest id of the chunk),
+          or (0, None) when no listings are left. Callers walk the table by
+          passing the returned id back as after_id.
+        - Must raise an exception if a database error occurs.
+
+        Constraints / notes:
+        - The comment, offer and account-delete writes keep the counters
+          exact; this repairs drift from manual SQL that bypasses them.
+        - The chunk's listing rows are locked before counting, in the same
+          order the comment/offer writes lock them, so a recount never
+          overwrites a concurrent increment.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
     # --------------------------------------------------
     # DELETE
     # --------------------------------------------------
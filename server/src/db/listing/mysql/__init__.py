@@ -1 +1,2 @@
-from .mysql_listing_db import MySQLListingDB
\ No newline at end of file
+from .listing_query_plan import ListingQueryPlan
+from .mysql_listing_db import MySQLListingDB
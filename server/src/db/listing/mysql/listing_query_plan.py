@@ -0,0 +1,126 @@
+"""
+Compiles a ListingQuery into one parameterized SELECT on a chosen index.
+
+Only fixed SQL fragments and index names are interpolated; every value
+from the request is a bind parameter.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from src.db.utils.listing_query import ListingQuery
+
+# Composite indexes a listing query can run on (assets/db/schema.sql).
+# InnoDB appends the primary key to every secondary index, so each one is
+# also ordered by id after its last column.
+IDX_SELLER_CREATED = "idx_listing_seller_created"    # (seller_id, created_at)
+IDX_LOCATION = "idx_listing_unsold_location"          # (is_sold, location_key, price)
+IDX_SOLD_PRICE = "idx_listing_sold_price"             # (is_sold, price)
+IDX_SOLD_CREATED = "idx_listing_sold_created"         # (is_sold, created_at)
+
+_ORDER_BY: Dict[str, str] = {
+    "newest": "created_at DESC, id DESC",
+    "price_asc": "price ASC, id ASC",
+    "price_desc": "price DESC, id DESC",
+}
+
+# Keyset predicate per sort: rows strictly after (:cursor_value, :cursor_id)
+_AFTER: Dict[str, str] = {
+    "newest": "(created_at < :cursor_value OR (created_at = :cursor_value AND id < :cursor_id))",
+    "price_asc": "(price > :cursor_value OR (price = :cursor_value AND id > :cursor_id))",
+    "price_desc": "(price < :cursor_value OR (price = :cursor_value AND id < :cursor_id))",
+}
+
+_COLUMNS = (
+    "id, seller_id, title, description, image_url, price, location, created_at, is_sold,"
+    " comment_count, offer_count, pending_offer_count"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ListingQueryPlan:
+    """The compiled statement: index it is pinned to, SQL text and bind parameters."""
+
+    index: str
+    sql: str
+    params: Dict[str, Any]
+
+
+def choose_index(query: ListingQuery) -> str:
+    """
+    The composite index whose leading columns the query constrains most.
+
+    1. seller_id: equality on the leading column; a seller has few rows,
+       and "newest" is read in index order.
+    2. location: is_sold + key prefix range; a price bound is checked
+       inside the index (third column) before any row is read.
+    3. price bound or price sort: is_sold + price range, rows come out in
+       price order.
+    4. otherwise is_sold + created_at: the feed is read in index order and
+       stops after limit + 1 rows.
+    """
+    if query.seller_id is not None:
+        return IDX_SELLER_CREATED
+    if query.location_key is not None:
+        return IDX_LOCATION
+    if query.min_price is not None or query.max_price is not None or query.sort != "newest":
+        return IDX_SOLD_PRICE
+    return IDX_SOLD_CREATED
+
+
+def plan(query: ListingQuery) -> ListingQueryPlan:
+    """
+    Compile query to SQL pinned (FORCE INDEX) to choose_index(query).
+
+    is_sold leads three of the indexes, so an unfiltered sold state is
+    spelled is_sold IN (FALSE, TRUE): two index ranges instead of a scan.
+    The statement selects limit + 1 rows; the extra one only tells the
+    caller whether another page exists.
+    """
+    index = choose_index(query)
+    where: List[str] = []
+    params: Dict[str, Any] = {"limit": query.limit + 1}
+
+    if query.seller_id is not None:
+        where.append("seller_id = :seller_id")
+        params["seller_id"] = query.seller_id
+    if query.is_sold is None:
+        if index != IDX_SELLER_CREATED:
+            where.append("is_sold IN (FALSE, TRUE)")
+    else:
+        where.append("is_sold = :is_sold")
+        params["is_sold"] = query.is_sold
+    if query.location_key is not None:
+        # Keys hold no % or _, so key + "%" is a plain prefix range
+        where.append("location_key LIKE :key_prefix")
+        params["key_prefix"] = f"{query.location_key}%"
+    if query.min_price is not None:
+        where.append("price >= :min_price")
+        params["min_price"] = query.min_price
+    if query.max_price is not None:
+        where.append("price <= :max_price")
+        params["max_price"] = query.max_price
+    if query.keyword is not None:
+        # Substring match cannot use an index; it filters the rows the index yields
+        where.append("title LIKE :keyword")
+        params["keyword"] = f"%{_escape_like(query.keyword)}%"
+    if query.after is not None:
+        where.append(_AFTER[query.sort])
+        params["cursor_value"] = query.after.value
+        params["cursor_id"] = query.after.id
+
+    sql = (
+        f"SELECT {_COLUMNS}\n"
+        f"FROM listing FORCE INDEX ({index})\n"
+        f"WHERE {' AND '.join(where)}\n"
+        f"ORDER BY {_ORDER_BY[query.sort]}\n"
+        "LIMIT :limit"
+    )
+    return ListingQueryPlan(index=index, sql=sql, params=params)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards (MySQL's default escape character is backslash)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
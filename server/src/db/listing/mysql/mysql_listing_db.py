@@ -7,19 +7,45 @@ This class only handles query-level failures.
 """
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing_extensions import override
 
-from src.db import DBUtility, ListingMapper
-from src.db.listing import ListingDB
+from src.db import (
+    LISTING_ROW_FIELDS,
+    DBUtility,
+    ListingCursor,
+    ListingMapper,
+    ListingProjection,
+    ListingQuery,
+    ListingRow,
+)
+from src.db.listing import (
+    PRICE_BUCKET_EDGES,
+    DashboardListing,
+    DetailComment,
+    DetailRating,
+    ListingDB,
+    ListingDetail,
+    ListingFacets,
+    ListingPage,
+    LocationFacet,
+    PendingOfferSummary,
+    PriceBucketFacet,
+    SellerDashboard,
+)
+from src.db.listing.mysql.listing_query_plan import plan
 from src.domain_models import Listing
-from src.utils import Validation, DatabaseQueryError, ListingNotFoundError
+from src.utils import Validation, DatabaseQueryError, ListingNotFoundError, ValidationError
+from src.db.utils.transaction_retry import transactional
 
 
 class MySQLListingDB(ListingDB):
+    # Rows buffered per round trip when streaming through a server-side cursor.
+    STREAM_BATCH_SIZE: int = 500
+
     def __init__(self, db: DBUtility) -> None:
         super().__init__(db)
 
@@ -27,6 +53,7 @@ class MySQLListingDB(ListingDB):
     # CREATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def add(self, listing: Listing) -> Listing:
         Validation.require_not_none(listing, "listing")
 
@@ -37,9 +64,11 @@ class MySQLListingDB(ListingDB):
 
         sql = text("""
             INSERT INTO listing
-                (seller_id, title, description, image_url, price, location, is_sold, sold_to_id)
+                (seller_id, title, description, image_url, price, location, location_key,
+                 is_sold, sold_to_id)
             VALUES
-                (:seller_id, :title, :description, :image_url, :price, :location, :is_sold, :sold_to_id)
+                (:seller_id, :title, :description, :image_url, :price, :location, :location_key,
+                 :is_sold, :sold_to_id)
         """)
 
         try:
@@ -51,6 +80,7 @@ class MySQLListingDB(ListingDB):
                     "image_url": (listing.image_url.strip() if listing.image_url else None),
                     "price": float(price),
                     "location": (listing.location.strip() if listing.location else None),
+                    "location_key": listing.location_key,
                     "is_sold": bool(listing.is_sold),
                     "sold_to_id": listing.sold_to_id,
                 })
@@ -194,19 +224,23 @@ class MySQLListingDB(ListingDB):
     @override
     def get_unsold_by_location(self, location: str) -> List[Listing]:
         location = Validation.require_str(location, "location")
+        key = Listing.location_key_of(location)
+        if key is None:
+            return []
 
         sql = text("""
             SELECT id, seller_id, title, description, image_url, price, location,
                    created_at, is_sold, sold_to_id
             FROM listing
             WHERE is_sold = FALSE
-              AND location LIKE :loc
+              AND location_key LIKE :key_prefix
             ORDER BY created_at DESC, id DESC
         """)
 
         try:
             with self._db.connect() as conn:
-                rows = conn.execute(sql, {"loc": f"%{location}%"}).mappings().all()
+                # Keys hold no % or _, so key + "%" is a plain prefix range
+                rows = conn.execute(sql, {"key_prefix": f"{key}%"}).mappings().all()
                 return [ListingMapper.from_mapping(r) for r in rows]
         except SQLAlchemyError as e:
             raise DatabaseQueryError(
@@ -241,20 +275,25 @@ class MySQLListingDB(ListingDB):
     def get_unsold_by_location_and_max_price(self, location: str, max_price: float) -> List[Listing]:
         location = Validation.require_str(location, "location")
         max_price = Validation.is_positive_number(max_price, "max_price")
+        key = Listing.location_key_of(location)
+        if key is None:
+            return []
 
         sql = text("""
             SELECT id, seller_id, title, description, image_url, price, location,
                    created_at, is_sold, sold_to_id
             FROM listing
             WHERE is_sold = FALSE
-              AND location LIKE :loc
+              AND location_key LIKE :key_prefix
               AND price <= :max_price
             ORDER BY created_at DESC, id DESC
         """)
 
         try:
             with self._db.connect() as conn:
-                rows = conn.execute(sql, {"loc": f"%{location}%", "max_price": float(max_price)}).mappings().all()
+                rows = conn.execute(
+                    sql, {"key_prefix": f"{key}%", "max_price": float(max_price)}
+                ).mappings().all()
                 return [ListingMapper.from_mapping(r) for r in rows]
         except SQLAlchemyError as e:
             raise DatabaseQueryError(
@@ -262,6 +301,55 @@ class MySQLListingDB(ListingDB):
                 details={"op": "get_unsold_by_location_and_max_price", "table": "listing"},
             ) from e
 
+    @override
+    def get_unsold_facets(self) -> ListingFacets:
+        # Bucket i holds PRICE_BUCKET_EDGES[i-1] <= price < PRICE_BUCKET_EDGES[i]
+        bucket = "CASE " + " ".join(
+            f"WHEN price < {edge:.2f} THEN {i}" for i, edge in enumerate(PRICE_BUCKET_EDGES)
+        ) + f" ELSE {len(PRICE_BUCKET_EDGES)} END"
+        sql = text(f"""
+            SELECT location_key,
+                   MIN(location) AS location,
+                   {bucket} AS price_bucket,
+                   COUNT(*) AS n
+            FROM listing
+            WHERE is_sold = FALSE
+            GROUP BY location_key, price_bucket
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                cells = conn.execute(sql).mappings().all()
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to count listing facets.",
+                details={"op": "get_unsold_facets", "table": "listing"},
+            ) from e
+
+        bucket_counts = [0] * (len(PRICE_BUCKET_EDGES) + 1)
+        locations: Dict[str, List[Any]] = {}
+        for cell in cells:
+            n = int(cell["n"])
+            bucket_counts[int(cell["price_bucket"])] += n
+            key = cell["location_key"]
+            if key is not None:
+                entry = locations.setdefault(key, [cell["location"], 0])
+                entry[0] = min(entry[0], cell["location"])
+                entry[1] += n
+
+        bounds = (0.0, *PRICE_BUCKET_EDGES, None)
+        return ListingFacets(
+            total=sum(bucket_counts),
+            locations=tuple(sorted(
+                (LocationFacet(key=key, location=label, count=n) for key, (label, n) in locations.items()),
+                key=lambda facet: (-facet.count, facet.key),
+            )),
+            price_buckets=tuple(
+                PriceBucketFacet(min_price=bounds[i], max_price=bounds[i + 1], count=n)
+                for i, n in enumerate(bucket_counts)
+            ),
+        )
+
     @override
     def get_recent_unsold(self, limit: int = 50, offset: int = 0) -> List[Listing]:
         # Your Validation doesn't have "require_int but allow 0"? It does, and 0 is fine.
@@ -313,10 +401,335 @@ class MySQLListingDB(ListingDB):
                 details={"op": "find_unsold_by_title_keyword", "table": "listing"},
             ) from e
 
+    # -----------------------------
+    # READ PROJECTIONS (list endpoints)
+    # -----------------------------
+    @override
+    def get_all_rows(self) -> List[ListingRow]:
+        sql = text("""
+            SELECT id, seller_id, title, description, image_url, price, location,
+                   created_at, is_sold, comment_count, offer_count, pending_offer_count
+            FROM listing
+            ORDER BY created_at DESC, id DESC
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(sql).mappings().all()
+                return [ListingMapper.row_from_mapping(r) for r in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch listing rows.",
+                details={"op": "get_all_rows", "table": "listing"},
+            ) from e
+
+    @override
+    def get_rows_by_seller_id(self, seller_id: int) -> List[ListingRow]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+
+        sql = text("""
+            SELECT id, seller_id, title, description, image_url, price, location,
+                   created_at, is_sold, comment_count, offer_count, pending_offer_count
+            FROM listing
+            WHERE seller_id = :seller_id
+            ORDER BY created_at DESC, id DESC
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(sql, {"seller_id": seller_id}).mappings().all()
+                return [ListingMapper.row_from_mapping(r) for r in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch listing rows by seller.",
+                details={"op": "get_rows_by_seller_id", "table": "listing"},
+            ) from e
+
+    @override
+    def get_all_projected(self, projection: ListingProjection) -> List[Dict[str, Any]]:
+        columns, params = self._projection_select(projection)
+        sql = text(f"""
+            SELECT {columns}
+            FROM listing
+            ORDER BY created_at DESC, id DESC
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(sql, params).mappings().all()
+                return [ListingMapper.projection_from_mapping(r) for r in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch projected listing rows.",
+                details={"op": "get_all_projected", "table": "listing"},
+            ) from e
+
+    @override
+    def get_projected_by_seller_id(
+        self, seller_id: int, projection: ListingProjection
+    ) -> List[Dict[str, Any]]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        columns, params = self._projection_select(projection)
+        sql = text(f"""
+            SELECT {columns}
+            FROM listing
+            WHERE seller_id = :seller_id
+            ORDER BY created_at DESC, id DESC
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(sql, {**params, "seller_id": seller_id}).mappings().all()
+                return [ListingMapper.projection_from_mapping(r) for r in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch projected listing rows by seller.",
+                details={"op": "get_projected_by_seller_id", "table": "listing"},
+            ) from e
+
+    @staticmethod
+    def _projection_select(projection: ListingProjection) -> tuple[str, Dict[str, Any]]:
+        """
+        SELECT list and bind parameters for a projection.
+
+        Column names are checked against LISTING_ROW_FIELDS before they are
+        interpolated; the truncation length is a bind parameter.
+        """
+        Validation.require_not_none(projection, "projection")
+        unknown = [name for name in projection.fields if name not in LISTING_ROW_FIELDS]
+        if unknown or not projection.fields:
+            raise ValidationError(
+                message="Invalid listing projection.",
+                details={"fields": list(projection.fields)},
+            )
+
+        columns, params = [], {}
+        for name in projection.fields:
+            if name == "description" and projection.description_chars is not None:
+                columns.append("LEFT(description, :description_chars) AS description")
+                params["description_chars"] = projection.description_chars
+            else:
+                columns.append(name)
+        return ", ".join(columns), params
+
+    # -----------------------------
+    # COMPOSABLE QUERY
+    # -----------------------------
+    @override
+    def query_rows(self, query: ListingQuery) -> ListingPage:
+        Validation.require_not_none(query, "query")
+        compiled = plan(query)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(text(compiled.sql), compiled.params).mappings().all()
+                page = [ListingMapper.row_from_mapping(r) for r in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to query listings.",
+                details={"op": "query_rows", "table": "listing", "index": compiled.index},
+            ) from e
+
+        # The plan selects one row past the page only to detect a next page
+        if len(page) <= query.limit:
+            return ListingPage(rows=tuple(page), next_cursor=None)
+        page = page[:query.limit]
+        return ListingPage(
+            rows=tuple(page),
+            next_cursor=ListingCursor.after(page[-1], query.sort).encode(),
+        )
+
+    # -----------------------------
+    # SELLER DASHBOARD
+    # -----------------------------
+    @override
+    def get_seller_dashboard(self, seller_id: int) -> Optional[SellerDashboard]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+
+        # Starting from account keeps one row (listing columns NULL) for a
+        # seller without listings; idx_listing_seller_created yields the
+        # listings newest first and uq_rating_one_per_listing their ratings.
+        listings_sql = text("""
+            SELECT a.id AS account_id, a.email, a.fname, a.lname, a.verified,
+                   l.id, l.seller_id, l.title, l.description, l.image_url, l.price,
+                   l.location, l.created_at, l.is_sold,
+                   l.comment_count, l.offer_count, l.pending_offer_count,
+                   r.transaction_rating
+            FROM account a
+            LEFT JOIN listing l ON l.seller_id = a.id
+            LEFT JOIN rating r ON r.listing_id = l.id
+            WHERE a.id = :seller_id
+            ORDER BY l.created_at DESC, l.id DESC
+        """)
+        # idx_offer_listing_state (listing_id, accepted, ...) serves the
+        # pending probe per listing
+        offers_sql = text("""
+            SELECT o.id, o.listing_id, o.sender_id, s.fname, s.lname,
+                   o.offered_price, o.location_offered, o.created_date, o.seen
+            FROM listing l
+            JOIN offer o ON o.listing_id = l.id AND o.accepted IS NULL
+            JOIN account s ON s.id = o.sender_id
+            WHERE l.seller_id = :seller_id
+            ORDER BY o.created_date DESC, o.id DESC
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(listings_sql, {"seller_id": seller_id}).mappings().all()
+                if not rows:
+                    return None
+                listings = tuple(
+                    DashboardListing(row=ListingMapper.row_from_mapping(r), rating=r["transaction_rating"])
+                    for r in rows
+                    if r["id"] is not None
+                )
+                offers = conn.execute(offers_sql, {"seller_id": seller_id}).mappings().all()
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch seller dashboard.",
+                details={"op": "get_seller_dashboard", "table": "listing"},
+            ) from e
+
+        account = rows[0]
+        return SellerDashboard(
+            account_id=int(account["account_id"]),
+            email=account["email"],
+            fname=account["fname"],
+            lname=account["lname"],
+            verified=bool(account["verified"]),
+            listings=listings,
+            pending_offers=tuple(
+                PendingOfferSummary(
+                    id=o["id"],
+                    listing_id=o["listing_id"],
+                    sender_id=o["sender_id"],
+                    sender_fname=o["fname"],
+                    sender_lname=o["lname"],
+                    offered_price=float(o["offered_price"]),
+                    location_offered=o["location_offered"],
+                    created_date=o["created_date"],
+                    seen=bool(o["seen"]),
+                )
+                for o in offers
+            ),
+        )
+
+    @override
+    def get_listing_detail(self, listing_id: int) -> Optional[ListingDetail]:
+        listing_id = Validation.require_int(listing_id, "listing_id")
+
+        # uq_rating_one_per_listing makes the rating join a single probe
+        listing_sql = text("""
+            SELECT l.id, l.seller_id, l.title, l.description, l.image_url, l.price,
+                   l.location, l.created_at, l.is_sold,
+                   l.comment_count, l.offer_count, l.pending_offer_count,
+                   r.id AS rating_id, r.rater_id, r.transaction_rating
+            FROM listing l
+            LEFT JOIN rating r ON r.listing_id = l.id
+            WHERE l.id = :listing_id
+        """)
+        # idx_comment_listing yields the comments; each author is a PK lookup
+        comments_sql = text("""
+            SELECT c.id, c.listing_id, c.author_id, a.fname, a.lname,
+                   c.body, c.created_date
+            FROM comment c
+            JOIN account a ON a.id = c.author_id
+            WHERE c.listing_id = :listing_id
+            ORDER BY c.created_date ASC, c.id ASC
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                row = conn.execute(listing_sql, {"listing_id": listing_id}).mappings().first()
+                if row is None:
+                    return None
+                listing = ListingMapper.row_from_mapping(row)
+                comments = conn.execute(comments_sql, {"listing_id": listing_id}).mappings().all()
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch listing detail.",
+                details={"op": "get_listing_detail", "table": "listing"},
+            ) from e
+
+        rating = None
+        if row["rating_id"] is not None:
+            rating = DetailRating(
+                id=row["rating_id"],
+                listing_id=listing.id,
+                rater_id=row["rater_id"],
+                transaction_rating=row["transaction_rating"],
+            )
+        return ListingDetail(
+            row=listing,
+            rating=rating,
+            comments=tuple(
+                DetailComment(
+                    id=c["id"],
+                    listing_id=c["listing_id"],
+                    author_id=c["author_id"],
+                    author_fname=c["fname"],
+                    author_lname=c["lname"],
+                    body=c["body"],
+                    created_date=c["created_date"],
+                )
+                for c in comments
+            ),
+        )
+
+    # -----------------------------
+    # STREAMING READS (exports)
+    # -----------------------------
+    @override
+    def iter_all(self) -> Iterator[Listing]:
+        sql = text("""
+            SELECT id, seller_id, title, description, image_url, price, location,
+                   created_at, is_sold, sold_to_id
+            FROM listing
+            ORDER BY created_at DESC, id DESC
+        """)
+
+        return self._stream(sql, {}, op="iter_all")
+
+    @override
+    def iter_by_seller_id(self, seller_id: int) -> Iterator[Listing]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+
+        sql = text("""
+            SELECT id, seller_id, title, description, image_url, price, location,
+                   created_at, is_sold, sold_to_id
+            FROM listing
+            WHERE seller_id = :seller_id
+            ORDER BY created_at DESC, id DESC
+        """)
+
+        return self._stream(sql, {"seller_id": seller_id}, op="iter_by_seller_id")
+
+    def _stream(self, sql, params: dict, *, op: str) -> Iterator[Listing]:
+        """
+        Execute `sql` on a server-side cursor and map rows lazily.
+
+        The connection stays checked out until the generator is exhausted
+        or closed, so only STREAM_BATCH_SIZE rows are ever buffered.
+        """
+        try:
+            with self._db.connect() as conn:
+                result = conn.execution_options(
+                    stream_results=True,
+                    yield_per=self.STREAM_BATCH_SIZE,
+                ).execute(sql, params)
+                for row in result.mappings():
+                    yield ListingMapper.from_mapping(row)
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to stream listings.",
+                details={"op": op, "table": "listing"},
+            ) from e
+
     # -----------------------------
     # UPDATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def update(self, listing: Listing) -> Listing:
         Validation.require_not_none(listing, "listing")
 
@@ -331,7 +744,8 @@ class MySQLListingDB(ListingDB):
                 description = :description,
                 image_url = :image_url,
                 price = :price,
-                location = :location
+                location = :location,
+                location_key = :location_key
             WHERE id = :id
         """)
 
@@ -344,6 +758,7 @@ class MySQLListingDB(ListingDB):
                     "image_url": (listing.image_url.strip() if listing.image_url else None),
                     "price": float(price),
                     "location": (listing.location.strip() if listing.location else None),
+                    "location_key": listing.location_key,
                 })
                 if int(result.rowcount or 0) == 0:
                     raise ListingNotFoundError(
@@ -366,6 +781,7 @@ class MySQLListingDB(ListingDB):
             ) from e
 
     @override
+    @transactional(retry_safe=True)
     def set_sold(self, listing_id: int, is_sold: bool, sold_to_id: Optional[int]) -> None:
         listing_id = Validation.require_int(listing_id, "listing_id")
         is_sold = Validation.is_boolean(is_sold, "is_sold")
@@ -394,6 +810,7 @@ class MySQLListingDB(ListingDB):
             ) from e
 
     @override
+    @transactional(retry_safe=True)
     def set_price(self, listing_id: int, price: float) -> None:
         listing_id = Validation.require_int(listing_id, "listing_id")
         price = Validation.is_positive_number(price, "price")
@@ -418,10 +835,64 @@ class MySQLListingDB(ListingDB):
                 details={"op": "set_price", "table": "listing"},
             ) from e
 
+    @override
+    @transactional(retry_safe=True)
+    def reconcile_activity_counts(self, after_id: int, limit: int) -> Tuple[int, Optional[int]]:
+        after_id = Validation.require_int(after_id, "after_id")
+        limit = Validation.require_positive_int(limit, "limit")
+
+        # Locking the chunk first (listing X, then comment/offer reads) is the
+        # order add/remove use, so a recount and a new offer queue rather
+        # than deadlock, and no increment lands between count and write.
+        lock_sql = text("""
+            SELECT id
+            FROM listing
+            WHERE id > :after_id
+            ORDER BY id
+            LIMIT :limit
+            FOR UPDATE
+        """)
+        fix_sql = text("""
+            UPDATE listing l
+            LEFT JOIN (
+                SELECT listing_id, COUNT(*) AS n
+                FROM comment
+                WHERE listing_id IN :ids
+                GROUP BY listing_id
+            ) c ON c.listing_id = l.id
+            LEFT JOIN (
+                SELECT listing_id, COUNT(*) AS n, SUM(accepted IS NULL) AS pending
+                FROM offer
+                WHERE listing_id IN :ids
+                GROUP BY listing_id
+            ) o ON o.listing_id = l.id
+            SET l.comment_count = COALESCE(c.n, 0),
+                l.offer_count = COALESCE(o.n, 0),
+                l.pending_offer_count = COALESCE(o.pending, 0)
+            WHERE l.id IN :ids
+              AND (l.comment_count <> COALESCE(c.n, 0)
+                   OR l.offer_count <> COALESCE(o.n, 0)
+                   OR l.pending_offer_count <> COALESCE(o.pending, 0))
+        """).bindparams(bindparam("ids", expanding=True))
+
+        try:
+            with self._db.transaction() as conn:
+                ids = [int(r[0]) for r in conn.execute(lock_sql, {"after_id": after_id, "limit": limit}).all()]
+                if not ids:
+                    return 0, None
+                result = conn.execute(fix_sql, {"ids": ids})
+                return int(result.rowcount or 0), ids[-1]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to reconcile listing activity counters.",
+                details={"op": "reconcile_activity_counts", "table": "listing"},
+            ) from e
+
     # -----------------------------
     # DELETE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def remove(self, listing_id: int) -> bool:
         listing_id = Validation.require_int(listing_id, "listing_id")
 
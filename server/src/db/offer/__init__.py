@@ -1 +1 @@
-from .offer_db import OfferDB
+from .offer_db import OfferCounts, OfferDB
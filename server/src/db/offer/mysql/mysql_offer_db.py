@@ -8,19 +8,23 @@ This class only handles query-level failures.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing_extensions import override
 
 from src.db import DBUtility, OfferMapper
-from src.db.offer import OfferDB
+from src.db.offer import OfferCounts, OfferDB
 from src.domain_models import Offer
 from src.utils import Validation, DatabaseQueryError, OfferNotFoundError
+from src.db.utils.transaction_retry import transactional
 
 
 class MySQLOfferDB(OfferDB):
+    # Rows buffered per round trip when streaming through a server-side cursor.
+    STREAM_BATCH_SIZE: int = 500
+
     def __init__(self, db: DBUtility) -> None:
         super().__init__(db)
 
@@ -28,6 +32,7 @@ class MySQLOfferDB(OfferDB):
     # CREATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def add(self, offer: Offer) -> Offer:
         Validation.require_not_none(offer, "offer")
 
@@ -37,6 +42,18 @@ class MySQLOfferDB(OfferDB):
             offer.offered_price, "offered_price"
         )
 
+        # listing.offer_count / pending_offer_count are kept exact in the same
+        # transaction. The counter row is locked (X) before the INSERT takes
+        # its FK share lock on it, so concurrent offers queue instead of
+        # deadlocking on the S -> X upgrade.
+        count_sql = text(
+            """
+            UPDATE listing
+            SET offer_count = offer_count + 1,
+                pending_offer_count = pending_offer_count + :pending
+            WHERE id = :listing_id
+        """
+        )
         sql = text(
             """
             INSERT INTO offer
@@ -48,6 +65,10 @@ class MySQLOfferDB(OfferDB):
 
         try:
             with self._db.transaction() as conn:
+                conn.execute(
+                    count_sql,
+                    {"listing_id": listing_id, "pending": int(offer.accepted is None)},
+                )
                 result = conn.execute(
                     sql,
                     {
@@ -278,10 +299,108 @@ class MySQLOfferDB(OfferDB):
                 details={"op": "get_by_sender_and_listing", "table": "offer"},
             ) from e
 
+    # -----------------------------
+    # STREAMING READS (exports)
+    # -----------------------------
+    @override
+    def iter_by_sender_id(self, sender_id: int) -> Iterator[Offer]:
+        sender_id = Validation.require_int(sender_id, "sender_id")
+
+        sql = text(
+            """
+            SELECT id, listing_id, sender_id, offered_price, location_offered,
+                   created_date, seen, accepted
+            FROM offer
+            WHERE sender_id = :sender_id
+            ORDER BY created_date DESC, id DESC
+        """
+        )
+
+        return self._stream(sql, {"sender_id": sender_id}, op="iter_by_sender_id")
+
+    @override
+    def iter_by_listing_ids(self, listing_ids: List[int]) -> Iterator[Offer]:
+        Validation.require_not_none(listing_ids, "listing_ids")
+        listing_ids = [Validation.require_int(i, "listing_id") for i in listing_ids]
+        if not listing_ids:
+            return iter(())
+
+        sql = text(
+            """
+            SELECT id, listing_id, sender_id, offered_price, location_offered,
+                   created_date, seen, accepted
+            FROM offer
+            WHERE listing_id IN :listing_ids
+            ORDER BY created_date DESC, id DESC
+        """
+        ).bindparams(bindparam("listing_ids", expanding=True))
+
+        return self._stream(sql, {"listing_ids": listing_ids}, op="iter_by_listing_ids")
+
+    def _stream(self, sql, params: dict, *, op: str) -> Iterator[Offer]:
+        """
+        Execute `sql` on a server-side cursor and map rows lazily.
+
+        The connection stays checked out until the generator is exhausted
+        or closed, so only STREAM_BATCH_SIZE rows are ever buffered.
+        """
+        try:
+            with self._db.connect() as conn:
+                result = conn.execution_options(
+                    stream_results=True,
+                    yield_per=self.STREAM_BATCH_SIZE,
+                ).execute(sql, params)
+                for row in result.mappings():
+                    yield OfferMapper.from_mapping(row)
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to stream offers.",
+                details={"op": op, "table": "offer"},
+            ) from e
+
+    # -----------------------------
+    # COUNTS
+    # -----------------------------
+    @override
+    def count_by_state(self, account_id: int) -> OfferCounts:
+        account_id = Validation.require_int(account_id, "account_id")
+
+        # Received counts join listing on seller_id (idx_listing_seller_created)
+        # and read offer through idx_offer_listing_state; sent_pending is
+        # answered from idx_offer_sender_state alone.
+        sql = text(
+            """
+            SELECT
+                COALESCE(SUM(o.seen = FALSE), 0) AS unseen,
+                COALESCE(SUM(o.accepted IS NULL), 0) AS pending,
+                (SELECT COUNT(*) FROM offer
+                 WHERE sender_id = :account_id AND accepted IS NULL) AS sent_pending
+            FROM listing l
+            JOIN offer o ON o.listing_id = l.id
+            WHERE l.seller_id = :account_id
+        """
+        )
+        params = {"account_id": account_id}
+
+        try:
+            with self._db.connect() as conn:
+                row = conn.execute(sql, params).mappings().one()
+                return OfferCounts(
+                    unseen=int(row["unseen"]),
+                    pending=int(row["pending"]),
+                    sent_pending=int(row["sent_pending"]),
+                )
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to count offers.",
+                details={"op": "count_by_state", "table": "offer"},
+            ) from e
+
     # -----------------------------
     # UPDATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def set_seen(self, offer_id: int) -> None:
         offer_id = Validation.require_int(offer_id, "offer_id")
 
@@ -308,10 +427,71 @@ class MySQLOfferDB(OfferDB):
             ) from e
 
     @override
+    @transactional(retry_safe=True)
+    def set_seen_many(self, seller_id: int, offer_ids: Optional[List[int]] = None) -> List[Offer]:
+        seller_id = Validation.require_int(seller_id, "seller_id")
+        if offer_ids is not None:
+            offer_ids = [Validation.require_int(i, "offer_id") for i in offer_ids]
+            if not offer_ids:
+                return []
+
+        # Ownership is the join on listing.seller_id, decided by MySQL in
+        # this transaction. MySQL has no UPDATE ... RETURNING, so the same
+        # predicate is read first with FOR UPDATE: the rows it locks are
+        # exactly the rows the UPDATE then changes.
+        id_filter = "" if offer_ids is None else "AND o.id IN :offer_ids"
+        select_sql = text(
+            f"""
+            SELECT o.id, o.listing_id, o.sender_id, o.offered_price, o.location_offered,
+                   o.created_date, o.seen, o.accepted
+            FROM offer o
+            JOIN listing l ON l.id = o.listing_id
+            WHERE l.seller_id = :seller_id AND o.seen = FALSE {id_filter}
+            ORDER BY o.id
+            FOR UPDATE
+        """
+        )
+        update_sql = text(
+            f"""
+            UPDATE offer o
+            JOIN listing l ON l.id = o.listing_id
+            SET o.seen = TRUE
+            WHERE l.seller_id = :seller_id AND o.seen = FALSE {id_filter}
+        """
+        )
+        params: Dict[str, Any] = {"seller_id": seller_id}
+        if offer_ids is not None:
+            select_sql = select_sql.bindparams(bindparam("offer_ids", expanding=True))
+            update_sql = update_sql.bindparams(bindparam("offer_ids", expanding=True))
+            params["offer_ids"] = offer_ids
+
+        try:
+            with self._db.transaction() as conn:
+                rows = conn.execute(select_sql, params).mappings().all()
+                if not rows:
+                    return []
+                conn.execute(update_sql, params)
+                return [OfferMapper.from_mapping({**row, "seen": True}) for row in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to mark offers as seen.",
+                details={"op": "set_seen_many", "table": "offer"},
+            ) from e
+
+    @override
+    @transactional(retry_safe=True)
     def set_accepted(self, offer_id: int, accepted: bool) -> None:
         offer_id = Validation.require_int(offer_id, "offer_id")
         accepted = Validation.is_boolean(accepted, "accepted")
 
+        lock_sql = text(
+            """
+            SELECT listing_id, accepted
+            FROM offer
+            WHERE id = :id
+            FOR UPDATE
+        """
+        )
         sql = text(
             """
             UPDATE offer
@@ -319,15 +499,26 @@ class MySQLOfferDB(OfferDB):
             WHERE id = :id
         """
         )
+        # Deciding a pending offer takes it out of listing.pending_offer_count
+        count_sql = text(
+            """
+            UPDATE listing
+            SET pending_offer_count = GREATEST(pending_offer_count, 1) - 1
+            WHERE id = :listing_id
+        """
+        )
 
         try:
             with self._db.transaction() as conn:
-                result = conn.execute(sql, {"id": offer_id, "accepted": bool(accepted)})
-                if int(result.rowcount or 0) == 0:
+                row = conn.execute(lock_sql, {"id": offer_id}).mappings().first()
+                if row is None:
                     raise OfferNotFoundError(
                         message=f"Offer not found for id: {offer_id}",
                         details={"offer_id": offer_id},
                     )
+                conn.execute(sql, {"id": offer_id, "accepted": bool(accepted)})
+                if row["accepted"] is None:
+                    conn.execute(count_sql, {"listing_id": int(row["listing_id"])})
         except SQLAlchemyError as e:
             raise DatabaseQueryError(
                 message="Failed to update offer accepted state.",
@@ -338,20 +529,46 @@ class MySQLOfferDB(OfferDB):
     # DELETE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def remove(self, offer_id: int) -> bool:
         offer_id = Validation.require_int(offer_id, "offer_id")
 
+        # Lock the offer first to learn its listing and state; a concurrent
+        # remove of the same offer then waits here and finds nothing to count.
+        lock_sql = text(
+            """
+            SELECT listing_id, accepted
+            FROM offer
+            WHERE id = :id
+            FOR UPDATE
+        """
+        )
         sql = text(
             """
             DELETE FROM offer
             WHERE id = :id
         """
         )
+        count_sql = text(
+            """
+            UPDATE listing
+            SET offer_count = GREATEST(offer_count, 1) - 1,
+                pending_offer_count = GREATEST(pending_offer_count, :pending) - :pending
+            WHERE id = :listing_id
+        """
+        )
 
         try:
             with self._db.transaction() as conn:
-                result = conn.execute(sql, {"id": offer_id})
-                return (result.rowcount or 0) > 0
+                row = conn.execute(lock_sql, {"id": offer_id}).mappings().first()
+                if row is None:
+                    return False
+                conn.execute(sql, {"id": offer_id})
+                conn.execute(
+                    count_sql,
+                    {"listing_id": int(row["listing_id"]), "pending": int(row["accepted"] is None)},
+                )
+                return True
         except SQLAlchemyError as e:
             raise DatabaseQueryError(
                 message="Failed to delete offer.",
@@ -1,10 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
 
 from src.db.utils.db_utils import DBUtility
 from src.domain_models.offer import Offer
 
 
+@dataclass(frozen=True, slots=True)
+class OfferCounts:
+    """Offer badge counters of one account."""
+
+    unseen: int        # received offers not yet seen
+    pending: int       # received offers not yet resolved
+    sent_pending: int  # sent offers not yet resolved
+
+
 class OfferDB(ABC):
     """
     Contract for Listing table persistence.
@@ -192,6 +202,74 @@ class OfferDB(ABC):
         """
         raise NotImplementedError
 
+    # --------------------------------------------------
+    # STREAMING READS (exports)
+    # --------------------------------------------------
+    @abstractmethod
+    def iter_by_sender_id(self, sender_id: int) -> Iterator[Offer]:
+        """
+        Stream all offers a user has SENT, one Offer at a time.
+
+        Expected behavior:
+        - Yield offers in the same order as get_by_sender_id().
+        - Rows must be fetched through a server-side cursor so memory
+          stays flat regardless of how many offers exist.
+        - sender_id is validated eagerly (before the iterator is returned).
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_by_listing_ids(self, listing_ids: List[int]) -> Iterator[Offer]:
+        """
+        Stream all offers for a set of listings, one Offer at a time.
+
+        Expected behavior:
+        - Single query (listing_id IN (...)), newest first.
+        - Yield nothing when listing_ids is empty (no query is issued).
+        - listing_ids is validated eagerly (before the iterator is returned).
+
+        Constraints / notes:
+        - Used for "offers received" exports: the business layer resolves
+          the seller's listing ids, this layer does not join across tables.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
+    # --------------------------------------------------
+    # COUNTS
+    # --------------------------------------------------
+    @abstractmethod
+    def count_by_state(self, account_id: int) -> OfferCounts:
+        """
+        Count unseen and pending offers received on account_id's listings,
+        and pending offers sent by account_id.
+
+        Expected behavior:
+        - One statement; offer rows are counted, never loaded.
+        - unseen / pending match get_unseen_by_listing_id() and
+          get_pending_by_listing_id() summed over the account's listings;
+          both are 0 when it has no listings.
+
+        Constraints / notes:
+        - Used for the offer badge: the seller's listings are joined in SQL
+          on seller_id, never resolved through a (possibly cached) listing read.
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
     # --------------------------------------------------
     # UPDATE
     # --------------------------------------------------
@@ -211,6 +289,30 @@ class OfferDB(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def set_seen_many(self, seller_id: int, offer_ids: Optional[List[int]] = None) -> List[Offer]:
+        """Mark many unseen offers on one seller's listings as seen, in one transaction.
+
+        Expected behavior:
+        - offer_ids=None marks every unseen offer on listings of seller_id;
+          otherwise only the given ids that are unseen AND on those listings.
+        - Ids on other sellers' listings, already seen or missing are
+          skipped silently (no OfferNotFoundError).
+        - Return the offers this call marked (seen=True); empty list when
+          nothing matched. No statement is issued when offer_ids is empty.
+
+        Constraints / notes:
+        - Ownership is decided in SQL by joining listing on seller_id inside
+          the write transaction, never from a listing-id list read earlier
+          (which may come from a cache).
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def set_accepted(self, offer_id: int, accepted: bool) -> None:
         """Accept or reject an offer (accepted = TRUE or FALSE).
@@ -10,13 +10,14 @@ from __future__ import annotations
 
 from typing import Optional, List
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing_extensions import override
 
 from src.db import DBUtility
 from src.db.rating import RatingDB
 from src.db.utils.rating_mapper import RatingMapper
+from src.db.utils.transaction_retry import transactional
 from src.domain_models import Rating
 from src.utils import (
     Validation,
@@ -153,6 +154,7 @@ class MySQLRatingDB(RatingDB):
     # CREATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def add(self, rating: Rating) -> Rating:
         Validation.require_not_none(rating, "rating")
 
@@ -246,6 +248,31 @@ class MySQLRatingDB(RatingDB):
                 details={"op": "get_by_listing_id", "table": "rating"},
             ) from e
 
+    @override
+    def get_by_listing_ids(self, listing_ids: List[int]) -> List[Rating]:
+        Validation.require_not_none(listing_ids, "listing_ids")
+        listing_ids = [Validation.require_int(i, "listing_id") for i in listing_ids]
+        if not listing_ids:
+            return []
+
+        sql = text(
+            """
+            SELECT id, created_at, transaction_rating, listing_id, rater_id
+            FROM rating
+            WHERE listing_id IN :listing_ids
+        """
+        ).bindparams(bindparam("listing_ids", expanding=True))
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(sql, {"listing_ids": listing_ids}).mappings().all()
+                return [RatingMapper.from_mapping(row) for row in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch ratings by listing ids.",
+                details={"op": "get_by_listing_ids", "table": "rating"},
+            ) from e
+
     @override
     def get_by_rater_id(self, rater_id: int) -> List[Rating]:
         Validation.require_int(rater_id, "rater_id")
@@ -413,6 +440,7 @@ class MySQLRatingDB(RatingDB):
     # UPDATE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def update(self, rating: Rating) -> Rating:
         Validation.require_not_none(rating, "rating")
         Validation.require_not_none(rating.id, "rating.id")
@@ -467,6 +495,7 @@ class MySQLRatingDB(RatingDB):
             ) from e
 
     @override
+    @transactional(retry_safe=True)
     def set_score(self, rating_id: int, transaction_rating: int) -> None:
         Validation.require_int(rating_id, "rating_id")
         Validation.require_int(transaction_rating, "transaction_rating")
@@ -512,6 +541,7 @@ class MySQLRatingDB(RatingDB):
     # DELETE
     # -----------------------------
     @override
+    @transactional(retry_safe=True)
     def remove(self, rating_id: int) -> bool:
         Validation.require_int(rating_id, "rating_id")
 
@@ -534,6 +564,7 @@ class MySQLRatingDB(RatingDB):
             ) from e
 
     @override
+    @transactional(retry_safe=True)
     def remove_by_listing_id(self, listing_id: int) -> bool:
         Validation.require_int(listing_id, "listing_id")
 
@@ -117,6 +117,24 @@ class RatingDB(BaseRatingDB):
 
 
 
+    @abstractmethod
+    def get_by_listing_ids(self, listing_ids: List[int]) -> List[Rating]:
+        """
+        Fetch the ratings of a set of listings in one query.
+
+        Expected behavior:
+        - Single query (listing_id IN (...)); at most one rating per listing.
+        - Listings without a rating (or that do not exist) are simply
+          absent from the result; never raise for "not found".
+        - Return an empty list when listing_ids is empty (no query is issued).
+
+        Raises:
+            ValidationError
+            DatabaseQueryError
+            DatabaseUnavailableError
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_all(self) -> List[Rating]:
         """
@@ -0,0 +1 @@
+from .revoked_token_db import RevokedToken, RevokedTokenDB
@@ -0,0 +1 @@
+from .mysql_revoked_token_db import MySQLRevokedTokenDB
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from typing_extensions import override
+
+from src.db import DBUtility
+from src.db.revoked_token import RevokedToken, RevokedTokenDB
+from src.utils import DatabaseQueryError, Validation
+from src.db.utils.transaction_retry import transactional
+
+
+class MySQLRevokedTokenDB(RevokedTokenDB):
+    """
+    MySQL implementation of revoked token persistence.
+
+    expires_at is stored as a naive UTC DATETIME and compared against
+    UTC_TIMESTAMP(), independent of the server's time zone.
+    """
+
+    def __init__(self, db: DBUtility) -> None:
+        super().__init__(db)
+
+    @override
+    @transactional(retry_safe=True)
+    def add(self, token_hash: str, account_id: int, expires_at: datetime) -> None:
+        token_hash = Validation.require_str(token_hash, "token_hash")
+        account_id = Validation.require_int(account_id, "account_id")
+        Validation.require_not_none(expires_at, "expires_at")
+
+        # INSERT IGNORE: a second logout with the same token is a no-op.
+        sql = text("""
+            INSERT IGNORE INTO revoked_token (token_hash, account_id, expires_at)
+            VALUES (:token_hash, :account_id, :expires_at)
+        """)
+
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(sql, {
+                    "token_hash": token_hash,
+                    "account_id": account_id,
+                    "expires_at": expires_at,
+                })
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to record revoked token.",
+                details={"op": "add", "table": "revoked_token"},
+            ) from e
+
+    @override
+    def get_active_since(self, after_id: int, limit: int = 1000) -> List[RevokedToken]:
+        after_id = Validation.require_int(after_id, "after_id")
+        limit = Validation.require_positive_int(limit, "limit")
+
+        sql = text("""
+            SELECT id, token_hash, account_id, expires_at
+            FROM revoked_token
+            WHERE id > :after_id
+              AND expires_at > UTC_TIMESTAMP()
+            ORDER BY id
+            LIMIT :limit
+        """)
+
+        try:
+            with self._db.connect() as conn:
+                rows = conn.execute(sql, {"after_id": after_id, "limit": limit}).mappings().all()
+                return [
+                    RevokedToken(
+                        id=int(r["id"]),
+                        token_hash=str(r["token_hash"]),
+                        account_id=int(r["account_id"]),
+                        expires_at=r["expires_at"],
+                    )
+                    for r in rows
+                ]
+        except SQLAlchemyError as e:
+            raise DatabaseQueryError(
+                message="Failed to fetch revoked tokens.",
+                details={"op": "get_active_since", "table": "revoked_token"},
+            ) from e
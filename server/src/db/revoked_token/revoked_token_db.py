@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+from src.db import DBUtility
+
+
+@dataclass(frozen=True, slots=True)
+class RevokedToken:
+    """One revoked_token row. token_hash is the SHA-256 hex digest of the JWT."""
+
+    id: int
+    token_hash: str
+    account_id: int
+    expires_at: datetime
+
+
+class RevokedTokenDB(ABC):
+    """
+    Contract for revoked_token table persistence.
+
+    IMPORTANT DESIGN RULES:
+
+    - This layer is responsible ONLY for database access.
+    - It never sees raw tokens, only their SHA-256 hex digests.
+    - Rows are append-only; readers page through them by increasing id so
+      an in-memory revocation set can be refreshed incrementally.
+    """
+
+    def __init__(self, db: DBUtility) -> None:
+        """
+        The DBUtility instance must be injected.
+        This allows connection pooling reuse across instances.
+        """
+        self._db = db
+
+    @abstractmethod
+    def add(self, token_hash: str, account_id: int, expires_at: datetime) -> None:
+        """
+        Record a revoked token.
+
+        Revoking the same token twice is not an error (no-op).
+
+        Args:
+            token_hash (str): SHA-256 hex digest of the raw JWT
+            account_id (int): Owner of the token (the JWT "sub")
+            expires_at (datetime): The token's own expiry (UTC); the row is
+                                   irrelevant after it
+
+        Raises:
+            ValidationError: If an argument is invalid
+            DatabaseQueryError: If insertion fails
+        """
+        pass
+
+    @abstractmethod
+    def get_active_since(self, after_id: int, limit: int = 1000) -> List[RevokedToken]:
+        """
+        Revocations with id > after_id that have not expired yet, by id.
+
+        Args:
+            after_id (int): Highest id the caller has already seen (0 for all)
+            limit (int): Page size
+
+        Returns:
+            List[RevokedToken]: Possibly empty, ordered by id ascending
+
+        Raises:
+            ValidationError: If an argument is invalid
+            DatabaseQueryError: If the query fails
+        """
+        pass
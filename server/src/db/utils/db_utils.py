@@ -5,11 +5,19 @@ from contextlib import contextmanager
 from typing import  Iterator
 
 from typing import  Optional
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine, Connection
 from sqlalchemy.exc import OperationalError
 
-from src.utils import Validation, DatabaseUnavailableError, ConfigurationError
+from src.utils import (
+    Validation,
+    DatabaseConflictError,
+    DatabaseUnavailableError,
+    ConfigurationError,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+from .transaction_retry import is_retryable_conflict, mysql_error_code
 
 
 class DBUtility:
@@ -72,8 +80,8 @@ class DBUtility:
         pool_timeout: int = 30,
         pool_recycle: int = 1800,
         pool_pre_ping: bool = True,
-        driver="mysql+pymysql"
-
+        driver="mysql+pymysql",
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         # ---- validate required inputs (fail fast) ----
         Validation.require_str(host, "host")
@@ -85,6 +93,11 @@ class DBUtility:
         self._database = database
         self._host = host
         self._port = port
+        self._pool_size = pool_size
+        self._pool_capacity = pool_size + max_overflow
+        self._breaker = circuit_breaker or CircuitBreakerRegistry.instance().breaker(
+            "mysql", _circuit_open_error
+        )
 
         url = f"{driver}://{username}:{password}@{host}:{port}/{database}"
 
@@ -114,25 +127,73 @@ class DBUtility:
         - Higher layers (e.g., MySQLAccountDB) should NOT catch
           OperationalError directly.
         - They should only convert query-level failures.
+        - While the circuit breaker is open, fails immediately without
+          touching the pool.
         """
+        self._breaker.allow()
+        checked_out = False
         try:
             with self._engine.connect() as conn:
+                checked_out = True
+                self._breaker.record_success()
                 yield conn
         except OperationalError as e:
-            raise DatabaseUnavailableError("Database is unavailable.") from e
+            raise self._operational_error(e, checked_out) from e
 
     @contextmanager
     def transaction(self) -> Iterator[Connection]:
         """
         Transaction wrapper.
         If DB is down, raises DatabaseUnavailableError (to be mapped to 503).
+        A deadlock or lock wait timeout raises DatabaseConflictError; the
+        transaction has been rolled back and may be run again (see
+        transactional(retry_safe=True)).
         """
+        self._breaker.allow()
+        checked_out = False
         try:
             with self._engine.begin() as conn:
+                checked_out = True
+                self._breaker.record_success()
                 yield conn
         except OperationalError as e:
-            raise DatabaseUnavailableError("Database is unavailable.") from e
+            raise self._operational_error(e, checked_out) from e
 
+    def prewarm(self) -> int:
+        """
+        Open pool_size connections and return them to the pool, so the first
+        requests after startup reuse them instead of each paying for the TCP
+        and auth handshake. Stops at the first failure (counted by the
+        circuit breaker). Returns how many connections were opened.
+        """
+        opened = []
+        try:
+            for _ in range(self._pool_size):
+                opened.append(self._engine.connect())
+        except OperationalError:
+            self._breaker.record_failure()
+        finally:
+            for conn in opened:
+                conn.close()
+        if opened:
+            self._breaker.record_success()
+        return len(opened)
+
+    def ping(self) -> None:
+        """Round-trip SELECT 1. Raises DatabaseUnavailableError if MySQL does not answer."""
+        with self.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    def _operational_error(self, error: OperationalError, checked_out: bool) -> Exception:
+        if not checked_out:
+            # Could not even get a connection: the database is unreachable.
+            self._breaker.record_failure()
+        elif is_retryable_conflict(error):
+            return DatabaseConflictError(
+                "Transaction was rolled back by a lock conflict.",
+                details={"mysql_error": mysql_error_code(error)},
+            )
+        return DatabaseUnavailableError("Database is unavailable.")
 
     @staticmethod
     def instance() -> DBUtility:
@@ -143,6 +204,7 @@ class DBUtility:
     def dispose(self) -> None:
         """Close all pooled connections (useful on app shutdown)."""
         self._engine.dispose()
+
     @classmethod
     def reset(cls) -> None:
         if cls._instance is not None:
@@ -157,9 +219,30 @@ class DBUtility:
         """Expose the underlying Engine (pool) if you want to share it."""
         return self._engine
 
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    @property
+    def pool_size(self) -> int:
+        """Connections the pool keeps open between requests."""
+        return self._pool_size
+
+    @property
+    def pool_capacity(self) -> int:
+        """Most connections the pool hands out at once (pool_size + max_overflow)."""
+        return self._pool_capacity
+
     @property
     def database(self) -> str:
         return self._database
     @property
     def url_database(self) -> str:
-        return self._database
\ No newline at end of file
+        return self._database
+
+
+def _circuit_open_error() -> DatabaseUnavailableError:
+    return DatabaseUnavailableError(
+        "Database is unavailable.",
+        details={"dependency": "mysql", "circuit": "open"},
+    )
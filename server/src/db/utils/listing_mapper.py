@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Mapping, Optional, List
 
+from src.db.utils.listing_row import ListingRow
 from src.domain_models import Listing
 from src.domain_models import Comment
 
@@ -43,6 +44,46 @@ class ListingMapper:
             comments=None,  # loaded separately (join or another query)
         )
 
+    @staticmethod
+    def row_from_mapping(m: Mapping[str, Any]) -> ListingRow:
+        """
+        Project a trusted listing row into a ListingRow (read path only).
+
+        Notes:
+        - Skips the Listing constructor and its validation; the DB schema
+          already guarantees the column types.
+        - price is DECIMAL in MySQL, so it is still converted to float.
+        """
+        return ListingRow(
+            id=m["id"],
+            seller_id=m["seller_id"],
+            title=m["title"],
+            description=m["description"],
+            price=float(m["price"]),
+            image_url=m["image_url"],
+            location=m["location"],
+            created_at=m["created_at"],
+            is_sold=bool(m["is_sold"]),
+            comment_count=m["comment_count"],
+            offer_count=m["offer_count"],
+            pending_offer_count=m["pending_offer_count"],
+        )
+
+    @staticmethod
+    def projection_from_mapping(m: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Project a sparse listing row (ListingProjection) into a plain dict.
+
+        Only the selected columns are present; price (DECIMAL) and is_sold
+        (TINYINT) are converted when selected, the rest pass through.
+        """
+        row = dict(m)
+        if "price" in row:
+            row["price"] = float(row["price"])
+        if "is_sold" in row:
+            row["is_sold"] = bool(row["is_sold"])
+        return row
+
 
 ## Commented out for now since we are not currently using this,
 ## Purpose of commenting: 100% code coverage
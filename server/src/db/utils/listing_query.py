@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import ClassVar, Optional, Tuple, Union
+
+import orjson
+
+from src.db.utils.listing_row import ListingRow
+from src.domain_models.listing import Listing
+from src.utils import ValidationError
+
+# Sort orders of GET /listings/query; every one ends on id so it is total.
+LISTING_SORTS: Tuple[str, ...] = ("newest", "price_asc", "price_desc")
+
+
+@dataclass(frozen=True, slots=True)
+class ListingCursor:
+    """
+    Keyset position: the sort key of the last row of a page.
+
+    The next page is "rows strictly after (value, id) in sort order", so
+    pages stay stable while listings are added, and a deep page costs the
+    same as the first (no OFFSET scan).
+
+    value is created_at for "newest" and the price (exact DECIMAL) for the
+    price sorts.
+    """
+
+    sort: str
+    value: Union[datetime, Decimal]
+    id: int
+
+    @classmethod
+    def after(cls, row: ListingRow, sort: str) -> "ListingCursor":
+        """Cursor pointing just past row."""
+        value = row.created_at if sort == "newest" else Decimal(f"{row.price:.2f}")
+        return cls(sort=sort, value=value, id=row.id)
+
+    def encode(self) -> str:
+        """Opaque, URL-safe token (unpadded base64url of a small JSON array)."""
+        value = self.value.isoformat() if isinstance(self.value, datetime) else str(self.value)
+        raw = orjson.dumps([self.sort, value, self.id])
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str, sort: str) -> "ListingCursor":
+        """
+        Parse a token produced by encode() for the same sort.
+
+        Raises:
+            ValidationError: malformed token, or one issued for another sort
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            token_sort, value, listing_id = orjson.loads(raw)
+            if token_sort != sort or not isinstance(listing_id, int) or not isinstance(value, str):
+                raise ValueError(token_sort)
+            parsed = datetime.fromisoformat(value) if sort == "newest" else Decimal(value)
+        except (binascii.Error, orjson.JSONDecodeError, InvalidOperation, TypeError, ValueError) as e:
+            raise ValidationError(
+                message="Invalid cursor.",
+                details={"cursor": token, "sort": sort},
+            ) from e
+        return cls(sort=sort, value=parsed, id=listing_id)
+
+
+@dataclass(frozen=True, slots=True)
+class ListingQuery:
+    """
+    Filters, sort and page of a composable listing query.
+
+    Every filter is optional; None means "not filtered". location is
+    matched as a prefix of the canonical location key (Listing.location_key_of),
+    keyword as a substring of the title. Build through of(), which
+    validates and normalizes the raw request values.
+    """
+
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+    location_key: Optional[str] = None
+    seller_id: Optional[int] = None
+    is_sold: Optional[bool] = None
+    keyword: Optional[str] = None
+    sort: str = "newest"
+    limit: int = 20
+    after: Optional[ListingCursor] = None
+
+    DEFAULT_LIMIT: ClassVar[int] = 20
+    MAX_LIMIT: ClassVar[int] = 100
+    MAX_KEYWORD_LENGTH: ClassVar[int] = 100
+
+    @classmethod
+    def of(
+        cls,
+        *,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        location: Optional[str] = None,
+        seller_id: Optional[int] = None,
+        is_sold: Optional[bool] = None,
+        keyword: Optional[str] = None,
+        sort: str = "newest",
+        limit: int = DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> "ListingQuery":
+        """
+        Validated query from raw request values.
+
+        Raises:
+            ValidationError: one message per invalid value, in details
+        """
+        errors: dict[str, str] = {}
+
+        if sort not in LISTING_SORTS:
+            errors["sort"] = f"sort must be one of: {', '.join(LISTING_SORTS)}."
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= cls.MAX_LIMIT:
+            errors["limit"] = f"limit must be between 1 and {cls.MAX_LIMIT}."
+        low, high = cls._price(min_price, "min_price", errors), cls._price(max_price, "max_price", errors)
+        if low is not None and high is not None and low > high:
+            errors["max_price"] = "max_price must not be below min_price."
+
+        location_key = None
+        if location is not None:
+            location_key = Listing.location_key_of(location)
+            if location_key is None:
+                errors["location"] = "location must contain letters or digits."
+        if seller_id is not None and (isinstance(seller_id, bool) or not isinstance(seller_id, int) or seller_id < 1):
+            errors["seller_id"] = "seller_id must be a positive integer."
+        if keyword is not None:
+            keyword = " ".join(keyword.split())
+            if not keyword or len(keyword) > cls.MAX_KEYWORD_LENGTH:
+                errors["keyword"] = f"keyword must be 1 to {cls.MAX_KEYWORD_LENGTH} characters."
+
+        if errors:
+            raise ValidationError(message="Invalid listing query.", details=errors)
+
+        return cls(
+            min_price=low,
+            max_price=high,
+            location_key=location_key,
+            seller_id=seller_id,
+            is_sold=is_sold,
+            keyword=keyword,
+            sort=sort,
+            limit=limit,
+            after=None if cursor is None else ListingCursor.decode(cursor, sort),
+        )
+
+    @staticmethod
+    def _price(value: Optional[float], name: str, errors: dict[str, str]) -> Optional[Decimal]:
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value <= 99_999_999.99:
+            errors[name] = f"{name} must be between 0 and 99999999.99."
+            return None
+        # price is DECIMAL(10,2): compare against the exact column value
+        return Decimal(f"{value:.2f}")
+
+    @property
+    def key(self) -> str:
+        """Stable digest of the query for cache validators (comma-free, fixed length)."""
+        cursor = None if self.after is None else self.after.encode()
+        raw = orjson.dumps([
+            None if self.min_price is None else str(self.min_price),
+            None if self.max_price is None else str(self.max_price),
+            self.location_key, self.seller_id, self.is_sold, self.keyword,
+            self.sort, self.limit, cursor,
+        ])
+        return hashlib.sha256(raw).hexdigest()[:16]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import ClassVar, Iterable, Optional, Tuple
+
+from src.utils import ValidationError
+
+
+@dataclass(frozen=True, slots=True)
+class ListingRow:
+    """
+    Read-only projection of a listing row for list endpoints.
+
+    Unlike Listing, this is NOT a domain entity:
+    - No validation runs on construction. Rows come straight from the
+      listing table, whose column types and constraints already hold.
+    - No comments/rating relations; their activity is summarized by the
+      denormalized counters instead (comment_count, offer_count,
+      pending_offer_count), so cards never count related rows.
+    - Never passed to write paths (use Listing for create/update).
+
+    Slotted and frozen so thousands of rows stay cheap to build and hold.
+    """
+
+    id: int
+    seller_id: int
+    title: str
+    description: str
+    price: float
+    image_url: Optional[str]
+    location: Optional[str]
+    created_at: Optional[datetime]
+    is_sold: bool
+    comment_count: int = 0
+    offer_count: int = 0
+    pending_offer_count: int = 0  # offers not yet accepted or rejected
+
+
+# Columns a list endpoint may select, in response order (ListingRow's fields)
+LISTING_ROW_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(ListingRow))
+
+
+@dataclass(frozen=True, slots=True)
+class ListingProjection:
+    """
+    The ListingRow columns a list query selects (sparse fieldsets).
+
+    fields are pushed down into the SELECT list, so unrequested columns
+    (notably the description TEXT) are never read or sent. When
+    description_chars is set the description is cut to that many
+    characters in SQL, before it leaves the database.
+
+    id is always included: clients key cards and links on it.
+    """
+
+    fields: Tuple[str, ...] = LISTING_ROW_FIELDS
+    description_chars: Optional[int] = None
+
+    # Description length of view=summary (feed cards show two lines)
+    SUMMARY_DESCRIPTION_CHARS: ClassVar[int] = 160
+
+    @classmethod
+    def of(
+        cls, requested: Optional[Iterable[str]] = None, description_chars: Optional[int] = None
+    ) -> "ListingProjection":
+        """
+        Projection of the requested field names (None: every field).
+
+        Raises:
+            ValidationError: unknown field names, or description_chars < 1
+        """
+        names = {"id"} | set(LISTING_ROW_FIELDS if requested is None else requested)
+        unknown = sorted(names - set(LISTING_ROW_FIELDS))
+        if unknown:
+            raise ValidationError(
+                message=f"Unknown listing fields: {', '.join(unknown)}.",
+                details={"fields": unknown, "allowed": list(LISTING_ROW_FIELDS)},
+            )
+        if description_chars is not None and description_chars < 1:
+            raise ValidationError(
+                message="description_chars must be positive.",
+                details={"description_chars": description_chars},
+            )
+        return cls(
+            fields=tuple(name for name in LISTING_ROW_FIELDS if name in names),
+            description_chars=description_chars,
+        )
+
+    @classmethod
+    def summary(cls, requested: Optional[Iterable[str]] = None) -> "ListingProjection":
+        """Projection for feed cards: the description is truncated server-side."""
+        return cls.of(requested, description_chars=cls.SUMMARY_DESCRIPTION_CHARS)
+
+    @property
+    def key(self) -> str:
+        """Stable text form for cache validators, e.g. "id+title+description~160".
+
+        Comma-free, since If-None-Match lists several ETags separated by commas.
+        """
+        key = "+".join(self.fields)
+        return key if self.description_chars is None else f"{key}~{self.description_chars}"
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from sqlalchemy.exc import OperationalError
+
+from src.utils import DatabaseConflictError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# MySQL errors after which InnoDB has rolled the statement/transaction back
+# and the same transaction may simply be run again.
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_LOCK_DEADLOCK = 1213
+RETRYABLE_MYSQL_ERRORS = frozenset({ER_LOCK_WAIT_TIMEOUT, ER_LOCK_DEADLOCK})
+
+
+def mysql_error_code(error: BaseException) -> Optional[int]:
+    """The MySQL error number of a DBAPI-wrapped error, if there is one."""
+    args = getattr(getattr(error, "orig", None), "args", None)
+    if args and isinstance(args[0], int):
+        return args[0]
+    return None
+
+
+def is_retryable_conflict(error: OperationalError) -> bool:
+    return mysql_error_code(error) in RETRYABLE_MYSQL_ERRORS
+
+
+class RetryBudget:
+    """Retries left for one request, shared by every transaction it runs."""
+
+    __slots__ = ("remaining",)
+
+    def __init__(self, retries: int) -> None:
+        self.remaining = retries
+
+
+_request_budget: ContextVar[Optional[RetryBudget]] = ContextVar("db_retry_budget", default=None)
+
+
+class TransactionRetrier:
+    """
+    Re-runs retry-safe transactions rolled back by a deadlock or lock wait
+    timeout (DatabaseConflictError).
+
+    Backoff:
+    - Up to max_attempts runs per call. Before run n+1 it sleeps a random
+      time in [0, min(max_delay, base_delay * 2**n)] ("full jitter"), so
+      the transactions that collided do not collide again in lockstep.
+
+    Retry budget:
+    - Inside request_budget() (one per HTTP request, see
+      RetryBudgetMiddleware) all transactions share request_retries
+      retries, so a request touching many contended rows cannot multiply
+      its latency. Outside a request only max_attempts applies.
+
+    When attempts or budget run out the last DatabaseConflictError is
+    raised (503 + Retry-After).
+    """
+
+    _instance: Optional["TransactionRetrier"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay_seconds: float = 0.02,
+        max_delay_seconds: float = 0.5,
+        request_retries: int = 5,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay_seconds
+        self._max_delay = max_delay_seconds
+        self._request_retries = request_retries
+        self._sleep = sleep
+        self._rng = rng
+
+        self._lock = threading.Lock()
+        self._conflicts = 0
+        self._retries = 0
+        self._recovered = 0
+        self._exhausted = 0
+        self._budget_exhausted = 0
+        self._retries_by_op: Dict[str, int] = {}
+
+    @classmethod
+    def instance(cls) -> "TransactionRetrier":
+        """
+        Process-wide retrier configured from the environment:
+        DB_RETRY_MAX_ATTEMPTS (default 3), DB_RETRY_BASE_DELAY_MS (default 20),
+        DB_RETRY_MAX_DELAY_MS (default 500), DB_RETRY_REQUEST_BUDGET (default 5).
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = TransactionRetrier(
+                        max_attempts=int(os.getenv("DB_RETRY_MAX_ATTEMPTS", "3")),
+                        base_delay_seconds=int(os.getenv("DB_RETRY_BASE_DELAY_MS", "20")) / 1000,
+                        max_delay_seconds=int(os.getenv("DB_RETRY_MAX_DELAY_MS", "500")) / 1000,
+                        request_retries=int(os.getenv("DB_RETRY_REQUEST_BUDGET", "5")),
+                    )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+    @contextmanager
+    def request_budget(self) -> Iterator[RetryBudget]:
+        """Share one retry budget across everything run inside the block."""
+        budget = RetryBudget(self._request_retries)
+        token = _request_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _request_budget.reset(token)
+
+    def run(self, fn: Callable[[], T], op: str) -> T:
+        attempt = 1
+        while True:
+            try:
+                result = fn()
+            except DatabaseConflictError:
+                self._count("_conflicts")
+                if not self._may_retry(attempt, op):
+                    raise
+                self._record_retry(op)
+                self._sleep(self._rng(0.0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1))))
+                attempt += 1
+                continue
+
+            if attempt > 1:
+                self._count("_recovered")
+            return result
+
+    def _may_retry(self, attempt: int, op: str) -> bool:
+        if attempt >= self._max_attempts:
+            self._count("_exhausted")
+            logger.warning("Giving up on %s after %d conflicting attempts", op, attempt)
+            return False
+
+        budget = _request_budget.get()
+        if budget is not None:
+            with self._lock:
+                if budget.remaining <= 0:
+                    self._budget_exhausted += 1
+                    return False
+                budget.remaining -= 1
+        return True
+
+    def _record_retry(self, op: str) -> None:
+        with self._lock:
+            self._retries += 1
+            self._retries_by_op[op] = self._retries_by_op.get(op, 0) + 1
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "conflicts": self._conflicts,
+            "retries": self._retries,
+            "recovered": self._recovered,
+            "attempts_exhausted": self._exhausted,
+            "budget_exhausted": self._budget_exhausted,
+            "retries_by_op": dict(self._retries_by_op),
+        }
+
+
+def transactional(*, retry_safe: bool) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Declare whether a DB write may be re-run after a deadlock/lock timeout.
+
+    retry_safe=True: the method is one self-contained transaction with no
+    effects outside MySQL, so running it again after a rollback is the
+    same as running it once. Conflicts are retried by TransactionRetrier.
+
+    retry_safe=False: conflicts are raised to the caller unchanged.
+    """
+
+    def decorate(fn: Callable[..., T]) -> Callable[..., T]:
+        fn.__retry_safe__ = retry_safe
+        if not retry_safe:
+            return fn
+
+        op = fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return TransactionRetrier.instance().run(lambda: fn(*args, **kwargs), op)
+
+        return wrapper
+
+    return decorate
@@ -38,8 +38,26 @@ class Account:
        - Parameters after `*` must be passed explicitly by name.
        - This prevents accidental parameter misordering.
        - Improves clarity and safety in object creation.
+
+    6. __slots__
+       - Entities are built per DB row, often thousands per request.
+       - `__slots__` drops the per-instance `__dict__`; the listings
+         list is only allocated once a listing is added.
     """
 
+    __slots__ = (
+        "_id",
+        "_email",
+        "_password",
+        "_fname",
+        "_lname",
+        "_verified",
+        "_listings",
+        "_average_rating_received",
+        "_sum_of_ratings_received",
+        "_rating_count",
+    )
+
     def __init__(
         self,
         email: str,
@@ -62,7 +80,7 @@ class Account:
         self._lname = Validation.require_str(lname, "lname")
         self._verified = Validation.is_boolean(verified, "verified")
 
-        self._listings: List[Listing] = list(listings) if listings is not None else []
+        self._listings: Optional[List[Listing]] = list(listings) if listings else None
 
         self._average_rating_received = Validation.rating_average(
             average_rating_received
@@ -190,7 +208,7 @@ class Account:
     @property
     def listings(self) -> List[Listing]:
         # return a copy to avoid accidental external mutation
-        return list(self._listings)
+        return list(self._listings) if self._listings is not None else []
 
     def add_listing(self, listing: Listing) -> None:
         Validation.require_not_none(listing, "listing")
@@ -201,12 +219,14 @@ class Account:
                 f"Cannot add Listing(seller_id={listing.seller_id}) to Account(id={self._id})."
             )
 
+        if self._listings is None:
+            self._listings = []
         self._listings.append(listing)
 
     def remove_listing(self, listing_id: int) -> None:
         listing_id = Validation.require_positive_int(listing_id, "listing_id")
 
-        for i, l in enumerate(self._listings):
+        for i, l in enumerate(self._listings or ()):
             if l.id == listing_id:
                 self._listings.pop(i)
                 return
@@ -226,6 +246,6 @@ class Account:
             f"fname={self._fname!r}, "
             f"lname={self._lname!r}, "
             f"verified={self._verified}, "
-            f"listings_count={len(self._listings)})"
-            f"listings={self._listings})"
+            f"listings_count={len(self._listings or ())})"
+            f"listings={self._listings or []})"
         )
@@ -17,6 +17,14 @@ class Comment:
     - id can only be assigned once (after DB persistence).
     """
 
+    __slots__ = (
+        "_id",
+        "_listing_id",
+        "_author_id",
+        "_body",
+        "_created_date",
+    )
+
     def __init__(
         self,
         listing_id: int,
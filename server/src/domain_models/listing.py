@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 from src.domain_models.offer import Offer
 from src.utils import ValidationError, UnapprovedBehaviorError, Validation
 from typing import List
@@ -7,6 +9,13 @@ from src.domain_models.comment import Comment
 from src.domain_models.rating import Rating
 
 
+# Runs of anything but letters/digits collapse to one space in location keys
+_LOCATION_KEY_SEPARATORS = re.compile(r"[\W_]+")
+
+# Width of listing.location_key
+LOCATION_KEY_MAX_LENGTH = 120
+
+
 class Listing:
     """
     Domain Entity: Listing
@@ -21,8 +30,26 @@ class Listing:
     - rating can only exist when the listing is sold.
     - id can only be assigned once (after DB persistence).
     - offers is the list of Offer objects associated with this listing.
+    - comments/offers lists are only allocated on first add; most rows come
+      from list queries and never get either.
     """
 
+    __slots__ = (
+        "_id",
+        "_seller_id",
+        "_title",
+        "_description",
+        "_price",
+        "_image_url",
+        "_location",
+        "_created_at",
+        "_is_sold",
+        "_sold_to_id",
+        "_comments",
+        "_rating",
+        "_offers",
+    )
+
     def __init__(
         self,
         seller_id: int,
@@ -61,9 +88,9 @@ class Listing:
         self._is_sold = Validation.is_boolean(is_sold, "is_sold")
         self._sold_to_id = sold_to_id
 
-        self._comments = list(comments) if comments is not None else []
+        self._comments: List[Comment] | None = list(comments) if comments else None
         self._rating = None if rating is None else rating
-        self._offers = list(offers) if offers is not None else []
+        self._offers: List[Offer] | None = list(offers) if offers else None
 
         self._enforce_sold_invariants()
         self._enforce_rating_invariants()
@@ -162,6 +189,25 @@ class Listing:
             None if value is None else Validation.require_str(value, "location")
         )
 
+    @property
+    def location_key(self) -> str | None:
+        """Canonical, indexed form of location (see location_key_of)."""
+        return Listing.location_key_of(self._location)
+
+    @staticmethod
+    def location_key_of(location: str | None) -> str | None:
+        """
+        Canonical key of a free-text location, e.g. " Winnipeg,  MB " -> "winnipeg mb".
+
+        Lower-cased; every run of punctuation/whitespace becomes one space.
+        Keys therefore never contain LIKE wildcards (% or _), so a prefix
+        match is just key + "%". None when nothing is left.
+        """
+        if location is None:
+            return None
+        key = _LOCATION_KEY_SEPARATORS.sub(" ", location.lower()).strip()
+        return key[:LOCATION_KEY_MAX_LENGTH].rstrip() or None
+
     # ==============================
     # CREATED AT (DB-managed)
     # ==============================
@@ -243,12 +289,12 @@ class Listing:
 
     @property
     def comments(self) -> List[Comment]:
-        return list(self._comments)
+        return list(self._comments) if self._comments is not None else []
 
     @comments.setter
     def comments(self, value: List[Comment] | None) -> None:
         if value is None:
-            self._comments = []
+            self._comments = None
             return
 
         if not isinstance(value, list):
@@ -263,7 +309,7 @@ class Listing:
     def add_comment(self, comment: Comment) -> None:
         Validation.require_not_none(comment, "Comment")
 
-        self._comments.append(comment)
+        self._comment_list().append(comment)
 
     def add_comments(self, comments: List[Comment]) -> None:
         Validation.require_not_none(comments, "comments")
@@ -281,7 +327,12 @@ class Listing:
                     f"does not match Listing.id ({self._id})."
                 )
 
-            self._comments.append(comment)
+            self._comment_list().append(comment)
+
+    def _comment_list(self) -> List[Comment]:
+        if self._comments is None:
+            self._comments = []
+        return self._comments
 
     # ==============================
     # OFFERS
@@ -289,12 +340,12 @@ class Listing:
 
     @property
     def offers(self) -> List[Offer]:
-        return list(self._offers)
+        return list(self._offers) if self._offers is not None else []
 
     @offers.setter
     def offers(self, value: List[Offer] | None) -> None:
         if value is None:
-            self._offers = []
+            self._offers = None
             return
 
         if not isinstance(value, list):
@@ -318,6 +369,8 @@ class Listing:
                 f"does not match Listing.id ({self._id})."
             )
 
+        if self._offers is None:
+            self._offers = []
         self._offers.append(offer)
 
     # ==============================
@@ -334,6 +387,6 @@ class Listing:
             f"sold_to_id={self._sold_to_id}, "
             f"created_at={self._created_at!r}, "
             f"rating={self._rating}, "
-            f"comments={self._comments}, "
-            f"offers={self._offers})"
+            f"comments={self._comments or []}, "
+            f"offers={self._offers or []})"
         )
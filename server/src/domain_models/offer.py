@@ -24,6 +24,17 @@ class Offer:
     - id can only be assigned once (after DB persistence).
     """
 
+    __slots__ = (
+        "_id",
+        "_listing_id",
+        "_sender_id",
+        "_offered_price",
+        "_location_offered",
+        "_created_date",
+        "_seen",
+        "_accepted",
+    )
+
     def __init__(
         self,
         listing_id: int,
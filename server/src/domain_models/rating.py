@@ -20,6 +20,14 @@ class Rating:
         * only the buyer can rate the listing
     """
 
+    __slots__ = (
+        "_id",
+        "_listing_id",
+        "_rater_id",
+        "_transaction_rating",
+        "_created_at",
+    )
+
     def __init__(
         self,
         listing_id: int,
@@ -0,0 +1,3 @@
+from .job_queue import JobHandler, JobQueue
+from .email_token_sweeper import PURGE_EMAIL_TOKENS_JOB, EmailTokenSweeper
+from .listing_counter_reconciler import RECONCILE_LISTING_COUNTERS_JOB, ListingCounterReconciler
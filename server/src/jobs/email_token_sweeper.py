@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from src.db.email_verification_token import EmailVerificationTokenDB
+
+logger = logging.getLogger(__name__)
+
+# Job kind of one sweep; the container schedules it on the JobQueue
+PURGE_EMAIL_TOKENS_JOB = "maintenance.purge_email_tokens"
+
+
+class EmailTokenSweeper:
+    """
+    Deletes expired and used email verification tokens in small chunks.
+
+    Each chunk is one short DELETE of at most chunk_size primary keys
+    (see EmailVerificationTokenDB.purge_chunk), followed by a pause of
+    pause_seconds, so a sweep never holds many row locks or starves
+    signup and verification writes. A run stops after max_chunks; the
+    next scheduled run continues from the start of the table.
+
+    Tokens are kept for grace_seconds after they expire or are used, so
+    a late click still gets "expired" / "already used" instead of "not
+    found". expires_at is written from the app clock (datetime.now), so
+    the cutoff is taken from the same clock.
+    """
+
+    def __init__(
+        self,
+        token_db: EmailVerificationTokenDB,
+        chunk_size: int = 500,
+        pause_seconds: float = 0.05,
+        grace_seconds: float = 3600.0,
+        max_chunks: int = 500,
+        now: Callable[[], datetime] = datetime.now,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._db = token_db
+        self._chunk_size = chunk_size
+        self._pause = pause_seconds
+        self._grace = grace_seconds
+        self._max_chunks = max_chunks
+        self._now = now
+        self._sleep = sleep
+
+    @classmethod
+    def from_environment(cls, token_db: EmailVerificationTokenDB) -> "EmailTokenSweeper":
+        return cls(
+            token_db,
+            chunk_size=int(os.getenv("EMAIL_TOKEN_PURGE_CHUNK_SIZE") or 500),
+            pause_seconds=float(os.getenv("EMAIL_TOKEN_PURGE_PAUSE_SECONDS") or 0.05),
+            grace_seconds=float(os.getenv("EMAIL_TOKEN_PURGE_GRACE_SECONDS") or 3600),
+        )
+
+    def run(self, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        One sweep (also the PURGE_EMAIL_TOKENS_JOB handler).
+
+        Returns:
+            Dict[str, Any]: purged rows, chunks, elapsed seconds, the cutoff,
+                            and complete=False if max_chunks cut the sweep short
+
+        Raises:
+            DatabaseQueryError: If a chunk fails (rows purged so far stay deleted)
+        """
+        cutoff = self._now() - timedelta(seconds=self._grace)
+        started = time.perf_counter()
+        purged = chunks = 0
+        after_id = 0
+        complete = False
+        while chunks < self._max_chunks:
+            deleted, last_id = self._db.purge_chunk(cutoff, after_id, self._chunk_size)
+            if last_id is None:
+                complete = True
+                break
+            purged += deleted
+            chunks += 1
+            after_id = last_id
+            self._sleep(self._pause)
+
+        report = {
+            "purged": purged,
+            "chunks": chunks,
+            "seconds": round(time.perf_counter() - started, 3),
+            "cutoff": cutoff.isoformat(timespec="seconds"),
+            "complete": complete,
+        }
+        logger.info("Purged %d email verification tokens in %d chunks (%.3fs)",
+                    purged, chunks, report["seconds"])
+        return report
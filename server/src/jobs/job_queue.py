@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from src.db.job import Job, JobDB, NewJob
+from src.utils import AppError, ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# A handler may return a dict summarizing the run; the latest one per kind is in stats().
+JobHandler = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class _Registration:
+    queue: str
+    handler: JobHandler
+    max_attempts: int
+
+
+@dataclass
+class _Schedule:
+    kind: str
+    every_seconds: float
+    payload: Dict[str, Any]
+    last_slot: Optional[int] = None
+
+
+class _QueueState:
+    """Worker slots and counters of one queue in this process."""
+
+    def __init__(self, name: str, concurrency: int) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.running = 0
+        self.slots = threading.Condition()
+        self.wake = threading.Event()
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.dispatcher: Optional[threading.Thread] = None
+
+        self.claimed = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+        self.lost_claims = 0
+        self.run_seconds = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self.succeeded + self.retried + self.failed
+        return {
+            "concurrency": self.concurrency,
+            "running": self.running,
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+            "lost_claims": self.lost_claims,
+            "avg_run_ms": round(self.run_seconds / finished * 1000, 3) if finished else 0.0,
+        }
+
+
+class JobQueue:
+    """
+    Background jobs for side effects, persisted in the job table.
+
+    Enqueue:
+    - enqueue() inserts the job row before it returns (one single-row
+      INSERT) and wakes this process's dispatcher for the queue. A job
+      whose enqueue() returned survives a crash of the process; if MySQL
+      is unavailable enqueue() raises and the caller sees the failure.
+
+    Run:
+    - Each queue has one dispatcher thread and `concurrency` worker
+      threads in this process. The dispatcher claims only as many jobs as
+      it has idle workers (FOR UPDATE SKIP LOCKED, see MySQLJobDB), so the
+      per-queue limit holds, and an idle queue costs one claim query per
+      poll_interval_seconds per process.
+    - Delivery is at-least-once: the jobs of a crashed process are
+      claimed again once their lease ends, so handlers must be idempotent.
+    - A handler that raises is retried with exponential backoff
+      (retry_base_seconds * 2^(attempt-1), capped at retry_max_seconds)
+      until max_attempts; then the row stays failed for inspection.
+    - Done rows older than retention_seconds are purged by the scheduler
+      thread.
+
+    Recurring jobs (schedule()) run once per slot: wall-clock time is cut
+    into every_seconds-long slots from the Unix epoch, and the scheduler
+    thread of each process inserts the current slot's job with the unique
+    key "kind@slot". Every process tries, the first insert wins, so adding
+    API processes does not multiply the runs. A process started mid-slot
+    runs the slot's job unless another process already inserted it.
+    """
+
+    def __init__(
+        self,
+        job_db: JobDB,
+        *,
+        concurrency: Optional[Dict[str, int]] = None,
+        default_concurrency: int = 2,
+        poll_interval_seconds: float = 1.0,
+        lease_seconds: float = 60.0,
+        retry_base_seconds: float = 2.0,
+        retry_max_seconds: float = 300.0,
+        retention_seconds: float = 7 * 24 * 3600,
+        purge_interval_seconds: float = 3600.0,
+        worker_id: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._db = job_db
+        self._concurrency = dict(concurrency or {})
+        self._default_concurrency = default_concurrency
+        self._poll_interval = poll_interval_seconds
+        self._lease = lease_seconds
+        self._retry_base = retry_base_seconds
+        self._retry_max = retry_max_seconds
+        self._retention = retention_seconds
+        self._purge_interval = purge_interval_seconds
+        self._worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._clock = clock
+        self._wall_clock = wall_clock
+
+        self._handlers: Dict[str, _Registration] = {}
+        self._queues: Dict[str, _QueueState] = {}
+        self._schedules: List[_Schedule] = []
+        self._last_results: Dict[str, Dict[str, Any]] = {}
+
+        self._scheduler: Optional[threading.Thread] = None
+        self._last_purge = clock()
+
+        self._stopping = threading.Event()
+        self._started = False
+
+        self._counter_lock = threading.Lock()
+        self._enqueued = 0
+        self._enqueue_failures = 0
+
+    @classmethod
+    def from_environment(cls, job_db: JobDB) -> "JobQueue":
+        """
+        JOB_CONCURRENCY: per-queue worker threads, e.g. "maintenance=1";
+        queues not listed get JOB_DEFAULT_CONCURRENCY (2).
+        """
+        return cls(
+            job_db,
+            concurrency=_parse_concurrency(os.getenv("JOB_CONCURRENCY", "")),
+            default_concurrency=int(os.getenv("JOB_DEFAULT_CONCURRENCY") or 2),
+            poll_interval_seconds=float(os.getenv("JOB_POLL_INTERVAL_SECONDS") or 1.0),
+            lease_seconds=float(os.getenv("JOB_LEASE_SECONDS") or 60),
+            retention_seconds=float(os.getenv("JOB_RETENTION_SECONDS") or 7 * 24 * 3600),
+        )
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    # -----------------------------
+    # Registration and enqueue
+    # -----------------------------
+    def register(self, kind: str, handler: JobHandler, queue: str = "default", max_attempts: int = 5) -> None:
+        """Route jobs of kind to handler(payload) on queue. Register before start()."""
+        self._handlers[kind] = _Registration(queue=queue, handler=handler, max_attempts=max_attempts)
+        if queue not in self._queues:
+            self._queues[queue] = _QueueState(queue, self._concurrency.get(queue, self._default_concurrency))
+
+    def schedule(self, kind: str, every_seconds: float, payload: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Enqueue a registered kind once per every_seconds slot (across all
+        processes) while the queue runs.
+        """
+        if kind not in self._handlers:
+            raise ConfigurationError(message=f"No handler registered for job kind '{kind}'.",
+                                     details={"kind": kind})
+        self._schedules.append(_Schedule(kind, every_seconds, dict(payload or {})))
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        delay_seconds: float = 0.0,
+        unique_key: Optional[str] = None,
+    ) -> None:
+        """
+        Insert a job of a registered kind; the row exists once this returns.
+        With unique_key, nothing is inserted if a job with that key exists.
+
+        Raises:
+            ConfigurationError: If kind has no handler
+            DatabaseUnavailableError / DatabaseQueryError: If the row could not be written
+        """
+        registration = self._handlers.get(kind)
+        if registration is None:
+            raise ConfigurationError(message=f"No handler registered for job kind '{kind}'.",
+                                     details={"kind": kind})
+        job = NewJob(
+            queue=registration.queue,
+            kind=kind,
+            payload=payload,
+            max_attempts=registration.max_attempts,
+            delay_seconds=delay_seconds,
+            unique_key=unique_key,
+        )
+        try:
+            self._db.add_many([job])
+        except AppError:
+            with self._counter_lock:
+                self._enqueue_failures += 1
+            raise
+        with self._counter_lock:
+            self._enqueued += 1
+        if delay_seconds <= 0:
+            self._queues[registration.queue].wake.set()
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    def start(self, run_workers: bool = True) -> None:
+        """
+        Start the scheduler and, with run_workers, one dispatcher plus worker
+        pool per registered queue. run_workers=False only enqueues (its own
+        and the scheduled jobs); other processes run them.
+        """
+        if self._started:
+            return
+        self._started = True
+        self._stopping.clear()
+        self._scheduler = threading.Thread(target=self._schedule_loop, name="jobs-scheduler", daemon=True)
+        self._scheduler.start()
+        if not run_workers:
+            return
+        for state in self._queues.values():
+            state.executor = ThreadPoolExecutor(max_workers=state.concurrency,
+                                                thread_name_prefix=f"jobs-{state.name}")
+            state.dispatcher = threading.Thread(target=self._dispatch_loop, args=(state,),
+                                                name=f"jobs-{state.name}-dispatch", daemon=True)
+            state.dispatcher.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop claiming and scheduling, wait up to timeout for running jobs.
+
+        Jobs still running after timeout keep their claim; another process
+        picks them up again once the lease ends.
+        """
+        if not self._started:
+            return
+        self._stopping.set()
+        for state in self._queues.values():
+            state.wake.set()
+            with state.slots:
+                state.slots.notify_all()
+
+        deadline = self._clock() + timeout
+        for state in self._queues.values():
+            if state.dispatcher is not None:
+                state.dispatcher.join(max(0.0, deadline - self._clock()))
+            with state.slots:
+                state.slots.wait_for(lambda: state.running == 0, max(0.0, deadline - self._clock()))
+            if state.executor is not None:
+                state.executor.shutdown(wait=False)
+            state.executor = state.dispatcher = None
+        if self._scheduler is not None:
+            self._scheduler.join(max(0.0, deadline - self._clock()))
+        self._started = False
+
+    # -----------------------------
+    # Metrics
+    # -----------------------------
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self._worker_id,
+            "started": self._started,
+            "enqueued": self._enqueued,
+            "enqueue_failures": self._enqueue_failures,
+            "queues": {name: state.stats() for name, state in self._queues.items()},
+            "last_results": dict(self._last_results),
+        }
+
+    def backlog(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """Pending / running / failed rows per queue across all processes; None if MySQL is unavailable."""
+        try:
+            return self._db.count_by_status()
+        except AppError:
+            return None
+
+    # -----------------------------
+    # Threads
+    # -----------------------------
+    def _schedule_loop(self) -> None:
+        while not self._stopping.wait(self._poll_interval):
+            self._enqueue_due()
+            self._maybe_purge()
+
+    def _enqueue_due(self) -> None:
+        now = self._wall_clock()
+        for schedule in self._schedules:
+            slot = int(now // schedule.every_seconds)
+            if slot != schedule.last_slot:
+                schedule.last_slot = slot
+                try:
+                    self.enqueue(schedule.kind, schedule.payload, unique_key=f"{schedule.kind}@{slot}")
+                except AppError as e:
+                    logger.warning("Could not enqueue scheduled job %s (%s)", schedule.kind, e.code)
+
+    def _maybe_purge(self) -> None:
+        if self._clock() - self._last_purge < self._purge_interval:
+            return
+        self._last_purge = self._clock()
+        try:
+            purged = self._db.purge_finished(self._retention)
+        except AppError as e:
+            logger.warning("Job purge failed (%s)", e.code)
+            return
+        if purged:
+            logger.info("Purged %d finished jobs", purged)
+
+    def _dispatch_loop(self, state: _QueueState) -> None:
+        while not self._stopping.is_set():
+            with state.slots:
+                state.slots.wait_for(
+                    lambda: state.running < state.concurrency or self._stopping.is_set()
+                )
+                free = state.concurrency - state.running
+            if self._stopping.is_set():
+                return
+
+            state.wake.clear()
+            try:
+                jobs = self._db.claim(state.name, self._worker_id, free, self._lease)
+            except AppError as e:
+                logger.warning("Job claim on queue %s failed (%s)", state.name, e.code)
+                jobs = []
+
+            with state.slots:
+                state.running += len(jobs)
+                state.claimed += len(jobs)
+            for job in jobs:
+                state.executor.submit(self._run, state, job)
+
+            if len(jobs) < free:
+                # Queue drained (or MySQL unavailable): wait for a local enqueue or the next poll.
+                state.wake.wait(self._poll_interval)
+
+    def _run(self, state: _QueueState, job: Job) -> None:
+        started = self._clock()
+        registration = self._handlers.get(job.kind)
+        try:
+            if registration is None:
+                raise LookupError(f"no handler registered for job kind '{job.kind}'")
+            result = registration.handler(job.payload)
+            if isinstance(result, dict):
+                self._last_results[job.kind] = result
+        except Exception as e:
+            outcome = self._record_failure(job, e)
+        else:
+            outcome = "succeeded"
+            try:
+                if not self._db.complete(job.id, job.attempts):
+                    outcome = "lost_claims"
+            except AppError as e:
+                logger.warning("Could not mark job %d done (%s); it will run again", job.id, e.code)
+                outcome = "lost_claims"
+        finally:
+            elapsed = self._clock() - started
+
+        with state.slots:
+            state.running -= 1
+            state.run_seconds += elapsed
+            setattr(state, outcome, getattr(state, outcome) + 1)
+            state.slots.notify_all()
+
+    def _record_failure(self, job: Job, error: Exception) -> str:
+        retry_in = self._retry_delay(job.attempts) if job.attempts < job.max_attempts else None
+        logger.warning("Job %d (%s) attempt %d/%d failed: %s",
+                       job.id, job.kind, job.attempts, job.max_attempts, error)
+        try:
+            held = self._db.fail(job.id, job.attempts, f"{type(error).__name__}: {error}", retry_in)
+        except AppError as e:
+            logger.warning("Could not record failure of job %d (%s)", job.id, e.code)
+            return "lost_claims"
+        if not held:
+            return "lost_claims"
+        return "failed" if retry_in is None else "retried"
+
+    def _retry_delay(self, attempts: int) -> float:
+        return min(self._retry_max, self._retry_base * 2 ** (attempts - 1))
+
+
+def _parse_concurrency(value: str) -> Dict[str, int]:
+    limits: Dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, count = item.partition("=")
+        try:
+            limits[name.strip()] = int(count)
+        except ValueError:
+            raise ConfigurationError(
+                message=f"JOB_CONCURRENCY entries must look like queue=N, got '{item}'.",
+                details={"variable": "JOB_CONCURRENCY"},
+            ) from None
+        if limits[name.strip()] < 1 or not name.strip():
+            raise ConfigurationError(
+                message=f"JOB_CONCURRENCY entries must look like queue=N with N >= 1, got '{item}'.",
+                details={"variable": "JOB_CONCURRENCY"},
+            )
+    return limits
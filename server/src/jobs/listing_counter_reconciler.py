@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.db.listing import ListingDB
+from src.utils import ChangeVersions
+
+logger = logging.getLogger(__name__)
+
+# Job kind of one reconciliation pass; the container schedules it on the JobQueue
+RECONCILE_LISTING_COUNTERS_JOB = "maintenance.reconcile_listing_counters"
+
+
+class ListingCounterReconciler:
+    """
+    Repairs listing.comment_count / offer_count / pending_offer_count.
+
+    The comment, offer and account-delete writes keep the counters exact
+    in their own transactions; this pass only repairs drift from manual
+    SQL that bypasses them. It walks the listing table in id order, chunk_size
+    listings per short transaction (ListingDB.reconcile_activity_counts),
+    pausing pause_seconds between chunks. A run stops after max_chunks;
+    the next scheduled run starts from the beginning again.
+
+    If any counter was wrong the listing collection version is bumped so
+    cached ETags of list responses stop matching.
+    """
+
+    def __init__(
+        self,
+        listing_db: ListingDB,
+        chunk_size: int = 500,
+        pause_seconds: float = 0.05,
+        max_chunks: int = 1000,
+        change_versions: Optional[ChangeVersions] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._db = listing_db
+        self._chunk_size = chunk_size
+        self._pause = pause_seconds
+        self._max_chunks = max_chunks
+        self._versions = change_versions or ChangeVersions.instance()
+        self._sleep = sleep
+
+    @classmethod
+    def from_environment(
+        cls, listing_db: ListingDB, change_versions: Optional[ChangeVersions] = None
+    ) -> "ListingCounterReconciler":
+        return cls(
+            listing_db,
+            chunk_size=int(os.getenv("LISTING_COUNTER_RECONCILE_CHUNK_SIZE") or 500),
+            pause_seconds=float(os.getenv("LISTING_COUNTER_RECONCILE_PAUSE_SECONDS") or 0.05),
+            change_versions=change_versions,
+        )
+
+    def run(self, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        One pass (also the RECONCILE_LISTING_COUNTERS_JOB handler).
+
+        Returns:
+            Dict[str, Any]: listings fixed, chunks, elapsed seconds, and
+                            complete=False if max_chunks cut the pass short
+
+        Raises:
+            DatabaseQueryError: If a chunk fails (chunks fixed so far stay fixed)
+        """
+        started = time.perf_counter()
+        fixed = chunks = 0
+        after_id = 0
+        complete = False
+        try:
+            while chunks < self._max_chunks:
+                repaired, last_id = self._db.reconcile_activity_counts(after_id, self._chunk_size)
+                if last_id is None:
+                    complete = True
+                    break
+                fixed += repaired
+                chunks += 1
+                after_id = last_id
+                self._sleep(self._pause)
+        finally:
+            if fixed:
+                self._versions.bump_listings(None)
+
+        report = {
+            "fixed": fixed,
+            "chunks": chunks,
+            "seconds": round(time.perf_counter() - started, 3),
+            "complete": complete,
+        }
+        if fixed:
+            logger.warning("Repaired activity counters of %d listings in %d chunks (%.3fs)",
+                           fixed, chunks, report["seconds"])
+        else:
+            logger.info("Listing activity counters consistent (%d chunks, %.3fs)",
+                        chunks, report["seconds"])
+        return report
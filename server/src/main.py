@@ -1,14 +1,21 @@
+import asyncio
 import os
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from src.minio import MediaStorageUtility
-from src.utils.errors import AppError
+from src.utils.errors import AppError, StorageUnavailableError
 from src.config import CORS_ALLOWED_ORIGINS
+from src.api.admission import AdmissionMiddleware
+from src.api.container import ServiceContainer
+from src.api.dependencies import media_storage_for
+from src.api.retry_budget import RetryBudgetMiddleware
 from src.api.errors.exception_handlers import (
     api_error_handler,
     app_error_handler,
@@ -17,38 +24,106 @@ from src.api.errors.exception_handlers import (
 from src.api.routes.listing_routes import router as listing_router
 from src.api.routes.account_routes import router as account_router
 from src.api.routes.offer_routes import router as offer_router
-from src.business_logic.services.account_service import AccountService
-from src.business_logic.services.listing_service import ListingService
+from src.api.routes.rating_routes import router as rating_router
+from src.api.routes.metrics_routes import router as metrics_router
+from src.api.routes.health_routes import router as health_router
 
 from src.api.errors.api_error import ApiError
-from src.business_logic.managers.account import AccountManager
 from src.db import DBUtility
-from src.db.account.mysql import MySQLAccountDB
-from src.business_logic.services import AccountService
+from src.auth.password_hasher import PasswordHasher
+from src.utils import ConfigurationError
 
 
-def create_app() -> FastAPI:
-    """Creates and configures the FastAPI application.
-
-    Returns:
-        FastAPI: The configured FastAPI application instance.
-    """
+def initialize_db() -> None:
+    """DBUtility from the DB_* environment. src.server sizes the pool per worker."""
     print("Initializing DBUtility...")
-    host = os.getenv("DB_HOST", "127.0.0.1")
-
     DBUtility.initialize(
-        host=host,
+        host=os.getenv("DB_HOST", "127.0.0.1"),
         port=int(os.getenv("DB_PORT", 3306)),
         database=os.getenv("DB_NAME"),
         username=os.getenv("DB_USER"),
         password=os.getenv("DB_PASSWORD"),
+        pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
         driver="mysql+pymysql",
     )
-    app = FastAPI(title="MarketSafe API")
+
+
+def _prewarm_db() -> None:
+    db = DBUtility.instance()
+    opened = db.prewarm()
+    print(f"DB pool pre-warmed: {opened}/{db.pool_size} connections")
+
+
+def _warm_media_storage(app: FastAPI) -> None:
+    try:
+        media_storage_for(app)
+    except StorageUnavailableError:
+        print("Media storage unavailable at startup; retrying on first use.")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Startup: initialize the DB pool and build the service container. Then,
+    unless STARTUP_WARMUP=false, pre-fill the pool to pool_size while
+    building the shared media client, so the first requests after a
+    deploy skip the MySQL and MinIO handshakes.
+    uvicorn only accepts connections once this has finished.
+
+    The job queue starts last. With JOB_WORKERS_ENABLED=false the process
+    only writes the jobs it enqueues; other processes run them.
+
+    Shutdown runs after uvicorn has drained in-flight requests: stop the
+    job scheduler and workers, the event fan-out
+    listener, then close the pool and the password-hashing workers.
+    """
+    started = time.perf_counter()
+    initialize_db()
+    app.state.services = ServiceContainer.from_environment()
+    if os.getenv("STARTUP_WARMUP", "true").lower() == "true":
+        await asyncio.gather(
+            asyncio.to_thread(_prewarm_db),
+            asyncio.to_thread(_warm_media_storage, app),
+        )
+    jobs = app.state.services.job_queue
+    jobs.start(run_workers=os.getenv("JOB_WORKERS_ENABLED", "true").lower() == "true")
+    app.state.startup_seconds = time.perf_counter() - started
+    print(f"Startup complete in {app.state.startup_seconds:.3f}s")
+
+    yield
+
+    print("Shutting down: stopping job workers...")
+    await asyncio.to_thread(jobs.stop, float(os.getenv("JOB_SHUTDOWN_TIMEOUT_SECONDS", "10")))
+    await asyncio.to_thread(app.state.services.event_hub.close)
+    print("Shutting down: disposing DB pool...")
+    try:
+        DBUtility.instance().dispose()
+    except ConfigurationError:
+        pass
+    PasswordHasher.reset()
+
+
+def create_app() -> FastAPI:
+    """Creates and configures the FastAPI application.
+
+    Connections to MySQL and MinIO are opened by the lifespan, not here,
+    so importing the app has no side effects on them.
+
+    Returns:
+        FastAPI: The configured FastAPI application instance.
+    """
+    app = FastAPI(title="MarketSafe API", lifespan=lifespan)
 
     uploads_dir = Path(__file__).resolve().parents[1] / "uploads"
     uploads_dir.mkdir(parents=True, exist_ok=True)
 
+    # Per-request deadlock retry budget
+    app.add_middleware(RetryBudgetMiddleware)
+
+    # Admission control (inside CORS, so 429/503 responses carry CORS headers)
+    app.add_middleware(AdmissionMiddleware)
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -62,6 +137,9 @@ def create_app() -> FastAPI:
     app.include_router(account_router)
     app.include_router(listing_router)
     app.include_router(offer_router)
+    app.include_router(rating_router)
+    app.include_router(metrics_router)
+    app.include_router(health_router)
     app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
 
     # exception handlers
@@ -69,16 +147,6 @@ def create_app() -> FastAPI:
     app.add_exception_handler(AppError, app_error_handler)
     app.add_exception_handler(RequestValidationError, request_validation_error_handler)
 
-    # app.state.media_storage = MediaStorageUtility(
-    #     endpoint=os.getenv("MINIO_ENDPOINT", "localhost:9000"),
-    #     access_key=os.getenv("MINIO_ROOT_USER", "minioadmin"),
-    #     secret_key=os.getenv("MINIO_ROOT_PASSWORD", "minioadmin123"),
-    #     secure=os.getenv("MINIO_SECURE", "false").lower() == "true",
-    #     public_base_url=os.getenv("MINIO_PUBLIC_BASE_URL", "http://localhost:9000"),
-    #     ensure_bucket_on_startup=True,
-    #     make_bucket_public_on_startup=True,
-    # )
-
     return app
 
 
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from io import BytesIO
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 import json
 
 from minio import Minio
 from minio.error import S3Error
 
-from src.utils import Validation, StorageUnavailableError, MediaNotFoundError
+from src.utils import (
+    Validation,
+    StorageUnavailableError,
+    MediaNotFoundError,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+
+T = TypeVar("T")
 
 
 class MediaStorageUtility:
@@ -19,6 +27,11 @@ class MediaStorageUtility:
     - ensures bucket exists
     - can make bucket public
     - returns stable public URLs for stored objects
+
+    Every MinIO call goes through a process-wide circuit breaker: while
+    MinIO is unreachable, calls fail at once with StorageUnavailableError
+    instead of each waiting for a connect timeout. An S3Error means MinIO
+    answered, so it does not count as a failure.
     """
 
     BUCKET = "media"
@@ -33,6 +46,7 @@ class MediaStorageUtility:
         public_base_url: Optional[str] = None,
         ensure_bucket_on_startup: bool = True,
         make_bucket_public_on_startup: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         Validation.require_str(endpoint, "endpoint")
         Validation.require_str(access_key, "access_key")
@@ -44,6 +58,9 @@ class MediaStorageUtility:
         self._secret_key = secret_key
         self._secure = secure
         self._public_base_url = public_base_url.rstrip("/") if public_base_url else None
+        self._breaker = circuit_breaker or CircuitBreakerRegistry.instance().breaker(
+            "minio", _circuit_open_error
+        )
 
         self._client = Minio(
             endpoint=endpoint,
@@ -58,16 +75,30 @@ class MediaStorageUtility:
         if make_bucket_public_on_startup:
             self.make_bucket_public()
 
+    def _call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run one MinIO client call through the circuit breaker."""
+        self._breaker.allow()
+        try:
+            result = fn(*args, **kwargs)
+        except S3Error:
+            self._breaker.record_success()
+            raise
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return result
+
     def ping(self) -> None:
         try:
-            self._client.bucket_exists(self.BUCKET)
+            self._call(self._client.bucket_exists, self.BUCKET)
         except Exception as e:
             raise StorageUnavailableError("Media storage is unavailable.") from e
 
     def ensure_bucket_exists(self) -> None:
         try:
-            if not self._client.bucket_exists(self.BUCKET):
-                self._client.make_bucket(self.BUCKET)
+            if not self._call(self._client.bucket_exists, self.BUCKET):
+                self._call(self._client.make_bucket, self.BUCKET)
         except Exception as e:
             raise StorageUnavailableError("Failed to initialize media bucket.") from e
 
@@ -85,7 +116,7 @@ class MediaStorageUtility:
         }
 
         try:
-            self._client.set_bucket_policy(self.BUCKET, json.dumps(policy))
+            self._call(self._client.set_bucket_policy, self.BUCKET, json.dumps(policy))
         except Exception as e:
             raise StorageUnavailableError("Failed to set public bucket policy.") from e
 
@@ -124,7 +155,8 @@ class MediaStorageUtility:
 
         try:
             bio = BytesIO(data)
-            self._client.put_object(
+            self._call(
+                self._client.put_object,
                 self.BUCKET,
                 key,
                 bio,
@@ -150,7 +182,8 @@ class MediaStorageUtility:
         Validation.require_str(file_path, "file_path")
 
         try:
-            self._client.fput_object(
+            self._call(
+                self._client.fput_object,
                 self.BUCKET,
                 key,
                 file_path,
@@ -165,7 +198,7 @@ class MediaStorageUtility:
         Validation.require_str(key, "key")
 
         try:
-            self._client.stat_object(self.BUCKET, key)
+            self._call(self._client.stat_object, self.BUCKET, key)
             return True
         except S3Error as e:
             if e.code in {"NoSuchKey", "NoSuchObject", "NotFound"}:
@@ -176,14 +209,16 @@ class MediaStorageUtility:
 
     def list_keys(self, prefix: str = "") -> list[str]:
         try:
-            return [
-                obj.object_name
-                for obj in self._client.list_objects(
-                    self.BUCKET,
-                    prefix=prefix,
-                    recursive=True,
-                )
-            ]
+            return self._call(
+                lambda: [
+                    obj.object_name
+                    for obj in self._client.list_objects(
+                        self.BUCKET,
+                        prefix=prefix,
+                        recursive=True,
+                    )
+                ]
+            )
         except Exception as e:
             raise StorageUnavailableError("Failed to list media objects.") from e
 
@@ -195,4 +230,11 @@ class MediaStorageUtility:
                 "Public base URL is not configured for media storage."
             )
 
-        return f"{self._public_base_url}/{self.BUCKET}/{key}"
\ No newline at end of file
+        return f"{self._public_base_url}/{self.BUCKET}/{key}"
+
+
+def _circuit_open_error() -> StorageUnavailableError:
+    return StorageUnavailableError(
+        "Media storage is unavailable.",
+        details={"dependency": "minio", "circuit": "open"},
+    )
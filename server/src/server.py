@@ -0,0 +1,151 @@
+"""
+Production server entrypoint.
+
+Run from server/:
+    python -m src.server [--workers N] [--db-max-connections N]
+
+Starts uvicorn with one worker process per usable CPU (WEB_CONCURRENCY
+overrides) and splits the MySQL connection budget (DB_MAX_CONNECTIONS,
+default 60) across them: each worker's pool gets budget // workers
+connections, a third kept open (DB_POOL_SIZE) and the rest as overflow
+(DB_MAX_OVERFLOW). create_app passes both to DBUtility.initialize.
+
+On SIGTERM uvicorn stops accepting connections, lets in-flight requests
+finish for up to GRACEFUL_SHUTDOWN_SECONDS (default 25, below Docker's
+stop_grace_period), then runs the app's lifespan shutdown, which disposes
+the connection pool.
+
+Per-process state is made safe for several workers:
+- ChangeVersions counters live in a shared file (CHANGE_VERSIONS_PATH),
+  so ETags stay valid whichever worker serves the revalidation.
+- The repository cache defaults to the shared backend when REPO_CACHE_URL
+  is set and is switched off otherwise, since a per-worker memory cache
+  would serve other workers' stale rows.
+- Each worker gets one password-hashing process instead of two.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.utils import ChangeVersions, ConfigurationError
+
+DEFAULT_DB_MAX_CONNECTIONS = 60
+DEFAULT_GRACEFUL_SHUTDOWN_SECONDS = 25
+# Smallest useful pool: one connection kept open plus one overflow.
+MIN_CONNECTIONS_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class WorkerPlan:
+    workers: int
+    pool_size: int
+    max_overflow: int
+
+    @property
+    def connections(self) -> int:
+        """MySQL connections all workers may hold at once."""
+        return self.workers * (self.pool_size + self.max_overflow)
+
+
+def usable_cpus() -> int:
+    """CPUs this process may run on (respects taskset/cgroup affinity)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def plan_workers(workers: Optional[int], db_max_connections: int) -> WorkerPlan:
+    """Worker count and per-worker pool sizing within the connection budget."""
+    workers = workers or usable_cpus()
+    if workers <= 0:
+        raise ConfigurationError(
+            message="Worker count must be positive.",
+            details={"variable": "WEB_CONCURRENCY"},
+        )
+
+    per_worker = db_max_connections // workers
+    if per_worker < MIN_CONNECTIONS_PER_WORKER:
+        raise ConfigurationError(
+            message=f"DB_MAX_CONNECTIONS={db_max_connections} is too small for {workers} workers.",
+            details={"variable": "DB_MAX_CONNECTIONS", "workers": workers},
+        )
+
+    pool_size = max(1, per_worker // 3)
+    return WorkerPlan(workers=workers, pool_size=pool_size, max_overflow=per_worker - pool_size)
+
+
+def worker_environment(plan: WorkerPlan, environ: Dict[str, str]) -> Dict[str, str]:
+    """Variables to export before the workers start (explicit settings win)."""
+    env = {
+        "DB_POOL_SIZE": str(plan.pool_size),
+        "DB_MAX_OVERFLOW": str(plan.max_overflow),
+    }
+    if plan.workers > 1:
+        if "REPO_CACHE_BACKEND" not in environ:
+            env["REPO_CACHE_BACKEND"] = "shared" if environ.get("REPO_CACHE_URL") else "off"
+        if "PASSWORD_HASH_WORKERS" not in environ:
+            env["PASSWORD_HASH_WORKERS"] = "1"
+    return env
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY") or 0) or None,
+        help="worker processes (default: usable CPUs)",
+    )
+    parser.add_argument(
+        "--db-max-connections",
+        type=int,
+        default=int(os.getenv("DB_MAX_CONNECTIONS") or DEFAULT_DB_MAX_CONNECTIONS),
+        help="MySQL connections shared by all workers",
+    )
+    parser.add_argument(
+        "--graceful-shutdown-seconds",
+        type=int,
+        default=int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS") or DEFAULT_GRACEFUL_SHUTDOWN_SECONDS),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    import uvicorn
+
+    plan = plan_workers(args.workers, args.db_max_connections)
+    os.environ.update(worker_environment(plan, dict(os.environ)))
+
+    versions_path = None
+    if plan.workers > 1 and not os.getenv("CHANGE_VERSIONS_PATH"):
+        fd, versions_path = tempfile.mkstemp(prefix="marketsafe-versions-")
+        os.close(fd)
+        ChangeVersions.create_shared_file(versions_path)
+        os.environ["CHANGE_VERSIONS_PATH"] = versions_path
+
+    print(
+        f"Starting {plan.workers} workers, MySQL pool {plan.pool_size}+{plan.max_overflow} "
+        f"each ({plan.connections} connections total)"
+    )
+    try:
+        uvicorn.run(
+            "src.main:app",
+            host=args.host,
+            port=args.port,
+            workers=plan.workers,
+            timeout_graceful_shutdown=args.graceful_shutdown_seconds,
+        )
+    finally:
+        if versions_path is not None:
+            os.remove(versions_path)
+
+
+if __name__ == "__main__":
+    main()
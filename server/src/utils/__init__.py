@@ -1,6 +1,7 @@
 from .validation import Validation
 from .token_generator import TokenGenerator
 from .errors import (AppError, InfrastructureError, DatabaseUnavailableError, DatabaseQueryError,
+                     ServiceOverloadedError, RateLimitedError, DatabaseConflictError,
                      DomainError, ValidationError, ConflictError, UnapprovedBehaviorError, ConfigurationError,
                      AccountAlreadyExistsError, AccountError, AccountNotFoundError,
                      TokenError, TokenNotFoundError, TokenExpiredError, TokenAlreadyUsedError,
@@ -8,3 +9,6 @@ from .errors import (AppError, InfrastructureError, DatabaseUnavailableError, Da
                      , RatingError, RatingNotFoundError, OfferError, OfferNotFoundError, MediaNotFoundError,
                      MediaConflictError, StorageError,
                      StorageUnavailableError)
+from .change_versions import ChangeVersions
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .event_hub import Event, EventBackend, EventHub, LocalEventBackend, RedisEventBackend, Subscription
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from typing import Dict, Iterable, Optional
+
+# Shared counter file layout: 8-byte epoch, then _SHARED_SLOTS uint64 counters.
+_SHARED_SLOTS = 1 << 16
+_COUNTER = struct.Struct("<Q")
+_HEADER_SIZE = 8
+
+
+class _LocalCounters:
+    """Counters private to this process."""
+
+    def __init__(self) -> None:
+        self.epoch = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+
+    def get(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def bump(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._counters[key] = self._counters.get(key, 0) + 1
+
+
+class _SharedCounters:
+    """
+    Counters in a memory-mapped file shared by every worker process.
+
+    Keys hash into a fixed number of slots; two scopes sharing a slot only
+    invalidate each other more often, never less. Reads are a lock-free
+    8-byte load; bumps hold an flock so no increment is lost.
+    """
+
+    def __init__(self, path: str) -> None:
+        import fcntl  # POSIX only; the shared store is used by src.server workers
+
+        self._fcntl = fcntl
+        self._lock = threading.Lock()
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self.epoch = self._map[:_HEADER_SIZE].hex()[:8]
+
+    @staticmethod
+    def _offset(key: str) -> int:
+        return _HEADER_SIZE + (zlib.crc32(key.encode()) % _SHARED_SLOTS) * _COUNTER.size
+
+    def get(self, key: str) -> int:
+        return _COUNTER.unpack_from(self._map, self._offset(key))[0]
+
+    def bump(self, keys: Iterable[str]) -> None:
+        offsets = {self._offset(key) for key in keys}
+        with self._lock:
+            self._fcntl.flock(self._file.fileno(), self._fcntl.LOCK_EX)
+            try:
+                for offset in offsets:
+                    value = _COUNTER.unpack_from(self._map, offset)[0]
+                    _COUNTER.pack_into(self._map, offset, value + 1)
+            finally:
+                self._fcntl.flock(self._file.fileno(), self._fcntl.LOCK_UN)
+
+
+class ChangeVersions:
+    """
+    Change counters for cacheable collection scopes.
+
+    Scopes:
+    - listings            bumped on every listing write
+    - seller listings     bumped when one seller's listings change
+    - account offers      bumped when an offer sent by, or made on a listing of,
+                          this account changes
+
+    Design:
+    - Write paths (managers) bump; read paths (routes) only read. Reading a
+      version is a memory lookup, so an If-None-Match check never touches
+      MySQL.
+    - Every token carries an epoch, so a restart (counters back at 0) can
+      never revalidate an ETag issued before it.
+    - Counters are per process unless shared_path names a counter file
+      (see create_shared_file). src.server creates one for its workers and
+      passes it as CHANGE_VERSIONS_PATH, so a write handled by one worker
+      invalidates the ETags every other worker hands out.
+    """
+
+    _instance: Optional["ChangeVersions"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, shared_path: Optional[str] = None) -> None:
+        self._counters = _SharedCounters(shared_path) if shared_path else _LocalCounters()
+        self._epoch = self._counters.epoch
+
+    @classmethod
+    def instance(cls) -> "ChangeVersions":
+        """Process-wide registry shared by every request."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = ChangeVersions(os.getenv("CHANGE_VERSIONS_PATH") or None)
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+    @staticmethod
+    def create_shared_file(path: str) -> None:
+        """Write a fresh counter file (new epoch, all counters 0) at path."""
+        with open(path, "wb") as f:
+            f.write(os.urandom(_HEADER_SIZE))
+            f.truncate(_HEADER_SIZE + _SHARED_SLOTS * _COUNTER.size)
+
+    # -----------------------------
+    # Read (cheap; used by conditional GETs)
+    # -----------------------------
+    def listings(self) -> str:
+        return f"{self._epoch}.{self._counters.get('listings')}"
+
+    def seller_listings(self, seller_id: int) -> str:
+        return f"{self._epoch}.{self._counters.get(f'seller:{seller_id}')}"
+
+    def account_offers(self, account_id: int) -> str:
+        return f"{self._epoch}.{self._counters.get(f'offers:{account_id}')}"
+
+    # -----------------------------
+    # Bump (called by write paths)
+    # -----------------------------
+    def bump_listings(self, seller_id: Optional[int]) -> None:
+        """Record a listing write. seller_id also bumps that seller's scope."""
+        keys = ["listings"]
+        if seller_id is not None:
+            keys.append(f"seller:{seller_id}")
+        self._counters.bump(keys)
+
+    def bump_offers(self, account_ids: Iterable[Optional[int]]) -> None:
+        """Record an offer write affecting each of the given accounts."""
+        self._counters.bump(
+            {f"offers:{account_id}" for account_id in account_ids if account_id is not None}
+        )
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .errors import AppError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fail-fast guard around one external dependency (MySQL, MinIO).
+
+    States:
+    - closed     calls go through; failure_threshold consecutive failures
+                 open the circuit.
+    - open       allow() raises open_error() immediately, so no thread
+                 waits on a connect timeout. After probe_interval_seconds
+                 the next call becomes a probe.
+    - half_open  one probe call goes through, everything else is still
+                 rejected. A success closes the circuit; a failure opens it
+                 again for another interval. A probe that never reports
+                 back (e.g. it raised something the caller does not count)
+                 is replaced by a new probe after the interval.
+
+    Callers decide what a failure is: only errors meaning "the dependency
+    is unreachable" should be recorded, never query or validation errors.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        open_error: Callable[[], AppError],
+        failure_threshold: int = 5,
+        probe_interval_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        self._name = name
+        self._open_error = open_error
+        self._failure_threshold = failure_threshold
+        self._probe_interval = probe_interval_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> None:
+        """Raise open_error() unless a call may go through now."""
+        if self._state == CLOSED:
+            return
+
+        with self._lock:
+            now = self._clock()
+            if self._state == OPEN and now - self._opened_at >= self._probe_interval:
+                self._state = HALF_OPEN
+                self._probe_started_at = now
+                return
+            if self._state == HALF_OPEN and now - self._probe_started_at >= self._probe_interval:
+                self._probe_started_at = now
+                return
+            if self._state == CLOSED:
+                return
+            self._rejected += 1
+        raise self._open_error()
+
+    def record_success(self) -> None:
+        if self._state == CLOSED and self._failures == 0:
+            return
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Circuit %s closed", self._name)
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self._failure_threshold
+            ):
+                if self._state == CLOSED:
+                    logger.warning("Circuit %s opened after %d failures", self._name, self._failures)
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self._state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self._failure_threshold,
+            "probe_interval_seconds": self._probe_interval,
+            "times_opened": self._opened,
+            "rejected_calls": self._rejected,
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide circuit breakers, one per dependency name.
+
+    Shared by every DBUtility / MediaStorageUtility instance in the
+    process. Both are normally process-wide already (DBUtility.instance(),
+    the app's media client from media_storage_for), but keeping the state
+    here rather than on the client means a client rebuilt after a failed
+    warm-up starts with the circuit its predecessor saw, and an outage seen
+    by one request opens the circuit for all of them.
+
+    Configured from the environment:
+    CIRCUIT_FAILURE_THRESHOLD (default 5),
+    CIRCUIT_PROBE_INTERVAL_SECONDS (default 10).
+    """
+
+    _instance: Optional["CircuitBreakerRegistry"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, failure_threshold: int = 5, probe_interval_seconds: float = 10.0) -> None:
+        self._failure_threshold = failure_threshold
+        self._probe_interval = probe_interval_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "CircuitBreakerRegistry":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = CircuitBreakerRegistry(
+                        failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+                        probe_interval_seconds=float(os.getenv("CIRCUIT_PROBE_INTERVAL_SECONDS", "10")),
+                    )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+    def breaker(self, name: str, open_error: Callable[[], AppError]) -> CircuitBreaker:
+        """The breaker for name, created on first use."""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = self._breakers[name] = CircuitBreaker(
+                        name,
+                        open_error,
+                        failure_threshold=self._failure_threshold,
+                        probe_interval_seconds=self._probe_interval,
+                    )
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: breaker.stats() for name, breaker in self._breakers.items()}
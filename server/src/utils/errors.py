@@ -35,6 +35,31 @@ class DatabaseUnavailableError(InfrastructureError):
     status_code: int = 503
 
 
+@dataclass
+class ServiceOverloadedError(InfrastructureError):
+    """
+    The server is shedding load (a bounded queue is full).
+    retry_after_seconds becomes the Retry-After response header.
+    """
+
+    code: str = "SERVICE_OVERLOADED"
+    status_code: int = 503
+    retry_after_seconds: Optional[int] = None
+
+
+@dataclass
+class DatabaseConflictError(InfrastructureError):
+    """
+    MySQL rolled a transaction back because of a deadlock (1213) or a lock
+    wait timeout (1205). Safe to retry the whole transaction.
+    retry_after_seconds becomes the Retry-After response header.
+    """
+
+    code: str = "DB_CONFLICT"
+    status_code: int = 503
+    retry_after_seconds: Optional[int] = 1
+
+
 @dataclass
 class DatabaseQueryError(InfrastructureError):
     """
@@ -75,6 +100,18 @@ class UnapprovedBehaviorError(DomainError):
     status_code: int = 403
 
 
+@dataclass
+class RateLimitedError(DomainError):
+    """
+    The caller exceeded its request rate.
+    retry_after_seconds becomes the Retry-After response header.
+    """
+
+    code: str = "RATE_LIMITED"
+    status_code: int = 429
+    retry_after_seconds: Optional[int] = None
+
+
 # -----------------------------
 # Account-specific errors (domain layer friendly)
 # -----------------------------
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import orjson
+
+from .errors import ConfigurationError, RateLimitedError, ServiceOverloadedError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """One notification for the accounts it was published to."""
+
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class EventBackend(ABC):
+    """
+    Cross-process fan-out for EventHub.
+
+    The hub always delivers to its own subscribers directly; the backend
+    only carries events to the other worker processes, and must not hand
+    the hub back its own. publish() is called on the writer's thread and
+    must not raise. start() is called once with the hub's callback for
+    events from other processes.
+    """
+
+    name = "abstract"
+
+    @abstractmethod
+    def publish(self, account_ids: List[int], event: Event) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def start(self, deliver: Callable[[List[int], Event], None]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class LocalEventBackend(EventBackend):
+    """No fan-out: events reach the subscribers of this process only."""
+
+    name = "local"
+
+    def publish(self, account_ids: List[int], event: Event) -> None:
+        pass
+
+    def start(self, deliver: Callable[[List[int], Event], None]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class RedisEventBackend(EventBackend):
+    """
+    Fan-out over one Redis pub/sub channel.
+
+    The client only needs publish(channel, message) and pubsub(), so
+    redis-py against Redis, Valkey or KeyDB all work. Messages are JSON
+    tagged with this process's origin id; a listener thread hands every
+    other process's message on the channel to the hub.
+
+    Pub/sub is fire-and-forget: a message published while the listener is
+    reconnecting is lost, which the stream covers by also watching
+    ChangeVersions.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: Any,
+        channel: str = "marketsafe:events",
+        reconnect_seconds: float = 1.0,
+    ) -> None:
+        self._client = client
+        self._channel = channel
+        self._reconnect_seconds = reconnect_seconds
+        self._origin = uuid.uuid4().hex
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, account_ids: List[int], event: Event) -> None:
+        try:
+            message = orjson.dumps({
+                "origin": self._origin, "accounts": account_ids, "type": event.type, "data": event.data,
+            })
+            self._client.publish(self._channel, message)
+        except Exception as e:
+            logger.warning("Event fan-out publish failed: %s", e)
+
+    def start(self, deliver: Callable[[List[int], Event], None]) -> None:
+        self._thread = threading.Thread(
+            target=self._listen, args=(deliver,), name="event-hub-listener", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _listen(self, deliver: Callable[[List[int], Event], None]) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None and message.get("type") == "message":
+                        self._receive(message["data"], deliver)
+            except Exception as e:
+                logger.warning("Event fan-out listener failed, reconnecting: %s", e)
+                self._stop.wait(self._reconnect_seconds)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _receive(self, message: bytes, deliver: Callable[[List[int], Event], None]) -> None:
+        try:
+            decoded = orjson.loads(message)
+            if decoded["origin"] == self._origin:
+                return
+            accounts, event = decoded["accounts"], Event(decoded["type"], decoded["data"])
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed event message: %s", e)
+            return
+        deliver(accounts, event)
+
+
+class Subscription:
+    """
+    One open stream's view of the hub: a bounded queue of events for one
+    account, owned by the event loop that opened it.
+
+    A subscriber that falls queue_size events behind is not slowed down
+    further and does not slow the publisher: further events are dropped
+    and the subscription is marked overflowed until the stream calls
+    take_overflow() and tells the client to refetch.
+    """
+
+    def __init__(self, hub: "EventHub", account_id: int, loop: asyncio.AbstractEventLoop, queue_size: int) -> None:
+        self.account_id = account_id
+        self._hub = hub
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._overflowed = False
+        self.dropped = 0
+
+    async def next(self, timeout: float) -> Optional[Event]:
+        """The next event, or None if none arrived within timeout seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def take_overflow(self) -> bool:
+        """True (once) if events were dropped; the queued ones are discarded too."""
+        if not self._overflowed:
+            return False
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._overflowed = False
+        return True
+
+    def close(self) -> None:
+        self._hub._unsubscribe(self)
+
+    def _push(self, event: Event) -> None:
+        """Hand event to the owning loop (any thread)."""
+        try:
+            self._loop.call_soon_threadsafe(self._offer, event)
+        except RuntimeError:
+            pass  # loop closed; the stream is gone
+
+    def _offer(self, event: Event) -> None:
+        if not self._overflowed:
+            try:
+                self._queue.put_nowait(event)
+                self._hub._delivered += 1
+                return
+            except asyncio.QueueFull:
+                self._overflowed = True
+                self._hub._overflows += 1
+        self.dropped += 1
+        self._hub._dropped += 1
+
+
+class EventHub:
+    """
+    In-process pub/sub of per-account notifications (offer events).
+
+    Write paths call publish() from any thread after their write has
+    committed; each open stream holds a Subscription for its account. The
+    hub never blocks a publisher: events are handed to the subscriber's
+    event loop and a slow subscriber overflows instead (see Subscription).
+
+    With several worker processes a subscriber only sees events published
+    in its own process unless a fan-out backend is configured. Streams
+    also poll ChangeVersions (shared between workers), so without one
+    they still learn of the change, as an untyped "offers.changed".
+
+    Configured from the environment by instance():
+    - EVENT_BACKEND               local (default) | redis
+    - EVENT_URL                   redis backend, default REPO_CACHE_URL
+    - EVENT_MAX_SUBSCRIBERS       open streams per process, default 1000
+    - EVENT_MAX_PER_ACCOUNT       open streams per account, default 5
+    - EVENT_QUEUE_SIZE            events buffered per stream, default 64
+    - EVENT_HEARTBEAT_SECONDS     idle stream keep-alive, default 15
+    - EVENT_POLL_SECONDS          ChangeVersions poll interval, default 1
+    - EVENT_STREAM_MAX_SECONDS    a stream is closed (and the client
+                                  reconnects) after this long, default 600
+    """
+
+    _instance: Optional["EventHub"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        backend: Optional[EventBackend] = None,
+        max_subscribers: int = 1000,
+        max_per_account: int = 5,
+        queue_size: int = 64,
+        heartbeat_seconds: float = 15.0,
+        poll_seconds: float = 1.0,
+        max_stream_seconds: float = 600.0,
+    ) -> None:
+        self._backend = backend or LocalEventBackend()
+        self._max_subscribers = max_subscribers
+        self._max_per_account = max_per_account
+        self._queue_size = queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self.poll_seconds = poll_seconds
+        self.max_stream_seconds = max_stream_seconds
+
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._count = 0
+
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._overflows = 0
+        self._rejected = 0
+        self._remote_received = 0
+
+        self._backend.start(self._on_remote)
+
+    @classmethod
+    def instance(cls) -> "EventHub":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = EventHub(
+                        backend=cls.backend_from_env(),
+                        max_subscribers=int(os.getenv("EVENT_MAX_SUBSCRIBERS", "1000")),
+                        max_per_account=int(os.getenv("EVENT_MAX_PER_ACCOUNT", "5")),
+                        queue_size=int(os.getenv("EVENT_QUEUE_SIZE", "64")),
+                        heartbeat_seconds=float(os.getenv("EVENT_HEARTBEAT_SECONDS", "15")),
+                        poll_seconds=float(os.getenv("EVENT_POLL_SECONDS", "1")),
+                        max_stream_seconds=float(os.getenv("EVENT_STREAM_MAX_SECONDS", "600")),
+                    )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = None
+
+    @staticmethod
+    def backend_from_env() -> EventBackend:
+        kind = os.getenv("EVENT_BACKEND", "local").strip().lower()
+        if kind == "local":
+            return LocalEventBackend()
+        if kind == "redis":
+            url = os.getenv("EVENT_URL") or os.getenv("REPO_CACHE_URL")
+            if not url:
+                raise ConfigurationError(
+                    message="EVENT_URL must be set when EVENT_BACKEND=redis.",
+                    details={"variable": "EVENT_URL"},
+                )
+            try:
+                import redis
+            except ImportError as e:
+                raise ConfigurationError(
+                    message="EVENT_BACKEND=redis requires the 'redis' package.",
+                    details={"variable": "EVENT_BACKEND"},
+                ) from e
+            return RedisEventBackend(redis.Redis.from_url(url))
+
+        raise ConfigurationError(
+            message=f"Unknown EVENT_BACKEND '{kind}'.",
+            details={"variable": "EVENT_BACKEND"},
+        )
+
+    # -----------------------------
+    # Subscribers (event loop)
+    # -----------------------------
+    def subscribe(self, account_id: int) -> Subscription:
+        """
+        Open a subscription for account_id on the running event loop.
+
+        Raises:
+            ServiceOverloadedError: If the process already holds max_subscribers streams
+            RateLimitedError: If the account already holds max_per_account streams
+        """
+        subscription = Subscription(self, account_id, asyncio.get_running_loop(), self._queue_size)
+        with self._lock:
+            if self._count >= self._max_subscribers:
+                self._rejected += 1
+                raise ServiceOverloadedError(
+                    message="Too many open event streams.", retry_after_seconds=5
+                )
+            subscribers = self._subscribers.setdefault(account_id, set())
+            if len(subscribers) >= self._max_per_account:
+                self._rejected += 1
+                raise RateLimitedError(
+                    message="Too many open event streams for this account.",
+                    retry_after_seconds=5,
+                )
+            subscribers.add(subscription)
+            self._count += 1
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.account_id)
+            if subscribers is None or subscription not in subscribers:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.account_id]
+            self._count -= 1
+
+    # -----------------------------
+    # Publishing (any thread)
+    # -----------------------------
+    def publish(self, account_ids: Iterable[Optional[int]], event_type: str, data: Dict[str, Any]) -> None:
+        """Notify every stream of the given accounts, here and (via the backend) in other processes."""
+        accounts = {account_id for account_id in account_ids if account_id is not None}
+        if not accounts:
+            return
+        event = Event(event_type, data)
+        self._published += 1
+        self._deliver(accounts, event)
+        self._backend.publish(list(accounts), event)
+
+    def _deliver(self, accounts: Iterable[int], event: Event) -> None:
+        with self._lock:
+            targets = [
+                subscription
+                for account_id in accounts
+                for subscription in self._subscribers.get(account_id, ())
+            ]
+        for subscription in targets:
+            subscription._push(event)
+
+    def _on_remote(self, account_ids: List[int], event: Event) -> None:
+        self._remote_received += 1
+        self._deliver(account_ids, event)
+
+    def close(self) -> None:
+        self._backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self._backend.name,
+            "subscribers": self._count,
+            "accounts": len(self._subscribers),
+            "max_subscribers": self._max_subscribers,
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "overflows": self._overflows,
+            "rejected": self._rejected,
+            "remote_received": self._remote_received,
+        }
@@ -0,0 +1,106 @@
+"""
+Benchmark: per-request dependency-injection overhead of the service dependencies.
+
+Mounts one no-op route per service dependency (get_account_service,
+get_listing_service, get_comment_service, get_offer_service) plus a route
+with no dependency at all, and drives them through the ASGI interface
+with a minimal in-memory receive/send (no HTTP client in the loop). The
+reported overhead is each route's median minus the no-dependency route's:
+the cost of resolving that service for one request.
+
+DBUtility is initialized with placeholder credentials; SQLAlchemy connects
+lazily and the routes never touch the database.
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_di_overhead
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from fastapi import Depends, FastAPI
+
+from src.api import dependencies as deps
+from src.db import DBUtility
+
+SERVICES = ("account", "listing", "comment", "offer")
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/none")
+    async def no_dependency():
+        return None
+
+    for name in SERVICES:
+        dependency = getattr(deps, f"get_{name}_service")
+
+        async def route(service=Depends(dependency)):
+            return None
+
+        app.add_api_route(f"/{name}", route, methods=["GET"])
+    return app
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80), "state": {},
+    }
+
+
+async def _time_route(app: FastAPI, path: str, requests: int) -> List[float]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"GET {path} returned {message['status']}")
+
+    samples = []
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        await app(_scope(path), receive, send)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+async def _measure(requests: int, rounds: int) -> Dict[str, float]:
+    app = _app()
+    paths = ["/none"] + [f"/{name}" for name in SERVICES]
+    for path in paths:
+        await _time_route(app, path, 50)  # warm-up: route compilation, first build
+
+    medians: Dict[str, List[float]] = {path: [] for path in paths}
+    for _ in range(rounds):  # interleave routes so drift hits all of them alike
+        for path in paths:
+            medians[path].append(statistics.median(await _time_route(app, path, requests)))
+    return {path: statistics.median(values) for path, values in medians.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    DBUtility.initialize(host="127.0.0.1", port=3306, database="bench", username="bench", password="bench")
+    results = asyncio.run(_measure(args.requests, args.rounds))
+
+    baseline = results["/none"]
+    print(f"per-request median over {args.rounds} x {args.requests} requests")
+    print(f"  {'no dependency':<18} {baseline * 1e6:8.1f} us")
+    for name in SERVICES:
+        value = results[f"/{name}"]
+        print(f"  {'get_' + name + '_service':<18} {value * 1e6:8.1f} us   (+{(value - baseline) * 1e6:.1f} us DI)")
+
+
+if __name__ == "__main__":
+    main()
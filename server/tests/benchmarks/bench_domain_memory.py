@@ -0,0 +1,146 @@
+"""
+Memory benchmark: bytes retained per domain entity, and for a 100k-row get_all.
+
+Each entity is measured twice with tracemalloc:
+    slotted    the real class (__slots__, lazily allocated relation lists)
+    __dict__   a trivial subclass, which gets a per-instance __dict__ back
+               (the layout these classes had before __slots__; the old eager
+               empty comments/offers lists on Listing are not re-created)
+
+The get_all section runs MySQLListingDB.get_all() against an in-memory
+fake connection, so it measures only the Listing objects the DB layer builds.
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_domain_memory
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+from src.db.listing.mysql.mysql_listing_db import MySQLListingDB
+from src.domain_models import Account, Comment, Listing, Offer, Rating
+
+
+class _DictListing(Listing):
+    pass
+
+
+class _DictOffer(Offer):
+    pass
+
+
+class _DictComment(Comment):
+    pass
+
+
+class _DictRating(Rating):
+    pass
+
+
+class _DictAccount(Account):
+    pass
+
+
+def _factories(cls_listing, cls_offer, cls_comment, cls_rating, cls_account):
+    created = datetime(2026, 1, 1, 12, 0, 0)
+    return {
+        "Listing": lambda i: cls_listing(
+            1 + i % 50, f"Listing {i}", "Gently used.", 10.0,
+            listing_id=i, location="Winnipeg", created_at=created, comments=None,
+        ),
+        "Offer": lambda i: cls_offer(i, 2, 10.0, offer_id=i, created_date=created),
+        "Comment": lambda i: cls_comment(i, 2, body="Still available?", comment_id=i),
+        "Rating": lambda i: cls_rating(i, 2, 4, rating_id=i, created_at=created),
+        "Account": lambda i: cls_account(
+            f"user{i}@example.com", "hash", "First", "Last", account_id=i,
+        ),
+    }
+
+
+def _retained_bytes(build: Callable[[], Any]) -> Tuple[Any, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def _per_entity(n: int) -> None:
+    slotted = _factories(Listing, Offer, Comment, Rating, Account)
+    with_dict = _factories(_DictListing, _DictOffer, _DictComment, _DictRating, _DictAccount)
+
+    print(f"bytes per entity ({n} instances, including the holding list)")
+    print(f"  {'entity':<8} {'slotted':>9} {'__dict__':>9}")
+    for name in slotted:
+        _, slot_bytes, _ = _retained_bytes(lambda: [slotted[name](i) for i in range(1, n + 1)])
+        _, dict_bytes, _ = _retained_bytes(lambda: [with_dict[name](i) for i in range(1, n + 1)])
+        print(f"  {name:<8} {slot_bytes / n:9.0f} {dict_bytes / n:9.0f}")
+
+
+def _rows(n: int) -> List[Dict[str, Any]]:
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        {
+            "id": i,
+            "seller_id": 1 + i % 50,
+            "title": f"Listing {i}",
+            "description": "Gently used.",
+            "image_url": None,
+            "price": Decimal("10.99"),
+            "location": "Winnipeg",
+            "created_at": base - timedelta(minutes=i),
+            "is_sold": False,
+            "sold_to_id": None,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def _fake_db(rows: List[Dict[str, Any]]) -> MagicMock:
+    conn = MagicMock()
+    conn.execute.return_value.mappings.return_value.all.return_value = rows
+
+    @contextmanager
+    def connect():
+        yield conn
+
+    db = MagicMock()
+    db.connect = connect
+    return db
+
+
+def _get_all(n: int) -> None:
+    rows = _rows(n)
+    listing_db = MySQLListingDB(_fake_db(rows))
+
+    listings, current, peak = _retained_bytes(listing_db.get_all)
+    assert len(listings) == n
+
+    print(f"MySQLListingDB.get_all() with {n} rows")
+    print(f"  retained  {current / 1024 / 1024:8.1f} MiB  ({current / n:.0f} B/listing)")
+    print(f"  peak      {peak / 1024 / 1024:8.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    _per_entity(args.entities)
+    print()
+    _get_all(args.rows)
+
+
+if __name__ == "__main__":
+    main()
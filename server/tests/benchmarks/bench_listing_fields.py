@@ -0,0 +1,137 @@
+"""
+Benchmark: payload size and serialization cost of listing views.
+
+Compares what GET /listings sends for the same catalog under
+
+    full       no parameters (ListingRow -> json_from_rows)
+    summary    ?view=summary (description cut to 160 characters in SQL)
+    cards      ?fields=id,title,price,image_url,location
+
+Without --mysql the catalog is synthetic (descriptions of 200-2000
+characters, like real listings) and the SQL projection is emulated on
+the row mappings, so only mapping + JSON encoding is timed. With --mysql
+the real queries run against the database in the DB_* variables (e.g.
+assets/db/schema.sql + seed_dev.sql), timing fetch + encoding end to end.
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_listing_fields [--mysql]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from src.api.converter.listing_converter import ListingResponse
+from src.db import ListingMapper, ListingProjection
+
+_CARDS = ("title", "price", "image_url", "location")
+
+
+class _FakeMediaStorage:
+    def public_url(self, key: str) -> str:
+        return f"http://localhost:9000/listing-images/{key}"
+
+
+def _rows(n: int) -> List[Dict[str, Any]]:
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    sentence = "Gently used, pickup only, cash or e-transfer. "
+    return [
+        {
+            "id": i,
+            "seller_id": 1 + i % 50,
+            "title": f"Listing {i}",
+            "description": (sentence * (5 + i % 40))[: 200 + (i * 37) % 1800],
+            "image_url": f"listings/{i:06d}.png" if i % 3 else None,
+            "price": Decimal(f"{10 + i % 500}.99"),
+            "location": "Winnipeg",
+            "created_at": base - timedelta(minutes=i),
+            "is_sold": i % 7 == 0,
+            "comment_count": i % 9,
+            "offer_count": i % 5,
+            "pending_offer_count": min(i % 3, i % 5),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def _select(rows: List[Dict[str, Any]], projection: ListingProjection) -> List[Dict[str, Any]]:
+    """What the projected SELECT returns: only the listed columns, LEFT(description, n)."""
+    n = projection.description_chars
+    out = []
+    for r in rows:
+        row = {name: r[name] for name in projection.fields}
+        if n is not None and "description" in row:
+            row["description"] = row["description"][:n]
+        out.append(row)
+    return out
+
+
+def _time(fn: Callable[[], bytes], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(name: str, body: bytes, samples: List[float]) -> None:
+    print(
+        f"  {name:<8} {len(body) / 1024:9.1f} KiB  gzip {len(gzip.compress(body)) / 1024:8.1f} KiB"
+        f"   median {statistics.median(samples) * 1000:7.1f} ms   best {min(samples) * 1000:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--mysql", action="store_true", help="time the real queries (needs MySQL)")
+    args = parser.parse_args()
+
+    media_storage = _FakeMediaStorage()
+    projections = {"summary": ListingProjection.summary(), "cards": ListingProjection.of(_CARDS)}
+
+    if args.mysql:
+        from src.db import DBUtility
+        from src.db.listing.mysql import MySQLListingDB
+
+        DBUtility.initialize(
+            host=os.getenv("DB_HOST", "127.0.0.1"), port=int(os.getenv("DB_PORT", 3306)),
+            database=os.getenv("DB_NAME"), username=os.getenv("DB_USER"), password=os.getenv("DB_PASSWORD"),
+        )
+        listing_db = MySQLListingDB(DBUtility.instance())
+        renders: Dict[str, Callable[[], bytes]] = {
+            "full": lambda: ListingResponse.json_from_rows(listing_db.get_all_rows(), media_storage),
+        }
+        for name, projection in projections.items():
+            renders[name] = lambda p=projection: ListingResponse.json_from_projections(
+                listing_db.get_all_projected(p), media_storage
+            )
+        print(f"MySQL listing table, {args.repeat} runs (wall time, fetch + encode)")
+    else:
+        rows = _rows(args.rows)
+        renders = {
+            "full": lambda: ListingResponse.json_from_rows(
+                [ListingMapper.row_from_mapping(r) for r in rows], media_storage
+            ),
+        }
+        for name, projection in projections.items():
+            selected = _select(rows, projection)
+            renders[name] = lambda s=selected: ListingResponse.json_from_projections(
+                [ListingMapper.projection_from_mapping(r) for r in s], media_storage
+            )
+        print(f"{args.rows} synthetic rows, {args.repeat} runs (wall time, map + encode)")
+
+    for name, render in renders.items():
+        _report(name, render(), _time(render, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
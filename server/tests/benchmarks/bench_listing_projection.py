@@ -0,0 +1,111 @@
+"""
+Microbenchmark: per-row CPU cost of serializing a listing collection.
+
+Compares the two paths a GET /listings row can take after the DB returns it:
+
+    domain     ListingMapper.from_mapping -> Listing(...) validation
+               -> ListingResponse.from_domain -> response_model validation
+               -> JSON encoding (what FastAPI does for a List[ListingResponse])
+    projection ListingMapper.row_from_mapping -> ListingResponse.json_from_rows
+
+No database is involved; the input is 10k synthetic row mappings shaped
+like result.mappings().all().
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_listing_projection
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from src.api.converter.listing_converter import ListingResponse
+from src.db import ListingMapper
+
+
+class _FakeMediaStorage:
+    def public_url(self, key: str) -> str:
+        return f"http://localhost:9000/listing-images/{key}"
+
+
+def _rows(n: int) -> List[Dict[str, Any]]:
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        {
+            "id": i,
+            "seller_id": 1 + i % 50,
+            "title": f"Listing {i}",
+            "description": " ".join(["Gently used, pickup only."] * 4),
+            "image_url": f"listings/{i:06d}.png" if i % 3 else None,
+            "price": Decimal(f"{10 + i % 500}.99"),
+            "location": "Winnipeg",
+            "created_at": base - timedelta(minutes=i),
+            "is_sold": i % 7 == 0,
+            "comment_count": i % 9,
+            "offer_count": i % 5,
+            "pending_offer_count": min(i % 3, i % 5),
+            "sold_to_id": 999 if i % 7 == 0 else None,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def _domain_path(rows, media_storage) -> bytes:
+    adapter = TypeAdapter(List[ListingResponse])
+    responses = [
+        ListingResponse.from_domain(ListingMapper.from_mapping(r), media_storage)
+        for r in rows
+    ]
+    validated = adapter.validate_python(responses)
+    return json.dumps(adapter.dump_python(validated, mode="json")).encode()
+
+
+def _projection_path(rows, media_storage) -> bytes:
+    return ListingResponse.json_from_rows(
+        [ListingMapper.row_from_mapping(r) for r in rows],
+        media_storage,
+    )
+
+
+def _best_cpu_seconds(fn: Callable[[], bytes], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    media_storage = _FakeMediaStorage()
+
+    # Both paths must produce the same document.
+    assert json.loads(_domain_path(rows, media_storage)) == json.loads(
+        _projection_path(rows, media_storage)
+    )
+
+    results = {
+        "domain": _best_cpu_seconds(lambda: _domain_path(rows, media_storage), args.repeat),
+        "projection": _best_cpu_seconds(lambda: _projection_path(rows, media_storage), args.repeat),
+    }
+
+    print(f"{args.rows} rows, best of {args.repeat} (CPU time)")
+    for name, seconds in results.items():
+        print(f"  {name:<11} {seconds * 1000:8.1f} ms total  {seconds / args.rows * 1e6:6.2f} us/row")
+    print(f"  speedup     {results['domain'] / results['projection']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
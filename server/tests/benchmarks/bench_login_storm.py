@@ -0,0 +1,137 @@
+"""
+Benchmark: latency of a non-auth handler while a login storm is running.
+
+A "non-auth request" here is the CPU work of a GET /listings page
+(ListingResponse.json_from_rows over 200 projected rows), run in a loop on
+one thread while N other threads each call PasswordHasher.verify in a loop.
+Three scenarios:
+
+    idle        no logins running (baseline)
+    in-thread   verify runs scrypt on the login threads themselves (what a
+                sync route would do without the pool)
+    pool        verify runs on PasswordHasher's process pool
+
+hashlib.scrypt releases the GIL only partly, so in-thread hashing shows up
+as tail latency on the non-auth loop; the pool moves it off the server
+process.
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_login_storm
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import Executor, Future
+from datetime import datetime
+from typing import List, Optional
+
+from src.api.converter.listing_converter import ListingResponse
+from src.auth.password_hasher import PasswordHasher
+from src.db.utils.listing_row import ListingRow
+from src.utils import ServiceOverloadedError
+
+
+class _InlineExecutor(Executor):
+    """Runs each job on the calling thread (no offloading)."""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class _FakeMediaStorage:
+    def public_url(self, key: str) -> str:
+        return f"http://localhost:9000/listing-images/{key}"
+
+
+def _rows(n: int) -> List[ListingRow]:
+    created = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        ListingRow(i, 1 + i % 50, f"Listing {i}", "Gently used, pickup only.", 10.99,
+                   f"listings/{i:06d}.png", "Winnipeg", created, False)
+        for i in range(1, n + 1)
+    ]
+
+
+def _measure(hasher: Optional[PasswordHasher], logins: int, seconds: float) -> dict:
+    rows = _rows(200)
+    media_storage = _FakeMediaStorage()
+    stop = threading.Event()
+    counts = {"logins": 0, "shed": 0}
+    counts_lock = threading.Lock()
+
+    def login_loop(stored: str) -> None:
+        while not stop.is_set():
+            try:
+                hasher.verify("StrongPass1", stored)
+                key = "logins"
+            except ServiceOverloadedError:
+                key = "shed"
+                time.sleep(0.001)
+            with counts_lock:
+                counts[key] += 1
+
+    threads = []
+    if hasher is not None:
+        stored = hasher.hash("StrongPass1")
+        threads = [threading.Thread(target=login_loop, args=(stored,)) for _ in range(logins)]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)  # let the storm reach steady state
+
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        ListingResponse.json_from_rows(rows, media_storage)
+        latencies.append(time.perf_counter() - start)
+
+    stop.set()
+    for t in threads:
+        t.join()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "logins": counts["logins"] / seconds,
+        "shed": counts["shed"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=8, help="concurrent login threads")
+    parser.add_argument("--cost", type=int, default=14, help="scrypt log2(N)")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    in_thread = PasswordHasher(cost=args.cost, max_pending=args.logins, executor=_InlineExecutor())
+    pool = PasswordHasher(cost=args.cost, max_workers=args.workers, max_pending=args.logins)
+    try:
+        pool.hash("warm-up")  # start the worker processes outside the measurement
+        results = {
+            "idle": _measure(None, 0, args.seconds),
+            "in-thread": _measure(in_thread, args.logins, args.seconds),
+            "pool": _measure(pool, args.logins, args.seconds),
+        }
+    finally:
+        pool.shutdown()
+
+    print(f"{args.logins} login threads, scrypt ln={args.cost}, {args.workers} pool workers, {args.seconds}s each")
+    print(f"  {'scenario':<10} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8} {'logins/s':>9} {'shed':>6}")
+    for name, r in results.items():
+        print(
+            f"  {name:<10} {r['p50'] * 1000:8.2f} {r['p99'] * 1000:8.2f} "
+            f"{r['requests'] / args.seconds:8.0f} {r['logins']:9.1f} {r['shed']:6d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark: cold start of one API worker (import, startup, first request).
+
+Every run uses a fresh interpreter, like a worker after a deploy, and
+reports:
+
+    import     `import src.main` (module imports + create_app)
+    startup    lifespan startup (DB pool pre-warm, media client warm-up)
+    first      latency of the first request after startup
+    steady     median latency of the next --requests requests
+
+The app is driven in-process through its ASGI interface (lifespan events,
+then httpx.ASGITransport), the same order uvicorn uses. Startup and
+first-request numbers for a DB-backed path (e.g. --path /listings) need
+MySQL and MinIO reachable through the DB_* / MINIO_* variables; compare
+--warmup with the default (STARTUP_WARMUP=false) to see what pre-warming
+saves. Without them, keep the default path /health/live, which touches
+no dependency.
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_startup
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+
+async def _run_lifespan(app, started: asyncio.Event, stop: asyncio.Event) -> None:
+    messages: asyncio.Queue = asyncio.Queue()
+    await messages.put({"type": "lifespan.startup"})
+
+    async def send(message):
+        if message["type"] == "lifespan.startup.complete":
+            started.set()
+            await stop.wait()
+            await messages.put({"type": "lifespan.shutdown"})
+        elif message["type"] == "lifespan.startup.failed":
+            raise RuntimeError(message.get("message"))
+
+    await app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, messages.get, send)
+
+
+async def _measure_app(app, path: str, requests: int) -> Dict[str, float]:
+    import httpx
+
+    started, stop = asyncio.Event(), asyncio.Event()
+    t0 = time.perf_counter()
+    lifespan = asyncio.ensure_future(_run_lifespan(app, started, stop))
+    await started.wait()
+    startup = time.perf_counter() - t0
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        t0 = time.perf_counter()
+        res = await client.get(path)
+        first = time.perf_counter() - t0
+
+        steady: List[float] = []
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            await client.get(path)
+            steady.append(time.perf_counter() - t0)
+
+    stop.set()
+    await lifespan
+    return {
+        "startup": startup,
+        "first": first,
+        "steady": statistics.median(steady),
+        "status": res.status_code,
+    }
+
+
+def _child(path: str, requests: int) -> None:
+    t0 = time.perf_counter()
+    import src.main
+
+    result = {"import": time.perf_counter() - t0}
+    result.update(asyncio.run(_measure_app(src.main.app, path, requests)))
+    print(json.dumps(result))
+
+
+def _spawn(path: str, requests: int, warmup: bool) -> Dict[str, float]:
+    env = dict(os.environ)
+    env["STARTUP_WARMUP"] = "true" if warmup else "false"
+    for name in ("DB_NAME", "DB_USER", "DB_PASSWORD"):
+        env.setdefault(name, "bench")
+    out = subprocess.run(
+        [sys.executable, "-m", "tests.benchmarks.bench_startup", "--child",
+         "--path", path, "--requests", str(requests)],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--path", default="/health/live")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true", help="pre-warm MySQL / MinIO at startup")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.path, args.requests)
+        return
+
+    runs = [_spawn(args.path, args.requests, args.warmup) for _ in range(args.runs)]
+    print(f"GET {args.path} (status {runs[0]['status']}), warm-up "
+          f"{'on' if args.warmup else 'off'}, median of {args.runs} fresh processes")
+    for key in ("import", "startup", "first", "steady"):
+        print(f"  {key:<8} {statistics.median(r[key] for r in runs) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
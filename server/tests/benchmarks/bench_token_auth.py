@@ -0,0 +1,73 @@
+"""
+Microbenchmark: per-request cost of authenticating a bearer token.
+
+    decode   src.auth.jwt.get_user_id_from_token (full HS256 verification)
+    cached   TokenAuthenticator.authenticate on a token it has already
+             verified (SHA-256 digest, revocation set check, dict lookup)
+
+The revocation store is an in-memory fake holding --revoked entries, so
+no database is involved.
+
+Run from server/:
+    SECRET_KEY=x FRONTEND_URL=http://localhost python -m tests.benchmarks.bench_token_auth
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt as pyjwt
+
+from src.auth.jwt import get_user_id_from_token
+from src.auth.token_authenticator import TokenAuthenticator
+from src.config import SECRET_KEY
+from src.db.revoked_token import RevokedToken
+
+
+class _FakeRevokedTokenDB:
+    def __init__(self, n: int) -> None:
+        expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=1)
+        self._rows = [
+            RevokedToken(i, hashlib.sha256(f"revoked-{i}".encode()).hexdigest(), 1, expires_at)
+            for i in range(1, n + 1)
+        ]
+
+    def get_active_since(self, after_id: int, limit: int = 1000):
+        return [r for r in self._rows if r.id > after_id][:limit]
+
+    def add(self, token_hash, account_id, expires_at) -> None:
+        pass
+
+
+def _per_call_ns(fn, token: str, n: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(n):
+        fn(token)
+    return (time.perf_counter_ns() - start) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--revoked", type=int, default=10_000)
+    args = parser.parse_args()
+
+    exp = datetime.now(timezone.utc) + timedelta(days=30)
+    token = pyjwt.encode({"sub": "42", "exp": exp}, SECRET_KEY, algorithm="HS256")
+
+    authenticator = TokenAuthenticator(_FakeRevokedTokenDB(args.revoked), refresh_interval_seconds=3600)
+    assert authenticator.authenticate(token) == get_user_id_from_token(token) == 42
+
+    decode_ns = _per_call_ns(get_user_id_from_token, token, args.calls // 10)
+    cached_ns = _per_call_ns(authenticator.authenticate, token, args.calls)
+
+    print(f"{len(token)}-byte token, {args.revoked} revoked tokens loaded")
+    print(f"  decode   {decode_ns / 1000:8.2f} us/request")
+    print(f"  cached   {cached_ns / 1000:8.2f} us/request")
+    print(f"  speedup  {decode_ns / cached_ns:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ from sqlalchemy import text
 TABLES: tuple[str, ...] = (
     "account",
     "email_verification_tokens",
+    "revoked_token",
     "listing",
     "offer",
     "comment",
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import itertools
 import unittest
+from datetime import datetime
+from decimal import Decimal
 from uuid import uuid4
 
 from sqlalchemy import text
 
+from src.db import LISTING_SORTS, ListingCursor, ListingProjection, ListingQuery
+from src.db.listing.mysql.listing_query_plan import (
+    IDX_SELLER_CREATED,
+    IDX_SOLD_CREATED,
+    IDX_SOLD_PRICE,
+    plan,
+)
 from src.db.account.mysql import MySQLAccountDB
+from src.db.comment.mysql import MySQLCommentDB
+from src.db.rating.mysql import MySQLRatingDB
 from src.db.listing.mysql.mysql_listing_db import MySQLListingDB
-from src.domain_models import Account, Listing
+from src.domain_models import Account, Comment, Listing, Rating
 from src.utils import (
     DatabaseQueryError,
     ListingNotFoundError,
@@ -144,6 +156,58 @@ class TestMySQLListingDB(unittest.TestCase):
         seller1_rows = self._listing_db.get_by_seller_id(seller1.id)
         self.assertEqual({x.id for x in seller1_rows}, {l1.id, l2.id})
 
+    def test_row_projections_match_domain_reads(self) -> None:
+        reset_all_tables(self._db)
+
+        seller1 = self._create_seller()
+        seller2 = self._create_seller()
+
+        self._listing_db.add(self._new_listing(seller1.id))
+        self._listing_db.add(self._new_listing(seller1.id))
+        self._listing_db.add(self._new_listing(seller2.id))
+
+        def project(listings):
+            return [
+                (x.id, x.seller_id, x.title, x.description, x.price,
+                 x.image_url, x.location, x.created_at, x.is_sold)
+                for x in listings
+            ]
+
+        self.assertEqual(
+            project(self._listing_db.get_all_rows()),
+            project(self._listing_db.get_all()),
+        )
+        self.assertEqual(
+            project(self._listing_db.get_rows_by_seller_id(seller1.id)),
+            project(self._listing_db.get_by_seller_id(seller1.id)),
+        )
+
+    def test_projected_reads_select_only_requested_columns(self) -> None:
+        reset_all_tables(self._db)
+
+        seller1 = self._create_seller()
+        seller2 = self._create_seller()
+        long_listing = self._new_listing(seller1.id)
+        long_listing.description = "x" * 500
+        self._listing_db.add(long_listing)
+        self._listing_db.add(self._new_listing(seller2.id))
+
+        rows = self._listing_db.get_all()
+        projected = self._listing_db.get_all_projected(ListingProjection.of(["title", "price"]))
+        self.assertEqual(
+            projected,
+            [{"id": x.id, "title": x.title, "price": x.price} for x in rows],
+        )
+
+        summary = self._listing_db.get_projected_by_seller_id(
+            seller1.id, ListingProjection.summary(["description", "is_sold"])
+        )
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(
+            summary[0]["description"], "x" * ListingProjection.SUMMARY_DESCRIPTION_CHARS
+        )
+        self.assertIs(summary[0]["is_sold"], False)
+
     def test_get_by_buyer_id(self) -> None:
         reset_all_tables(self._db)
 
@@ -199,6 +263,37 @@ class TestMySQLListingDB(unittest.TestCase):
         rows = self._listing_db.get_unsold_by_location("Winni")
         self.assertIn(created.id, {x.id for x in rows})
 
+    def test_get_unsold_by_location_is_a_canonical_prefix_match(self) -> None:
+        reset_all_tables(self._db)
+        seller = self._create_seller()
+
+        wpg = self._new_listing(seller.id)
+        wpg.location = "Winnipeg,  MB"
+        created = self._listing_db.add(wpg)
+        west = self._new_listing(seller.id)
+        west.location = "West Winnipeg"
+        self._listing_db.add(west)
+
+        rows = self._listing_db.get_unsold_by_location("winnipeg mb")
+        self.assertEqual([x.id for x in rows], [created.id])
+
+    def test_get_unsold_facets_counts_locations_and_price_buckets(self) -> None:
+        reset_all_tables(self._db)
+        seller = self._create_seller()
+
+        for location, price in (("Winnipeg", 10.0), ("winnipeg ", 30.0), ("Brandon", 2000.0)):
+            listing = self._new_listing(seller.id, price=price)
+            listing.location = location
+            self._listing_db.add(listing)
+
+        facets = self._listing_db.get_unsold_facets()
+
+        self.assertEqual(facets.total, 3)
+        self.assertEqual(
+            [(f.key, f.count) for f in facets.locations], [("winnipeg", 2), ("brandon", 1)]
+        )
+        self.assertEqual([b.count for b in facets.price_buckets], [1, 1, 0, 0, 0, 0, 1])
+
     def test_get_unsold_by_max_price(self) -> None:
         reset_all_tables(self._db)
         seller = self._create_seller()
@@ -248,6 +343,91 @@ class TestMySQLListingDB(unittest.TestCase):
         rows = self._listing_db.find_unsold_by_title_keyword("Laptop", limit=50, offset=0)
         self.assertIn(target.id, {x.id for x in rows})
 
+    # -----------------------------
+    # COMPOSABLE QUERY
+    # -----------------------------
+    def _explain(self, query: ListingQuery) -> dict:
+        compiled = plan(query)
+        with self._db.connect() as conn:
+            rows = conn.execute(text("EXPLAIN " + compiled.sql), compiled.params).mappings().all()
+        self.assertEqual(len(rows), 1)
+        return dict(rows[0])
+
+    def test_query_rows_explain_uses_the_planned_index_for_every_combination(self) -> None:
+        reset_all_tables(self._db)
+        seller = self._create_seller()
+        for i, location in enumerate(("Winnipeg", "Brandon", "Winnipeg Beach", None) * 5):
+            listing = self._new_listing(seller.id, title=f"Road bike {i}", price=5.0 + i * 7)
+            listing.location = location
+            created = self._listing_db.add(listing)
+            if i % 3 == 0:
+                self._listing_db.set_sold(created.id, True, seller.id)
+
+        cursors = {
+            "newest": ListingCursor(sort="newest", value=datetime(2030, 1, 1), id=10**9),
+            "price_asc": ListingCursor(sort="price_asc", value=Decimal("1.00"), id=0),
+            "price_desc": ListingCursor(sort="price_desc", value=Decimal("99999.00"), id=10**9),
+        }
+        for seller_id, location, min_price, max_price, is_sold, keyword, sort, paged in itertools.product(
+            (None, seller.id), (None, "Winn"), (None, 10.0), (None, 100.0),
+            (None, False, True), (None, "bike"), LISTING_SORTS, (False, True),
+        ):
+            query = ListingQuery.of(
+                seller_id=seller_id, location=location, min_price=min_price, max_price=max_price,
+                is_sold=is_sold, keyword=keyword, sort=sort,
+                cursor=cursors[sort].encode() if paged else None,
+            )
+            with self.subTest(query=query):
+                explained = self._explain(query)
+
+                self.assertEqual(explained["key"], plan(query).index)
+                self.assertIn(explained["type"], ("ref", "range"))
+                # The feed orders that the index already holds need no sort step
+                index_ordered = (
+                    (plan(query).index == IDX_SELLER_CREATED and sort == "newest")
+                    or (plan(query).index == IDX_SOLD_CREATED and is_sold is not None)
+                    or (plan(query).index == IDX_SOLD_PRICE and is_sold is not None and sort != "newest")
+                )
+                if index_ordered:
+                    self.assertNotIn("filesort", explained["Extra"] or "")
+
+                # ...and the statement itself runs
+                self._listing_db.query_rows(query)
+
+    def test_query_rows_pages_through_every_match_once(self) -> None:
+        reset_all_tables(self._db)
+        seller = self._create_seller()
+        expected = []
+        for i, price in enumerate((30.0, 10.0, 20.0, 10.0, 40.0, 500.0)):
+            listing = self._new_listing(seller.id, title=f"Bike {i}", price=price)
+            listing.location = "Winnipeg" if i != 4 else "Brandon"
+            created = self._listing_db.add(listing)
+            if price <= 100.0 and i != 4:
+                expected.append((price, created.id))
+        expected.sort()
+
+        seen, cursor = [], None
+        while True:
+            page = self._listing_db.query_rows(ListingQuery.of(
+                location="winn", max_price=100.0, sort="price_asc", limit=2, cursor=cursor,
+            ))
+            seen.extend((row.price, row.id) for row in page.rows)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, expected)
+
+    def test_query_rows_keyword_is_a_literal_substring(self) -> None:
+        reset_all_tables(self._db)
+        seller = self._create_seller()
+        literal = self._listing_db.add(self._new_listing(seller.id, title="Bike 100% new"))
+        self._listing_db.add(self._new_listing(seller.id, title="Bike 100 new"))
+
+        page = self._listing_db.query_rows(ListingQuery.of(keyword="100%"))
+
+        self.assertEqual([row.id for row in page.rows], [literal.id])
+
     # -----------------------------
     # UPDATE
     # -----------------------------
@@ -283,6 +463,35 @@ class TestMySQLListingDB(unittest.TestCase):
         with self.assertRaises(ListingNotFoundError):
             self._listing_db.set_price(999999999, 10.0)
 
+    # -----------------------------
+    # LISTING DETAIL
+    # -----------------------------
+    def test_get_listing_detail_joins_rating_and_comment_authors(self) -> None:
+        seller = self._create_seller()
+        buyer = self._create_seller()
+        listing = self._listing_db.add(self._new_listing(seller.id))
+        comment_db = MySQLCommentDB(self._db)
+        first = comment_db.add(Comment(listing.id, buyer.id, body="Still available?"))
+        second = comment_db.add(Comment(listing.id, seller.id, body="Yes"))
+        self._listing_db.set_sold(listing.id, True, buyer.id)
+        rating = MySQLRatingDB(self._db).add(Rating(listing.id, buyer.id, 4))
+
+        detail = self._listing_db.get_listing_detail(listing.id)
+
+        self.assertEqual((detail.row.id, detail.row.is_sold, detail.row.comment_count), (listing.id, True, 2))
+        self.assertEqual((detail.rating.id, detail.rating.rater_id, detail.rating.transaction_rating),
+                         (rating.id, buyer.id, 4))
+        self.assertEqual([c.id for c in detail.comments], [first.id, second.id])
+        self.assertEqual((detail.comments[0].author_fname, detail.comments[0].body), ("Seller", "Still available?"))
+
+    def test_get_listing_detail_of_quiet_listing_and_missing_listing(self) -> None:
+        listing = self._listing_db.add(self._new_listing(self._create_seller().id))
+
+        detail = self._listing_db.get_listing_detail(listing.id)
+
+        self.assertEqual((detail.rating, detail.comments), (None, ()))
+        self.assertIsNone(self._listing_db.get_listing_detail(999999999))
+
     # -----------------------------
     # DELETE
     # -----------------------------
@@ -3,10 +3,14 @@ from __future__ import annotations
 import unittest
 from uuid import uuid4
 
+from sqlalchemy import text
+
 from src.db.account.mysql import MySQLAccountDB
+from src.db.comment.mysql import MySQLCommentDB
 from src.db.listing.mysql.mysql_listing_db import MySQLListingDB
 from src.db.offer.mysql.mysql_offer_db import MySQLOfferDB
 from src.domain_models.account import Account
+from src.domain_models.comment import Comment
 from src.domain_models.listing import Listing
 from src.domain_models.offer import Offer
 from src.utils import ValidationError, DatabaseQueryError, OfferNotFoundError
@@ -269,6 +273,32 @@ class TestMySQLOfferDB(unittest.TestCase):
         result = self._offer_db.get_by_sender_and_listing(999999999, 999999999)
         self.assertIsNone(result)
 
+    def test_count_by_state_matches_unseen_pending_and_sent_lists(self) -> None:
+        seller = self._create_account("seller")
+        buyer1 = self._create_account("buyer1")
+        buyer2 = self._create_account("buyer2")
+        listing = self._create_listing(seller.id)
+        other_listing = self._create_listing(buyer1.id)
+
+        self._create_offer(listing.id, buyer1.id)
+        seen = self._create_offer(listing.id, buyer2.id)
+        self._offer_db.set_seen(seen.id)
+        self._create_offer(other_listing.id, buyer2.id)
+        resolved = self._create_offer(other_listing.id, seller.id)
+        self._offer_db.set_accepted(resolved.id, False)
+
+        counts = self._offer_db.count_by_state(seller.id)
+        self.assertEqual(
+            (counts.unseen, counts.pending, counts.sent_pending),
+            (len(self._offer_db.get_unseen_by_listing_id(listing.id)),
+             len(self._offer_db.get_pending_by_listing_id(listing.id)),
+             0),
+        )
+        self.assertEqual((counts.unseen, counts.pending), (1, 2))
+
+        buyer2_counts = self._offer_db.count_by_state(buyer2.id)
+        self.assertEqual((buyer2_counts.unseen, buyer2_counts.pending, buyer2_counts.sent_pending), (0, 0, 2))
+
     # --------------------------------------------------
     # UPDATE
     # --------------------------------------------------
@@ -292,6 +322,37 @@ class TestMySQLOfferDB(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self._offer_db.set_seen(None)  # type: ignore[arg-type]
 
+    def test_set_seen_many_marks_only_unseen_offers_on_the_sellers_listings(self) -> None:
+        seller = self._create_account("seller")
+        other_seller = self._create_account("other")
+        buyer = self._create_account("buyer")
+        mine = self._create_listing(seller.id)
+        theirs = self._create_listing(other_seller.id)
+        unseen = self._create_offer(mine.id, buyer.id)
+        already_seen = self._create_offer(mine.id, self._create_account("buyer2").id)
+        foreign = self._create_offer(theirs.id, buyer.id)
+        self._offer_db.set_seen(already_seen.id)
+
+        marked = self._offer_db.set_seen_many(
+            seller.id, [unseen.id, already_seen.id, foreign.id, 999999999]
+        )
+
+        self.assertEqual([(o.id, o.sender_id, o.seen) for o in marked], [(unseen.id, buyer.id, True)])
+        self.assertTrue(bool(self._offer_db.get_by_id(unseen.id).seen))
+        self.assertFalse(bool(self._offer_db.get_by_id(foreign.id).seen))
+
+    def test_set_seen_many_without_ids_marks_every_unseen_offer(self) -> None:
+        seller = self._create_account("seller")
+        listing = self._create_listing(seller.id)
+        first = self._create_offer(listing.id, self._create_account("buyer").id)
+        second = self._create_offer(listing.id, self._create_account("buyer").id)
+
+        marked = self._offer_db.set_seen_many(seller.id)
+
+        self.assertEqual(sorted(o.id for o in marked), sorted([first.id, second.id]))
+        self.assertEqual(self._offer_db.get_unseen_by_listing_id(listing.id), [])
+        self.assertEqual(self._offer_db.set_seen_many(seller.id), [])
+
     def test_set_accepted_accepts_offer(self) -> None:
         seller = self._create_account("seller")
         buyer = self._create_account("buyer")
@@ -344,3 +405,58 @@ class TestMySQLOfferDB(unittest.TestCase):
     def test_remove_raises_validation_error_when_id_invalid(self) -> None:
         with self.assertRaises(ValidationError):
             self._offer_db.remove(None)  # type: ignore[arg-type]
+
+    # --------------------------------------------------
+    # listing activity counters
+    # --------------------------------------------------
+
+    def _counters(self, seller_id: int) -> tuple[int, int]:
+        [row] = self._listing_db.get_rows_by_seller_id(seller_id)
+        return row.offer_count, row.pending_offer_count
+
+    def test_offer_writes_keep_listing_counters_exact(self) -> None:
+        seller = self._create_account("seller")
+        listing = self._create_listing(seller.id)
+        first = self._create_offer(listing.id, self._create_account("buyer").id)
+        second = self._create_offer(listing.id, self._create_account("buyer").id)
+        self.assertEqual(self._counters(seller.id), (2, 2))
+
+        self._offer_db.set_accepted(first.id, False)
+        self._offer_db.set_accepted(first.id, True)
+        self.assertEqual(self._counters(seller.id), (2, 1))
+
+        self.assertTrue(self._offer_db.remove(second.id))
+        self.assertFalse(self._offer_db.remove(second.id))
+        self.assertEqual(self._counters(seller.id), (1, 0))
+
+    def test_account_delete_decrements_counters_of_other_sellers_listings(self) -> None:
+        seller = self._create_account("seller")
+        listing = self._create_listing(seller.id)
+        leaving = self._create_account("buyer")
+        staying = self._create_account("buyer")
+        self._create_offer(listing.id, leaving.id)
+        self._create_offer(listing.id, staying.id)
+        comment_db = MySQLCommentDB(self._db)
+        comment_db.add(Comment(listing.id, leaving.id, body="still available?"))
+        comment_db.add(Comment(listing.id, staying.id, body="interested"))
+
+        self.assertTrue(self._account_db.remove(leaving.id))
+
+        [row] = self._listing_db.get_rows_by_seller_id(seller.id)
+        self.assertEqual((row.comment_count, row.offer_count, row.pending_offer_count), (1, 1, 1))
+        self.assertEqual(self._listing_db.reconcile_activity_counts(0, 100), (0, listing.id))
+
+    def test_reconcile_activity_counts_repairs_drift_only(self) -> None:
+        seller = self._create_account("seller")
+        listing = self._create_listing(seller.id)
+        self._create_offer(listing.id, self._create_account("buyer").id)
+        with self._db.transaction() as conn:
+            conn.execute(
+                text("UPDATE listing SET offer_count = 7, comment_count = 3 WHERE id = :id"),
+                {"id": listing.id},
+            )
+
+        self.assertEqual(self._listing_db.reconcile_activity_counts(0, 100), (1, listing.id))
+        self.assertEqual(self._counters(seller.id), (1, 1))
+        self.assertEqual(self._listing_db.reconcile_activity_counts(0, 100), (0, listing.id))
+        self.assertEqual(self._listing_db.reconcile_activity_counts(listing.id, 100), (0, None))
@@ -155,6 +155,20 @@ class TestMySQLRatingDB(unittest.TestCase):
         fetched = self._rating_db.get_by_listing_id(999999)
         self.assertIsNone(fetched)
 
+    def test_get_by_listing_ids_returns_only_rated_listings(self) -> None:
+        first = self._rating_db.add(self._new_rating_for_sold_listing(score=5))
+        second = self._rating_db.add(self._new_rating_for_sold_listing(score=3))
+        unrated_listing_id = self._insert_listing(self._insert_account())
+
+        fetched = self._rating_db.get_by_listing_ids(
+            [first.listing_id, unrated_listing_id, second.listing_id, 999999]
+        )
+
+        self.assertEqual(
+            sorted((r.listing_id, r.transaction_rating) for r in fetched),
+            sorted([(first.listing_id, 5), (second.listing_id, 3)]),
+        )
+
     def test_add_duplicate_listing_rating_raises(self) -> None:
         rating = self._new_rating_for_sold_listing(score=5)
         self._rating_db.add(rating)
@@ -113,7 +113,9 @@ def setup_test(environment, **kwargs):
 
 
 class LoadTest(HttpUser):
-    wait_time = between(3, 5) # ~300 req/min with 20 users; lower values = more requests per minute
+    # ~300 req/min with 20 users; lower values = more requests per minute.
+    # LOCUST_WAIT_MIN=0 LOCUST_WAIT_MAX=0 saturates the server (throughput runs).
+    wait_time = between(float(os.getenv("LOCUST_WAIT_MIN", "3")), float(os.getenv("LOCUST_WAIT_MAX", "5")))
     host = BASE_URL
 
     def on_start(self):
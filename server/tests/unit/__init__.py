@@ -1,2 +1,3 @@
 from .all_unit_tests import load_tests
 from .test_main import TestMainUnit
+from .test_server import TestServerEntrypoint
@@ -16,6 +16,8 @@ from tests.unit.db.rating import (
 )
 from tests.unit.minio import TestMediaStorageUtility
 from tests.unit.test_main import TestMainUnit
+from tests.unit.test_server import TestServerEntrypoint
+from tests.unit.jobs import TestJobQueue, TestEmailTokenSweeper, TestListingCounterReconciler
 from tests.unit.api import (
     TestAPIDependencies,
     TestAPIError,
@@ -28,8 +30,16 @@ from tests.unit.api import (
     TestErrorHandlers,
     TestAccountRoutes,
     TestOfferRoutes,
+    TestRatingRoutes,
+    TestNDJSONStreaming,
+    TestConditionalGet,
+    TestMetricsRoutes,
+    TestAdmissionController,
+    TestAdmissionMiddleware,
+    TestHealth,
+    TestServiceContainer,
 )
-from tests.unit.auth import TestJWTAuth
+from tests.unit.auth import TestJWTAuth, TestPasswordHasher, TestTokenAuthenticator
 from tests.unit.business_logic import (
     TestAccountManagerUnit,
     TestAccountServiceUnit,
@@ -52,10 +62,23 @@ from tests.unit.db import (
     TestMySQLEmailVerificationTokenDB,
     TestListingDBABC,
     TestMySQLListingDB,
+    TestListingQueryPlan,
     TestDBUtility,
+    TestTransactionRetry,
     TestCommentMapper,
+    TestListingMapper,
+    TestListingProjection,
+    TestListingQuery,
+    TestListingCursor,
     TestMySQLOfferDB,
     TestOfferDBABC,
+    TestCacheBackends,
+    TestCachedListingDB,
+    TestCachedAccountDB,
+    TestCachedRatingDB,
+    TestCachedCommentDB,
+    TestRevokedTokenDB,
+    TestJobDB,
 )
 from tests.unit.domain_models import (
     TestAccount,
@@ -65,7 +88,7 @@ from tests.unit.domain_models import (
     TestListing,
     TestOffer,
 )
-from tests.unit.utils import TestValidation, TestTokenGenerator
+from tests.unit.utils import TestValidation, TestTokenGenerator, TestChangeVersions, TestCircuitBreaker, TestEventHub
 
 
 def load_tests(
@@ -79,8 +102,12 @@ def load_tests(
     suite.addTests(loader.loadTestsFromTestCase(TestCommentManagerUnit))
     suite.addTests(loader.loadTestsFromTestCase(TestCommentServiceUnit))
     suite.addTests(loader.loadTestsFromTestCase(TestTokenGenerator))
+    suite.addTests(loader.loadTestsFromTestCase(TestChangeVersions))
+    suite.addTests(loader.loadTestsFromTestCase(TestCircuitBreaker))
+    suite.addTests(loader.loadTestsFromTestCase(TestEventHub))
     suite.addTests(loader.loadTestsFromTestCase(TestAccountTokenService))
     suite.addTests(loader.loadTestsFromTestCase(TestJWTAuth))
+    suite.addTests(loader.loadTestsFromTestCase(TestTokenAuthenticator))
     suite.addTests(loader.loadTestsFromTestCase(TestBusinessManagerContracts))
     suite.addTests(loader.loadTestsFromTestCase(TestAccountDBABC))
     suite.addTests(loader.loadTestsFromTestCase(TestMySQLAccountDB))
@@ -89,8 +116,14 @@ def load_tests(
     suite.addTests(loader.loadTestsFromTestCase(TestEmailVerificationTokenDBABC))
     suite.addTests(loader.loadTestsFromTestCase(TestListingDBABC))
     suite.addTests(loader.loadTestsFromTestCase(TestMySQLListingDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingQueryPlan))
     suite.addTests(loader.loadTestsFromTestCase(TestDBUtility))
+    suite.addTests(loader.loadTestsFromTestCase(TestTransactionRetry))
     suite.addTests(loader.loadTestsFromTestCase(TestAPIDependencies))
+    suite.addTests(loader.loadTestsFromTestCase(TestAdmissionController))
+    suite.addTests(loader.loadTestsFromTestCase(TestAdmissionMiddleware))
+    suite.addTests(loader.loadTestsFromTestCase(TestHealth))
+    suite.addTests(loader.loadTestsFromTestCase(TestServiceContainer))
     suite.addTests(loader.loadTestsFromTestCase(TestAPIError))
     suite.addTests(loader.loadTestsFromTestCase(TestListingRoutes))
     suite.addTests(loader.loadTestsFromTestCase(TestConfig))
@@ -100,9 +133,25 @@ def load_tests(
     suite.addTests(loader.loadTestsFromTestCase(TestOfferRoutes))
     suite.addTests(loader.loadTestsFromTestCase(TestErrorHandlers))
     suite.addTests(loader.loadTestsFromTestCase(TestAccountRoutes))
+    suite.addTests(loader.loadTestsFromTestCase(TestRatingRoutes))
     suite.addTests(loader.loadTestsFromTestCase(TestMySQLCommentDB))
     suite.addTests(loader.loadTestsFromTestCase(TestCommentMapper))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingMapper))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingProjection))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingQuery))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingCursor))
+    suite.addTests(loader.loadTestsFromTestCase(TestCacheBackends))
+    suite.addTests(loader.loadTestsFromTestCase(TestCachedListingDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestCachedAccountDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestCachedRatingDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestCachedCommentDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestRevokedTokenDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestJobDB))
+    suite.addTests(loader.loadTestsFromTestCase(TestJobQueue))
+    suite.addTests(loader.loadTestsFromTestCase(TestEmailTokenSweeper))
+    suite.addTests(loader.loadTestsFromTestCase(TestListingCounterReconciler))
     suite.addTests(loader.loadTestsFromTestCase(TestMainUnit))
+    suite.addTests(loader.loadTestsFromTestCase(TestServerEntrypoint))
     suite.addTests(loader.loadTestsFromTestCase(TestBaseRatingDBABC))
     suite.addTests(loader.loadTestsFromTestCase(TestRatingDBABC))
     suite.addTests(loader.loadTestsFromTestCase(TestRatingManagerABC))
@@ -125,6 +174,9 @@ def load_tests(
     suite.addTests(loader.loadTestsFromTestCase(TestOfferConverter))
     suite.addTests(loader.loadTestsFromTestCase(TestMediaStorageUtility))
     suite.addTests(loader.loadTestsFromTestCase(TestRatingConverter))
+    suite.addTests(loader.loadTestsFromTestCase(TestNDJSONStreaming))
+    suite.addTests(loader.loadTestsFromTestCase(TestConditionalGet))
+    suite.addTests(loader.loadTestsFromTestCase(TestMetricsRoutes))
     return suite
 
 
@@ -3,8 +3,15 @@ from .errors.test_errors import TestAPIError
 from .routes.test_listing_routes import TestListingRoutes
 from .routes.test_account_routes import TestAccountRoutes
 from .routes.test_offer_routes import TestOfferRoutes
+from .routes.test_rating_routes import TestRatingRoutes
 from .converter.test_comment_converter import TestCommentConverter
 from .converter.test_listing_converter import TestListingConverter
 from .converter.test_offer_converter import TestOfferConverter
 from .converter.test_rating_converter import TestRatingConverter
 from .errors.test_exception_handler import TestErrorHandlers
+from .test_streaming import TestNDJSONStreaming
+from .test_conditional import TestConditionalGet
+from .routes.test_metrics_routes import TestMetricsRoutes
+from .test_admission import TestAdmissionController, TestAdmissionMiddleware
+from .test_health import TestHealth
+from .test_container import TestServiceContainer
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from unittest.mock import Mock
 
+import json
 import unittest
 from datetime import datetime, timezone
 
@@ -8,7 +9,24 @@ from pydantic import ValidationError as PydanticValidationError
 
 from src.api.converter.listing_converter import (
     ListingCreate,
+    ListingDetailResponse,
+    ListingFacetsResponse,
+    ListingPageResponse,
     ListingResponse,
+    SellerDashboardResponse,
+)
+from src.db import ListingRow
+from src.db.listing import (
+    DashboardListing,
+    DetailComment,
+    DetailRating,
+    ListingDetail,
+    ListingFacets,
+    ListingPage,
+    LocationFacet,
+    PendingOfferSummary,
+    PriceBucketFacet,
+    SellerDashboard,
 )
 from src.domain_models import Listing
 
@@ -215,3 +233,251 @@ class TestListingConverter(unittest.TestCase):
         self.assertEqual(result.title, "Bike")
         self.assertEqual(result.created_at, listing.created_at.isoformat())
         self.assertFalse(result.is_sold)
+
+    # -----------------------------
+    # ListingResponse.json_from_rows
+    # -----------------------------
+    def test_json_from_rows_matches_from_domain_shape(self) -> None:
+        created = datetime(2026, 3, 4, 12, 30, 0, 123456, tzinfo=timezone.utc)
+        listing = Listing(
+            listing_id=10,
+            seller_id=7,
+            title="Bike",
+            description="Nice",
+            price=50.0,
+            image_url="http://img",
+            location="Winnipeg",
+            created_at=created,
+            is_sold=False,
+            sold_to_id=None,
+        )
+        row = ListingRow(
+            id=10,
+            seller_id=7,
+            title="Bike",
+            description="Nice",
+            price=50.0,
+            image_url="http://img",
+            location="Winnipeg",
+            created_at=created,
+            is_sold=False,
+        )
+
+        out = json.loads(ListingResponse.json_from_rows([row]))
+
+        expected = ListingResponse.from_domain(listing).model_dump()
+        expected.update(comment_count=0, offer_count=0, pending_offer_count=0)
+        self.assertEqual(out, [expected])
+
+    def test_json_from_rows_uses_media_storage_public_url(self) -> None:
+        row = ListingRow(
+            id=11,
+            seller_id=7,
+            title="Bike",
+            description="Nice",
+            price=50.0,
+            image_url="listing-images/bike.png",
+            location=None,
+            created_at=None,
+            is_sold=False,
+        )
+        media_storage = Mock()
+        media_storage.public_url.return_value = (
+            "http://localhost:9000/listing-images/bike.png"
+        )
+
+        out = json.loads(ListingResponse.json_from_rows([row], media_storage))
+
+        media_storage.public_url.assert_called_once_with("listing-images/bike.png")
+        self.assertEqual(
+            out[0]["image_url"],
+            "http://localhost:9000/listing-images/bike.png",
+        )
+
+    def test_json_from_rows_skips_public_url_when_image_missing(self) -> None:
+        row = ListingRow(
+            id=12,
+            seller_id=7,
+            title="Bike",
+            description="Nice",
+            price=50.0,
+            image_url=None,
+            location=None,
+            created_at=None,
+            is_sold=True,
+        )
+        media_storage = Mock()
+
+        out = json.loads(ListingResponse.json_from_rows([row], media_storage))
+
+        media_storage.public_url.assert_not_called()
+        self.assertIsNone(out[0]["image_url"])
+        self.assertTrue(out[0]["is_sold"])
+
+    def test_json_from_rows_empty_returns_empty_array(self) -> None:
+        self.assertEqual(ListingResponse.json_from_rows([]), b"[]")
+
+    # -----------------------------
+    # ListingResponse.json_from_projections
+    # -----------------------------
+    def test_json_from_projections_keeps_only_selected_fields(self) -> None:
+        created = datetime(2026, 3, 4, 12, 30, 0, tzinfo=timezone.utc)
+
+        out = json.loads(ListingResponse.json_from_projections(
+            [{"id": 10, "title": "Bike", "price": 50.0, "created_at": created}]
+        ))
+
+        self.assertEqual(
+            out,
+            [{"id": 10, "title": "Bike", "price": 50.0, "created_at": created.isoformat()}],
+        )
+
+    def test_json_from_projections_rewrites_selected_image_url_only(self) -> None:
+        media_storage = Mock()
+        media_storage.public_url.return_value = "http://localhost:9000/listing-images/bike.png"
+
+        out = json.loads(ListingResponse.json_from_projections(
+            [
+                {"id": 1, "image_url": "listing-images/bike.png"},
+                {"id": 2, "image_url": None},
+                {"id": 3},
+            ],
+            media_storage,
+        ))
+
+        media_storage.public_url.assert_called_once_with("listing-images/bike.png")
+        self.assertEqual(
+            out,
+            [
+                {"id": 1, "image_url": "http://localhost:9000/listing-images/bike.png"},
+                {"id": 2, "image_url": None},
+                {"id": 3},
+            ],
+        )
+
+    def test_json_from_projections_empty_returns_empty_array(self) -> None:
+        self.assertEqual(ListingResponse.json_from_projections(iter([])), b"[]")
+
+    def test_json_page_from_rows_wraps_items_and_cursor(self) -> None:
+        row = ListingRow(
+            id=12, seller_id=7, title="Bike", description="Nice", price=50.0,
+            image_url="listing-images/bike.png", location=None, created_at=None, is_sold=False,
+        )
+        media_storage = Mock()
+        media_storage.public_url.return_value = "http://cdn/bike.png"
+
+        out = json.loads(ListingResponse.json_page_from_rows(
+            ListingPage(rows=(row,), next_cursor="abc"), media_storage
+        ))
+
+        self.assertEqual(out, ListingPageResponse.model_validate(out).model_dump())
+        self.assertEqual(out["next_cursor"], "abc")
+        self.assertEqual(out["items"], json.loads(ListingResponse.json_from_rows([row], media_storage)))
+
+    # -----------------------------
+    # ListingFacetsResponse
+    # -----------------------------
+    def test_facets_response_from_facets(self) -> None:
+        facets = ListingFacets(
+            total=3,
+            locations=(LocationFacet(key="winnipeg", location="Winnipeg", count=3),),
+            price_buckets=(
+                PriceBucketFacet(min_price=0.0, max_price=25.0, count=2),
+                PriceBucketFacet(min_price=25.0, max_price=None, count=1),
+            ),
+        )
+
+        out = ListingFacetsResponse.from_facets(facets).model_dump()
+
+        self.assertEqual(
+            out,
+            {
+                "total": 3,
+                "locations": [{"key": "winnipeg", "location": "Winnipeg", "count": 3}],
+                "price_buckets": [
+                    {"min_price": 0.0, "max_price": 25.0, "count": 2},
+                    {"min_price": 25.0, "max_price": None, "count": 1},
+                ],
+            },
+        )
+
+    # -----------------------------
+    # SellerDashboardResponse
+    # -----------------------------
+    def _dashboard(self) -> SellerDashboard:
+        def row(listing_id: int, pending: int) -> ListingRow:
+            return ListingRow(
+                id=listing_id, seller_id=7, title=f"Bike {listing_id}", description="d", price=50.0,
+                image_url=None, location=None, created_at=None, is_sold=False,
+                offer_count=pending, pending_offer_count=pending,
+            )
+
+        def offer(offer_id: int, price: float, seen: bool) -> PendingOfferSummary:
+            return PendingOfferSummary(
+                id=offer_id, listing_id=2, sender_id=9, sender_fname="Bo", sender_lname="Buyer",
+                offered_price=price, location_offered=None,
+                created_date=datetime(2026, 2, offer_id), seen=seen,
+            )
+
+        return SellerDashboard(
+            account_id=7, email="s@x.com", fname="Sam", lname="Seller", verified=True,
+            listings=(DashboardListing(row(2, 2), None), DashboardListing(row(1, 0), 5)),
+            pending_offers=(offer(4, 30.0, False), offer(3, 45.0, True)),
+        )
+
+    def test_json_from_dashboard_groups_pending_offers_under_their_listing(self) -> None:
+        out = json.loads(SellerDashboardResponse.json_from_dashboard(self._dashboard()))
+
+        SellerDashboardResponse.model_validate(out)
+        second, first = out["listings"]
+        self.assertEqual([o["id"] for o in second["pending_offers"]], [4, 3])
+        self.assertEqual((second["highest_pending_offer"], second["rating"]), (45.0, None))
+        self.assertEqual((first["pending_offers"], first["highest_pending_offer"], first["rating"]), ([], None, 5))
+        self.assertEqual((out["pending_offer_count"], out["unseen_pending_offer_count"]), (2, 1))
+
+    def test_json_from_dashboard_summarizes_ratings_on_the_account(self) -> None:
+        out = json.loads(SellerDashboardResponse.json_from_dashboard(self._dashboard()))
+
+        self.assertEqual(out["account"], {
+            "id": 7, "email": "s@x.com", "fname": "Sam", "lname": "Seller", "verified": True,
+            "average_rating_received": 5.0, "sum_of_ratings_received": 5, "rating_count": 1,
+        })
+
+    # -----------------------------
+    # ListingDetailResponse
+    # -----------------------------
+    def test_json_from_detail_embeds_rating_and_comments_with_author_names(self) -> None:
+        row = ListingRow(
+            id=3, seller_id=7, title="Bike", description="d", price=50.0,
+            image_url=None, location=None, created_at=None, is_sold=True, comment_count=1,
+        )
+        detail = ListingDetail(
+            row=row,
+            rating=DetailRating(id=8, listing_id=3, rater_id=5, transaction_rating=4),
+            comments=(DetailComment(
+                id=40, listing_id=3, author_id=6, author_fname="Al", author_lname="Asker",
+                body="Still available?", created_date=datetime(2026, 2, 1, 9, 30),
+            ),),
+        )
+
+        out = json.loads(ListingDetailResponse.json_from_detail(detail))
+
+        self.assertEqual(out, ListingDetailResponse.model_validate(out).model_dump())
+        self.assertEqual(out["rating"], {"id": 8, "listing_id": 3, "rater_id": 5, "transaction_rating": 4})
+        self.assertEqual(out["comments"], [{
+            "id": 40, "listing_id": 3, "author_id": 6, "author_name": "Al Asker",
+            "body": "Still available?", "created_date": "2026-02-01T09:30:00",
+        }])
+        listing_fields = {k: v for k, v in out.items() if k not in ("rating", "comments")}
+        self.assertEqual([listing_fields], json.loads(ListingResponse.json_from_rows([row])))
+
+    def test_json_from_detail_without_rating_or_comments(self) -> None:
+        row = ListingRow(
+            id=3, seller_id=7, title="Bike", description="d", price=50.0,
+            image_url=None, location=None, created_at=None, is_sold=False,
+        )
+
+        out = json.loads(ListingDetailResponse.json_from_detail(ListingDetail(row=row, rating=None, comments=())))
+
+        self.assertEqual((out["rating"], out["comments"]), (None, []))
+
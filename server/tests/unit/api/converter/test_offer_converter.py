@@ -8,6 +8,7 @@ from pydantic import ValidationError as PydanticValidationError
 from src.api.converter.offer_converter import (
     OfferCreate,
     OfferResponse,
+    OfferSeenUpdate,
 )
 from src.domain_models import Offer
 
@@ -37,6 +38,23 @@ class TestOfferConverter(unittest.TestCase):
     # -----------------------------
     # OfferCreate.to_domain
     # -----------------------------
+    # -----------------------------
+    # OfferSeenUpdate
+    # -----------------------------
+    def test_offer_seen_update_accepts_ids_or_all(self) -> None:
+        self.assertEqual(OfferSeenUpdate(offer_ids=[1, 2]).offer_ids, [1, 2])
+        self.assertTrue(OfferSeenUpdate(all=True).all)
+
+    def test_offer_seen_update_rejects_neither_or_both_modes(self) -> None:
+        with self.assertRaises(PydanticValidationError):
+            OfferSeenUpdate()
+        with self.assertRaises(PydanticValidationError):
+            OfferSeenUpdate(offer_ids=[1], all=True)
+
+    def test_offer_seen_update_rejects_over_1000_ids(self) -> None:
+        with self.assertRaises(PydanticValidationError):
+            OfferSeenUpdate(offer_ids=list(range(1001)))
+
     def test_offer_create_to_domain_sets_fields(self) -> None:
         dto = OfferCreate(
             offered_price=50.5,
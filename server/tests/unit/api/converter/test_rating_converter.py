@@ -4,7 +4,7 @@ import unittest
 
 from pydantic import ValidationError as PydanticValidationError
 
-from src.api.converter.rating_converter import RatingCreate, RatingResponse
+from src.api.converter.rating_converter import RatingBatchResponse, RatingCreate, RatingResponse
 from src.domain_models.rating import Rating
 
 
@@ -93,3 +93,11 @@ class TestRatingConverter(unittest.TestCase):
         out = RatingResponse.from_domain(rating)
 
         self.assertEqual(out.transaction_rating, 5)
+
+    def test_rating_batch_response_keeps_missing_listings_as_none(self) -> None:
+        rating = Rating(listing_id=5, rater_id=1, transaction_rating=4, rating_id=7)
+
+        out = RatingBatchResponse.from_domain({5: rating, 6: None})
+
+        self.assertEqual(out.ratings[5].id, 7)
+        self.assertIsNone(out.ratings[6])
@@ -8,7 +8,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from src.api.errors import exception_handlers
-from src.utils.errors import AppError
+from src.utils.errors import AppError, ServiceOverloadedError
 
 
 class TestErrorHandlers(unittest.IsolatedAsyncioTestCase):
@@ -94,3 +94,23 @@ class TestErrorHandlers(unittest.IsolatedAsyncioTestCase):
         payload = json.loads(response.body.decode())
         self.assertEqual(payload["error_message"], "Request validation failed.")
         self.assertIsInstance(payload["details"], list)
+
+    async def test_app_error_handler_sets_retry_after(self) -> None:
+        request = MagicMock()
+        error = ServiceOverloadedError(message="Busy", retry_after_seconds=2)
+
+        response: JSONResponse = await exception_handlers.app_error_handler(
+            request, error
+        )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["retry-after"], "2")
+        payload = json.loads(response.body.decode())
+        self.assertEqual(payload["error_code"], "SERVICE_OVERLOADED")
+
+    async def test_app_error_handler_omits_retry_after_by_default(self) -> None:
+        response: JSONResponse = await exception_handlers.app_error_handler(
+            MagicMock(), ServiceOverloadedError(message="Busy")
+        )
+
+        self.assertNotIn("retry-after", response.headers)
@@ -8,8 +8,9 @@ from fastapi.testclient import TestClient
 
 import src.api.routes.account_routes as account_routes
 
-from src.api.dependencies import get_account_service
-from src.auth.dependencies import get_current_user_id
+from src.api.dependencies import get_account_service, get_listing_service, get_media_storage
+from src.auth.dependencies import get_current_user_id, get_token_authenticator
+from src.db.listing import SellerDashboard
 
 
 class TestAccountRoutes(unittest.TestCase):
@@ -35,6 +36,7 @@ class TestAccountRoutes(unittest.TestCase):
         account.email = "a@b.com"
         account.fname = "A"
         account.lname = "B"
+        account.id = 42
         service.create_account.return_value = account
         service.generate_and_store_verification_token.return_value = (
             "rawtoken_1234567890"
@@ -63,9 +65,7 @@ class TestAccountRoutes(unittest.TestCase):
             fname="A",
             lname="B",
         )
-        service.generate_and_store_verification_token.assert_called_once_with(
-            account_id=1
-        )
+        service.generate_and_store_verification_token.assert_called_once_with(account_id=42)
 
     def test_create_account_exception_returns_500(self) -> None:
         service = MagicMock(name="account_service")
@@ -168,6 +168,41 @@ class TestAccountRoutes(unittest.TestCase):
         )
         service.get_account_by_userid.assert_called_once_with(12)
 
+    # -----------------------------
+    # GET /accounts/me/dashboard  (get_seller_dashboard)
+    # -----------------------------
+    def test_get_seller_dashboard_serializes_the_service_result(self) -> None:
+        service = MagicMock(name="listing_service")
+        service.get_seller_dashboard.return_value = SellerDashboard(
+            account_id=self.user_id, email="me@b.com", fname="Me", lname="User",
+            verified=True, listings=(), pending_offers=(),
+        )
+        self.app.dependency_overrides[get_listing_service] = lambda: service
+        self.app.dependency_overrides[get_media_storage] = lambda: MagicMock(name="media_storage")
+
+        resp = self.client.get("/accounts/me/dashboard")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            resp.json(),
+            {
+                "account": {
+                    "id": self.user_id,
+                    "email": "me@b.com",
+                    "fname": "Me",
+                    "lname": "User",
+                    "verified": True,
+                    "average_rating_received": None,
+                    "sum_of_ratings_received": 0,
+                    "rating_count": 0,
+                },
+                "listings": [],
+                "pending_offer_count": 0,
+                "unseen_pending_offer_count": 0,
+            },
+        )
+        service.get_seller_dashboard.assert_called_once_with(self.user_id)
+
     # -----------------------------
     # GET /accounts/verify-email  (verify_email)
     # -----------------------------
@@ -315,5 +350,31 @@ class TestAccountRoutes(unittest.TestCase):
         self.assertEqual(resp.json()["email"], "a@b.com")
         service.verify_email_token.assert_called_once_with("1234567890")
 
+
+    # -----------------------------
+    # POST /accounts/logout
+    # -----------------------------
+    def test_logout_revokes_bearer_token(self) -> None:
+        authenticator = MagicMock(name="authenticator")
+        self.app.dependency_overrides[get_token_authenticator] = lambda: authenticator
+
+        resp = self.client.post(
+            "/accounts/logout", headers={"Authorization": "Bearer header.payload.sig"}
+        )
+
+        self.assertEqual(resp.status_code, 204)
+        self.assertEqual(resp.content, b"")
+        authenticator.revoke.assert_called_once_with("header.payload.sig")
+
+    def test_logout_without_bearer_token_is_rejected(self) -> None:
+        authenticator = MagicMock(name="authenticator")
+        self.app.dependency_overrides[get_token_authenticator] = lambda: authenticator
+
+        resp = self.client.post("/accounts/logout")
+
+        self.assertIn(resp.status_code, (401, 403))
+        authenticator.revoke.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import io
+import json
 import unittest
 import tempfile
+from datetime import datetime
 from fastapi import UploadFile
 from io import BytesIO
 from pathlib import Path
@@ -17,8 +19,22 @@ from src.api.dependencies import (
     get_comment_service,
     get_listing_service,
     get_media_storage,
+    get_change_versions,
 )
 from src.auth.dependencies import get_current_user_id
+from src.db import ListingProjection, ListingQuery, ListingRow
+from src.db.listing import (
+    DetailComment,
+    ListingDetail,
+    ListingFacets,
+    ListingPage,
+    LocationFacet,
+    PriceBucketFacet,
+)
+from src.utils import ChangeVersions, ValidationError
+
+# Responses built from a domain Listing carry no activity counters
+_NO_COUNTERS = {"comment_count": None, "offer_count": None, "pending_offer_count": None}
 
 
 class TestListingRoutes(unittest.TestCase):
@@ -39,6 +55,11 @@ class TestListingRoutes(unittest.TestCase):
             lambda: self.media_storage
         )
 
+        self.change_versions = ChangeVersions()
+        self.app.dependency_overrides[get_change_versions] = (
+            lambda: self.change_versions
+        )
+
         self.client = TestClient(self.app)
 
     def tearDown(self) -> None:
@@ -201,7 +222,7 @@ class TestListingRoutes(unittest.TestCase):
             )
 
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.json(), fake_response_dict)
+        self.assertEqual(resp.json(), {**fake_response_dict, **_NO_COUNTERS})
 
         self.listing_service.create_listing.assert_called_once_with(
             seller_id=self.user_id,
@@ -293,25 +314,55 @@ class TestListingRoutes(unittest.TestCase):
             actor_user_id=self.user_id,
         )
 
-    def test_get_all_listing_returns_list_of_listing_responses(self):
-        l1 = MagicMock(name="listing1")
-        l2 = MagicMock(name="listing2")
-        self.listing_service.get_all_listing.return_value = [l1, l2]
+    def test_get_all_listing_serializes_listing_rows(self):
+        created = datetime(2026, 3, 4, 12, 30, 0)
+        self.listing_service.get_all_listing_rows.return_value = [
+            ListingRow(
+                id=1,
+                seller_id=123,
+                title="A",
+                description="D",
+                price=1.0,
+                image_url="listings/a.png",
+                location=None,
+                created_at=created,
+                is_sold=False,
+            ),
+            ListingRow(
+                id=2,
+                seller_id=123,
+                title="B",
+                description="D",
+                price=2.0,
+                image_url=None,
+                location="Winnipeg",
+                created_at=None,
+                is_sold=True,
+            ),
+        ]
+        self.media_storage.public_url.return_value = "http://cdn/listings/a.png"
+
+        with patch.object(listing_routes.ListingResponse, "from_domain") as from_domain_mock:
+            resp = self.client.get("/listings")
 
-        with patch.object(
-            listing_routes.ListingResponse,
-            "from_domain",
-            side_effect=[
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers["content-type"], "application/json")
+        self.assertEqual(
+            resp.json(),
+            [
                 {
                     "id": 1,
                     "seller_id": 123,
                     "title": "A",
                     "description": "D",
                     "price": 1.0,
-                    "image_url": None,
+                    "image_url": "http://cdn/listings/a.png",
                     "location": None,
-                    "created_at": None,
+                    "created_at": created.isoformat(),
                     "is_sold": False,
+                    "comment_count": 0,
+                    "offer_count": 0,
+                    "pending_offer_count": 0,
                 },
                 {
                     "id": 2,
@@ -320,46 +371,43 @@ class TestListingRoutes(unittest.TestCase):
                     "description": "D",
                     "price": 2.0,
                     "image_url": None,
-                    "location": None,
+                    "location": "Winnipeg",
                     "created_at": None,
-                    "is_sold": False,
+                    "is_sold": True,
+                    "comment_count": 0,
+                    "offer_count": 0,
+                    "pending_offer_count": 0,
                 },
             ],
-        ) as from_domain_mock:
-            resp = self.client.get("/listings")
-
-        self.assertEqual(resp.status_code, 200)
-        self.assertEqual(len(resp.json()), 2)
-        self.listing_service.get_all_listing.assert_called_once()
-        self.assertEqual(from_domain_mock.call_count, 2)
+        )
+        self.listing_service.get_all_listing_rows.assert_called_once()
+        self.listing_service.get_all_listing.assert_not_called()
+        self.media_storage.public_url.assert_called_once_with("listings/a.png")
+        from_domain_mock.assert_not_called()
 
     def test_get_my_listing_returns_list(self):
-        l1 = MagicMock()
-        self.listing_service.get_listing_by_user_id.return_value = [l1]
+        self.listing_service.get_listing_rows_by_user_id.return_value = [
+            ListingRow(
+                id=1,
+                seller_id=self.user_id,
+                title="T",
+                description="D",
+                price=10.0,
+                image_url=None,
+                location="L",
+                created_at=None,
+                is_sold=False,
+            )
+        ]
 
-        with patch.object(
-            listing_routes.ListingResponse,
-            "from_domain",
-            return_value={
-                "id": 1,
-                "seller_id": self.user_id,
-                "title": "T",
-                "description": "D",
-                "price": 10.0,
-                "image_url": None,
-                "location": "L",
-                "created_at": None,
-                "is_sold": False,
-            },
-        ) as from_domain_mock:
-            resp = self.client.get("/listings/me")
+        resp = self.client.get("/listings/me")
 
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json()[0]["seller_id"], self.user_id)
-        self.listing_service.get_listing_by_user_id.assert_called_once_with(
+        self.assertEqual(resp.json()[0]["location"], "L")
+        self.listing_service.get_listing_rows_by_user_id.assert_called_once_with(
             user_id=self.user_id
         )
-        from_domain_mock.assert_called_once_with(l1, self.media_storage)
 
     def test_search_listings_calls_service_and_returns_list(self):
         l1 = MagicMock()
@@ -420,7 +468,7 @@ class TestListingRoutes(unittest.TestCase):
             )
 
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.json(), fake_response)
+        self.assertEqual(resp.json(), {**fake_response, **_NO_COUNTERS})
 
         self.listing_service.create_listing.assert_called_once_with(
             seller_id=self.user_id,
@@ -433,35 +481,36 @@ class TestListingRoutes(unittest.TestCase):
         from_domain_mock.assert_called_once_with(fake_listing, self.media_storage)
 
     def test_get_listings_by_seller_returns_list(self):
-        l1 = MagicMock()
-        self.listing_service.get_listing_by_user_id.return_value = [l1]
-
-        fake_response = {
-            "id": 5,
-            "seller_id": 42,
-            "title": "Desk",
-            "description": "Nice desk",
-            "price": 80.0,
-            "image_url": None,
-            "location": "Winnipeg",
-            "created_at": None,
-            "is_sold": False,
-        }
+        self.listing_service.get_listing_rows_by_user_id.return_value = [
+            ListingRow(
+                id=5,
+                seller_id=42,
+                title="Desk",
+                description="Nice desk",
+                price=80.0,
+                image_url=None,
+                location="Winnipeg",
+                created_at=None,
+                is_sold=False,
+            )
+        ]
 
-        with patch.object(
-            listing_routes.ListingResponse,
-            "from_domain",
-            return_value=fake_response,
-        ) as from_domain_mock:
-            resp = self.client.get("/listings/seller/42")
+        resp = self.client.get("/listings/seller/42")
 
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(len(resp.json()), 1)
         self.assertEqual(resp.json()[0]["seller_id"], 42)
-        self.listing_service.get_listing_by_user_id.assert_called_once_with(
+        self.listing_service.get_listing_rows_by_user_id.assert_called_once_with(
             user_id=42
         )
-        from_domain_mock.assert_called_once_with(l1, self.media_storage)
+
+    def test_get_all_listing_returns_empty_array_when_no_rows(self):
+        self.listing_service.get_all_listing_rows.return_value = []
+
+        resp = self.client.get("/listings")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), [])
 
     def test_rate_listing_calls_service_and_returns_rating_response(self):
         fake_rating = MagicMock(name="rating_domain")
@@ -596,6 +645,36 @@ class TestListingRoutes(unittest.TestCase):
         response = self.client.get("/listings/search?q=")
         self.assertEqual(response.status_code, 422)
 
+    def test_get_listing_detail_returns_listing_comments_and_rating(self):
+        row = ListingRow(
+            id=42, seller_id=7, title="Bike", description="d", price=50.0,
+            image_url=None, location="Winnipeg", created_at=None, is_sold=False, comment_count=1,
+        )
+        self.listing_service.get_listing_detail.return_value = ListingDetail(
+            row=row,
+            rating=None,
+            comments=(DetailComment(
+                id=5, listing_id=42, author_id=9, author_fname="Al", author_lname="Asker",
+                body="Hi", created_date=None,
+            ),),
+        )
+
+        response = self.client.get("/listings/42")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual((body["id"], body["comment_count"], body["rating"]), (42, 1, None))
+        self.assertEqual(body["comments"][0]["author_name"], "Al Asker")
+        self.listing_service.get_listing_detail.assert_called_once_with(42)
+
+    def test_get_listing_detail_does_not_shadow_fixed_paths(self):
+        self.listing_service.get_listings_by_user_id.return_value = []
+        self.listing_service.get_listing_rows_by_user_id.return_value = []
+
+        self.assertEqual(self.client.get("/listings/me").status_code, 200)
+        self.assertEqual(self.client.get("/listings/abc").status_code, 422)
+        self.listing_service.get_listing_detail.assert_not_called()
+
     def test_get_listing_rating_returns_none_when_service_returns_none(self):
         listing_id = 42
         self.listing_service.get_listing_rating.return_value = None
@@ -663,6 +742,233 @@ class TestListingRoutes(unittest.TestCase):
         self.assertIsNone(resp.json())
         self.listing_service.get_listing_rating.assert_called_once_with(99)
 
+    def test_export_listings_streams_ndjson(self):
+        listing_a, listing_b = MagicMock(), MagicMock()
+        self.listing_service.export_listings.return_value = iter([listing_a, listing_b])
+
+        with patch.object(listing_routes.ListingResponse, "from_domain") as from_domain:
+            from_domain.side_effect = [
+                listing_routes.ListingResponse(id=1, seller_id=1, title="A", description="d", price=1.0, is_sold=False),
+                listing_routes.ListingResponse(id=2, seller_id=1, title="B", description="d", price=2.0, is_sold=False),
+            ]
+            response = self.client.get("/listings/export?seller_id=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = response.text.strip().split("\n")
+        self.assertEqual([json.loads(line)["id"] for line in lines], [1, 2])
+        self.listing_service.export_listings.assert_called_once_with(seller_id=1)
+
+    def test_export_listings_without_seller_exports_all(self):
+        self.listing_service.export_listings.return_value = iter([])
+
+        response = self.client.get("/listings/export")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "")
+        self.listing_service.export_listings.assert_called_once_with(seller_id=None)
+
+    # -----------------------------
+    # conditional GET (ETag / 304)
+    # -----------------------------
+    def test_get_all_listing_returns_304_without_querying_when_etag_matches(self):
+        self.listing_service.get_all_listing_rows.return_value = []
+
+        first = self.client.get("/listings")
+        etag = first.headers["etag"]
+        self.listing_service.get_all_listing_rows.reset_mock()
+
+        resp = self.client.get("/listings", headers={"If-None-Match": etag})
+
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.headers["etag"], etag)
+        self.listing_service.get_all_listing_rows.assert_not_called()
+
+    def test_get_all_listing_etag_changes_after_listing_write(self):
+        self.listing_service.get_all_listing_rows.return_value = []
+        etag = self.client.get("/listings").headers["etag"]
+
+        self.change_versions.bump_listings(9)
+        resp = self.client.get("/listings", headers={"If-None-Match": etag})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers["etag"], etag)
+
+    def test_get_my_listing_etag_is_scoped_to_seller(self):
+        self.listing_service.get_listing_rows_by_user_id.return_value = []
+        etag = self.client.get("/listings/me").headers["etag"]
+
+        self.change_versions.bump_listings(self.user_id + 1)
+        unchanged = self.client.get("/listings/me", headers={"If-None-Match": etag})
+
+        self.change_versions.bump_listings(self.user_id)
+        changed = self.client.get("/listings/me", headers={"If-None-Match": etag})
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+
+    def test_get_listings_by_seller_returns_304_when_etag_matches(self):
+        self.listing_service.get_listing_rows_by_user_id.return_value = []
+        etag = self.client.get("/listings/seller/42").headers["etag"]
+        self.listing_service.get_listing_rows_by_user_id.reset_mock()
+
+        resp = self.client.get("/listings/seller/42", headers={"If-None-Match": etag})
+
+        self.assertEqual(resp.status_code, 304)
+        self.listing_service.get_listing_rows_by_user_id.assert_not_called()
+
+    # -----------------------------
+    # sparse fieldsets / summary view
+    # -----------------------------
+    def test_get_all_listing_with_fields_returns_projected_rows(self):
+        self.listing_service.get_listing_projections.return_value = [
+            {"id": 1, "title": "Bike", "price": 5.0},
+        ]
+
+        resp = self.client.get("/listings", params={"fields": "title, price"})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), [{"id": 1, "title": "Bike", "price": 5.0}])
+        self.listing_service.get_listing_projections.assert_called_once_with(
+            ListingProjection.of(["title", "price"])
+        )
+        self.listing_service.get_all_listing_rows.assert_not_called()
+
+    def test_get_all_listing_summary_view_truncates_description(self):
+        self.listing_service.get_listing_projections.return_value = []
+
+        self.client.get("/listings", params={"view": "summary"})
+
+        self.listing_service.get_listing_projections.assert_called_once_with(
+            ListingProjection.summary()
+        )
+
+    def test_get_all_listing_without_fields_or_view_keeps_full_rows(self):
+        self.listing_service.get_all_listing_rows.return_value = []
+
+        self.client.get("/listings", params={"view": "full"})
+
+        self.listing_service.get_listing_projections.assert_not_called()
+
+    def test_get_all_listing_projection_has_its_own_etag(self):
+        self.listing_service.get_all_listing_rows.return_value = []
+        self.listing_service.get_listing_projections.return_value = []
+        full = self.client.get("/listings").headers["etag"]
+        summary = self.client.get("/listings", params={"view": "summary"}).headers["etag"]
+
+        resp = self.client.get(
+            "/listings", params={"view": "summary"}, headers={"If-None-Match": f"{full}, {summary}"}
+        )
+
+        self.assertNotEqual(full, summary)
+        self.assertEqual(resp.status_code, 304)
+        self.assertNotEqual(
+            self.client.get("/listings", params={"view": "summary"},
+                            headers={"If-None-Match": full}).status_code,
+            304,
+        )
+
+    def test_get_all_listing_rejects_unknown_fields_and_views(self):
+        with self.assertRaises(ValidationError):
+            self.client.get("/listings", params={"fields": "title,password"})
+        self.assertEqual(self.client.get("/listings", params={"view": "tiny"}).status_code, 422)
+        self.listing_service.get_listing_projections.assert_not_called()
+
+    def test_get_my_listing_with_fields_is_scoped_to_user(self):
+        self.listing_service.get_listing_projections.return_value = []
+
+        self.client.get("/listings/me", params={"fields": "title", "view": "summary"})
+
+        self.listing_service.get_listing_projections.assert_called_once_with(
+            ListingProjection.summary(["title"]), user_id=self.user_id
+        )
+
+    def test_get_listings_by_seller_summary_rewrites_image_url(self):
+        self.media_storage.public_url.return_value = "http://cdn/listings/x.png"
+        self.listing_service.get_listing_projections.return_value = [
+            {"id": 3, "image_url": "listings/x.png"},
+        ]
+
+        resp = self.client.get("/listings/seller/42", params={"fields": "image_url"})
+
+        self.assertEqual(resp.json(), [{"id": 3, "image_url": "http://cdn/listings/x.png"}])
+        self.listing_service.get_listing_projections.assert_called_once_with(
+            ListingProjection.of(["image_url"]), user_id=42
+        )
+
+    # -----------------------------
+    # facets
+    # -----------------------------
+    def test_get_listing_facets_returns_counts_with_listings_etag(self):
+        self.listing_service.get_listing_facets.return_value = ListingFacets(
+            total=2,
+            locations=(LocationFacet(key="winnipeg", location="Winnipeg", count=2),),
+            price_buckets=(PriceBucketFacet(min_price=0.0, max_price=None, count=2),),
+        )
+
+        resp = self.client.get("/listings/facets")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["locations"], [{"key": "winnipeg", "location": "Winnipeg", "count": 2}])
+        self.assertEqual(resp.json()["total"], 2)
+
+        self.listing_service.get_listing_facets.reset_mock()
+        cached = self.client.get("/listings/facets", headers={"If-None-Match": resp.headers["etag"]})
+        self.assertEqual(cached.status_code, 304)
+        self.listing_service.get_listing_facets.assert_not_called()
+
+        self.change_versions.bump_listings(1)
+        changed = self.client.get("/listings/facets", headers={"If-None-Match": resp.headers["etag"]})
+        self.assertEqual(changed.status_code, 200)
+
+
+    # -----------------------------
+    # query
+    # -----------------------------
+    def test_query_listings_builds_query_and_returns_page(self):
+        row = ListingRow(
+            id=5, seller_id=2, title="Bike", description="d", price=20.0,
+            image_url=None, location="Winnipeg", created_at=None, is_sold=False,
+        )
+        self.listing_service.query_listings.return_value = ListingPage(rows=(row,), next_cursor="next")
+
+        resp = self.client.get(
+            "/listings/query",
+            params={"location": "Winn", "max_price": 50, "sold": "false", "q": "bike",
+                    "sort": "price_asc", "limit": 10},
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["next_cursor"], "next")
+        self.assertEqual([item["id"] for item in resp.json()["items"]], [5])
+        self.listing_service.query_listings.assert_called_once_with(ListingQuery.of(
+            location="Winn", max_price=50.0, is_sold=False, keyword="bike", sort="price_asc", limit=10,
+        ))
+
+    def test_query_listings_etag_depends_on_query_and_listings_version(self):
+        self.listing_service.query_listings.return_value = ListingPage(rows=(), next_cursor=None)
+        resp = self.client.get("/listings/query", params={"location": "Winnipeg"})
+
+        cached = self.client.get(
+            "/listings/query", params={"location": "Winnipeg"}, headers={"If-None-Match": resp.headers["etag"]}
+        )
+        other = self.client.get(
+            "/listings/query", params={"location": "Brandon"}, headers={"If-None-Match": resp.headers["etag"]}
+        )
+        self.change_versions.bump_listings(1)
+        changed = self.client.get(
+            "/listings/query", params={"location": "Winnipeg"}, headers={"If-None-Match": resp.headers["etag"]}
+        )
+
+        self.assertEqual((cached.status_code, other.status_code, changed.status_code), (304, 200, 200))
+        self.assertEqual(self.listing_service.query_listings.call_count, 3)
+
+    def test_query_listings_rejects_invalid_query_before_querying(self):
+        with self.assertRaises(ValidationError):
+            self.client.get("/listings/query", params={"min_price": 10, "max_price": 5})
+
+        self.listing_service.query_listings.assert_not_called()
+
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.api.routes.metrics_routes as metrics_routes
+from src.api.dependencies import (
+    get_admission_controller,
+    get_circuit_breakers,
+    get_event_hub,
+    get_job_queue,
+    get_repository_cache,
+    get_transaction_retrier,
+)
+from src.auth.dependencies import get_current_user_id, get_token_authenticator
+from src.db.cache import InMemoryCacheBackend
+from src.utils import EventHub
+
+
+class TestMetricsRoutes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = FastAPI()
+        self.app.include_router(metrics_routes.router)
+        self.cache = InMemoryCacheBackend(ttl_seconds=30)
+        self.app.dependency_overrides[get_repository_cache] = lambda: self.cache
+        self.app.dependency_overrides[get_current_user_id] = lambda: 1
+        self.client = TestClient(self.app)
+
+    def tearDown(self) -> None:
+        self.app.dependency_overrides.clear()
+
+    def test_every_metrics_endpoint_requires_a_signed_in_caller(self):
+        del self.app.dependency_overrides[get_current_user_id]
+        jobs = MagicMock(name="job_queue")
+        self.app.dependency_overrides[get_job_queue] = lambda: jobs
+
+        for path in ("/metrics/cache", "/metrics/auth", "/metrics/admission", "/metrics/circuits",
+                     "/metrics/transactions", "/metrics/jobs", "/metrics/events"):
+            with self.subTest(path=path):
+                self.assertIn(self.client.get(path).status_code, (401, 403))
+        jobs.backlog.assert_not_called()
+
+    def test_cache_metrics_reports_hits_and_misses(self):
+        self.cache.get("listing:1")
+        self.cache.set("listing:1", b"v")
+        self.cache.get("listing:1")
+
+        res = self.client.get("/metrics/cache")
+
+        self.assertEqual(res.status_code, 200)
+        body = res.json()
+        self.assertEqual(body["backend"], "memory")
+        self.assertEqual(body["namespaces"]["listing"], {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+        self.assertNotIn("listing:1", res.text)
+
+    def test_cache_metrics_when_cache_is_off(self):
+        self.app.dependency_overrides[get_repository_cache] = lambda: None
+
+        res = self.client.get("/metrics/cache")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"backend": "off"})
+
+
+    def test_auth_metrics_reports_authenticator_stats(self):
+        authenticator = MagicMock(name="authenticator")
+        authenticator.stats.return_value = {"verified_cache_hits": 3, "revoked_tokens": 1}
+        self.app.dependency_overrides[get_token_authenticator] = lambda: authenticator
+
+        res = self.client.get("/metrics/auth")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"verified_cache_hits": 3, "revoked_tokens": 1})
+
+    def test_admission_metrics_reports_controller_stats(self):
+        controller = MagicMock(name="controller")
+        controller.stats.return_value = {"max_in_flight": 15, "rate_limited": 2}
+        self.app.dependency_overrides[get_admission_controller] = lambda: controller
+
+        res = self.client.get("/metrics/admission")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"max_in_flight": 15, "rate_limited": 2})
+
+    def test_circuit_metrics_reports_breaker_states(self):
+        registry = MagicMock(name="registry")
+        registry.stats.return_value = {"mysql": {"state": "open"}}
+        self.app.dependency_overrides[get_circuit_breakers] = lambda: registry
+
+        res = self.client.get("/metrics/circuits")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"mysql": {"state": "open"}})
+
+    def test_transaction_metrics_reports_retrier_stats(self):
+        retrier = MagicMock(name="retrier")
+        retrier.stats.return_value = {"conflicts": 4, "retries": 3}
+        self.app.dependency_overrides[get_transaction_retrier] = lambda: retrier
+
+        res = self.client.get("/metrics/transactions")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"conflicts": 4, "retries": 3})
+
+    def test_event_metrics_reports_hub_stats(self):
+        hub = EventHub()
+        self.app.dependency_overrides[get_event_hub] = lambda: hub
+
+        res = self.client.get("/metrics/events")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["backend"], "local")
+        self.assertEqual(res.json()["subscribers"], 0)
+
+    def test_job_metrics_reports_queue_stats_and_backlog(self):
+        jobs = MagicMock(name="job_queue")
+        jobs.stats.return_value = {"buffered": 0, "queues": {"email": {"running": 1}}}
+        jobs.backlog.return_value = {"email": {"pending": 4}}
+        self.app.dependency_overrides[get_job_queue] = lambda: jobs
+
+        res = self.client.get("/metrics/jobs")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {
+            "buffered": 0,
+            "queues": {"email": {"running": 1}},
+            "backlog": {"email": {"pending": 4}},
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
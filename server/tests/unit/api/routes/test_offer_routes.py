@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from fastapi import FastAPI
@@ -8,8 +11,13 @@ from fastapi.testclient import TestClient
 
 import src.api.routes.offer_routes as offer_routes
 
-from src.api.dependencies import get_offer_service
-from src.auth.dependencies import get_current_user_id
+from src.api.dependencies import get_offer_service, get_change_versions, get_event_hub
+from src.api.errors import ApiError, api_error_handler
+from src.api.streaming import SSE_HEARTBEAT, sse_event
+from src.auth.dependencies import get_current_user_id, get_stream_user_id, get_token_authenticator
+from src.auth.jwt import decode_stream_ticket, issue_stream_ticket
+from src.db.offer import OfferCounts
+from src.utils import ChangeVersions, EventHub
 
 
 class TestOfferRoutes(unittest.TestCase):
@@ -19,10 +27,14 @@ class TestOfferRoutes(unittest.TestCase):
 
         self.user_id = 555
         self.app.dependency_overrides[get_current_user_id] = lambda: self.user_id
+        self.app.dependency_overrides[get_stream_user_id] = lambda: self.user_id
 
         self.offer_service = MagicMock(name="offer_service")
         self.app.dependency_overrides[get_offer_service] = lambda: self.offer_service
 
+        self.change_versions = ChangeVersions()
+        self.app.dependency_overrides[get_change_versions] = lambda: self.change_versions
+
         self.client = TestClient(self.app)
 
     def tearDown(self) -> None:
@@ -98,7 +110,7 @@ class TestOfferRoutes(unittest.TestCase):
         with patch.object(
             offer_routes.OfferResponse,
             "from_domain",
-            return_value=self._full_offer_response(),
+            return_value=offer_routes.OfferResponse(**self._full_offer_response()),
         ):
             resp = self.client.get("/accounts/offers/sent")
 
@@ -112,7 +124,7 @@ class TestOfferRoutes(unittest.TestCase):
         with patch.object(
             offer_routes.OfferResponse,
             "from_domain",
-            return_value=self._full_offer_response(),
+            return_value=offer_routes.OfferResponse(**self._full_offer_response()),
         ):
             resp = self.client.get("/accounts/offers/received")
 
@@ -126,7 +138,7 @@ class TestOfferRoutes(unittest.TestCase):
         with patch.object(
             offer_routes.OfferResponse,
             "from_domain",
-            return_value=self._full_offer_response(),
+            return_value=offer_routes.OfferResponse(**self._full_offer_response()),
         ):
             resp = self.client.get("/accounts/offers/received/pending")
 
@@ -140,7 +152,7 @@ class TestOfferRoutes(unittest.TestCase):
         with patch.object(
             offer_routes.OfferResponse,
             "from_domain",
-            return_value=self._full_offer_response(seen=False),
+            return_value=offer_routes.OfferResponse(**self._full_offer_response(seen=False)),
         ):
             resp = self.client.get("/accounts/offers/received/unseen")
 
@@ -156,7 +168,7 @@ class TestOfferRoutes(unittest.TestCase):
         with patch.object(
             offer_routes.OfferResponse,
             "from_domain",
-            return_value=self._full_offer_response(),
+            return_value=offer_routes.OfferResponse(**self._full_offer_response()),
         ):
             resp = self.client.get("/accounts/offers/sent/pending")
 
@@ -173,6 +185,29 @@ class TestOfferRoutes(unittest.TestCase):
         self.assertEqual(resp.json(), {"message": "Offer marked as seen"})
         self.offer_service.set_offer_seen.assert_called_once_with(55)
 
+    def test_mark_offers_seen_marks_given_ids_for_caller(self):
+        self.offer_service.set_offers_seen.return_value = [SimpleNamespace(id=3), SimpleNamespace(id=5)]
+
+        resp = self.client.patch("/offers/seen", json={"offer_ids": [3, 4, 5]})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"message": "Offers marked as seen", "offer_ids": [3, 5]})
+        self.offer_service.set_offers_seen.assert_called_once_with(self.user_id, [3, 4, 5])
+
+    def test_mark_offers_seen_all_passes_no_ids(self):
+        self.offer_service.set_offers_seen.return_value = []
+
+        resp = self.client.patch("/offers/seen", json={"all": True})
+
+        self.assertEqual(resp.status_code, 200)
+        self.offer_service.set_offers_seen.assert_called_once_with(self.user_id, None)
+
+    def test_mark_offers_seen_requires_exactly_one_mode(self):
+        for body in ({}, {"offer_ids": [1], "all": True}):
+            resp = self.client.patch("/offers/seen", json=body)
+            self.assertEqual(resp.status_code, 422)
+        self.offer_service.set_offers_seen.assert_not_called()
+
     def test_resolve_offer_calls_service_and_returns_message(self):
         resp = self.client.post("/offers/66/resolve?accepted=true")
 
@@ -189,6 +224,221 @@ class TestOfferRoutes(unittest.TestCase):
         self.assertEqual(resp.json(), {"deleted": True})
         self.offer_service.delete_offer.assert_called_once_with(77)
 
+    def test_export_offers_streams_ndjson_for_scope(self):
+        offers = [MagicMock(), MagicMock()]
+        self.offer_service.export_offers.return_value = iter(offers)
+
+        with patch.object(offer_routes.OfferResponse, "from_domain") as from_domain:
+            from_domain.side_effect = [
+                offer_routes.OfferResponse(**self._full_offer_response(id=1)),
+                offer_routes.OfferResponse(**self._full_offer_response(id=2)),
+            ]
+            response = self.client.get("/accounts/offers/export?scope=sent")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+        self.assertEqual(ids, [1, 2])
+        self.offer_service.export_offers.assert_called_once_with(self.user_id, scope="sent")
+
+    def test_export_offers_defaults_to_received(self):
+        self.offer_service.export_offers.return_value = iter([])
+
+        response = self.client.get("/accounts/offers/export")
+
+        self.assertEqual(response.status_code, 200)
+        self.offer_service.export_offers.assert_called_once_with(self.user_id, scope="received")
+
+    def test_export_offers_rejects_unknown_scope(self):
+        response = self.client.get("/accounts/offers/export?scope=all")
+
+        self.assertEqual(response.status_code, 422)
+        self.offer_service.export_offers.assert_not_called()
+
+    # -----------------------------
+    # conditional GET (ETag / 304)
+    # -----------------------------
+    def test_get_offers_sent_returns_304_without_querying_when_etag_matches(self):
+        self.offer_service.get_offers_by_sender_id.return_value = []
+        etag = self.client.get("/accounts/offers/sent").headers["etag"]
+        self.offer_service.get_offers_by_sender_id.reset_mock()
+
+        resp = self.client.get("/accounts/offers/sent", headers={"If-None-Match": etag})
+
+        self.assertEqual(resp.status_code, 304)
+        self.offer_service.get_offers_by_sender_id.assert_not_called()
+
+    def test_get_offers_sent_etag_changes_on_offer_write_or_any_listing_write(self):
+        self.offer_service.get_offers_by_sender_id.return_value = []
+        etag = self.client.get("/accounts/offers/sent").headers["etag"]
+
+        self.change_versions.bump_offers([self.user_id])
+        after_offer = self.client.get("/accounts/offers/sent").headers["etag"]
+        self.change_versions.bump_listings(None)
+        after_listing = self.client.get("/accounts/offers/sent").headers["etag"]
+
+        self.assertEqual(len({etag, after_offer, after_listing}), 3)
+
+    def test_get_offers_received_etag_follows_own_listings_only(self):
+        self.offer_service.get_offers_sellers.return_value = []
+        etag = self.client.get("/accounts/offers/received").headers["etag"]
+
+        self.change_versions.bump_listings(self.user_id + 1)
+        unchanged = self.client.get(
+            "/accounts/offers/received", headers={"If-None-Match": etag}
+        )
+        self.change_versions.bump_listings(self.user_id)
+        changed = self.client.get(
+            "/accounts/offers/received", headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+
+    def test_offer_collections_use_distinct_etags_per_endpoint(self):
+        self.offer_service.get_offer_sellers_pending.return_value = []
+        self.offer_service.get_offer_sellers_unseen.return_value = []
+
+        pending = self.client.get("/accounts/offers/received/pending").headers["etag"]
+        unseen = self.client.get("/accounts/offers/received/unseen").headers["etag"]
+
+        self.assertNotEqual(pending, unseen)
+
+    # -----------------------------
+    # offer counts (badge)
+    # -----------------------------
+    def test_get_offer_counts_returns_counters(self):
+        self.offer_service.get_offer_counts.return_value = OfferCounts(unseen=2, pending=3, sent_pending=1)
+
+        resp = self.client.get("/accounts/offers/counts")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"unseen": 2, "pending": 3, "sent_pending": 1})
+        self.offer_service.get_offer_counts.assert_called_once_with(self.user_id)
+
+    def test_get_offer_counts_revalidates_until_an_offer_or_listing_write(self):
+        self.offer_service.get_offer_counts.return_value = OfferCounts(unseen=0, pending=0, sent_pending=0)
+        etag = self.client.get("/accounts/offers/counts").headers["etag"]
+
+        unchanged = self.client.get("/accounts/offers/counts", headers={"If-None-Match": etag})
+        self.change_versions.bump_offers([self.user_id])
+        after_offer = self.client.get("/accounts/offers/counts", headers={"If-None-Match": etag})
+        self.change_versions.bump_listings(None)
+        after_listing = self.client.get(
+            "/accounts/offers/counts", headers={"If-None-Match": after_offer.headers["etag"]}
+        )
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(after_offer.status_code, 200)
+        self.assertEqual(after_listing.status_code, 200)
+        self.assertEqual(self.offer_service.get_offer_counts.call_count, 3)
+
+    # --------------------------------------------------
+    # Offer event stream (SSE)
+    # --------------------------------------------------
+
+    def test_stream_offer_events_opens_sse_stream_with_ready_event(self):
+        hub = EventHub(max_stream_seconds=0)
+        self.app.dependency_overrides[get_event_hub] = lambda: hub
+
+        resp = self.client.get("/accounts/offers/stream")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/event-stream"))
+        self.assertEqual(resp.headers["cache-control"], "no-cache")
+        version = self.change_versions.account_offers(self.user_id)
+        self.assertEqual(
+            resp.content,
+            b"retry: 3000\n\n" + sse_event("ready", {"offers_version": version}),
+        )
+        self.assertEqual(hub.stats()["subscribers"], 0)
+
+    def test_stream_offer_events_accepts_a_ticket_in_the_query_string(self):
+        hub = EventHub(max_stream_seconds=0)
+        self.app.dependency_overrides[get_event_hub] = lambda: hub
+        del self.app.dependency_overrides[get_stream_user_id]
+        self.app.add_exception_handler(ApiError, api_error_handler)
+        authenticator = MagicMock(name="authenticator")
+        self.app.dependency_overrides[get_token_authenticator] = lambda: authenticator
+
+        opened = self.client.get("/accounts/offers/stream", params={"ticket": issue_stream_ticket(self.user_id)})
+        bad_ticket = self.client.get("/accounts/offers/stream", params={"ticket": "nope"})
+        no_auth = self.client.get("/accounts/offers/stream")
+
+        self.assertEqual(opened.status_code, 200)
+        version = self.change_versions.account_offers(self.user_id)
+        self.assertIn(sse_event("ready", {"offers_version": version}), opened.content)
+        self.assertEqual((bad_ticket.status_code, no_auth.status_code), (401, 401))
+        authenticator.authenticate.assert_not_called()
+
+    def test_issue_offer_stream_ticket_returns_a_ticket_for_the_caller(self):
+        resp = self.client.post("/accounts/offers/ticket")
+
+        self.assertEqual(resp.status_code, 200)
+        body = resp.json()
+        self.assertEqual(decode_stream_ticket(body["ticket"]), self.user_id)
+        self.assertEqual(body["expires_in"], 60)
+
+    def _stream(self, hub, version):
+        """The first chunk and the event generator of a fresh subscription."""
+        async def start():
+            stream = offer_routes._offer_events(hub.subscribe(self.user_id), lambda: version[0], hub)
+            return await stream.__anext__(), stream
+        return start()
+
+    def test_offer_events_forwards_published_events_and_closes_subscription(self):
+        hub = EventHub(poll_seconds=0.01)
+
+        async def run():
+            _, stream = await self._stream(hub, ["e.0"])
+            hub.publish([self.user_id], "offer.seen", {"offer_id": 3, "listing_id": 4})
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        self.assertEqual(asyncio.run(run()), sse_event("offer.seen", {"offer_id": 3, "listing_id": 4}))
+        self.assertEqual(hub.stats()["subscribers"], 0)
+
+    def test_offer_events_reports_unannounced_version_change(self):
+        hub = EventHub(poll_seconds=0.01)
+        version = ["e.0"]
+
+        async def run():
+            _, stream = await self._stream(hub, version)
+            version[0] = "e.1"  # a write in another worker: bumped, never published here
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        self.assertEqual(asyncio.run(run()), sse_event("offers.changed", {"offers_version": "e.1"}))
+
+    def test_offer_events_sends_resync_when_client_fell_behind(self):
+        hub = EventHub(poll_seconds=0.01, heartbeat_seconds=0, queue_size=1)
+
+        async def run():
+            _, stream = await self._stream(hub, ["e.0"])
+            for offer_id in range(3):
+                hub.publish([self.user_id], "offer.seen", {"offer_id": offer_id})
+            await asyncio.sleep(0)
+            chunks = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return chunks
+
+        resync, after = asyncio.run(run())
+        self.assertEqual(resync, sse_event("resync", {"offers_version": "e.0"}))
+        self.assertEqual(after, SSE_HEARTBEAT)  # the queued events were discarded
+
+    def test_offer_events_sends_heartbeat_when_idle(self):
+        hub = EventHub(poll_seconds=0.01, heartbeat_seconds=0)
+
+        async def run():
+            _, stream = await self._stream(hub, ["e.0"])
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        self.assertEqual(asyncio.run(run()), SSE_HEARTBEAT)
+
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.api.routes.rating_routes as rating_routes
+from src.api.dependencies import get_listing_service
+from src.auth.dependencies import get_current_user_id
+from src.domain_models import Rating
+
+
+class TestRatingRoutes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = FastAPI()
+        self.app.include_router(rating_routes.router)
+
+        self.app.dependency_overrides[get_current_user_id] = lambda: 123
+        self.listing_service = MagicMock(name="listing_service")
+        self.app.dependency_overrides[get_listing_service] = lambda: self.listing_service
+
+        self.client = TestClient(self.app)
+
+    def test_get_ratings_maps_every_requested_listing(self) -> None:
+        self.listing_service.get_listing_ratings.return_value = {
+            4: Rating(listing_id=4, rater_id=9, transaction_rating=5, rating_id=1),
+            7: None,
+        }
+
+        resp = self.client.get("/ratings?listing_ids=4&listing_ids=7")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            resp.json(),
+            {
+                "ratings": {
+                    "4": {"id": 1, "listing_id": 4, "rater_id": 9, "transaction_rating": 5},
+                    "7": None,
+                }
+            },
+        )
+        self.listing_service.get_listing_ratings.assert_called_once_with([4, 7])
+
+    def test_get_ratings_requires_listing_ids(self) -> None:
+        resp = self.client.get("/ratings")
+
+        self.assertEqual(resp.status_code, 422)
+        self.listing_service.get_listing_ratings.assert_not_called()
+
+    def test_get_ratings_rejects_more_than_the_batch_limit(self) -> None:
+        query = "&".join(
+            f"listing_ids={i}" for i in range(rating_routes.MAX_BATCH_LISTING_IDS + 1)
+        )
+
+        resp = self.client.get(f"/ratings?{query}")
+
+        self.assertEqual(resp.status_code, 422)
+        self.listing_service.get_listing_ratings.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+from fastapi import FastAPI
+
+from src.api.admission import CHEAP, EXPENSIVE, AdmissionController, AdmissionMiddleware
+from src.utils import ConfigurationError, ServiceOverloadedError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdmissionController(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+
+    def tearDown(self) -> None:
+        AdmissionController.reset()
+
+    def _controller(self, **kwargs) -> AdmissionController:
+        kwargs.setdefault("clock", self.clock)
+        return AdmissionController(**kwargs)
+
+    def test_lane_for_classifies_paths(self) -> None:
+        controller = self._controller(max_in_flight=4)
+
+        self.assertEqual(controller.lane_for("/listings"), CHEAP)
+        self.assertEqual(controller.lane_for("/listings/12"), CHEAP)
+        self.assertEqual(controller.lane_for("/listings/search"), EXPENSIVE)
+        self.assertEqual(controller.lane_for("/listings/export"), EXPENSIVE)
+        self.assertEqual(controller.lane_for("/accounts/offers/export"), EXPENSIVE)
+        self.assertEqual(controller.lane_for("/listings/seller/3"), CHEAP)
+        self.assertIsNone(controller.lane_for("/metrics/cache"))
+        self.assertIsNone(controller.lane_for("/openapi.json"))
+        self.assertIsNone(controller.lane_for("/health/ready"))
+        self.assertIsNone(controller.lane_for("/accounts/offers/stream"))
+        self.assertEqual(controller.lane_for("/accounts/offers/ticket"), CHEAP)
+
+    def test_query_and_facets_share_the_expensive_lane_with_search(self) -> None:
+        controller = self._controller(max_in_flight=4)
+
+        # /listings/query can scan title LIKE '%kw%' with a filesort, and
+        # /listings/facets groups every unsold listing on a version miss
+        self.assertEqual(controller.lane_for("/listings/query"), EXPENSIVE)
+        self.assertEqual(controller.lane_for("/listings/facets"), EXPENSIVE)
+
+    async def test_query_is_shed_while_cheap_requests_wait(self) -> None:
+        controller = self._controller(max_in_flight=1, expensive_max_in_flight=1, queue_timeout_seconds=1.0)
+        await controller.acquire(controller.lane_for("/listings"))
+        cheap_waiter = asyncio.ensure_future(controller.acquire(CHEAP))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ServiceOverloadedError):
+            await controller.acquire(controller.lane_for("/listings/query"))
+
+        self.assertEqual(controller.stats()["shed"][EXPENSIVE], 1)
+        controller.release(CHEAP)
+        await asyncio.wait_for(cheap_waiter, 1.0)
+
+    def test_rejects_non_positive_limit(self) -> None:
+        with self.assertRaises(ValueError):
+            AdmissionController(max_in_flight=0)
+
+    async def test_admits_up_to_limit_then_sheds_after_queue_budget(self) -> None:
+        controller = self._controller(max_in_flight=2, queue_timeout_seconds=0.01)
+        await controller.acquire(CHEAP)
+        await controller.acquire(CHEAP)
+
+        with self.assertRaises(ServiceOverloadedError) as ctx:
+            await controller.acquire(CHEAP)
+
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(ctx.exception.retry_after_seconds, 1)
+        stats = controller.stats()
+        self.assertEqual(stats["in_flight"][CHEAP], 2)
+        self.assertEqual(stats["queued"][CHEAP], 1)
+        self.assertEqual(stats["shed"][CHEAP], 1)
+        self.assertEqual(stats["waiting"][CHEAP], 0)
+
+    async def test_queued_request_gets_the_released_slot(self) -> None:
+        controller = self._controller(max_in_flight=1, queue_timeout_seconds=1.0)
+        await controller.acquire(CHEAP)
+
+        waiter = asyncio.ensure_future(controller.acquire(CHEAP))
+        await asyncio.sleep(0)
+        self.assertEqual(controller.stats()["waiting"][CHEAP], 1)
+
+        controller.release(CHEAP)
+        await asyncio.wait_for(waiter, 1.0)
+
+        stats = controller.stats()
+        self.assertEqual(stats["in_flight"][CHEAP], 1)
+        self.assertEqual(stats["admitted"][CHEAP], 2)
+
+    async def test_expensive_lane_is_capped_and_does_not_queue(self) -> None:
+        controller = self._controller(max_in_flight=4, expensive_max_in_flight=1)
+        await controller.acquire(EXPENSIVE)
+
+        with self.assertRaises(ServiceOverloadedError) as ctx:
+            await controller.acquire(EXPENSIVE)
+        self.assertEqual(ctx.exception.details, {"lane": EXPENSIVE})
+
+        # cheap reads still get the remaining slots
+        for _ in range(3):
+            await controller.acquire(CHEAP)
+        self.assertEqual(controller.stats()["in_flight"], {CHEAP: 3, EXPENSIVE: 1})
+
+    async def test_expensive_is_shed_while_cheap_requests_wait(self) -> None:
+        controller = self._controller(
+            max_in_flight=1,
+            queue_timeout_seconds=1.0,
+            expensive_queue_timeout_seconds=1.0,
+        )
+        await controller.acquire(CHEAP)
+        cheap_waiter = asyncio.ensure_future(controller.acquire(CHEAP))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ServiceOverloadedError):
+            await controller.acquire(EXPENSIVE)
+
+        controller.release(CHEAP)
+        await asyncio.wait_for(cheap_waiter, 1.0)
+
+    async def test_freed_slot_goes_to_cheap_waiter_first(self) -> None:
+        controller = self._controller(
+            max_in_flight=1,
+            queue_timeout_seconds=1.0,
+            expensive_queue_timeout_seconds=1.0,
+        )
+        await controller.acquire(CHEAP)
+        expensive_waiter = asyncio.ensure_future(controller.acquire(EXPENSIVE))
+        await asyncio.sleep(0)
+        cheap_waiter = asyncio.ensure_future(controller.acquire(CHEAP))
+        await asyncio.sleep(0)
+
+        controller.release(CHEAP)
+        await asyncio.wait_for(cheap_waiter, 1.0)
+        self.assertFalse(expensive_waiter.done())
+
+        controller.release(CHEAP)
+        await asyncio.wait_for(expensive_waiter, 1.0)
+        self.assertEqual(controller.stats()["in_flight"], {CHEAP: 0, EXPENSIVE: 1})
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self) -> None:
+        controller = self._controller(max_in_flight=1, queue_timeout_seconds=1.0)
+        await controller.acquire(CHEAP)
+        waiter = asyncio.ensure_future(controller.acquire(CHEAP))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        controller.release(CHEAP)
+
+        self.assertEqual(controller.stats()["in_flight"], {CHEAP: 0, EXPENSIVE: 0})
+        await controller.acquire(CHEAP)
+
+    def test_token_bucket_allows_burst_then_limits_and_refills(self) -> None:
+        controller = self._controller(max_in_flight=1, user_rate=2.0, user_burst=3.0)
+
+        for _ in range(3):
+            self.assertIsNone(controller.check_rate("user:1"))
+        self.assertEqual(controller.check_rate("user:1"), 1)
+        # other callers have their own bucket
+        self.assertIsNone(controller.check_rate("user:2"))
+
+        self.clock.now += 0.5
+        self.assertIsNone(controller.check_rate("user:1"))
+        self.assertEqual(controller.stats()["rate_limited"], 1)
+
+    def test_token_bucket_disabled_with_zero_rate(self) -> None:
+        controller = self._controller(max_in_flight=1, user_rate=0, user_burst=0)
+
+        for _ in range(100):
+            self.assertIsNone(controller.check_rate("user:1"))
+
+    def test_tracked_buckets_are_bounded(self) -> None:
+        controller = self._controller(max_in_flight=1, max_tracked_users=2)
+
+        for key in ("a", "b", "c"):
+            controller.check_rate(key)
+
+        self.assertEqual(controller.stats()["tracked_users"], 2)
+
+    def test_instance_defaults_to_db_pool_capacity(self) -> None:
+        db = MagicMock(pool_capacity=12)
+        with patch("src.api.admission.DBUtility.instance", return_value=db):
+            controller = AdmissionController.instance()
+
+        self.assertIs(controller, AdmissionController.instance())
+        self.assertEqual(controller.stats()["max_in_flight"], 12)
+        self.assertEqual(controller.stats()["expensive_max_in_flight"], 3)
+
+    def test_instance_reads_environment(self) -> None:
+        env = {"ADMISSION_MAX_IN_FLIGHT": "8", "ADMISSION_EXPENSIVE_MAX_IN_FLIGHT": "1"}
+        with patch.dict(os.environ, env), patch(
+            "src.api.admission.DBUtility.instance", side_effect=ConfigurationError("x")
+        ):
+            controller = AdmissionController.instance()
+
+        self.assertEqual(controller.stats()["max_in_flight"], 8)
+        self.assertEqual(controller.stats()["expensive_max_in_flight"], 1)
+
+    def test_instance_without_db_uses_default_capacity(self) -> None:
+        with patch("src.api.admission.DBUtility.instance", side_effect=ConfigurationError("x")):
+            controller = AdmissionController.instance()
+
+        self.assertEqual(controller.stats()["max_in_flight"], 15)
+
+
+class TestAdmissionMiddleware(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.release = asyncio.Event()
+        self.authenticator = MagicMock(name="authenticator")
+        self.authenticator.peek_user_id.return_value = None
+
+        app = FastAPI()
+
+        @app.get("/listings")
+        async def listings():
+            return []
+
+        @app.get("/listings/search")
+        async def search():
+            await self.release.wait()
+            return []
+
+        @app.get("/metrics/cache")
+        async def metrics():
+            return {}
+
+        self.app = app
+
+    def _client(self, controller: AdmissionController) -> httpx.AsyncClient:
+        self.app.user_middleware.clear()
+        self.app.middleware_stack = None
+        self.app.add_middleware(
+            AdmissionMiddleware, controller=controller, authenticator=self.authenticator
+        )
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app), base_url="http://test"
+        )
+
+    async def test_admitted_request_releases_its_slot(self) -> None:
+        controller = AdmissionController(max_in_flight=1)
+        async with self._client(controller) as client:
+            for _ in range(3):
+                res = await client.get("/listings")
+                self.assertEqual(res.status_code, 200)
+
+        self.assertEqual(controller.stats()["in_flight"], {CHEAP: 0, EXPENSIVE: 0})
+
+    async def test_sheds_search_with_503_and_retry_after(self) -> None:
+        controller = AdmissionController(max_in_flight=4, expensive_max_in_flight=1)
+        async with self._client(controller) as client:
+            running = asyncio.ensure_future(client.get("/listings/search"))
+            while controller.stats()["in_flight"][EXPENSIVE] == 0:
+                await asyncio.sleep(0)
+
+            shed = await client.get("/listings/search")
+            cheap = await client.get("/listings")
+            self.release.set()
+            await running
+
+        self.assertEqual(shed.status_code, 503)
+        self.assertEqual(shed.headers["retry-after"], "1")
+        self.assertEqual(shed.json()["error_code"], "SERVICE_OVERLOADED")
+        self.assertEqual(cheap.status_code, 200)
+
+    async def test_rate_limits_per_user_with_429(self) -> None:
+        self.authenticator.peek_user_id.side_effect = lambda token: int(token)
+        controller = AdmissionController(max_in_flight=4, user_rate=0.5, user_burst=1)
+        async with self._client(controller) as client:
+            first = await client.get("/listings", headers={"Authorization": "Bearer 7"})
+            second = await client.get("/listings", headers={"Authorization": "Bearer 7"})
+            other = await client.get("/listings", headers={"Authorization": "Bearer 8"})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 429)
+        self.assertEqual(second.headers["retry-after"], "2")
+        self.assertEqual(second.json()["error_code"], "RATE_LIMITED")
+        self.assertEqual(other.status_code, 200)
+
+    async def test_anonymous_callers_are_keyed_by_client_address(self) -> None:
+        controller = AdmissionController(max_in_flight=4, user_rate=0.5, user_burst=1)
+        async with self._client(controller) as client:
+            await client.get("/listings", headers={"Authorization": "Bearer bad"})
+            res = await client.get("/listings")
+
+        self.assertEqual(res.status_code, 429)
+        self.authenticator.peek_user_id.assert_called_once_with("bad")
+
+    async def test_exempt_paths_and_preflight_bypass_admission(self) -> None:
+        controller = AdmissionController(max_in_flight=1, user_rate=0.5, user_burst=1)
+        async with self._client(controller) as client:
+            for _ in range(3):
+                self.assertEqual((await client.get("/metrics/cache")).status_code, 200)
+            await client.options("/listings")
+            await client.options("/listings")
+
+        self.assertEqual(controller.stats()["admitted"], {CHEAP: 0, EXPENSIVE: 0})
+        self.assertEqual(controller.stats()["rate_limited"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,26 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import src.api.dependencies as deps
+from src.utils import StorageUnavailableError
 
 
 class TestAPIDependencies(unittest.TestCase):
 
     def setUp(self) -> None:
         self.db = MagicMock(name="db")
-        self.account_db = MagicMock(name="account_db")
-        self.listing_db = MagicMock(name="listing_db")
-        self.comment_db = MagicMock(name="comment_db")
-        self.offer_db = MagicMock(name="offer_db") 
-        self.token_db = MagicMock(name="token_db")
-
-        self.account_manager = MagicMock(name="account_manager")
-        self.comment_manager = MagicMock(name="comment_manager")
-        self.listing_manager = MagicMock(name="listing_manager")
-        self.offer_manager = MagicMock(name="offer_manager")
-        self.rating_manager = MagicMock(name="rating_manager")
+        self.change_versions = MagicMock(name="change_versions")
+        self.password_hasher = MagicMock(name="password_hasher")
 
     def test_get_db(self):
         with patch.object(deps.DBUtility, "instance", return_value=self.db) as mock_instance:
@@ -29,167 +24,61 @@ class TestAPIDependencies(unittest.TestCase):
         mock_instance.assert_called_once()
         self.assertIs(result, self.db)
 
-    def test_get_account_db(self):
-        with patch.object(deps, "MySQLAccountDB", return_value=self.account_db) as ctor:
-            result = deps.get_account_db(db=self.db)
+    def test_get_change_versions_returns_process_registry(self):
+        with patch.object(deps.ChangeVersions, "instance", return_value=self.change_versions) as mock_instance:
+            result = deps.get_change_versions()
 
-        ctor.assert_called_once_with(db=self.db)
-        self.assertIs(result, self.account_db)
-
-    def test_get_listing_db(self):
-        with patch.object(deps, "MySQLListingDB", return_value=self.listing_db) as ctor:
-            result = deps.get_listing_db(db=self.db)
-
-        ctor.assert_called_once_with(db=self.db)
-        self.assertIs(result, self.listing_db)
-
-    def test_get_comment_db(self):
-        with patch.object(deps, "MySQLCommentDB", return_value=self.comment_db) as ctor:
-            result = deps.get_comment_db(db=self.db)
-
-        ctor.assert_called_once_with(db=self.db)
-        self.assertIs(result, self.comment_db)
-
-    def test_get_email_token_db(self):
-        with patch.object(deps, "MySQLEmailVerificationTokenDB", return_value=self.token_db) as ctor:
-            result = deps.get_email_token_db(db=self.db)
-
-        ctor.assert_called_once_with(db=self.db)
-        self.assertIs(result, self.token_db)
-
-    def test_get_offer_db(self):
-        with patch.object(deps, "MySQLOfferDB", return_value=self.offer_db) as ctor:
-            result = deps.get_offer_db(db=self.db)
-
-        ctor.assert_called_once_with(db=self.db)
-        self.assertIs(result, self.offer_db)
-
-    def test_get_rating_db(self):
-        rating_db = MagicMock(name="rating_db")
-        with patch.object(deps, "MySQLRatingDB", return_value=rating_db) as ctor:
-            result = deps.get_rating_db(db=self.db)
-
-        ctor.assert_called_once_with(db=self.db)
-        self.assertIs(result, rating_db)
-
-    def test_get_account_manager(self):
-        with patch.object(deps, "AccountManager", return_value=self.account_manager) as ctor:
-            result = deps.get_account_manager(account_db=self.account_db)
-
-        ctor.assert_called_once_with(account_db=self.account_db)
-        self.assertIs(result, self.account_manager)
-
-    def test_get_comment_manager(self):
-        with patch.object(deps, "CommentManager", return_value=self.comment_manager) as ctor:
-            result = deps.get_comment_manager(comment_db=self.comment_db)
-
-        ctor.assert_called_once_with(comment_db=self.comment_db)
-        self.assertIs(result, self.comment_manager)
-
-    def test_get_listing_manager(self):
-        with patch.object(deps, "ListingManager", return_value=self.listing_manager) as ctor:
-            result = deps.get_listing_manager(
-                listing_db=self.listing_db,
-                comment_db=self.comment_db
-            )
-
-        ctor.assert_called_once_with(
-            listing_db=self.listing_db,
-            comment_db=self.comment_db
-        )
-        self.assertIs(result, self.listing_manager)
-
-    def test_get_rating_manager(self):
-        rating_db = MagicMock(name="rating_db")
-        with patch.object(deps, "RatingManager", return_value=self.rating_manager) as ctor:
-            result = deps.get_rating_manager(rating_db=rating_db)
-
-        ctor.assert_called_once_with(rating_db=rating_db)
-        self.assertIs(result, self.rating_manager)
-
-    def test_get_offer_manager(self):
-        with patch.object(deps, "OfferManager", return_value=self.offer_manager) as ctor:
-            result = deps.get_offer_manager(
-                offer_db=self.offer_db,
-                listing_db=self.listing_db,
-            )
-
-        ctor.assert_called_once_with(
-            offer_db=self.offer_db,
-            listing_db=self.listing_db,
-        )
-        self.assertIs(result, self.offer_manager)
-
-    def test_get_account_service(self):
-        service = MagicMock()
-
-        with patch.object(deps, "AccountService", return_value=service) as ctor:
-            result = deps.get_account_service(
-                account_manager=self.account_manager,
-                token_db=self.token_db,
-                rating_manager=self.rating_manager,
-            )
-
-        ctor.assert_called_once_with(
-            account_manager=self.account_manager,
-            token_db=self.token_db,
-            rating_manager=self.rating_manager,
-        )
-        self.assertIs(result, service)
-
-    def test_get_comment_service(self):
-        service = MagicMock()
-
-        with patch.object(deps, "CommentService", return_value=service) as ctor:
-            result = deps.get_comment_service(
-                comment_manager=self.comment_manager,
-                listing_manager=self.listing_manager,
-                account_manager=self.account_manager,
-            )
-
-        ctor.assert_called_once_with(
-            comment_manager=self.comment_manager,
-            listing_manager=self.listing_manager,
-            account_manager=self.account_manager,
-        )
-        self.assertIs(result, service)
+        mock_instance.assert_called_once()
+        self.assertIs(result, self.change_versions)
 
-    def test_get_listing_service(self):
-        service = MagicMock()
+    def test_get_password_hasher_returns_process_hasher(self):
+        with patch.object(deps.PasswordHasher, "instance", return_value=self.password_hasher) as mock_instance:
+            result = deps.get_password_hasher()
 
-        with patch.object(deps, "ListingService", return_value=service) as ctor:
-            result = deps.get_listing_service(
-                listing_manager=self.listing_manager,
-                rating_manager=self.rating_manager,
-            )
+        mock_instance.assert_called_once()
+        self.assertIs(result, self.password_hasher)
 
-        ctor.assert_called_once_with(
-            listing_manager=self.listing_manager,
-            rating_manager=self.rating_manager,
-        )
-        self.assertIs(result, service)
+    def test_get_repository_cache_returns_process_cache(self):
+        cache = MagicMock(name="cache")
+        with patch.object(deps.RepositoryCache, "instance", return_value=cache) as mock_instance:
+            result = deps.get_repository_cache()
 
-    def test_get_offer_service(self):
-        service = MagicMock()
+        mock_instance.assert_called_once()
+        self.assertIs(result, cache)
 
-        with patch.object(deps, "OfferService", return_value=service) as ctor:
-            result = deps.get_offer_service(
-                offer_manager=self.offer_manager,
-                listing_manager=self.listing_manager,
-                account_manager=self.account_manager,
-            )
+    def test_services_for_builds_the_container_once_per_app(self):
+        app = MagicMock(name="app")
+        app.state = SimpleNamespace()
+        container = MagicMock(name="container")
 
-        ctor.assert_called_once_with(
-            offer_manager=self.offer_manager,
-            listing_manager=self.listing_manager,
-            account_manager=self.account_manager,
-        )
-        self.assertIs(result, service)
+        with patch.object(deps.ServiceContainer, "from_environment", return_value=container) as build:
+            first = deps.services_for(app)
+            second = deps.services_for(app)
 
+        build.assert_called_once_with()
+        self.assertIs(first, container)
+        self.assertIs(second, container)
 
+    def test_service_dependencies_read_from_the_app_container(self):
+        container = MagicMock(name="container")
+        request = MagicMock(name="request")
+        request.app.state = SimpleNamespace(services=container)
+        cases = [
+            (deps.get_account_service, container.account_service),
+            (deps.get_comment_service, container.comment_service),
+            (deps.get_listing_service, container.listing_service),
+            (deps.get_offer_service, container.offer_service),
+            (deps.get_job_queue, container.job_queue),
+            (deps.get_event_hub, container.event_hub),
+        ]
+
+        for dependency, expected in cases:
+            self.assertTrue(inspect.iscoroutinefunction(dependency))
+            self.assertIs(asyncio.run(dependency(request=request)), expected)
 
     def test_get_media_storage_uses_default_env_values(self):
         request = MagicMock(name="request")
+        request.app.state = SimpleNamespace()
 
         with (
             patch.dict("os.environ", {}, clear=True),
@@ -213,6 +102,7 @@ class TestAPIDependencies(unittest.TestCase):
 
     def test_get_media_storage_uses_env_values(self):
         request = MagicMock(name="request")
+        request.app.state = SimpleNamespace()
 
         env = {
             "MINIO_ENDPOINT": "minio:9000",
@@ -242,6 +132,70 @@ class TestAPIDependencies(unittest.TestCase):
         )
         self.assertIs(result, instance)
 
+    def test_get_admission_controller_returns_process_controller(self):
+        controller = MagicMock(name="controller")
+        with patch.object(deps.AdmissionController, "instance", return_value=controller) as mock_instance:
+            result = deps.get_admission_controller()
+
+        mock_instance.assert_called_once()
+        self.assertIs(result, controller)
+
+    def test_get_circuit_breakers_returns_process_registry(self):
+        registry = MagicMock(name="registry")
+        with patch.object(deps.CircuitBreakerRegistry, "instance", return_value=registry) as mock_instance:
+            result = deps.get_circuit_breakers()
+
+        mock_instance.assert_called_once()
+        self.assertIs(result, registry)
+
+    def test_get_transaction_retrier_returns_process_retrier(self):
+        retrier = MagicMock(name="retrier")
+        with patch.object(deps.TransactionRetrier, "instance", return_value=retrier) as mock_instance:
+            result = deps.get_transaction_retrier()
+
+        mock_instance.assert_called_once()
+        self.assertIs(result, retrier)
+
+
+    def test_get_media_storage_reuses_the_app_client(self):
+        request = MagicMock(name="request")
+        request.app.state = SimpleNamespace()
+
+        with patch.object(deps, "MediaStorageUtility") as ctor:
+            first = deps.get_media_storage(request=request)
+            second = deps.get_media_storage(request=request)
+
+        ctor.assert_called_once()
+        self.assertIs(first, second)
+        self.assertIs(request.app.state.media_storage, first)
+
+    def test_get_media_storage_retries_after_failed_creation(self):
+        request = MagicMock(name="request")
+        request.app.state = SimpleNamespace()
+        instance = MagicMock(name="media_storage")
+
+        with patch.object(
+            deps, "MediaStorageUtility", side_effect=[StorageUnavailableError("down"), instance]
+        ):
+            with self.assertRaises(StorageUnavailableError):
+                deps.get_media_storage(request=request)
+            self.assertIs(deps.get_media_storage(request=request), instance)
+
+    def test_get_readiness_checker_probes_mysql_and_minio_once_per_app(self):
+        request = MagicMock(name="request")
+        request.app.state = SimpleNamespace(media_storage=MagicMock(name="media_storage"))
+
+        with patch.object(deps.DBUtility, "instance", return_value=self.db):
+            checker = deps.get_readiness_checker(request=request)
+            ready, checks = checker.check()
+
+        self.assertIs(deps.get_readiness_checker(request=request), checker)
+        self.assertTrue(ready)
+        self.assertEqual(set(checks), {"mysql", "minio"})
+        self.assertFalse(checks["minio"]["critical"])
+        self.db.ping.assert_called_once_with()
+        request.app.state.media_storage.ping.assert_called_once_with()
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from starlette.requests import Request
+
+from src.api.conditional import (
+    CONDITIONAL_CACHE_CONTROL,
+    conditional_json,
+    etag_matches,
+    weak_etag,
+)
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestConditionalGet(unittest.TestCase):
+    def test_weak_etag_joins_parts(self) -> None:
+        self.assertEqual(weak_etag("seller", 7, "ab.3"), 'W/"seller-7-ab.3"')
+
+    def test_etag_matches_is_false_without_header(self) -> None:
+        self.assertFalse(etag_matches(_request(), 'W/"a"'))
+
+    def test_etag_matches_uses_weak_comparison(self) -> None:
+        self.assertTrue(etag_matches(_request('"a"'), 'W/"a"'))
+        self.assertTrue(etag_matches(_request('W/"a"'), 'W/"a"'))
+
+    def test_etag_matches_any_tag_in_list(self) -> None:
+        self.assertTrue(etag_matches(_request('W/"x", W/"a"'), 'W/"a"'))
+        self.assertFalse(etag_matches(_request('W/"x", W/"y"'), 'W/"a"'))
+
+    def test_etag_matches_wildcard(self) -> None:
+        self.assertTrue(etag_matches(_request("*"), 'W/"a"'))
+
+    def test_conditional_json_returns_304_without_rendering(self) -> None:
+        render = MagicMock()
+
+        response = conditional_json(_request('W/"a"'), 'W/"a"', render)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
+        self.assertEqual(response.headers["etag"], 'W/"a"')
+        render.assert_not_called()
+
+    def test_conditional_json_renders_body_on_miss(self) -> None:
+        response = conditional_json(_request('W/"old"'), 'W/"a"', lambda: b"[]")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, b"[]")
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(response.headers["etag"], 'W/"a"')
+        self.assertEqual(response.headers["cache-control"], CONDITIONAL_CACHE_CONTROL)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.api.container import ServiceContainer
+from src.business_logic.services import AccountService, CommentService, ListingService, OfferService
+from src.db.comment.mysql import MySQLCommentDB
+from src.db.account.mysql import MySQLAccountDB
+from src.db.cache import CachedAccountDB, CachedCommentDB, CachedListingDB, CachedRatingDB
+from src.db.job.mysql import MySQLJobDB
+from src.db.listing.mysql import MySQLListingDB
+from src.db.rating.mysql import MySQLRatingDB
+from src.jobs import PURGE_EMAIL_TOKENS_JOB, RECONCILE_LISTING_COUNTERS_JOB, JobQueue
+from src.utils import EventHub
+
+
+class TestServiceContainer(unittest.TestCase):
+    """Unit tests for the app-scoped object graph."""
+
+    def setUp(self) -> None:
+        self.db = MagicMock(name="db")
+        self.change_versions = MagicMock(name="change_versions")
+        self.password_hasher = MagicMock(name="password_hasher")
+
+    def _container(self, cache=None) -> ServiceContainer:
+        return ServiceContainer(
+            db=self.db,
+            cache=cache,
+            change_versions=self.change_versions,
+            password_hasher=self.password_hasher,
+        )
+
+    def test_builds_every_service(self) -> None:
+        container = self._container()
+
+        self.assertIsInstance(container.account_service, AccountService)
+        self.assertIsInstance(container.comment_service, CommentService)
+        self.assertIsInstance(container.listing_service, ListingService)
+        self.assertIsInstance(container.offer_service, OfferService)
+
+    def test_without_cache_uses_mysql_wrappers_directly(self) -> None:
+        container = self._container()
+
+        self.assertIsInstance(container.account_db, MySQLAccountDB)
+        self.assertIsInstance(container.listing_db, MySQLListingDB)
+        self.assertIsInstance(container.rating_db, MySQLRatingDB)
+        self.assertIsInstance(container.comment_db, MySQLCommentDB)
+
+    def test_cache_wraps_account_listing_rating_and_comment_dbs(self) -> None:
+        cache = MagicMock(name="cache")
+
+        container = self._container(cache)
+
+        for db, cached_cls in (
+            (container.account_db, CachedAccountDB),
+            (container.listing_db, CachedListingDB),
+            (container.rating_db, CachedRatingDB),
+            (container.comment_db, CachedCommentDB),
+        ):
+            self.assertIsInstance(db, cached_cls)
+            self.assertIs(db._cache, cache)
+
+    def test_write_path_listing_reads_bypass_the_cache(self) -> None:
+        container = self._container(MagicMock(name="cache"))
+
+        self.assertIsInstance(container.listing_source_db, MySQLListingDB)
+        self.assertIs(container.offer_manager._listing_db, container.listing_source_db)
+        self.assertIs(container.listing_manager._source_listing_db, container.listing_source_db)
+
+    def test_services_share_one_instance_of_each_manager(self) -> None:
+        container = self._container()
+
+        self.assertIs(container.comment_service._listing_manager, container.listing_manager)
+        self.assertIs(container.offer_service._listing_manager, container.listing_manager)
+        self.assertIs(container.offer_service._account_manager, container.account_manager)
+        self.assertIs(container.account_service.account_manager, container.account_manager)
+        self.assertIs(container.account_service.token_db, container.email_token_db)
+        self.assertIs(container.account_service.password_hasher, self.password_hasher)
+
+    def test_managers_bump_the_given_change_versions(self) -> None:
+        container = self._container()
+
+        self.assertIs(container.listing_manager._versions, self.change_versions)
+        self.assertIs(container.offer_manager._versions, self.change_versions)
+
+    def test_offer_manager_publishes_to_the_container_event_hub(self) -> None:
+        hub = EventHub()
+        container = ServiceContainer(
+            db=self.db,
+            cache=None,
+            change_versions=self.change_versions,
+            password_hasher=self.password_hasher,
+            event_hub=hub,
+        )
+
+        self.assertIs(container.event_hub, hub)
+        self.assertIs(container.offer_manager._events, hub)
+
+    def test_from_environment_uses_process_singletons(self) -> None:
+        with patch("src.api.container.DBUtility.instance", return_value=self.db), patch(
+            "src.api.container.RepositoryCache.instance", return_value=None
+        ), patch(
+            "src.api.container.ChangeVersions.instance", return_value=self.change_versions
+        ), patch(
+            "src.api.container.PasswordHasher.instance", return_value=self.password_hasher
+        ):
+            container = ServiceContainer.from_environment()
+
+        self.assertIs(container.listing_manager._versions, self.change_versions)
+        self.assertIs(container.account_service.password_hasher, self.password_hasher)
+
+    def test_uses_the_given_job_queue(self) -> None:
+        jobs = JobQueue(MagicMock(name="job_db"))
+        container = ServiceContainer(
+            db=self.db,
+            cache=None,
+            change_versions=self.change_versions,
+            password_hasher=self.password_hasher,
+            job_queue=jobs,
+        )
+
+        self.assertIs(container.job_queue, jobs)
+        self.assertIn("maintenance", jobs.stats()["queues"])
+
+    def test_default_job_queue_writes_to_the_job_table(self) -> None:
+        container = self._container()
+
+        self.assertIsInstance(container.job_queue._db, MySQLJobDB)
+        self.assertFalse(container.job_queue.started)
+
+    def test_email_token_sweeper_is_scheduled_on_the_maintenance_queue(self) -> None:
+        with patch.dict(os.environ, {"EMAIL_TOKEN_PURGE_INTERVAL_SECONDS": "120"}):
+            container = self._container()
+
+        self.assertIs(container.email_token_sweeper._db, container.email_token_db)
+        [schedule] = [s for s in container.job_queue._schedules if s.kind == PURGE_EMAIL_TOKENS_JOB]
+        self.assertEqual(schedule.every_seconds, 120.0)
+        self.assertIn("maintenance", container.job_queue.stats()["queues"])
+
+    def test_listing_counter_reconciler_is_scheduled_on_the_maintenance_queue(self) -> None:
+        with patch.dict(os.environ, {"LISTING_COUNTER_RECONCILE_INTERVAL_SECONDS": "600"}):
+            container = self._container()
+
+        self.assertIs(container.listing_counter_reconciler._db, container.listing_db)
+        [schedule] = [s for s in container.job_queue._schedules if s.kind == RECONCILE_LISTING_COUNTERS_JOB]
+        self.assertEqual(schedule.every_seconds, 600.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
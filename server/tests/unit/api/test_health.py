@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_readiness_checker
+from src.api.health import DependencyProbe, ReadinessChecker
+from src.api.routes.health_routes import router
+from src.utils import DatabaseUnavailableError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 50.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestHealth(unittest.TestCase):
+    """Unit tests for the cached readiness probes and /health routes."""
+
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.mysql_check = MagicMock(name="mysql_check")
+        self.minio_check = MagicMock(name="minio_check")
+        self.checker = ReadinessChecker([
+            DependencyProbe("mysql", self.mysql_check, ttl_seconds=5, clock=self.clock),
+            DependencyProbe("minio", self.minio_check, critical=False, ttl_seconds=5, clock=self.clock),
+        ])
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_readiness_checker] = lambda: self.checker
+        self.client = TestClient(app)
+
+    def test_probe_result_is_cached_for_ttl(self) -> None:
+        probe = DependencyProbe("mysql", self.mysql_check, ttl_seconds=5, clock=self.clock)
+
+        for _ in range(3):
+            self.assertTrue(probe.result()["ok"])
+        self.clock.now += 4.9
+        probe.result()
+        self.assertEqual(self.mysql_check.call_count, 1)
+
+        self.clock.now += 0.1
+        self.assertEqual(probe.result()["age_seconds"], 0)
+        self.assertEqual(probe.runs, 2)
+
+    def test_failing_probe_reports_error_type_and_recovers(self) -> None:
+        self.mysql_check.side_effect = [DatabaseUnavailableError("down"), None]
+        probe = DependencyProbe("mysql", self.mysql_check, ttl_seconds=5, clock=self.clock)
+
+        failed = probe.result()
+        self.clock.now += 5
+        recovered = probe.result()
+
+        self.assertFalse(failed["ok"])
+        self.assertEqual(failed["error"], "DatabaseUnavailableError")
+        self.assertTrue(recovered["ok"])
+        self.assertIsNone(recovered["error"])
+
+    def test_only_critical_probes_decide_readiness(self) -> None:
+        self.minio_check.side_effect = ConnectionError("minio down")
+
+        ready, checks = self.checker.check()
+
+        self.assertTrue(ready)
+        self.assertFalse(checks["minio"]["ok"])
+
+    def test_live_touches_no_dependency(self) -> None:
+        res = self.client.get("/health/live")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"status": "ok"})
+        self.mysql_check.assert_not_called()
+
+    def test_ready_returns_200_with_checks(self) -> None:
+        res = self.client.get("/health/ready")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["status"], "ready")
+        self.assertEqual(set(res.json()["checks"]), {"mysql", "minio"})
+
+    def test_ready_returns_503_when_mysql_is_down(self) -> None:
+        self.mysql_check.side_effect = DatabaseUnavailableError("down")
+
+        res = self.client.get("/health/ready")
+        self.client.get("/health/ready")
+
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(res.json()["status"], "unavailable")
+        self.assertEqual(self.mysql_check.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
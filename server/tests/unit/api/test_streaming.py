@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from pydantic import BaseModel
+
+from src.api.streaming import ndjson_lines, sse_event, sse_retry
+
+
+class _Row(BaseModel):
+    id: int
+
+
+class TestNDJSONStreaming(unittest.TestCase):
+    def test_ndjson_lines_emits_one_json_document_per_line(self) -> None:
+        chunks = list(ndjson_lines(range(3), lambda i: _Row(id=i)))
+
+        body = b"".join(chunks).decode()
+        self.assertEqual([json.loads(line)["id"] for line in body.splitlines()], [0, 1, 2])
+        self.assertTrue(body.endswith("\n"))
+
+    def test_ndjson_lines_flushes_when_buffer_exceeds_threshold(self) -> None:
+        chunks = list(ndjson_lines(range(4), lambda i: _Row(id=i), flush_bytes=1))
+
+        self.assertEqual(len(chunks), 4)
+
+    def test_ndjson_lines_empty_iterable_yields_nothing(self) -> None:
+        self.assertEqual(list(ndjson_lines([], lambda i: _Row(id=i))), [])
+
+    def test_ndjson_lines_is_lazy(self) -> None:
+        consumed = []
+
+        def source():
+            for i in range(2):
+                consumed.append(i)
+                yield i
+
+        gen = ndjson_lines(source(), lambda i: _Row(id=i), flush_bytes=1)
+        self.assertEqual(consumed, [])
+        next(gen)
+        self.assertEqual(consumed, [0])
+
+    def test_sse_event_is_a_named_event_with_one_json_data_line(self) -> None:
+        self.assertEqual(
+            sse_event("offer.seen", {"offer_id": 1}),
+            b'event: offer.seen\ndata: {"offer_id":1}\n\n',
+        )
+
+    def test_sse_retry_sets_reconnect_delay(self) -> None:
+        self.assertEqual(sse_retry(3000), b"retry: 3000\n\n")
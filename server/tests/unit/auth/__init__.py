@@ -1 +1,3 @@
 from .test_auth import TestJWTAuth
+from .test_token_authenticator import TestTokenAuthenticator
+from .test_password_hasher import TestPasswordHasher
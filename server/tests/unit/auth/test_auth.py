@@ -8,9 +8,10 @@ import jwt as pyjwt
 import datetime
 from unittest.mock import patch, MagicMock
 
-from src.auth.jwt import get_user_id_from_token
+from src.auth.jwt import decode_stream_ticket, decode_token, get_user_id_from_token, issue_stream_ticket
 from src.api.errors.api_error import ApiError
-from src.auth.dependencies import get_current_user_id
+from src.auth.dependencies import get_current_user_id, get_stream_user_id, get_token_authenticator
+from src.auth.token_authenticator import TokenAuthenticator
 from src.config import SECRET_KEY 
 
 
@@ -79,23 +80,26 @@ class TestJWTAuth(unittest.TestCase):
     # get_current_user_id (dependency)
     # -----------------------------
 
-    @patch("src.auth.dependencies.jwt.get_user_id_from_token")
-    def test_get_current_user_id_delegates_to_jwt(self, mock_get_user_id) -> None:
-        # Mock JWT extraction
-        mock_get_user_id.return_value = 5
+    def test_get_current_user_id_delegates_to_authenticator(self) -> None:
+        authenticator = MagicMock()
+        authenticator.authenticate.return_value = 5
 
         # Fake credentials object
         credentials = MagicMock()
         credentials.credentials = "valid.auth_token"
 
-        result = get_current_user_id(credentials)
+        result = get_current_user_id(credentials, authenticator)
 
         self.assertEqual(result, 5)
-        mock_get_user_id.assert_called_once_with("valid.auth_token")
+        authenticator.authenticate.assert_called_once_with("valid.auth_token")
 
+    def test_get_token_authenticator_returns_process_instance(self) -> None:
+        authenticator = MagicMock()
+        with patch.object(TokenAuthenticator, "instance", return_value=authenticator):
+            self.assertIs(get_token_authenticator(), authenticator)
 
-    @patch("src.auth.dependencies.jwt.get_user_id_from_token")
-    def test_expired_signature_error(self, decode_mock):
+
+    def test_expired_signature_error(self):
         expiration = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)
         token = pyjwt.encode(
             {"sub": "abc", "exp": expiration},
@@ -105,4 +109,61 @@ class TestJWTAuth(unittest.TestCase):
         with self.assertRaises(ApiError) as ctx:
             get_user_id_from_token(token)
 
-        self.assertEqual(ctx.exception.status_code, 401)
\ No newline at end of file
+        self.assertEqual(ctx.exception.status_code, 401)
+
+
+    def test_decode_token_returns_user_id_and_exp(self) -> None:
+        expiration = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=1)
+        token = pyjwt.encode({"sub": "3", "exp": expiration}, SECRET_KEY, algorithm="HS256")
+
+        user_id, exp = decode_token(token)
+
+        self.assertEqual(user_id, 3)
+        self.assertEqual(exp, float(int(expiration.timestamp())))
+
+    def test_decode_token_without_exp_returns_none_exp(self) -> None:
+        token = pyjwt.encode({"sub": "3"}, SECRET_KEY, algorithm="HS256")
+        self.assertEqual(decode_token(token), (3, None))
+
+    # -----------------------------
+    # stream tickets
+    # -----------------------------
+
+    def test_stream_ticket_round_trips_the_user_id(self) -> None:
+        self.assertEqual(decode_stream_ticket(issue_stream_ticket(9)), 9)
+
+    def test_stream_ticket_and_login_token_are_not_interchangeable(self) -> None:
+        expiration = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=1)
+        login_token = pyjwt.encode({"sub": "9", "exp": expiration}, SECRET_KEY, algorithm="HS256")
+
+        for call, value in ((decode_stream_ticket, login_token), (decode_token, issue_stream_ticket(9))):
+            with self.assertRaises(ApiError) as ctx:
+                call(value)
+            self.assertEqual(ctx.exception.status_code, 401)
+
+    def test_expired_or_missing_stream_ticket_raises_401(self) -> None:
+        for ticket, message in (
+            (issue_stream_ticket(9, ttl_seconds=-1), "Stream ticket has expired"),
+            ("", "Missing stream ticket"),
+            ("not.a.ticket", "Invalid stream ticket"),
+        ):
+            with self.assertRaises(ApiError) as ctx:
+                decode_stream_ticket(ticket)
+            self.assertEqual((ctx.exception.status_code, str(ctx.exception)), (401, message))
+
+    def test_get_stream_user_id_prefers_the_ticket(self) -> None:
+        authenticator = MagicMock()
+
+        self.assertEqual(get_stream_user_id(issue_stream_ticket(4), None, authenticator), 4)
+        authenticator.authenticate.assert_not_called()
+
+    def test_get_stream_user_id_falls_back_to_the_bearer_token(self) -> None:
+        authenticator = MagicMock()
+        authenticator.authenticate.return_value = 5
+        credentials = MagicMock()
+        credentials.credentials = "valid.auth_token"
+
+        self.assertEqual(get_stream_user_id(None, credentials, authenticator), 5)
+        with self.assertRaises(ApiError) as ctx:
+            get_stream_user_id(None, None, authenticator)
+        self.assertEqual(ctx.exception.status_code, 401)
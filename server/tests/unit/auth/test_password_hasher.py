@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from src.auth.password_hasher import PasswordHasher
+from src.utils import ServiceOverloadedError
+
+
+class TestPasswordHasher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.hasher = PasswordHasher(cost=4, executor=ThreadPoolExecutor(2))
+        self.addCleanup(self.hasher.shutdown)
+
+    def tearDown(self) -> None:
+        PasswordHasher.reset()
+
+    def test_hash_round_trips_and_is_salted(self) -> None:
+        first = self.hasher.hash("StrongPass1")
+        second = self.hasher.hash("StrongPass1")
+
+        self.assertTrue(first.startswith("$scrypt$ln=4,r=8,p=1$"))
+        self.assertNotEqual(first, second)
+        self.assertTrue(self.hasher.verify("StrongPass1", first))
+        self.assertTrue(self.hasher.verify("StrongPass1", second))
+        self.assertFalse(self.hasher.verify("StrongPass2", first))
+
+    def test_verify_accepts_legacy_plaintext_without_the_pool(self) -> None:
+        executor = MagicMock()
+        hasher = PasswordHasher(cost=4, executor=executor)
+
+        self.assertTrue(hasher.verify("StrongPass1", "StrongPass1"))
+        self.assertFalse(hasher.verify("StrongPass1", "strongpass1"))
+        executor.submit.assert_not_called()
+
+    def test_verify_rejects_malformed_hash(self) -> None:
+        self.assertFalse(self.hasher.verify("StrongPass1", "$scrypt$garbage"))
+        self.assertFalse(self.hasher.verify("StrongPass1", "$scrypt$ln=4$salt$hash"))
+
+    def test_needs_rehash(self) -> None:
+        current = self.hasher.hash("StrongPass1")
+        stronger = PasswordHasher(cost=5, executor=MagicMock())
+
+        self.assertFalse(self.hasher.needs_rehash(current))
+        self.assertTrue(stronger.needs_rehash(current))
+        self.assertTrue(self.hasher.needs_rehash("StrongPass1"))
+        self.assertTrue(self.hasher.needs_rehash("$scrypt$garbage"))
+
+    def test_full_queue_fails_fast_with_retry_after(self) -> None:
+        release = threading.Event()
+        started = threading.Event()
+
+        class _BlockingExecutor:
+            def submit(self, fn, *args):
+                started.set()
+                release.wait(5)
+                future = MagicMock()
+                future.result.return_value = "$scrypt$x"
+                return future
+
+            def shutdown(self, **kwargs):
+                pass
+
+        hasher = PasswordHasher(cost=4, max_pending=1, retry_after_seconds=3, executor=_BlockingExecutor())
+        worker = threading.Thread(target=hasher.hash, args=("StrongPass1",))
+        worker.start()
+        started.wait(5)
+        try:
+            with self.assertRaises(ServiceOverloadedError) as ctx:
+                hasher.verify("StrongPass1", "$scrypt$ln=4,r=8,p=1$c2FsdA$aGFzaA")
+        finally:
+            release.set()
+            worker.join(5)
+
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(ctx.exception.retry_after_seconds, 3)
+        # the slot is released once the running job completes
+        self.assertEqual(hasher.hash("StrongPass1"), "$scrypt$x")
+
+    def test_slot_is_released_when_the_job_raises(self) -> None:
+        executor = MagicMock()
+        executor.submit.return_value.result.side_effect = RuntimeError("worker died")
+        hasher = PasswordHasher(cost=4, max_pending=1, executor=executor)
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                hasher.hash("StrongPass1")
+
+    def test_rejects_invalid_configuration(self) -> None:
+        with self.assertRaises(ValueError):
+            PasswordHasher(cost=0)
+        with self.assertRaises(ValueError):
+            PasswordHasher(max_pending=0)
+
+    def test_process_pool_is_created_lazily_with_spawn(self) -> None:
+        with patch("src.auth.password_hasher.ProcessPoolExecutor") as pool_cls:
+            hasher = PasswordHasher(cost=4, max_workers=3)
+            pool_cls.assert_not_called()
+
+            pool_cls.return_value.submit.return_value.result.return_value = "$scrypt$x"
+            self.assertEqual(hasher.hash("StrongPass1"), "$scrypt$x")
+            hasher.hash("StrongPass1")
+
+        pool_cls.assert_called_once()
+        kwargs = pool_cls.call_args.kwargs
+        self.assertEqual(kwargs["max_workers"], 3)
+        self.assertEqual(kwargs["mp_context"].get_start_method(), "spawn")
+
+        hasher.shutdown()
+        pool_cls.return_value.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    def test_instance_reads_environment(self) -> None:
+        env = {
+            "PASSWORD_HASH_COST": "6",
+            "PASSWORD_HASH_WORKERS": "1",
+            "PASSWORD_HASH_MAX_PENDING": "4",
+        }
+        with patch.dict(os.environ, env):
+            first = PasswordHasher.instance()
+
+        self.assertIs(first, PasswordHasher.instance())
+        self.assertEqual(first._cost, 6)
+        self.assertEqual(first._max_workers, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import os
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+import hashlib
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import jwt as pyjwt
+
+from src.api.errors.api_error import ApiError
+from src.auth import jwt as auth_jwt
+from src.auth.revocation_set import RevocationSet
+from src.auth.token_authenticator import TokenAuthenticator
+from src.config import SECRET_KEY
+from src.db.revoked_token import RevokedToken, RevokedTokenDB
+
+# Real time (jwt.decode checks exp against it), frozen for the cache clock.
+NOW = float(int(time.time()))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _token(sub: str = "7", exp: float | None = NOW + 3600) -> str:
+    payload = {"sub": sub}
+    if exp is not None:
+        payload["exp"] = int(exp)
+    return pyjwt.encode(payload, SECRET_KEY, algorithm="HS256")
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class TestTokenAuthenticator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.revoked_db = MagicMock(spec=RevokedTokenDB)
+        self.revoked_db.get_active_since.return_value = []
+        self.auth = TokenAuthenticator(
+            self.revoked_db, max_entries=3, refresh_interval_seconds=5, clock=self.clock
+        )
+
+    def tearDown(self) -> None:
+        TokenAuthenticator.reset()
+
+    # -----------------------------
+    # RevocationSet
+    # -----------------------------
+    def test_revocation_set_membership_and_purge(self) -> None:
+        revocations = RevocationSet()
+        a, b = _digest("a"), _digest("b")
+        revocations.add(a, NOW + 10)
+        revocations.add(b, NOW - 1)
+
+        self.assertIn(a, revocations)
+        self.assertIn(b, revocations)
+        self.assertNotIn(_digest("c"), revocations)
+
+        self.assertEqual(revocations.purge_expired(NOW), 1)
+        self.assertEqual(revocations.purge_expired(NOW), 0)
+        self.assertIn(a, revocations)
+        self.assertNotIn(b, revocations)
+        self.assertEqual(len(revocations), 1)
+
+    # -----------------------------
+    # authenticate
+    # -----------------------------
+    def test_repeat_authentication_skips_decode(self) -> None:
+        token = _token()
+        with patch("src.auth.token_authenticator.jwt.decode_token", wraps=auth_jwt.decode_token) as decode:
+            self.assertEqual(self.auth.authenticate(token), 7)
+            self.assertEqual(self.auth.authenticate(token), 7)
+
+        decode.assert_called_once_with(token)
+        self.assertEqual(self.auth.stats()["verified_cache_hits"], 1)
+        self.assertEqual(self.auth.stats()["verified_cache_misses"], 1)
+
+    def test_cached_entry_is_bounded_by_token_exp(self) -> None:
+        token = _token(exp=NOW + 60)
+        self.auth.authenticate(token)
+
+        self.clock.now = NOW + 61
+        with self.assertRaises(ApiError) as ctx:
+            self.auth.authenticate(token)
+
+        self.assertEqual(ctx.exception.status_code, 401)
+        self.assertEqual(self.auth.stats()["verified_cache_entries"], 0)
+
+    def test_tokens_without_exp_are_not_cached(self) -> None:
+        token = _token(exp=None)
+        self.assertEqual(self.auth.authenticate(token), 7)
+        self.assertEqual(self.auth.stats()["verified_cache_entries"], 0)
+
+    def test_cache_evicts_oldest_entry_when_full(self) -> None:
+        tokens = [_token(sub=str(i)) for i in range(1, 5)]
+        for token in tokens:
+            self.auth.authenticate(token)
+
+        self.assertEqual(self.auth.stats()["verified_cache_entries"], 3)
+        self.assertNotIn(_digest(tokens[0]), self.auth._verified)
+
+    def test_invalid_and_missing_tokens_raise_401(self) -> None:
+        for token in ("", "not.a.jwt", _token(sub="abc")):
+            with self.assertRaises(ApiError) as ctx:
+                self.auth.authenticate(token)
+            self.assertEqual(ctx.exception.status_code, 401)
+
+    # -----------------------------
+    # revoke
+    # -----------------------------
+    def test_revoke_records_digest_and_rejects_cached_token(self) -> None:
+        token = _token(exp=NOW + 3600)
+        self.auth.authenticate(token)
+
+        self.assertEqual(self.auth.revoke(token), 7)
+
+        self.revoked_db.add.assert_called_once_with(
+            _digest(token).hex(),
+            7,
+            datetime.fromtimestamp(int(NOW + 3600), timezone.utc).replace(tzinfo=None),
+        )
+        with self.assertRaises(ApiError) as ctx:
+            self.auth.authenticate(token)
+        self.assertEqual(str(ctx.exception), "Token has been revoked")
+
+    def test_revoke_without_exp_uses_login_lifetime(self) -> None:
+        self.auth.revoke(_token(exp=None))
+
+        expires_at = self.revoked_db.add.call_args.args[2]
+        expected = datetime.fromtimestamp(NOW, timezone.utc).replace(tzinfo=None) + timedelta(days=30)
+        self.assertEqual(expires_at, expected)
+
+    def test_failed_revocation_write_keeps_token_valid(self) -> None:
+        token = _token()
+        self.revoked_db.add.side_effect = RuntimeError("db down")
+
+        with self.assertRaises(RuntimeError):
+            self.auth.revoke(token)
+
+        self.assertEqual(self.auth.authenticate(token), 7)
+
+    # -----------------------------
+    # refresh
+    # -----------------------------
+    def test_refresh_loads_other_processes_revocations_incrementally(self) -> None:
+        token = _token()
+        expires_at = datetime.fromtimestamp(NOW + 3600, timezone.utc).replace(tzinfo=None)
+        self.revoked_db.get_active_since.side_effect = [
+            [],
+            [RevokedToken(4, _digest(token).hex(), 7, expires_at)],
+            [],
+        ]
+        self.assertEqual(self.auth.authenticate(token), 7)
+
+        self.clock.now = NOW + 4  # inside the interval: no query
+        self.assertEqual(self.auth.authenticate(token), 7)
+        self.assertEqual(self.revoked_db.get_active_since.call_count, 1)
+
+        self.clock.now = NOW + 5
+        with self.assertRaises(ApiError):
+            self.auth.authenticate(token)
+
+        self.clock.now = NOW + 10
+        with self.assertRaises(ApiError):
+            self.auth.authenticate(token)
+
+        calls = [c.args for c in self.revoked_db.get_active_since.call_args_list]
+        self.assertEqual(calls, [(0, 1000), (0, 1000), (4, 1000)])
+
+    def test_refresh_pages_until_short_page(self) -> None:
+        expires_at = datetime.fromtimestamp(NOW + 3600, timezone.utc).replace(tzinfo=None)
+        page = lambda start: [RevokedToken(i, _digest(str(i)).hex(), 1, expires_at) for i in range(start, start + 2)]
+        self.revoked_db.get_active_since.side_effect = [page(1), page(3), []]
+
+        self.auth.refresh(page_size=2)
+
+        self.assertEqual(self.auth.stats()["revoked_tokens"], 4)
+        self.assertEqual(self.auth._last_revocation_id, 4)
+
+    def test_refresh_failure_keeps_last_known_set(self) -> None:
+        self.auth._revocations.add(_digest("x"), NOW + 100)
+        self.revoked_db.get_active_since.side_effect = RuntimeError("db down")
+
+        with self.assertLogs("src.auth.token_authenticator", level="WARNING"):
+            self.auth.refresh()
+
+        self.assertEqual(self.auth.stats()["revoked_tokens"], 1)
+
+    def test_refresh_is_skipped_while_another_refresh_runs(self) -> None:
+        self.auth._refresh_lock.acquire()
+        try:
+            self.auth.refresh()
+        finally:
+            self.auth._refresh_lock.release()
+        self.revoked_db.get_active_since.assert_not_called()
+
+    # -----------------------------
+    # instance
+    # -----------------------------
+    def test_instance_is_a_mysql_backed_singleton(self) -> None:
+        db = MagicMock(name="db")
+        with patch("src.auth.token_authenticator.DBUtility.instance", return_value=db):
+            first = TokenAuthenticator.instance()
+            second = TokenAuthenticator.instance()
+
+        self.assertIs(first, second)
+        self.assertIs(first._revoked_token_db._db, db)
+
+    # -----------------------------
+    # peek_user_id
+    # -----------------------------
+    def test_peek_user_id_uses_cache_without_refresh(self) -> None:
+        token = _token()
+        self.auth.authenticate(token)
+        self.revoked_db.get_active_since.reset_mock()
+        self.clock.now = NOW + 60  # past the refresh interval
+
+        with patch("src.auth.token_authenticator.jwt.decode_token") as decode:
+            self.assertEqual(self.auth.peek_user_id(token), 7)
+
+        decode.assert_not_called()
+        self.revoked_db.get_active_since.assert_not_called()
+
+    def test_peek_user_id_decodes_uncached_token_without_caching_it(self) -> None:
+        self.assertEqual(self.auth.peek_user_id(_token(sub="9")), 9)
+        self.assertEqual(self.auth.stats()["verified_cache_entries"], 0)
+
+    def test_peek_user_id_returns_none_for_invalid_token(self) -> None:
+        self.assertIsNone(self.auth.peek_user_id("not-a-jwt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from src.business_logic.managers.account import AccountManager, IAccountManager
-from src.db.account import AccountDB
+from src.db.account import AccountDB, AccountFootprint
 from src.db.listing import ListingDB
 from src.db.rating import BaseRatingDB
 from src.domain_models import Account, Listing
@@ -12,6 +12,7 @@ from src.utils import (
     AccountAlreadyExistsError,
     AccountNotFoundError,
     ConfigurationError,
+    ValidationError,
 )
 
 
@@ -21,7 +22,9 @@ class TestAccountManagerUnit(unittest.TestCase):
         self.listing_db: MagicMock = MagicMock(spec=ListingDB)
         self.rating_db: MagicMock = MagicMock(spec=BaseRatingDB)
 
-        self.manager = AccountManager(self.db)
+        self.versions: MagicMock = MagicMock()
+
+        self.manager = AccountManager(self.db, change_versions=self.versions)
         self.manager_with_listing = AccountManager(self.db, self.listing_db)
         self.manager_with_rating = AccountManager(self.db, rating_db=self.rating_db)
         self.manager_with_listing_and_rating = AccountManager(
@@ -202,6 +205,33 @@ class TestAccountManagerUnit(unittest.TestCase):
         self.assertTrue(out)
         self.db.remove.assert_called_once_with(9)
 
+    def test_delete_account_bumps_versions_of_every_touched_account(self) -> None:
+        self.db.get_footprint.return_value = AccountFootprint(
+            sellers=frozenset({9, 4, 2}),
+            offer_accounts=frozenset({9, 4, 6}),
+        )
+        self.db.remove.return_value = True
+
+        self.assertTrue(self.manager.delete_account(9))
+
+        self.db.get_footprint.assert_called_once_with(9)
+        self.assertEqual(
+            [c.args for c in self.versions.bump_listings.call_args_list],
+            [(2,), (4,), (9,)],
+        )
+        self.versions.bump_offers.assert_called_once_with(frozenset({9, 4, 6}))
+
+    def test_delete_account_bumps_nothing_when_account_missing(self) -> None:
+        self.db.get_footprint.return_value = AccountFootprint(
+            sellers=frozenset({9}), offer_accounts=frozenset({9})
+        )
+        self.db.remove.return_value = False
+
+        self.assertFalse(self.manager.delete_account(9))
+
+        self.versions.bump_listings.assert_not_called()
+        self.versions.bump_offers.assert_not_called()
+
     # -----------------------------
     # require_account_by_id
     # -----------------------------
@@ -434,4 +464,13 @@ class TestAccountManagerUnit(unittest.TestCase):
         self.assertIs(out, acc)
         self.assertIsNone(out.id)
         self.rating_db.get_average_rating_by_account_id.assert_not_called()
-        self.rating_db.get_sum_of_ratings_received_by_account_id.assert_not_called()
\ No newline at end of file
+        self.rating_db.get_sum_of_ratings_received_by_account_id.assert_not_called()
+
+    def test_set_password_hash_delegates(self) -> None:
+        self.manager.set_password_hash(10, "$scrypt$hash")
+        self.db.set_password.assert_called_once_with(10, "$scrypt$hash")
+
+    def test_set_password_hash_rejects_blank_hash(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.set_password_hash(10, "")
+        self.db.set_password.assert_not_called()
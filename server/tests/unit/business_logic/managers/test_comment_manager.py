@@ -15,7 +15,13 @@ from src.utils import (
 class TestCommentManagerUnit(unittest.TestCase):
     def setUp(self) -> None:
         self.comment_db = Mock()
-        self.mgr = CommentManager(self.comment_db)
+        self.versions = Mock()
+        self.listing_db = Mock()
+        self.mgr = CommentManager(
+            self.comment_db,
+            change_versions=self.versions,
+            listing_db=self.listing_db,
+        )
 
     # -----------------------------
     # helpers
@@ -148,6 +154,8 @@ class TestCommentManagerUnit(unittest.TestCase):
         out = self.mgr.create_comment(actor=actor, listing=listing, comment=comment)
 
         self.assertEqual(out, created)
+        # listing.comment_count changed
+        self.versions.bump_listings.assert_called_once_with(2)
         self.comment_db.add.assert_called_once_with(comment)
 
     # -----------------------------
@@ -257,6 +265,7 @@ class TestCommentManagerUnit(unittest.TestCase):
         self.assertFalse(out)
         self.comment_db.get_by_id.assert_called_once_with(123)
         self.comment_db.remove.assert_not_called()
+        self.versions.bump_listings.assert_not_called()
 
     def test_delete_comment_requires_persisted_actor(self) -> None:
         actor = self._account(account_id=None)
@@ -292,7 +301,22 @@ class TestCommentManagerUnit(unittest.TestCase):
         self.comment_db.get_by_id.return_value = existing
         self.comment_db.remove.return_value = True
 
+        self.listing_db.get_by_id.return_value = self._listing(listing_id=10, seller_id=42)
+
         out = self.mgr.delete_comment(actor=actor, comment_id=123)
 
         self.assertTrue(out)
         self.comment_db.remove.assert_called_once_with(123)
+        self.listing_db.get_by_id.assert_called_once_with(10)
+        self.versions.bump_listings.assert_called_once_with(42)
+
+    def test_delete_comment_bumps_global_listings_when_listing_is_gone(self) -> None:
+        actor = self._account(1, verified=True)
+        existing = self._comment(comment_id=123, listing_id=10, author_id=1, body="x")
+        self.comment_db.get_by_id.return_value = existing
+        self.comment_db.remove.return_value = True
+        self.listing_db.get_by_id.return_value = None
+
+        self.assertTrue(self.mgr.delete_comment(actor=actor, comment_id=123))
+
+        self.versions.bump_listings.assert_called_once_with(None)
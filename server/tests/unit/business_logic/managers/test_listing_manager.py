@@ -6,7 +6,7 @@ from types import SimpleNamespace
 
 from src.business_logic.managers.listing.listing_manager import ListingManager
 from src.domain_models import Account, Listing, Comment
-from src.utils import ListingNotFoundError, UnapprovedBehaviorError
+from src.utils import ListingNotFoundError, UnapprovedBehaviorError, ValidationError
 
 
 class TestListingManagerUnit(unittest.TestCase):
@@ -222,6 +222,22 @@ class TestListingManagerUnit(unittest.TestCase):
         with self.assertRaises(Exception):
             self.mgr.list_unsold_by_location_and_max_price("Winnipeg", -1)
 
+    # ---- get_unsold_facets ----
+    def test_get_unsold_facets_is_memoized_per_listings_version(self):
+        from src.utils import ChangeVersions
+
+        versions = ChangeVersions()
+        mgr = ListingManager(self.listing_db, self.comment_db, change_versions=versions)
+        first, second = Mock(), Mock()
+        self.listing_db.get_unsold_facets.side_effect = [first, second]
+
+        self.assertIs(mgr.get_unsold_facets(), first)
+        self.assertIs(mgr.get_unsold_facets(), first)
+        versions.bump_listings(7)
+        self.assertIs(mgr.get_unsold_facets(), second)
+
+        self.assertEqual(self.listing_db.get_unsold_facets.call_count, 2)
+
     # ---- find_unsold_by_title_keyword ----
     def test_find_unsold_by_title_keyword_defaults_delegates(self):
         expected = []
@@ -359,6 +375,30 @@ class TestListingManagerUnit(unittest.TestCase):
         with self.assertRaises(Exception):
             self.mgr.get_listing_by_id("bad")
 
+    # -----------------------------
+    # get_listing_for_write
+    # -----------------------------
+    def test_get_listing_for_write_reads_the_source_db_not_the_cached_one(self) -> None:
+        source_db = Mock()
+        listing = self._listing(listing_id=10, seller_id=1)
+        source_db.get_by_id.return_value = listing
+        mgr = ListingManager(self.listing_db, self.comment_db, source_listing_db=source_db)
+
+        self.assertIs(mgr.get_listing_for_write(10), listing)
+
+        source_db.get_by_id.assert_called_once_with(10)
+        self.listing_db.get_by_id.assert_not_called()
+
+    def test_get_listing_for_write_defaults_to_listing_db(self) -> None:
+        self.listing_db.get_by_id.return_value = None
+
+        self.assertIsNone(self.mgr.get_listing_for_write(10))
+        self.listing_db.get_by_id.assert_called_once_with(10)
+
+    def test_get_listing_for_write_invalid_raises(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.mgr.get_listing_for_write("bad")
+
     # -----------------------------
     # list_listings
     # -----------------------------
@@ -571,4 +611,166 @@ class TestListingManagerUnit(unittest.TestCase):
 
         self.mgr.mark_listing_sold(actor, listing, buyer)
 
-        listing.mark_sold.assert_called_once_with(10)
\ No newline at end of file
+        listing.mark_sold.assert_called_once_with(10)
+
+    # -----------------------------
+    # streaming exports
+    # -----------------------------
+    def test_iter_listings_delegates_to_db_stream(self):
+        stream = iter([])
+        self.listing_db.iter_all.return_value = stream
+
+        self.assertIs(self.mgr.iter_listings(), stream)
+        self.listing_db.get_all.assert_not_called()
+
+    def test_iter_listings_by_seller_validates_and_delegates(self):
+        stream = iter([])
+        self.listing_db.iter_by_seller_id.return_value = stream
+
+        self.assertIs(self.mgr.iter_listings_by_seller(4), stream)
+        self.listing_db.iter_by_seller_id.assert_called_once_with(4)
+
+    # -----------------------------
+    # read projections
+    # -----------------------------
+    def test_list_listing_rows_delegates_to_db_without_rating_enrichment(self):
+        rows = [Mock()]
+        self.listing_db.get_all_rows.return_value = rows
+
+        self.assertIs(self.mgr.list_listing_rows(), rows)
+        self.listing_db.get_all.assert_not_called()
+
+    def test_list_listing_rows_by_seller_validates_and_delegates(self):
+        rows = [Mock()]
+        self.listing_db.get_rows_by_seller_id.return_value = rows
+
+        self.assertIs(self.mgr.list_listing_rows_by_seller(4), rows)
+        self.listing_db.get_rows_by_seller_id.assert_called_once_with(4)
+
+    def test_list_listing_rows_by_seller_rejects_non_int(self):
+        from src.utils import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.mgr.list_listing_rows_by_seller("4")  # type: ignore[arg-type]
+
+        self.listing_db.get_rows_by_seller_id.assert_not_called()
+
+    def test_list_listing_projections_delegates_projection_to_db(self):
+        from src.db import ListingProjection
+
+        projection = ListingProjection.summary()
+        rows = [{"id": 1}]
+        self.listing_db.get_all_projected.return_value = rows
+
+        self.assertIs(self.mgr.list_listing_projections(projection), rows)
+        self.listing_db.get_all_projected.assert_called_once_with(projection)
+
+    def test_list_listing_projections_by_seller_validates_and_delegates(self):
+        from src.db import ListingProjection
+        from src.utils import ValidationError
+
+        projection = ListingProjection.of(["title"])
+        self.listing_db.get_projected_by_seller_id.return_value = []
+
+        self.assertEqual(self.mgr.list_listing_projections_by_seller(4, projection), [])
+        self.listing_db.get_projected_by_seller_id.assert_called_once_with(4, projection)
+        with self.assertRaises(ValidationError):
+            self.mgr.list_listing_projections_by_seller("4", projection)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.mgr.list_listing_projections(None)  # type: ignore[arg-type]
+
+    def test_query_listing_rows_delegates_the_query(self):
+        from src.db import ListingQuery
+        from src.utils import ValidationError
+
+        query = ListingQuery.of(location="Winnipeg")
+        page = Mock()
+        self.listing_db.query_rows.return_value = page
+
+        self.assertIs(self.mgr.query_listing_rows(query), page)
+        self.listing_db.query_rows.assert_called_once_with(query)
+        with self.assertRaises(ValidationError):
+            self.mgr.query_listing_rows(None)  # type: ignore[arg-type]
+
+    def test_get_seller_dashboard_delegates_the_seller_id(self):
+        from src.utils import ValidationError
+
+        dashboard = Mock()
+        self.listing_db.get_seller_dashboard.return_value = dashboard
+
+        self.assertIs(self.mgr.get_seller_dashboard(7), dashboard)
+        self.listing_db.get_seller_dashboard.assert_called_once_with(7)
+        with self.assertRaises(ValidationError):
+            self.mgr.get_seller_dashboard("7")  # type: ignore[arg-type]
+
+    def test_get_listing_detail_delegates_the_listing_id(self):
+        from src.utils import ValidationError
+
+        detail = Mock()
+        self.listing_db.get_listing_detail.return_value = detail
+
+        self.assertIs(self.mgr.get_listing_detail(3), detail)
+        self.listing_db.get_listing_detail.assert_called_once_with(3)
+        self.comment_db.get_by_listing_id.assert_not_called()
+        with self.assertRaises(ValidationError):
+            self.mgr.get_listing_detail("3")  # type: ignore[arg-type]
+
+    # -----------------------------
+    # change versions (conditional GET support)
+    # -----------------------------
+    def _mgr_with_versions(self):
+        versions = Mock()
+        return ListingManager(self.listing_db, self.comment_db, change_versions=versions), versions
+
+    def test_create_listing_bumps_seller_listing_version(self):
+        mgr, versions = self._mgr_with_versions()
+        self.listing_db.add.return_value = self._listing(listing_id=1, seller_id=7)
+
+        mgr.create_listing(self._listing(listing_id=None, seller_id=7))
+
+        versions.bump_listings.assert_called_once_with(7)
+
+    def test_update_listing_bumps_seller_listing_version(self):
+        mgr, versions = self._mgr_with_versions()
+        self.listing_db.update.return_value = self._listing(listing_id=1, seller_id=7)
+
+        mgr.update_listing(self._listing(listing_id=1, seller_id=7))
+
+        versions.bump_listings.assert_called_once_with(7)
+
+    def test_mark_listing_sold_bumps_seller_listing_version(self):
+        mgr, versions = self._mgr_with_versions()
+        listing = self._listing(listing_id=1, seller_id=7)
+
+        mgr.mark_listing_sold(self._account(7), listing, self._account(8))
+
+        versions.bump_listings.assert_called_once_with(7)
+
+    def test_update_listing_price_resolves_seller_and_bumps(self):
+        mgr, versions = self._mgr_with_versions()
+        self.listing_db.get_by_id.return_value = self._listing(listing_id=1, seller_id=7)
+
+        mgr.update_listing_price(1, 20.0)
+
+        self.listing_db.set_price.assert_called_once_with(1, 20.0)
+        versions.bump_listings.assert_called_once_with(7)
+
+    def test_delete_listing_bumps_only_when_a_row_was_deleted(self):
+        mgr, versions = self._mgr_with_versions()
+        self.listing_db.get_by_id.return_value = self._listing(listing_id=1, seller_id=7)
+        self.listing_db.remove.return_value = False
+
+        self.assertFalse(mgr.delete_listing(1))
+        versions.bump_listings.assert_not_called()
+
+        self.listing_db.remove.return_value = True
+        self.assertTrue(mgr.delete_listing(1))
+        versions.bump_listings.assert_called_once_with(7)
+
+    def test_reads_do_not_bump_versions(self):
+        mgr, versions = self._mgr_with_versions()
+        self.listing_db.get_all_rows.return_value = []
+
+        mgr.list_listing_rows()
+
+        versions.bump_listings.assert_not_called()
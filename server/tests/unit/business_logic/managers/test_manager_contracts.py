@@ -46,6 +46,9 @@ class AccountManagerContractStub(IAccountManager):
     def set_verified(self, account_id, verified):
         return super().set_verified(account_id, verified)
 
+    def set_password_hash(self, account_id, password_hash):
+        return super().set_password_hash(account_id, password_hash)
+
     def delete_account(self, account_id):
         return super().delete_account(account_id)
 
@@ -102,6 +105,9 @@ class ListingManagerContractStub(IListingManager):
     def get_listing_by_id(self, listing_id):
         return super().get_listing_by_id(listing_id)
 
+    def get_listing_for_write(self, listing_id):
+        return super().get_listing_for_write(listing_id)
+
     def list_listings(self):
         return super().list_listings()
 
@@ -120,6 +126,18 @@ class ListingManagerContractStub(IListingManager):
     def list_unsold_by_location_and_max_price(self, location, max_price):
         return super().list_unsold_by_location_and_max_price(location, max_price)
 
+    def get_unsold_facets(self):
+        return super().get_unsold_facets()
+
+    def query_listing_rows(self, query):
+        return super().query_listing_rows(query)
+
+    def get_seller_dashboard(self, seller_id):
+        return super().get_seller_dashboard(seller_id)
+
+    def get_listing_detail(self, listing_id):
+        return super().get_listing_detail(listing_id)
+
     def find_unsold_by_title_keyword(self, keyword, limit=50, offset=0):
         return super().find_unsold_by_title_keyword(keyword, limit, offset)
 
@@ -129,6 +147,24 @@ class ListingManagerContractStub(IListingManager):
     def list_listings_by_buyer(self, buyer_id):
         return super().list_listings_by_buyer(buyer_id)
 
+    def list_listing_rows(self):
+        return super().list_listing_rows()
+
+    def list_listing_rows_by_seller(self, seller_id):
+        return super().list_listing_rows_by_seller(seller_id)
+
+    def list_listing_projections(self, projection):
+        return super().list_listing_projections(projection)
+
+    def list_listing_projections_by_seller(self, seller_id, projection):
+        return super().list_listing_projections_by_seller(seller_id, projection)
+
+    def iter_listings(self):
+        return super().iter_listings()
+
+    def iter_listings_by_seller(self, seller_id):
+        return super().iter_listings_by_seller(seller_id)
+
     def get_listing_with_comments(self, listing_id):
         return super().get_listing_with_comments(listing_id)
 
@@ -196,9 +232,21 @@ class OfferManagerContractStub(IOffermanager):
     def get_pending_offers_with_listing_by_sender(self, sender_id):
         return super().get_pending_offers_with_listing_by_sender(sender_id)
 
+    def iter_offers_by_sender_id(self, sender_id):
+        return super().iter_offers_by_sender_id(sender_id)
+
+    def iter_offers_received_by_seller(self, seller_id):
+        return super().iter_offers_received_by_seller(seller_id)
+
+    def get_offer_counts(self, account_id):
+        return super().get_offer_counts(account_id)
+
     def set_offer_seen(self, offer_id):
         return super().set_offer_seen(offer_id)
 
+    def set_offers_seen(self, seller_id, offer_ids=None):
+        return super().set_offers_seen(seller_id, offer_ids)
+
     def set_offer_accepted(self, offer_id, accepted, actor_id):
         return super().set_offer_accepted(offer_id, accepted, actor_id)
 
@@ -239,6 +287,8 @@ class TestBusinessManagerContracts(unittest.TestCase):
             mgr.list_accounts()
         with self.assertRaises(NotImplementedError):
             mgr.set_verified(1, True)
+        with self.assertRaises(NotImplementedError):
+            mgr.set_password_hash(1, "$scrypt$hash")
         with self.assertRaises(NotImplementedError):
             mgr.delete_account(1)
         with self.assertRaises(NotImplementedError):
@@ -299,6 +349,8 @@ class TestBusinessManagerContracts(unittest.TestCase):
             mgr.create_listing(listing=None)
         with self.assertRaises(NotImplementedError):
             mgr.get_listing_by_id(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.get_listing_for_write(1)
         with self.assertRaises(NotImplementedError):
             mgr.list_listings()
         with self.assertRaises(NotImplementedError):
@@ -313,10 +365,30 @@ class TestBusinessManagerContracts(unittest.TestCase):
             mgr.list_unsold_by_location_and_max_price("Winnipeg", 100.0)
         with self.assertRaises(NotImplementedError):
             mgr.find_unsold_by_title_keyword("bike", limit=10, offset=0)
+        with self.assertRaises(NotImplementedError):
+            mgr.get_unsold_facets()
+        with self.assertRaises(NotImplementedError):
+            mgr.query_listing_rows(object())
+        with self.assertRaises(NotImplementedError):
+            mgr.get_seller_dashboard(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.get_listing_detail(1)
         with self.assertRaises(NotImplementedError):
             mgr.list_listings_by_seller(1)
         with self.assertRaises(NotImplementedError):
             mgr.list_listings_by_buyer(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.list_listing_rows()
+        with self.assertRaises(NotImplementedError):
+            mgr.list_listing_rows_by_seller(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.list_listing_projections(None)
+        with self.assertRaises(NotImplementedError):
+            mgr.list_listing_projections_by_seller(1, None)
+        with self.assertRaises(NotImplementedError):
+            mgr.iter_listings()
+        with self.assertRaises(NotImplementedError):
+            mgr.iter_listings_by_seller(1)
         with self.assertRaises(NotImplementedError):
             mgr.get_listing_with_comments(1)
         with self.assertRaises(NotImplementedError):
@@ -405,8 +477,16 @@ class TestBusinessManagerContracts(unittest.TestCase):
             mgr.get_offer_sellers_unseen(1)
         with self.assertRaises(NotImplementedError):
             mgr.get_pending_offers_with_listing_by_sender(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.iter_offers_by_sender_id(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.iter_offers_received_by_seller(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.get_offer_counts(1)
         with self.assertRaises(NotImplementedError):
             mgr.set_offer_seen(1)
+        with self.assertRaises(NotImplementedError):
+            mgr.set_offers_seen(1, [2])
         with self.assertRaises(NotImplementedError):
             mgr.set_offer_accepted(offer_id=1, accepted=True, actor_id=1)
         with self.assertRaises(NotImplementedError):
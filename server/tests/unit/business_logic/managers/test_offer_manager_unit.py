@@ -5,6 +5,7 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, call
 
 from src.business_logic.managers.offer.offer_manager import OfferManager
+from src.db.offer import OfferCounts
 from src.domain_models.offer import Offer
 from src.utils import (
     ValidationError,
@@ -346,6 +347,23 @@ class TestOfferManagerUnit(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self.manager.set_offer_seen(None)  # type: ignore[arg-type]
 
+    def test_set_offers_seen_leaves_ownership_to_the_offer_write(self) -> None:
+        self.offer_db.set_seen_many.return_value = []
+
+        out = self.manager.set_offers_seen(99, [1, 2])
+
+        self.assertEqual(out, [])
+        self.offer_db.set_seen_many.assert_called_once_with(99, [1, 2])
+        # no (possibly cached) listing-id list decides which offers are marked
+        self.listing_db.get_by_seller_id.assert_not_called()
+
+    def test_set_offers_seen_raises_validation_error_when_ids_invalid(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.set_offers_seen(None)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.manager.set_offers_seen(99, ["x"])  # type: ignore[list-item]
+        self.offer_db.set_seen_many.assert_not_called()
+
     def test_set_offer_accepted_declines_offer(self) -> None:
         offer = _make_offer(offer_id=1, listing_id=10, sender_id=5, accepted=None)
         listing = _make_listing(listing_id=10, seller_id=99)
@@ -572,7 +590,7 @@ class TestOfferManagerUnit(unittest.TestCase):
         Kills:
         - listing.seller_id == offer.sender_id  -> listing.seller_id <= offer.sender_id
         """
-        offer = SimpleNamespace(listing_id=10, sender_id=20)
+        offer = SimpleNamespace(id=None, listing_id=10, sender_id=20)
         listing = SimpleNamespace(id=10, seller_id=5, is_sold=False)
 
         self.listing_db.get_by_id.return_value = listing
@@ -614,7 +632,7 @@ class TestOfferManagerUnit(unittest.TestCase):
         - original code: 1 is True -> False
         - mutant:        1 == True -> True
         """
-        offer = SimpleNamespace(listing_id=10, sender_id=20)
+        offer = SimpleNamespace(id=None, listing_id=10, sender_id=20)
         listing = SimpleNamespace(id=10, seller_id=5, is_sold=False)
         existing = SimpleNamespace(is_pending=False, accepted=1)
 
@@ -636,7 +654,7 @@ class TestOfferManagerUnit(unittest.TestCase):
         - original code: 2 is True -> False
         - mutant:        2 >= True -> True
         """
-        offer = SimpleNamespace(listing_id=10, sender_id=20)
+        offer = SimpleNamespace(id=None, listing_id=10, sender_id=20)
         listing = SimpleNamespace(id=10, seller_id=5, is_sold=False)
         existing = SimpleNamespace(is_pending=False, accepted=2)
 
@@ -678,7 +696,7 @@ class TestOfferManagerUnit(unittest.TestCase):
         self.assertEqual(seller_id, actor_id)
         self.assertIsNot(seller_id, actor_id)
 
-        offer = SimpleNamespace(id=50, listing_id=10, is_pending=True)
+        offer = SimpleNamespace(id=50, listing_id=10, sender_id=3, is_pending=True)
         listing = SimpleNamespace(id=10, seller_id=seller_id)
 
         self.offer_db.get_by_id.return_value = offer
@@ -697,8 +715,8 @@ class TestOfferManagerUnit(unittest.TestCase):
         A lower-id pending offer should still be rejected.
         """
         offer_id = 100
-        accepted_offer = SimpleNamespace(id=offer_id, listing_id=10, is_pending=True)
-        other_pending = SimpleNamespace(id=99)
+        accepted_offer = SimpleNamespace(id=offer_id, listing_id=10, sender_id=3, is_pending=True)
+        other_pending = SimpleNamespace(id=99, sender_id=4)
 
         listing = SimpleNamespace(id=10, seller_id=7)
 
@@ -730,7 +748,7 @@ class TestOfferManagerUnit(unittest.TestCase):
         self.assertEqual(offer_id, same_value_different_object)
         self.assertIsNot(offer_id, same_value_different_object)
 
-        accepted_offer = SimpleNamespace(id=offer_id, listing_id=10, is_pending=True)
+        accepted_offer = SimpleNamespace(id=offer_id, listing_id=10, sender_id=3, is_pending=True)
         same_offer_again = SimpleNamespace(id=same_value_different_object)
         listing = SimpleNamespace(id=10, seller_id=7)
 
@@ -743,4 +761,236 @@ class TestOfferManagerUnit(unittest.TestCase):
         self.assertEqual(
             self.offer_db.set_accepted.call_args_list,
             [unittest.mock.call(offer_id, True)],
-        )
\ No newline at end of file
+        )
+
+    # --------------------------------------------------
+    # STREAMING EXPORTS
+    # --------------------------------------------------
+
+    def test_iter_offers_by_sender_id_delegates_to_db_stream(self) -> None:
+        stream = iter([])
+        self.offer_db.iter_by_sender_id.return_value = stream
+
+        self.assertIs(self.manager.iter_offers_by_sender_id(5), stream)
+        self.offer_db.iter_by_sender_id.assert_called_once_with(5)
+
+    def test_iter_offers_received_by_seller_streams_all_listings_in_one_query(self) -> None:
+        self.listing_db.get_by_seller_id.return_value = [
+            _make_listing(listing_id=10),
+            _make_listing(listing_id=11),
+        ]
+        stream = iter([])
+        self.offer_db.iter_by_listing_ids.return_value = stream
+
+        self.assertIs(self.manager.iter_offers_received_by_seller(99), stream)
+        self.offer_db.iter_by_listing_ids.assert_called_once_with([10, 11])
+        self.offer_db.get_by_listing_id.assert_not_called()
+
+    def test_iter_offers_received_by_seller_rejects_non_int(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.iter_offers_received_by_seller("x")
+
+    # --------------------------------------------------
+    # CHANGE VERSIONS (conditional GET support)
+    # --------------------------------------------------
+
+    def _manager_with_versions(self):
+        versions = MagicMock()
+        return OfferManager(self.offer_db, self.listing_db, change_versions=versions), versions
+
+    def test_create_offer_bumps_sender_and_seller(self) -> None:
+        manager, versions = self._manager_with_versions()
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+        self.offer_db.get_by_sender_and_listing.return_value = None
+
+        manager.create_offer(Offer(listing_id=10, sender_id=5, offered_price=100.0))
+
+        versions.bump_offers.assert_called_once_with((5, 99))
+        # the listing's offer counters changed
+        versions.bump_listings.assert_called_once_with(99)
+
+    def test_set_offer_seen_bumps_sender_and_seller(self) -> None:
+        manager, versions = self._manager_with_versions()
+        self.offer_db.get_by_id.return_value = _make_offer(offer_id=1, sender_id=5)
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+
+        manager.set_offer_seen(1)
+
+        self.offer_db.set_seen.assert_called_once_with(1)
+        versions.bump_offers.assert_called_once_with((5, 99))
+
+    def test_set_offers_seen_bumps_seller_and_each_sender_once(self) -> None:
+        manager, versions = self._manager_with_versions()
+        self.offer_db.set_seen_many.return_value = [
+            _make_offer(offer_id=1, sender_id=5),
+            _make_offer(offer_id=2, sender_id=6),
+        ]
+
+        manager.set_offers_seen(99)
+
+        versions.bump_offers.assert_called_once_with([99, 5, 6])
+
+    def test_set_offers_seen_without_changes_bumps_nothing(self) -> None:
+        manager, versions = self._manager_with_versions()
+        self.offer_db.set_seen_many.return_value = []
+
+        manager.set_offers_seen(99)
+
+        versions.bump_offers.assert_not_called()
+
+    def test_set_offer_accepted_bumps_all_auto_rejected_senders(self) -> None:
+        manager, versions = self._manager_with_versions()
+        accepted = _make_offer(offer_id=1, sender_id=5)
+        other = _make_offer(offer_id=2, sender_id=6)
+        self.offer_db.get_by_id.return_value = accepted
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+        self.offer_db.get_pending_by_listing_id.return_value = [accepted, other]
+
+        manager.set_offer_accepted(1, True, actor_id=99)
+
+        versions.bump_offers.assert_called_once_with([5, 99, 6])
+        versions.bump_listings.assert_called_once_with(99)
+
+    def test_delete_offer_bumps_parties_resolved_before_removal(self) -> None:
+        manager, versions = self._manager_with_versions()
+        self.offer_db.get_by_id.return_value = _make_offer(offer_id=1, sender_id=5)
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+        self.offer_db.remove.return_value = True
+
+        self.assertTrue(manager.delete_offer(1))
+
+        versions.bump_offers.assert_called_once_with((5, 99))
+        versions.bump_listings.assert_called_once_with(99)
+
+    def test_delete_offer_does_not_bump_when_nothing_deleted(self) -> None:
+        manager, versions = self._manager_with_versions()
+        self.offer_db.get_by_id.return_value = None
+        self.offer_db.remove.return_value = False
+
+        self.assertFalse(manager.delete_offer(1))
+
+        versions.bump_offers.assert_not_called()
+        versions.bump_listings.assert_not_called()
+
+
+    # --------------------------------------------------
+    # EVENTS (offer event stream)
+    # --------------------------------------------------
+
+    def _manager_with_events(self):
+        events = MagicMock()
+        return OfferManager(self.offer_db, self.listing_db, change_versions=MagicMock(), events=events), events
+
+    def test_create_offer_publishes_created_to_sender_and_seller(self) -> None:
+        manager, events = self._manager_with_events()
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+        self.offer_db.get_by_sender_and_listing.return_value = None
+        self.offer_db.add.return_value = _make_offer(offer_id=7, sender_id=5)
+
+        manager.create_offer(Offer(listing_id=10, sender_id=5, offered_price=100.0))
+
+        events.publish.assert_called_once_with(
+            (5, 99), "offer.created", {"offer_id": 7, "listing_id": 10, "sender_id": 5}
+        )
+
+    def test_create_offer_does_not_publish_when_rejected(self) -> None:
+        manager, events = self._manager_with_events()
+        self.listing_db.get_by_id.return_value = None
+
+        with self.assertRaises(ListingNotFoundError):
+            manager.create_offer(Offer(listing_id=10, sender_id=5, offered_price=100.0))
+
+        events.publish.assert_not_called()
+
+    def test_set_offer_seen_publishes_seen_to_parties(self) -> None:
+        manager, events = self._manager_with_events()
+        self.offer_db.get_by_id.return_value = _make_offer(offer_id=1, sender_id=5)
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+
+        manager.set_offer_seen(1)
+
+        events.publish.assert_called_once_with((5, 99), "offer.seen", {"offer_id": 1, "listing_id": 10})
+
+    def test_set_offer_seen_skips_publish_for_missing_offer(self) -> None:
+        manager, events = self._manager_with_events()
+        self.offer_db.get_by_id.return_value = None
+
+        manager.set_offer_seen(1)
+
+        events.publish.assert_not_called()
+
+    def test_set_offers_seen_publishes_to_each_sender_and_once_to_seller(self) -> None:
+        manager, events = self._manager_with_events()
+        self.offer_db.set_seen_many.return_value = [
+            _make_offer(offer_id=1, listing_id=10, sender_id=5),
+            _make_offer(offer_id=2, listing_id=10, sender_id=6),
+        ]
+
+        manager.set_offers_seen(99, [1, 2])
+
+        self.assertEqual(
+            [c.args for c in events.publish.call_args_list],
+            [
+                ((5,), "offer.seen", {"offer_id": 1, "listing_id": 10}),
+                ((6,), "offer.seen", {"offer_id": 2, "listing_id": 10}),
+                ((99,), "offers.seen", {"offer_ids": [1, 2]}),
+            ],
+        )
+
+    def test_set_offer_accepted_publishes_resolved_and_auto_rejections(self) -> None:
+        manager, events = self._manager_with_events()
+        accepted = _make_offer(offer_id=1, sender_id=5)
+        other = _make_offer(offer_id=2, sender_id=6)
+        self.offer_db.get_by_id.return_value = accepted
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+        self.offer_db.get_pending_by_listing_id.return_value = [accepted, other]
+
+        manager.set_offer_accepted(1, True, actor_id=99)
+
+        self.assertEqual(events.publish.call_args_list, [
+            call((5, 99), "offer.resolved", {"offer_id": 1, "listing_id": 10, "accepted": True}),
+            call((6,), "offer.resolved", {"offer_id": 2, "listing_id": 10, "accepted": False}),
+        ])
+
+    def test_set_offer_declined_publishes_only_that_offer(self) -> None:
+        manager, events = self._manager_with_events()
+        self.offer_db.get_by_id.return_value = _make_offer(offer_id=1, sender_id=5)
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+
+        manager.set_offer_accepted(1, False, actor_id=99)
+
+        events.publish.assert_called_once_with(
+            (5, 99), "offer.resolved", {"offer_id": 1, "listing_id": 10, "accepted": False}
+        )
+
+    def test_delete_offer_publishes_deleted_only_when_removed(self) -> None:
+        manager, events = self._manager_with_events()
+        self.offer_db.get_by_id.return_value = _make_offer(offer_id=1, sender_id=5)
+        self.listing_db.get_by_id.return_value = _make_listing(listing_id=10, seller_id=99)
+        self.offer_db.remove.return_value = False
+
+        manager.delete_offer(1)
+        events.publish.assert_not_called()
+
+        self.offer_db.remove.return_value = True
+        manager.delete_offer(1)
+        events.publish.assert_called_once_with((5, 99), "offer.deleted", {"offer_id": 1, "listing_id": 10})
+
+
+    # --------------------------------------------------
+    # COUNTS (offer badge)
+    # --------------------------------------------------
+
+    def test_get_offer_counts_is_one_offer_query_without_listing_reads(self) -> None:
+        counts = OfferCounts(unseen=2, pending=1, sent_pending=3)
+        self.offer_db.count_by_state.return_value = counts
+
+        self.assertIs(self.manager.get_offer_counts(99), counts)
+
+        self.offer_db.count_by_state.assert_called_once_with(99)
+        self.listing_db.get_by_seller_id.assert_not_called()
+        self.offer_db.get_unseen_by_listing_id.assert_not_called()
+
+    def test_get_offer_counts_rejects_non_int(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.get_offer_counts("x")
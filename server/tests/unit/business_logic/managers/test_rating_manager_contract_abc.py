@@ -24,6 +24,9 @@ class _RatingManagerCoverageShim(IRatingManager):
     def get_rating_by_listing_id(self, listing_id: int):
         return IRatingManager.get_rating_by_listing_id(self, listing_id)
 
+    def get_ratings_by_listing_ids(self, listing_ids):
+        return IRatingManager.get_ratings_by_listing_ids(self, listing_ids)
+
     def list_ratings_by_rater(self, rater_id: int):
         return IRatingManager.list_ratings_by_rater(self, rater_id)
 
@@ -114,6 +117,10 @@ class TestRatingManagerABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.get_rating_by_listing_id(1)
 
+    def test_get_ratings_by_listing_ids_raises_not_implemented_error(self):
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_ratings_by_listing_ids([1])
+
     def test_list_ratings_by_rater_raises_not_implemented_error(self):
         with self.assertRaises(NotImplementedError):
             self.sut.list_ratings_by_rater(2)
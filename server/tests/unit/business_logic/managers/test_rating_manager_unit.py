@@ -60,6 +60,21 @@ class TestRatingManagerUnit(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self.manager.get_rating_by_listing_id(None)  # type: ignore[arg-type]
 
+    def test_get_ratings_by_listing_ids_delegates_in_one_call(self) -> None:
+        ratings = [Rating(listing_id=1, rater_id=2, transaction_rating=5, rating_id=10)]
+        self.rating_db.get_by_listing_ids.return_value = ratings
+
+        out = self.manager.get_ratings_by_listing_ids([1, 3])
+
+        self.assertIs(ratings, out)
+        self.rating_db.get_by_listing_ids.assert_called_once_with([1, 3])
+
+    def test_get_ratings_by_listing_ids_raises_validation_error_when_ids_invalid(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.get_ratings_by_listing_ids(None)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.manager.get_ratings_by_listing_ids([1, None])  # type: ignore[list-item]
+
     def test_list_ratings_by_rater_returns_ratings(self) -> None:
         ratings = [
             Rating(listing_id=1, rater_id=2, transaction_rating=5, rating_id=10),
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 import datetime
 import jwt
 
+from src.auth.password_hasher import PasswordHasher
 from src.business_logic.services.account_service import AccountService
 from src.domain_models import Account
 
@@ -13,6 +15,7 @@ from src.utils.errors import (
     ValidationError,
     DatabaseUnavailableError,
     AccountAlreadyExistsError,
+    ServiceOverloadedError,
 )
 from src.utils import (
     TokenNotFoundError,
@@ -28,10 +31,14 @@ class TestAccountServiceUnit(unittest.TestCase):
         self.account_manager: MagicMock = MagicMock(name="account_manager")
         self.token_db: MagicMock = MagicMock(name="token_db")
         self.rating_manager: MagicMock = MagicMock(name="rating_manager")
+        # Cheap scrypt on a thread so tests do not spawn worker processes.
+        self.password_hasher = PasswordHasher(cost=4, executor=ThreadPoolExecutor(1))
+        self.addCleanup(self.password_hasher.shutdown)
         self.service = AccountService(
             account_manager=self.account_manager,
             token_db=self.token_db,
             rating_manager=self.rating_manager,
+            password_hasher=self.password_hasher,
         )
 
 
@@ -506,4 +513,95 @@ class TestAccountServiceUnit(unittest.TestCase):
         self.assertEqual(
             payload["exp"],
             frozen_now + datetime.timedelta(days=30),
-        )
\ No newline at end of file
+        )
+
+    def test_create_account_stores_a_hash_not_the_password(self) -> None:
+        self.account_manager.create_account.side_effect = lambda acc: acc
+
+        self.service.create_account("test@umanitoba.ca", "StrongPass1", "John", "Smith")
+
+        stored = self.account_manager.create_account.call_args.args[0].password
+        self.assertTrue(PasswordHasher.is_hashed(stored))
+        self.assertTrue(self.password_hasher.verify("StrongPass1", stored))
+
+    def test_login_upgrades_legacy_plaintext_password(self) -> None:
+        account = Account(
+            account_id=1,
+            email="test@umanitoba.ca",
+            password="StrongPass1",
+            fname="John",
+            lname="Smith",
+            verified=False,
+        )
+        self.account_manager.get_account_by_email.return_value = account
+
+        self.service.login("test@umanitoba.ca", "StrongPass1")
+
+        account_id, stored = self.account_manager.set_password_hash.call_args.args
+        self.assertEqual(account_id, 1)
+        self.assertTrue(self.password_hasher.verify("StrongPass1", stored))
+
+    def test_login_with_current_hash_does_not_rehash(self) -> None:
+        account = Account(
+            account_id=1,
+            email="test@umanitoba.ca",
+            password=self.password_hasher.hash("StrongPass1"),
+            fname="John",
+            lname="Smith",
+            verified=False,
+        )
+        self.account_manager.get_account_by_email.return_value = account
+
+        token = self.service.login("test@umanitoba.ca", "StrongPass1")
+
+        self.assertTrue(token)
+        self.account_manager.set_password_hash.assert_not_called()
+
+    def test_login_wrong_password_against_hash_raises_401(self) -> None:
+        account = Account(
+            account_id=1,
+            email="test@umanitoba.ca",
+            password=self.password_hasher.hash("StrongPass1"),
+            fname="John",
+            lname="Smith",
+            verified=False,
+        )
+        self.account_manager.get_account_by_email.return_value = account
+
+        with self.assertRaises(ApiError) as ctx:
+            self.service.login("test@umanitoba.ca", "WrongPass1")
+        self.assertEqual(ctx.exception.status_code, 401)
+
+    def test_login_succeeds_when_rehash_write_fails(self) -> None:
+        account = Account(
+            account_id=1,
+            email="test@umanitoba.ca",
+            password="StrongPass1",
+            fname="John",
+            lname="Smith",
+            verified=False,
+        )
+        self.account_manager.get_account_by_email.return_value = account
+        self.account_manager.set_password_hash.side_effect = RuntimeError("db down")
+
+        token = self.service.login("test@umanitoba.ca", "StrongPass1")
+
+        self.assertTrue(token)
+
+    def test_login_propagates_hasher_overload(self) -> None:
+        account = Account(
+            account_id=1,
+            email="test@umanitoba.ca",
+            password="$scrypt$ln=4,r=8,p=1$c2FsdA$aGFzaA",
+            fname="John",
+            lname="Smith",
+            verified=False,
+        )
+        self.account_manager.get_account_by_email.return_value = account
+        self.service.password_hasher = MagicMock()
+        self.service.password_hasher.verify.side_effect = ServiceOverloadedError(
+            message="busy", retry_after_seconds=1
+        )
+
+        with self.assertRaises(ServiceOverloadedError):
+            self.service.login("test@umanitoba.ca", "StrongPass1")
@@ -56,7 +56,7 @@ class TestCommentServiceUnit(unittest.TestCase):
         self.assertEqual(result[1].comment, c2)
         self.assertEqual(result[1].author, a2)
 
-        self.listing_manager.get_listing_by_id.assert_not_called()
+        self.listing_manager.get_listing_for_write.assert_not_called()
         self.comment_manager.create_comment.assert_not_called()
 
     # -----------------------------
@@ -85,7 +85,7 @@ class TestCommentServiceUnit(unittest.TestCase):
         )
 
         self.account_manager.get_account_by_id.return_value = actor
-        self.listing_manager.get_listing_by_id.return_value = listing
+        self.listing_manager.get_listing_for_write.return_value = listing
         self.comment_manager.create_comment.return_value = created_comment
 
         result = self.service.create_comment(
@@ -97,7 +97,7 @@ class TestCommentServiceUnit(unittest.TestCase):
         self.account_manager.get_account_by_id.assert_called_once_with(
             account_id=actor_id
         )
-        self.listing_manager.get_listing_by_id.assert_called_once_with(
+        self.listing_manager.get_listing_for_write.assert_called_once_with(
             listing_id=listing_id
         )
         self.comment_manager.create_comment.assert_called_once_with(
@@ -130,7 +130,7 @@ class TestCommentServiceUnit(unittest.TestCase):
 
         self.assertIn("actor missing", str(ctx.exception))
 
-        self.listing_manager.get_listing_by_id.assert_not_called()
+        self.listing_manager.get_listing_for_write.assert_not_called()
         self.comment_manager.create_comment.assert_not_called()
 
     def test_create_comment_listing_lookup_error_propagates_and_stops(self) -> None:
@@ -142,7 +142,7 @@ class TestCommentServiceUnit(unittest.TestCase):
         )
 
         self.account_manager.get_account_by_id.return_value = actor
-        self.listing_manager.get_listing_by_id.side_effect = Exception(
+        self.listing_manager.get_listing_for_write.side_effect = Exception(
             "listing missing"
         )
 
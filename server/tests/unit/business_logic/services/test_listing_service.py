@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 
 from src.business_logic.services.listing_service import ListingService
 from src.domain_models.listing import Listing
-from src.utils import ValidationError, ListingNotFoundError, UnapprovedBehaviorError
+from src.utils import AccountNotFoundError, ValidationError, ListingNotFoundError, UnapprovedBehaviorError
 from src.api.converter.listing_converter import ListingCreate
 
 
@@ -340,6 +340,34 @@ class TestListingServiceUnit(unittest.TestCase):
         self.assertIn("Location cannot exceed 120 characters.", errors["location"])
         self.manager.create_listing.assert_not_called()
 
+    def test_create_listing_collapses_location_whitespace(self) -> None:
+        self.service.create_listing(
+            seller_id=1,
+            title="A",
+            description="B",
+            price=10.0,
+            location="  Winnipeg,\t  MB ",
+            image_url=None,
+        )
+
+        created_listing = self.manager.create_listing.call_args.args[0]
+        self.assertEqual(created_listing.location, "Winnipeg, MB")
+        self.assertEqual(created_listing.location_key, "winnipeg mb")
+
+    def test_create_listing_location_without_letters_raises_validation_error(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            self.service.create_listing(
+                seller_id=1,
+                title="A",
+                description="B",
+                price=10.0,
+                location=" -- ",
+                image_url=None,
+            )
+
+        self.assertIn("Location must contain letters or digits.", ctx.exception.details["errors"]["location"])
+        self.manager.create_listing.assert_not_called()
+
     def test_create_listing_image_key_valid(self) -> None:
         expected = Listing(
             listing_id=123,
@@ -492,7 +520,7 @@ class TestListingServiceUnit(unittest.TestCase):
     # rate_listing
     # -----------------------------
     def test_rate_listing_listing_not_found_raises(self) -> None:
-        self.manager.get_listing_by_id.return_value = None
+        self.manager.get_listing_for_write.return_value = None
 
         with self.assertRaises(ListingNotFoundError):
             self.service.rate_listing(listing_id=1, rater_id=2, transaction_rating=5)
@@ -502,7 +530,7 @@ class TestListingServiceUnit(unittest.TestCase):
     def test_rate_listing_not_sold_raises(self) -> None:
         listing = MagicMock()
         listing.is_sold = False
-        self.manager.get_listing_by_id.return_value = listing
+        self.manager.get_listing_for_write.return_value = listing
 
         with self.assertRaises(UnapprovedBehaviorError):
             self.service.rate_listing(listing_id=1, rater_id=2, transaction_rating=5)
@@ -513,7 +541,7 @@ class TestListingServiceUnit(unittest.TestCase):
         listing = MagicMock()
         listing.is_sold = True
         listing.sold_to_id = 99
-        self.manager.get_listing_by_id.return_value = listing
+        self.manager.get_listing_for_write.return_value = listing
 
         with self.assertRaises(UnapprovedBehaviorError):
             self.service.rate_listing(listing_id=1, rater_id=2, transaction_rating=5)
@@ -524,7 +552,7 @@ class TestListingServiceUnit(unittest.TestCase):
         listing = MagicMock()
         listing.is_sold = True
         listing.sold_to_id = 2
-        self.manager.get_listing_by_id.return_value = listing
+        self.manager.get_listing_for_write.return_value = listing
         self.rating_manager.get_rating_by_listing_id.return_value = MagicMock()
 
         with self.assertRaises(UnapprovedBehaviorError):
@@ -536,7 +564,7 @@ class TestListingServiceUnit(unittest.TestCase):
         listing = MagicMock()
         listing.is_sold = True
         listing.sold_to_id = 2
-        self.manager.get_listing_by_id.return_value = listing
+        self.manager.get_listing_for_write.return_value = listing
         self.rating_manager.get_rating_by_listing_id.return_value = None
 
         created_rating = MagicMock()
@@ -550,6 +578,8 @@ class TestListingServiceUnit(unittest.TestCase):
         self.assertEqual(created.listing_id, 1)
         self.assertEqual(created.rater_id, 2)
         self.assertEqual(created.transaction_rating, 4)
+        self.manager.get_listing_for_write.assert_called_once_with(1)
+        self.manager.get_listing_by_id.assert_not_called()
 
     # -----------------------------
     # get_listing_rating
@@ -572,6 +602,16 @@ class TestListingServiceUnit(unittest.TestCase):
         self.rating_manager.get_rating_by_listing_id.assert_called_once_with(5)
         self.assertEqual(result, expected_rating)
 
+    def test_get_listing_ratings_maps_every_requested_id(self) -> None:
+        rated = MagicMock(listing_id=5)
+        self.rating_manager.get_ratings_by_listing_ids.return_value = [rated]
+
+        result = self.service.get_listing_ratings([5, 6, 5])
+
+        self.rating_manager.get_ratings_by_listing_ids.assert_called_once_with([5, 6])
+        self.assertEqual(result, {5: rated, 6: None})
+        self.manager.get_listing_by_id.assert_not_called()
+
     def test_listingcreate_to_domain_allows_none_optionals(self) -> None:
         dto = ListingCreate(
             title="Desk lamp",
@@ -585,6 +625,90 @@ class TestListingServiceUnit(unittest.TestCase):
         self.assertIsNone(listing.image_url)
         self.assertIsNone(listing.location)
 
+    def test_export_listings_without_seller_streams_everything(self) -> None:
+        stream = iter([])
+        self.manager.iter_listings.return_value = stream
+
+        self.assertIs(self.service.export_listings(), stream)
+        self.manager.iter_listings_by_seller.assert_not_called()
+
+    def test_export_listings_with_seller_streams_seller_only(self) -> None:
+        stream = iter([])
+        self.manager.iter_listings_by_seller.return_value = stream
+
+        self.assertIs(self.service.export_listings(seller_id=3), stream)
+        self.manager.iter_listings_by_seller.assert_called_once_with(3)
+
+    def test_get_all_listing_rows_delegates_to_manager(self) -> None:
+        rows = [MagicMock()]
+        self.manager.list_listing_rows.return_value = rows
+
+        self.assertIs(self.service.get_all_listing_rows(), rows)
+        self.manager.list_listings.assert_not_called()
+
+    def test_get_listing_rows_by_user_id_delegates_to_manager(self) -> None:
+        rows = [MagicMock()]
+        self.manager.list_listing_rows_by_seller.return_value = rows
+
+        self.assertIs(self.service.get_listing_rows_by_user_id(5), rows)
+        self.manager.list_listing_rows_by_seller.assert_called_once_with(5)
+
+    def test_get_listing_facets_delegates_to_manager(self) -> None:
+        facets = MagicMock()
+        self.manager.get_unsold_facets.return_value = facets
+
+        self.assertIs(self.service.get_listing_facets(), facets)
+
+    def test_query_listings_delegates_to_manager(self) -> None:
+        query, page = MagicMock(), MagicMock()
+        self.manager.query_listing_rows.return_value = page
+
+        self.assertIs(self.service.query_listings(query), page)
+        self.manager.query_listing_rows.assert_called_once_with(query)
+
+    def test_get_seller_dashboard_delegates_to_manager(self) -> None:
+        dashboard = MagicMock()
+        self.manager.get_seller_dashboard.return_value = dashboard
+
+        self.assertIs(self.service.get_seller_dashboard(7), dashboard)
+        self.manager.get_seller_dashboard.assert_called_once_with(7)
+
+    def test_get_seller_dashboard_of_missing_account_raises_not_found(self) -> None:
+        self.manager.get_seller_dashboard.return_value = None
+
+        with self.assertRaises(AccountNotFoundError):
+            self.service.get_seller_dashboard(7)
+
+    def test_get_listing_detail_delegates_to_manager(self) -> None:
+        detail = MagicMock()
+        self.manager.get_listing_detail.return_value = detail
+
+        self.assertIs(self.service.get_listing_detail(3), detail)
+        self.manager.get_listing_detail.assert_called_once_with(3)
+
+    def test_get_listing_detail_of_missing_listing_raises_not_found(self) -> None:
+        self.manager.get_listing_detail.return_value = None
+
+        with self.assertRaises(ListingNotFoundError) as ctx:
+            self.service.get_listing_detail(3)
+
+        self.assertEqual(ctx.exception.details, {"listing_id": 3})
+
+    def test_get_listing_projections_without_user_lists_all(self) -> None:
+        projection = MagicMock()
+        self.manager.list_listing_projections.return_value = [{"id": 1}]
+
+        self.assertEqual(self.service.get_listing_projections(projection), [{"id": 1}])
+        self.manager.list_listing_projections.assert_called_once_with(projection)
+        self.manager.list_listing_projections_by_seller.assert_not_called()
+
+    def test_get_listing_projections_with_user_lists_seller_only(self) -> None:
+        projection = MagicMock()
+        self.manager.list_listing_projections_by_seller.return_value = []
+
+        self.assertEqual(self.service.get_listing_projections(projection, user_id=5), [])
+        self.manager.list_listing_projections_by_seller.assert_called_once_with(5, projection)
+
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
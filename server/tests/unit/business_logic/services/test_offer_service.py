@@ -115,11 +115,26 @@ class TestOfferServiceUnit(unittest.TestCase):
         self.assertEqual(offers, out)
         self.offer_manager.get_pending_offers_with_listing_by_sender.assert_called_once_with(5)
 
+    def test_get_offer_counts_delegates(self) -> None:
+        counts = MagicMock(name="counts")
+        self.offer_manager.get_offer_counts.return_value = counts
+
+        self.assertIs(self.service.get_offer_counts(5), counts)
+        self.offer_manager.get_offer_counts.assert_called_once_with(5)
+
     def test_set_offer_seen_delegates_to_manager(self) -> None:
         self.service.set_offer_seen(1)
 
         self.offer_manager.set_offer_seen.assert_called_once_with(1)
 
+    def test_set_offers_seen_delegates_to_manager(self) -> None:
+        self.offer_manager.set_offers_seen.return_value = ["o"]
+
+        out = self.service.set_offers_seen(7, [1, 2])
+
+        self.assertEqual(out, ["o"])
+        self.offer_manager.set_offers_seen.assert_called_once_with(7, [1, 2])
+
     def test_delete_offer_delegates_to_manager(self) -> None:
         self.offer_manager.delete_offer.return_value = True
 
@@ -153,7 +168,7 @@ class TestOfferServiceUnit(unittest.TestCase):
         listing = _make_listing(listing_id=10, seller_id=99)
 
         self.offer_manager.get_offer_by_id.return_value = offer
-        self.listing_manager.get_listing_by_id.return_value = listing
+        self.listing_manager.get_listing_for_write.return_value = listing
         self.account_manager.get_account_by_id.side_effect = lambda account_id: (
             actor if account_id == 99 else buyer
         )
@@ -170,7 +185,7 @@ class TestOfferServiceUnit(unittest.TestCase):
         listing = _make_listing(listing_id=10, seller_id=99)
 
         self.offer_manager.get_offer_by_id.return_value = offer
-        self.listing_manager.get_listing_by_id.return_value = listing
+        self.listing_manager.get_listing_for_write.return_value = listing
         self.account_manager.get_account_by_id.side_effect = lambda account_id: (
             actor if account_id == 99 else buyer
         )
@@ -199,7 +214,7 @@ class TestOfferServiceUnit(unittest.TestCase):
     def test_resolve_offer_raises_listing_not_found_when_listing_missing(self) -> None:
         offer = _make_offer(offer_id=1, listing_id=10, sender_id=5)
         self.offer_manager.get_offer_by_id.return_value = offer
-        self.listing_manager.get_listing_by_id.return_value = None
+        self.listing_manager.get_listing_for_write.return_value = None
 
         with self.assertRaises(ListingNotFoundError):
             self.service.resolve_offer(offer_id=1, accepted=True, actor_id=99)
@@ -212,7 +227,7 @@ class TestOfferServiceUnit(unittest.TestCase):
         listing = _make_listing(listing_id=10, seller_id=99)
 
         self.offer_manager.get_offer_by_id.return_value = offer
-        self.listing_manager.get_listing_by_id.return_value = listing
+        self.listing_manager.get_listing_for_write.return_value = listing
         self.account_manager.get_account_by_id.side_effect = lambda account_id: (
             actor if account_id == 99 else None
         )
@@ -233,3 +248,23 @@ class TestOfferServiceUnit(unittest.TestCase):
             self.service.resolve_offer(offer_id=1, accepted=True, actor_id=55)
 
         self.listing_manager.mark_listing_sold.assert_not_called()
+
+    def test_export_offers_received_scope_streams_seller_offers(self) -> None:
+        stream = iter([])
+        self.offer_manager.iter_offers_received_by_seller.return_value = stream
+
+        self.assertIs(self.service.export_offers(99, scope="received"), stream)
+        self.offer_manager.iter_offers_received_by_seller.assert_called_once_with(99)
+
+    def test_export_offers_sent_scope_streams_sender_offers(self) -> None:
+        stream = iter([])
+        self.offer_manager.iter_offers_by_sender_id.return_value = stream
+
+        self.assertIs(self.service.export_offers(5, scope="sent"), stream)
+        self.offer_manager.iter_offers_by_sender_id.assert_called_once_with(5)
+
+    def test_export_offers_rejects_unknown_scope(self) -> None:
+        from src.utils import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.service.export_offers(5, scope="everything")
@@ -2,6 +2,7 @@ from .account.test_account_db_abc import TestAccountDBABC
 from .account.test_mysql_account_db import TestMySQLAccountDB
 from .listing.test_listing_db_abc import TestListingDBABC
 from .listing.test_mysql_listing_db import TestMySQLListingDB
+from .listing.test_listing_query_plan import TestListingQueryPlan
 from .comment.test_comment_db_abc import TestCommentDBABC
 from .comment.test_mysql_comment_db import TestMySQLCommentDB
 from .email_verification_token.test_email_verification_token_abc import (
@@ -11,6 +12,18 @@ from .email_verification_token.test_mysql_email_verification_token_db import (
     TestMySQLEmailVerificationTokenDB,
 )
 from .utils.test_db_utils import TestDBUtility
+from .utils.test_transaction_retry import TestTransactionRetry
 from .utils.test_comment_mapper import TestCommentMapper
+from .utils.test_listing_mapper import TestListingMapper, TestListingProjection
+from .utils.test_listing_query import TestListingCursor, TestListingQuery
 from .offer.test_offer_db_abc import TestOfferDBABC
 from .offer.test_mysql_offer_db import TestMySQLOfferDB
+from .cache import (
+    TestCacheBackends,
+    TestCachedListingDB,
+    TestCachedAccountDB,
+    TestCachedRatingDB,
+    TestCachedCommentDB,
+)
+from .revoked_token import TestRevokedTokenDB
+from .job import TestJobDB
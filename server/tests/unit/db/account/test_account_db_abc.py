@@ -27,6 +27,12 @@ class _AccountDBCoverageShim(AccountDB):
     def set_verified_by_email(self, email: str, verified: bool) -> None:
         return AccountDB.set_verified_by_email(self, email, verified)
 
+    def set_password(self, account_id: int, password_hash: str) -> None:
+        return AccountDB.set_password(self, account_id, password_hash)
+
+    def get_footprint(self, account_id: int):
+        return AccountDB.get_footprint(self, account_id)
+
     def remove(self, account_id: int) -> bool:
         return AccountDB.remove(self, account_id)
 
@@ -74,10 +80,18 @@ class TestAccountDBABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.set_verified(1, True)
 
+    def test_set_password_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.set_password(1, "$scrypt$hash")
+
     def test_set_verified_by_email_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.set_verified_by_email("test@example.com", True)
 
+    def test_get_footprint_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_footprint(1)
+
     def test_remove_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.remove(1)
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from src.db.account import AccountFootprint
 from src.db.account.mysql import MySQLAccountDB
 from src.db import DBUtility
 from src.domain_models import Account
@@ -253,27 +254,117 @@ class TestMySQLAccountDB(unittest.TestCase):
         with self.assertRaises(DatabaseQueryError):
             self.account_db.set_verified_by_email("a@b.com", True)
 
+    # -----------------------------
+    # get_footprint
+    # -----------------------------
+    def test_get_footprint_always_includes_the_account_itself(self) -> None:
+        sellers = MagicMock()
+        sellers.scalars.return_value = iter([4, 2])
+        offer_accounts = MagicMock()
+        offer_accounts.scalars.return_value = iter([4, 6])
+        self.conn.execute.side_effect = [sellers, offer_accounts]
+
+        out = self.account_db.get_footprint(9)
+
+        self.assertEqual(out, AccountFootprint(
+            sellers=frozenset({2, 4, 9}),
+            offer_accounts=frozenset({4, 6, 9}),
+        ))
+        self.db_util.connect.assert_called_once()
+        calls = self.conn.execute.call_args_list
+        self.assertIn("sold_to_id", str(calls[0].args[0]))
+        self.assertEqual(calls[0].args[1], {"id": 9})
+        self.assertIn("sender_id", str(calls[1].args[0]))
+
+    def test_get_footprint_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError):
+            self.account_db.get_footprint(1)
+
     # -----------------------------
     # remove
     # -----------------------------
+    def _remove_results(self, *, comments, offers, rowcount):
+        comments_result = MagicMock()
+        comments_result.scalars.return_value = iter(comments)
+        offers_result = MagicMock()
+        offers_result.mappings.return_value = iter(offers)
+        delete_result = MagicMock()
+        delete_result.rowcount = rowcount
+        counts = [MagicMock() for _ in set(comments) | {o["listing_id"] for o in offers}]
+        self.conn.execute.side_effect = [comments_result, offers_result, *counts, delete_result]
+
     def test_remove_returns_true_when_deleted(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 1
-        self.conn.execute.return_value = exec_result
+        self._remove_results(comments=[], offers=[], rowcount=1)
 
         out = self.account_db.remove(5)
         self.assertTrue(out)
 
     def test_remove_returns_false_when_missing(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 0
-        self.conn.execute.return_value = exec_result
+        self._remove_results(comments=[], offers=[], rowcount=0)
 
         out = self.account_db.remove(999)
         self.assertFalse(out)
 
+    def test_remove_decrements_listing_counters_before_the_delete(self) -> None:
+        self._remove_results(
+            comments=[7, 3, 7],
+            offers=[{"listing_id": 7, "accepted": None}, {"listing_id": 9, "accepted": False}],
+            rowcount=1,
+        )
+
+        self.assertTrue(self.account_db.remove(5))
+
+        self.db_util.transaction.assert_called_once()
+        calls = self.conn.execute.call_args_list
+        self.assertIn("FOR UPDATE", str(calls[0].args[0]))
+        self.assertIn("FROM comment", str(calls[0].args[0]))
+        self.assertIn("FOR UPDATE", str(calls[1].args[0]))
+        self.assertIn("FROM offer", str(calls[1].args[0]))
+        self.assertEqual(
+            [call.args[1] for call in calls[2:5]],
+            [
+                {"listing_id": 3, "comments": 1, "offers": 0, "pending": 0},
+                {"listing_id": 7, "comments": 2, "offers": 1, "pending": 1},
+                {"listing_id": 9, "comments": 0, "offers": 1, "pending": 0},
+            ],
+        )
+        self.assertIn("UPDATE listing", str(calls[2].args[0]))
+        self.assertIn("DELETE", str(calls[5].args[0]))
+        self.assertEqual(calls[5].args[1], {"id": 5})
+
     def test_remove_raises_database_query_error_on_sqlalchemy_error(self) -> None:
         self.conn.execute.side_effect = SQLAlchemyError("fail")
 
         with self.assertRaises(DatabaseQueryError):
             self.account_db.remove(1)
+
+    # -----------------------------
+    # set_password
+    # -----------------------------
+    def test_set_password_updates_when_row_exists(self) -> None:
+        exec_result = MagicMock()
+        exec_result.rowcount = 1
+        self.conn.execute.return_value = exec_result
+
+        self.account_db.set_password(10, "$scrypt$hash")
+
+        self.db_util.transaction.assert_called_once()
+        params = self.conn.execute.call_args.args[1]
+        self.assertEqual(params, {"password": "$scrypt$hash", "id": 10})
+
+    def test_set_password_raises_account_not_found_when_rowcount_zero(self) -> None:
+        exec_result = MagicMock()
+        exec_result.rowcount = 0
+        self.conn.execute.return_value = exec_result
+
+        with self.assertRaises(AccountNotFoundError):
+            self.account_db.set_password(999, "$scrypt$hash")
+
+    def test_set_password_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.account_db.set_password(1, "$scrypt$hash")
+        self.assertEqual(ctx.exception.details["op"], "set_password")
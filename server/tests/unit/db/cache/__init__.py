@@ -0,0 +1,5 @@
+from .test_cache_backends import TestCacheBackends
+from .test_cached_listing_db import TestCachedListingDB
+from .test_cached_account_db import TestCachedAccountDB
+from .test_cached_rating_db import TestCachedRatingDB
+from .test_cached_comment_db import TestCachedCommentDB
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import os
+import pickle
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.db.cache import InMemoryCacheBackend, RepositoryCache, SharedCacheBackend
+from src.utils import ConfigurationError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeRedis:
+    """Minimal Redis-compatible stand-in (get / set ex= / delete / scan_iter)."""
+
+    def __init__(self) -> None:
+        self.data = {}
+        self.set_calls = []
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.set_calls.append((key, ex))
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.data) if k.startswith(prefix)]
+
+
+class TestCacheBackends(unittest.TestCase):
+    def tearDown(self) -> None:
+        RepositoryCache.reset()
+
+    # -----------------------------
+    # InMemoryCacheBackend
+    # -----------------------------
+    def test_memory_get_returns_none_on_miss_and_value_on_hit(self):
+        cache = InMemoryCacheBackend()
+        self.assertIsNone(cache.get("listing:1"))
+        cache.set("listing:1", b"v")
+        self.assertEqual(cache.get("listing:1"), b"v")
+
+    def test_memory_entries_expire_after_ttl(self):
+        clock = _Clock()
+        cache = InMemoryCacheBackend(ttl_seconds=5, clock=clock)
+        cache.set("listing:1", b"v")
+
+        clock.now += 4.9
+        self.assertEqual(cache.get("listing:1"), b"v")
+        clock.now += 0.2
+        self.assertIsNone(cache.get("listing:1"))
+        self.assertEqual(len(cache), 0)
+
+    def test_memory_entry_ttl_shortens_but_never_extends_the_backend_ttl(self):
+        clock = _Clock()
+        cache = InMemoryCacheBackend(ttl_seconds=5, clock=clock)
+        cache.set("listing_detail:1", b"short", ttl_seconds=1)
+        cache.set("listing_detail:2", b"capped", ttl_seconds=60)
+
+        clock.now += 1.1
+        self.assertIsNone(cache.get("listing_detail:1"))
+        self.assertEqual(cache.get("listing_detail:2"), b"capped")
+        clock.now += 4
+        self.assertIsNone(cache.get("listing_detail:2"))
+
+    def test_memory_evicts_least_recently_used(self):
+        cache = InMemoryCacheBackend(max_entries=2)
+        cache.set("a:1", b"1")
+        cache.set("a:2", b"2")
+        cache.get("a:1")  # a:2 is now the LRU entry
+        cache.set("a:3", b"3")
+
+        self.assertEqual(cache.get("a:1"), b"1")
+        self.assertIsNone(cache.get("a:2"))
+        self.assertEqual(cache.get("a:3"), b"3")
+
+    def test_memory_delete_and_clear(self):
+        cache = InMemoryCacheBackend()
+        cache.set("a:1", b"1")
+        cache.set("a:2", b"2")
+        cache.delete(["a:1", "missing"])
+        self.assertIsNone(cache.get("a:1"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_memory_rejects_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            InMemoryCacheBackend(max_entries=0)
+        with self.assertRaises(ValueError):
+            InMemoryCacheBackend(ttl_seconds=0)
+
+    def test_stats_counts_hits_and_misses_per_namespace(self):
+        cache = InMemoryCacheBackend(max_entries=10, ttl_seconds=30)
+        cache.get("listing:1")
+        cache.set("listing:1", b"v")
+        cache.get("listing:1")
+        cache.get("listing:1")
+        cache.get("account:1")
+        cache.delete(["listing:1", "listing:2"])
+        cache.delete([])
+
+        stats = cache.stats()
+        self.assertEqual(stats["backend"], "memory")
+        self.assertEqual(stats["ttl_seconds"], 30)
+        self.assertEqual(stats["max_entries"], 10)
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual(stats["invalidations"], 2)
+        self.assertEqual(
+            stats["namespaces"]["listing"], {"hits": 2, "misses": 1, "hit_ratio": 0.6667}
+        )
+        self.assertEqual(
+            stats["namespaces"]["account"], {"hits": 0, "misses": 1, "hit_ratio": 0.0}
+        )
+
+    # -----------------------------
+    # read_through
+    # -----------------------------
+    def test_read_through_loads_once_and_returns_copies(self):
+        cache = InMemoryCacheBackend()
+        load = MagicMock(return_value={"title": "Bike"})
+
+        first = cache.read_through("listing:1", load)
+        second = cache.read_through("listing:1", load)
+        second["title"] = "mutated"
+        third = cache.read_through("listing:1", load)
+
+        load.assert_called_once_with()
+        self.assertEqual(first, {"title": "Bike"})
+        self.assertEqual(third, {"title": "Bike"})
+        self.assertIsNot(second, third)
+
+    def test_read_through_does_not_cache_none(self):
+        cache = InMemoryCacheBackend()
+        load = MagicMock(return_value=None)
+
+        self.assertIsNone(cache.read_through("listing:1", load))
+        self.assertIsNone(cache.read_through("listing:1", load))
+        self.assertEqual(load.call_count, 2)
+
+    # -----------------------------
+    # SharedCacheBackend
+    # -----------------------------
+    def test_shared_round_trip_uses_prefix_and_ttl(self):
+        client = _FakeRedis()
+        cache = SharedCacheBackend(client, ttl_seconds=12.5, key_prefix="t:")
+
+        self.assertEqual(cache.read_through("account:3", lambda: [1, 2]), [1, 2])
+        self.assertEqual(pickle.loads(client.data["t:account:3"]), [1, 2])
+        self.assertEqual(client.set_calls, [("t:account:3", 12)])
+        self.assertEqual(cache.read_through("account:3", lambda: None), [1, 2])
+
+        cache.delete(["account:3"])
+        self.assertNotIn("t:account:3", client.data)
+        self.assertEqual(cache.stats()["backend"], "shared")
+
+    def test_shared_read_through_passes_the_entry_ttl(self):
+        client = _FakeRedis()
+        cache = SharedCacheBackend(client, ttl_seconds=30, key_prefix="t:")
+
+        cache.read_through("listing_detail:3", lambda: "detail", ttl_seconds=5)
+
+        self.assertEqual(client.set_calls, [("t:listing_detail:3", 5)])
+
+    def test_shared_clear_only_removes_prefixed_keys(self):
+        client = _FakeRedis()
+        client.data["other"] = b"keep"
+        cache = SharedCacheBackend(client, key_prefix="t:")
+        cache.set("listing:1", b"v")
+
+        cache.clear()
+
+        self.assertEqual(client.data, {"other": b"keep"})
+
+    def test_shared_backend_failures_degrade_to_misses(self):
+        client = MagicMock()
+        client.get.side_effect = ConnectionError("down")
+        client.set.side_effect = ConnectionError("down")
+        client.delete.side_effect = ConnectionError("down")
+        client.scan_iter.side_effect = ConnectionError("down")
+        cache = SharedCacheBackend(client)
+
+        with self.assertLogs("src.db.cache.shared_cache", level="WARNING"):
+            self.assertEqual(cache.read_through("listing:1", lambda: "row"), "row")
+            cache.delete(["listing:1"])
+            cache.clear()
+        self.assertEqual(cache.stats()["namespaces"]["listing"]["misses"], 1)
+
+    # -----------------------------
+    # RepositoryCache (env configuration)
+    # -----------------------------
+    def test_repository_cache_defaults_to_memory_singleton(self):
+        with patch.dict(os.environ, {}, clear=False):
+            for var in ("REPO_CACHE_BACKEND", "REPO_CACHE_TTL_SECONDS", "REPO_CACHE_MAX_ENTRIES"):
+                os.environ.pop(var, None)
+            first = RepositoryCache.instance()
+            second = RepositoryCache.instance()
+
+        self.assertIsInstance(first, InMemoryCacheBackend)
+        self.assertIs(first, second)
+        self.assertEqual(first.ttl_seconds, 30.0)
+
+    def test_repository_cache_reads_memory_settings(self):
+        env = {
+            "REPO_CACHE_BACKEND": "memory",
+            "REPO_CACHE_TTL_SECONDS": "5",
+            "REPO_CACHE_MAX_ENTRIES": "7",
+        }
+        with patch.dict(os.environ, env):
+            cache = RepositoryCache.from_env()
+
+        self.assertEqual(cache.ttl_seconds, 5.0)
+        self.assertEqual(cache.stats()["max_entries"], 7)
+
+    def test_repository_cache_off_returns_none(self):
+        with patch.dict(os.environ, {"REPO_CACHE_BACKEND": "off"}):
+            self.assertIsNone(RepositoryCache.instance())
+            self.assertIsNone(RepositoryCache.instance())
+
+    def test_repository_cache_shared_requires_url(self):
+        with patch.dict(os.environ, {"REPO_CACHE_BACKEND": "shared"}):
+            os.environ.pop("REPO_CACHE_URL", None)
+            with self.assertRaises(ConfigurationError):
+                RepositoryCache.from_env()
+
+    def test_repository_cache_shared_builds_redis_client(self):
+        fake_redis = MagicMock()
+        env = {"REPO_CACHE_BACKEND": "shared", "REPO_CACHE_URL": "redis://localhost:6379/0"}
+        with patch.dict(os.environ, env), patch.dict("sys.modules", {"redis": fake_redis}):
+            cache = RepositoryCache.from_env()
+
+        self.assertIsInstance(cache, SharedCacheBackend)
+        fake_redis.Redis.from_url.assert_called_once_with("redis://localhost:6379/0")
+
+    def test_repository_cache_shared_without_redis_package(self):
+        env = {"REPO_CACHE_BACKEND": "shared", "REPO_CACHE_URL": "redis://localhost:6379/0"}
+        with patch.dict(os.environ, env), patch.dict("sys.modules", {"redis": None}):
+            with self.assertRaises(ConfigurationError):
+                RepositoryCache.from_env()
+
+    def test_repository_cache_rejects_unknown_backend(self):
+        with patch.dict(os.environ, {"REPO_CACHE_BACKEND": "memcached"}):
+            with self.assertRaises(ConfigurationError):
+                RepositoryCache.from_env()
+
+
+if __name__ == "__main__":
+    unittest.main()
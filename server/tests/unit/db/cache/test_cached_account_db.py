@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.db.account import AccountDB, AccountFootprint
+from src.db.cache import CachedAccountDB, InMemoryCacheBackend
+from src.domain_models import Account
+
+
+def _account(account_id: int = 5, verified: bool = False) -> Account:
+    return Account(
+        "a@example.com", "hash", "First", "Last", account_id=account_id, verified=verified
+    )
+
+
+class TestCachedAccountDB(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner = MagicMock(spec=AccountDB)
+        self.inner._db = MagicMock(name="db")
+        self.cache = InMemoryCacheBackend()
+        self.account_db = CachedAccountDB(self.inner, self.cache)
+
+    def test_get_by_id_is_not_cached(self):
+        self.inner.get_by_id.return_value = _account()
+
+        self.account_db.get_by_id(5)
+        result = self.account_db.get_by_id(5)
+
+        self.assertEqual(self.inner.get_by_id.call_count, 2)
+        self.assertEqual(result.email, "a@example.com")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_password_hash_never_reaches_the_cache(self):
+        self.inner.get_by_id.return_value = _account()
+        self.inner.get_by_email.return_value = _account()
+        self.inner.get_all.return_value = [_account()]
+
+        self.account_db.get_by_id(5)
+        self.account_db.get_by_email("a@example.com")
+        self.account_db.get_all()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats()["namespaces"], {})
+
+    def test_add_passes_through(self):
+        self.inner.add.return_value = _account(9)
+
+        self.assertEqual(self.account_db.add(_account(None)).id, 9)
+
+    def test_updates_pass_through(self):
+        self.account_db.set_verified(5, True)
+        self.account_db.set_verified_by_email("a@example.com", True)
+        self.account_db.set_password(5, "$scrypt$hash")
+
+        self.inner.set_verified.assert_called_once_with(5, True)
+        self.inner.set_verified_by_email.assert_called_once_with("a@example.com", True)
+        self.inner.set_password.assert_called_once_with(5, "$scrypt$hash")
+
+    def test_get_footprint_passes_through_without_caching(self):
+        footprint = AccountFootprint(sellers=frozenset({5}), offer_accounts=frozenset({5}))
+        self.inner.get_footprint.return_value = footprint
+
+        self.assertIs(self.account_db.get_footprint(5), footprint)
+
+        self.inner.get_footprint.assert_called_once_with(5)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_remove_clears_every_cached_entry(self):
+        self.inner.remove.return_value = True
+        self.cache.set("listing:5", b"l")
+        self.cache.set("listing:seller:5", b"l")
+
+        self.assertTrue(self.account_db.remove(5))
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_remove_clears_the_cache_even_when_the_delete_fails(self):
+        self.inner.remove.side_effect = RuntimeError("db down")
+        self.cache.set("listing:5", b"l")
+
+        with self.assertRaises(RuntimeError):
+            self.account_db.remove(5)
+
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.db.cache import CachedCommentDB, InMemoryCacheBackend
+from src.db.comment import CommentDB
+from src.domain_models import Comment
+from src.utils import DatabaseQueryError
+
+
+def _comment(listing_id: int = 4, comment_id: int | None = 1) -> Comment:
+    return Comment(listing_id, 2, body="Still available?", comment_id=comment_id)
+
+
+class TestCachedCommentDB(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner = MagicMock(spec=CommentDB)
+        self.inner._db = MagicMock(name="db")
+        self.cache = InMemoryCacheBackend()
+        self.comment_db = CachedCommentDB(self.inner, self.cache)
+        self.inner.get_by_id.return_value = _comment()
+        self.cache.set("listing_detail:4", b"detail")
+
+    def test_is_a_comment_db_sharing_the_inner_db_utility(self):
+        self.assertIsInstance(self.comment_db, CommentDB)
+        self.assertIs(self.comment_db._db, self.inner._db)
+
+    def test_add_drops_the_listing_detail(self):
+        self.inner.add.return_value = _comment()
+
+        self.comment_db.add(_comment(comment_id=None))
+
+        self.assertIsNone(self.cache.get("listing_detail:4"))
+
+    def test_update_body_and_remove_look_up_the_listing(self):
+        for write in (
+            lambda: self.comment_db.update_body(1, "Sold?"),
+            lambda: self.comment_db.remove(1),
+        ):
+            self.cache.set("listing_detail:4", b"detail")
+            write()
+            self.assertIsNone(self.cache.get("listing_detail:4"))
+
+        self.inner.update_body.assert_called_once_with(1, "Sold?")
+        self.inner.remove.assert_called_once_with(1)
+
+    def test_failed_write_still_invalidates(self):
+        self.inner.add.side_effect = DatabaseQueryError(message="boom")
+
+        with self.assertRaises(DatabaseQueryError):
+            self.comment_db.add(_comment(comment_id=None))
+
+        self.assertIsNone(self.cache.get("listing_detail:4"))
+
+    def test_write_on_unknown_comment_invalidates_nothing(self):
+        self.inner.get_by_id.return_value = None
+        self.inner.remove.return_value = False
+
+        self.assertFalse(self.comment_db.remove(99))
+
+        self.assertEqual(self.cache.get("listing_detail:4"), b"detail")
+
+    def test_reads_pass_through_uncached(self):
+        calls = {"get_by_id": (1,), "get_by_listing_id": (4,), "get_by_author_id": (2,)}
+        for name, args in calls.items():
+            getattr(self.inner, name).return_value = [name]
+            self.assertEqual(getattr(self.comment_db, name)(*args), [name])
+            self.assertEqual(getattr(self.comment_db, name)(*args), [name])
+            self.assertEqual(getattr(self.inner, name).call_count, 2, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.db.cache import CachedListingDB, InMemoryCacheBackend
+from src.db.listing import ListingDB
+from src.domain_models import Listing
+from src.utils import ListingNotFoundError
+
+
+def _listing(listing_id: int = 1, seller_id: int = 7, price: float = 10.0) -> Listing:
+    return Listing(seller_id, "Bike", "Blue bike", price, listing_id=listing_id)
+
+
+class TestCachedListingDB(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner = MagicMock(spec=ListingDB)
+        self.inner._db = MagicMock(name="db")
+        self.cache = InMemoryCacheBackend()
+        self.listing_db = CachedListingDB(self.inner, self.cache)
+
+    def test_is_a_listing_db_sharing_the_inner_db_utility(self):
+        self.assertIsInstance(self.listing_db, ListingDB)
+        self.assertIs(self.listing_db._db, self.inner._db)
+
+    def test_get_by_id_reads_through_once(self):
+        self.inner.get_by_id.return_value = _listing()
+
+        first = self.listing_db.get_by_id(1)
+        second = self.listing_db.get_by_id(1)
+
+        self.inner.get_by_id.assert_called_once_with(1)
+        self.assertEqual(second.title, "Bike")
+        self.assertIsNot(first, second)
+
+    def test_get_by_id_hands_out_copies_that_callers_may_mutate(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.listing_db.get_by_id(1)
+
+        self.listing_db.get_by_id(1).mark_sold(99)
+
+        self.assertFalse(self.listing_db.get_by_id(1).is_sold)
+
+    def test_get_by_id_not_found_is_not_cached(self):
+        self.inner.get_by_id.return_value = None
+
+        self.assertIsNone(self.listing_db.get_by_id(1))
+        self.assertIsNone(self.listing_db.get_by_id(1))
+        self.assertEqual(self.inner.get_by_id.call_count, 2)
+
+    def test_get_by_seller_id_reads_through_once(self):
+        self.inner.get_by_seller_id.return_value = [_listing(1), _listing(2)]
+
+        self.listing_db.get_by_seller_id(7)
+        result = self.listing_db.get_by_seller_id(7)
+
+        self.inner.get_by_seller_id.assert_called_once_with(7)
+        self.assertEqual([l.id for l in result], [1, 2])
+
+    def test_add_invalidates_seller_listings(self):
+        self.inner.get_by_seller_id.return_value = []
+        self.listing_db.get_by_seller_id(7)
+        self.inner.add.return_value = _listing(3)
+
+        self.assertEqual(self.listing_db.add(_listing(None)).id, 3)
+        self.listing_db.get_by_seller_id(7)
+
+        self.assertEqual(self.inner.get_by_seller_id.call_count, 2)
+
+    def test_update_invalidates_listing_and_seller(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.inner.get_by_seller_id.return_value = [_listing()]
+        self.listing_db.get_by_id(1)
+        self.listing_db.get_by_seller_id(7)
+        self.listing_db.get_by_seller_id(8)
+
+        self.listing_db.update(_listing(price=20.0))
+        self.listing_db.get_by_id(1)
+        self.listing_db.get_by_seller_id(7)
+        self.listing_db.get_by_seller_id(8)
+
+        self.assertEqual(self.inner.get_by_id.call_count, 2)
+        # seller 8 was untouched and stays cached
+        self.assertEqual(self.inner.get_by_seller_id.call_count, 3)
+
+    def test_set_sold_and_set_price_invalidate_listing_and_seller(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.inner.get_by_seller_id.return_value = [_listing()]
+
+        for write in (
+            lambda: self.listing_db.set_sold(1, True, 99),
+            lambda: self.listing_db.set_price(1, 15.0),
+        ):
+            self.listing_db.get_by_seller_id(7)
+            before = self.inner.get_by_seller_id.call_count
+            write()
+            self.listing_db.get_by_seller_id(7)
+            self.assertEqual(self.inner.get_by_seller_id.call_count, before + 1)
+
+        self.inner.set_sold.assert_called_once_with(1, True, 99)
+        self.inner.set_price.assert_called_once_with(1, 15.0)
+
+    def test_remove_also_drops_the_listing_rating(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.inner.remove.return_value = True
+        self.cache.set("rating:listing:1", b"x")
+        self.listing_db.get_by_id(1)
+
+        self.assertTrue(self.listing_db.remove(1))
+
+        self.assertIsNone(self.cache.get("listing:1"))
+        self.assertIsNone(self.cache.get("rating:listing:1"))
+
+    def test_failed_write_still_invalidates(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.inner.set_price.side_effect = ListingNotFoundError(message="gone")
+        self.listing_db.get_by_id(1)
+
+        with self.assertRaises(ListingNotFoundError):
+            self.listing_db.set_price(1, 5.0)
+
+        self.assertIsNone(self.cache.get("listing:1"))
+
+    def test_write_on_unknown_listing_only_drops_its_key(self):
+        self.inner.get_by_id.return_value = None
+        self.inner.remove.return_value = False
+
+        self.assertFalse(self.listing_db.remove(404))
+        self.inner.remove.assert_called_once_with(404)
+
+    def test_get_listing_detail_reads_through_for_the_detail_ttl(self):
+        clock = [0.0]
+        self.cache = InMemoryCacheBackend(ttl_seconds=30, clock=lambda: clock[0])
+        self.listing_db = CachedListingDB(self.inner, self.cache, detail_ttl_seconds=5)
+        self.inner.get_listing_detail.return_value = "detail"
+
+        self.assertEqual(self.listing_db.get_listing_detail(1), "detail")
+        self.assertEqual(self.listing_db.get_listing_detail(1), "detail")
+        self.inner.get_listing_detail.assert_called_once_with(1)
+
+        clock[0] += 6
+        self.listing_db.get_listing_detail(1)
+        self.assertEqual(self.inner.get_listing_detail.call_count, 2)
+
+    def test_listing_writes_drop_the_listing_detail(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.inner.get_listing_detail.return_value = "detail"
+
+        for write in (
+            lambda: self.listing_db.set_sold(1, True, 99),
+            lambda: self.listing_db.set_price(1, 15.0),
+            lambda: self.listing_db.update(_listing()),
+            lambda: self.listing_db.remove(1),
+        ):
+            self.listing_db.get_listing_detail(1)
+            write()
+            self.assertIsNone(self.cache.get("listing_detail:1"))
+
+    def test_other_reads_pass_through_uncached(self):
+        calls = {
+            "get_all": (),
+            "get_by_buyer_id": (3,),
+            "get_unsold": (),
+            "get_unsold_by_location": ("Winnipeg",),
+            "get_unsold_by_max_price": (50.0,),
+            "get_unsold_by_location_and_max_price": ("Winnipeg", 50.0),
+            "get_all_rows": (),
+            "get_rows_by_seller_id": (7,),
+            "get_all_projected": ("projection",),
+            "get_unsold_facets": (),
+            "get_projected_by_seller_id": (7, "projection"),
+            "query_rows": ("query",),
+            "get_seller_dashboard": (7,),
+            "iter_all": (),
+            "iter_by_seller_id": (7,),
+        }
+        for name, args in calls.items():
+            getattr(self.inner, name).return_value = [name]
+            self.assertEqual(getattr(self.listing_db, name)(*args), [name])
+            self.assertEqual(getattr(self.listing_db, name)(*args), [name])
+            self.assertEqual(getattr(self.inner, name).call_count, 2, name)
+
+        self.inner.get_recent_unsold.return_value = []
+        self.listing_db.get_recent_unsold(limit=5, offset=10)
+        self.inner.get_recent_unsold.assert_called_once_with(limit=5, offset=10)
+
+        self.inner.find_unsold_by_title_keyword.return_value = []
+        self.listing_db.find_unsold_by_title_keyword("bike", limit=5, offset=10)
+        self.inner.find_unsold_by_title_keyword.assert_called_once_with("bike", limit=5, offset=10)
+
+    def test_reconcile_activity_counts_passes_through_without_invalidating(self):
+        self.inner.get_by_id.return_value = _listing()
+        self.listing_db.get_by_id(1)
+        self.inner.reconcile_activity_counts.return_value = (2, 500)
+
+        self.assertEqual(self.listing_db.reconcile_activity_counts(0, 500), (2, 500))
+
+        self.inner.reconcile_activity_counts.assert_called_once_with(0, 500)
+        self.listing_db.get_by_id(1)
+        self.inner.get_by_id.assert_called_once_with(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
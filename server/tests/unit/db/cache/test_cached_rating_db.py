@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.db.cache import CachedRatingDB, InMemoryCacheBackend
+from src.db.rating import RatingDB
+from src.domain_models import Rating
+
+
+def _rating(listing_id: int = 4, rating_id: int = 1, score: int = 5) -> Rating:
+    return Rating(listing_id, 2, score, rating_id=rating_id)
+
+
+class TestCachedRatingDB(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner = MagicMock(spec=RatingDB)
+        self.inner._db = MagicMock(name="db")
+        self.cache = InMemoryCacheBackend()
+        self.rating_db = CachedRatingDB(self.inner, self.cache)
+        self.inner.get_by_listing_id.return_value = _rating()
+        self.inner.get_by_id.return_value = _rating()
+
+    def _assert_listing_rating_reloaded(self, listing_id: int = 4) -> None:
+        before = self.inner.get_by_listing_id.call_count
+        self.rating_db.get_by_listing_id(listing_id)
+        self.assertEqual(self.inner.get_by_listing_id.call_count, before + 1)
+
+    def test_get_by_listing_id_reads_through_once(self):
+        self.rating_db.get_by_listing_id(4)
+        result = self.rating_db.get_by_listing_id(4)
+
+        self.inner.get_by_listing_id.assert_called_once_with(4)
+        self.assertEqual(result.transaction_rating, 5)
+
+    def test_add_invalidates_listing_rating(self):
+        self.rating_db.get_by_listing_id(4)
+        self.rating_db.add(_rating(rating_id=None))
+        self._assert_listing_rating_reloaded()
+
+    def test_writes_drop_the_listing_detail_embedding_the_rating(self):
+        self.cache.set("listing_detail:4", b"x")
+
+        self.rating_db.set_score(1, 3)
+
+        self.assertIsNone(self.cache.get("listing_detail:4"))
+
+    def test_update_invalidates_old_and_new_listing(self):
+        self.rating_db.get_by_listing_id(4)
+        self.rating_db.get_by_listing_id(6)
+
+        self.rating_db.update(_rating(listing_id=6))
+
+        self.inner.get_by_id.assert_called_once_with(1)
+        self._assert_listing_rating_reloaded(4)
+        self._assert_listing_rating_reloaded(6)
+
+    def test_set_score_and_remove_look_up_the_listing(self):
+        for write in (
+            lambda: self.rating_db.set_score(1, 3),
+            lambda: self.rating_db.remove(1),
+        ):
+            self.rating_db.get_by_listing_id(4)
+            write()
+            self._assert_listing_rating_reloaded()
+
+        self.inner.set_score.assert_called_once_with(1, 3)
+        self.inner.remove.assert_called_once_with(1)
+
+    def test_write_on_unknown_rating_invalidates_nothing(self):
+        self.inner.get_by_id.return_value = None
+        self.rating_db.get_by_listing_id(4)
+
+        self.rating_db.remove(99)
+
+        self.assertIsNotNone(self.cache.get("rating:listing:4"))
+
+    def test_remove_by_listing_id_invalidates(self):
+        self.rating_db.get_by_listing_id(4)
+        self.rating_db.remove_by_listing_id(4)
+        self._assert_listing_rating_reloaded()
+
+    def test_stats_and_other_reads_pass_through(self):
+        calls = {
+            "get_average_rating_by_account_id": (2,),
+            "get_sum_of_ratings_given_by_account_id": (2,),
+            "count_ratings_received_by_account_id": (2,),
+            "get_sum_of_ratings_received_by_account_id": (2,),
+            "get_average_for_rater": (2,),
+            "count_by_rater": (2,),
+            "get_by_id": (1,),
+            "get_by_rater_id": (2,),
+            "get_by_listing_ids": ([4, 6],),
+            "get_all": (),
+            "get_by_score": (5,),
+        }
+        for name, args in calls.items():
+            getattr(self.inner, name).return_value = name
+            getattr(self.inner, name).reset_mock()
+            self.assertEqual(getattr(self.rating_db, name)(*args), name)
+            getattr(self.inner, name).assert_called_once_with(*args)
+
+        self.inner.get_recent.return_value = []
+        self.rating_db.get_recent(limit=3, offset=6)
+        self.inner.get_recent.assert_called_once_with(limit=3, offset=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,7 +62,10 @@ class TestMySQLCommentDB(unittest.TestCase):
         self.assertEqual(out.body, "hi")
 
         self.db_util.transaction.assert_called_once()
-        self.conn.execute.assert_called_once()
+        (count_sql, count_params), (insert_sql, _) = [c.args for c in self.conn.execute.call_args_list]
+        self.assertIn("SET comment_count = comment_count + 1", str(count_sql))
+        self.assertEqual(count_params, {"listing_id": 10})
+        self.assertIn("INSERT INTO comment", str(insert_sql))
 
     def test_add_raises_database_query_error_on_integrity_error(self) -> None:
         c = self._comment()
@@ -286,20 +289,23 @@ class TestMySQLCommentDB(unittest.TestCase):
     # remove
     # -----------------------------
     def test_remove_returns_true_when_deleted(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 1
-        self.conn.execute.return_value = exec_result
+        self.conn.execute.return_value.scalar.return_value = 10
 
         out = self.comment_db.remove(5)
         self.assertTrue(out)
 
+        lock_call, delete_call, count_call = self.conn.execute.call_args_list
+        self.assertIn("FOR UPDATE", str(lock_call.args[0]))
+        self.assertIn("DELETE FROM comment", str(delete_call.args[0]))
+        self.assertIn("comment_count = GREATEST(comment_count, 1) - 1", str(count_call.args[0]))
+        self.assertEqual(count_call.args[1], {"listing_id": 10})
+
     def test_remove_returns_false_when_missing(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 0
-        self.conn.execute.return_value = exec_result
+        self.conn.execute.return_value.scalar.return_value = None
 
         out = self.comment_db.remove(999)
         self.assertFalse(out)
+        self.conn.execute.assert_called_once()
 
     def test_remove_raises_database_query_error_on_sqlalchemy_error(self) -> None:
         self.conn.execute.side_effect = SQLAlchemyError("fail")
@@ -25,6 +25,9 @@ class _EmailVerificationTokenDBCoverageShim(EmailVerificationTokenDB):
     def clear_used_tokens(self, account_id: int) -> int:
         return EmailVerificationTokenDB.clear_used_tokens(self, account_id)  # type: ignore[return-value]
 
+    def purge_chunk(self, cutoff: datetime, after_id: int, limit: int):
+        return EmailVerificationTokenDB.purge_chunk(self, cutoff, after_id, limit)
+
 
 class TestEmailVerificationTokenDBABC(unittest.TestCase):
     def setUp(self) -> None:
@@ -67,3 +70,7 @@ class TestEmailVerificationTokenDBABC(unittest.TestCase):
     def test_clear_used_tokens_base_body_executes_and_returns_none(self) -> None:
         out = self.sut.clear_used_tokens(1)
         self.assertIsNone(out)
+
+    def test_purge_chunk_base_body_executes_and_returns_none(self) -> None:
+        out = self.sut.purge_chunk(datetime.utcnow(), 0, 100)
+        self.assertIsNone(out)
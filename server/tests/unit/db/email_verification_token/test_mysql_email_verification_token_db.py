@@ -11,7 +11,7 @@ from src.db.email_verification_token.mysql.mysql_email_verification_token_db imp
     MySQLEmailVerificationTokenDB,
 )
 from src.domain_models import VerificationToken
-from src.utils import DatabaseQueryError, TokenNotFoundError
+from src.utils import DatabaseQueryError, TokenNotFoundError, ValidationError
 
 
 class TestMySQLEmailVerificationTokenDB(unittest.TestCase):
@@ -252,3 +252,41 @@ class TestMySQLEmailVerificationTokenDB(unittest.TestCase):
         self.assertEqual(tok.expires_at, row["expires_at"])
         self.assertTrue(tok.used)
         self.assertIsNone(tok.used_at)
+
+    # -----------------------------
+    # purge_chunk
+    # -----------------------------
+    def test_purge_chunk_deletes_selected_ids_in_one_short_transaction(self) -> None:
+        cutoff = datetime(2026, 10, 1, 12, 0, 0)
+        self.conn.execute.return_value.all.return_value = [(3,), (8,), (9,)]
+        self.conn.execute.return_value.rowcount = 2
+
+        out = self.sut.purge_chunk(cutoff, 2, 3)
+
+        self.assertEqual(out, (2, 9))
+        (select_sql, select_params), (delete_sql, delete_params) = (
+            c.args for c in self.conn.execute.call_args_list
+        )
+        self.assertIn("SELECT id", str(select_sql))
+        self.assertNotIn("FOR UPDATE", str(select_sql))
+        self.assertEqual(select_params, {"after_id": 2, "cutoff": cutoff, "limit": 3})
+        self.assertIn("DELETE FROM email_verification_tokens", str(delete_sql))
+        self.assertIn("expires_at < :cutoff", str(delete_sql))  # condition re-checked under the lock
+        self.assertEqual(delete_params, {"ids": [3, 8, 9], "cutoff": cutoff})
+        self.db_util.connect.assert_called_once()
+        self.db_util.transaction.assert_called_once()
+
+    def test_purge_chunk_without_candidates_reports_done(self) -> None:
+        self.conn.execute.return_value.all.return_value = []
+
+        self.assertEqual(self.sut.purge_chunk(datetime(2026, 10, 1), 0, 100), (0, None))
+        self.db_util.transaction.assert_not_called()
+
+    def test_purge_chunk_validates_and_wraps_errors(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.purge_chunk(datetime(2026, 10, 1), 0, 0)
+
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.purge_chunk(datetime(2026, 10, 1), 0, 100)
+        self.assertEqual(ctx.exception.details, {"op": "purge_chunk", "table": "email_verification_tokens"})
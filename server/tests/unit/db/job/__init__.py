@@ -0,0 +1 @@
+from .test_job_db import TestJobDB
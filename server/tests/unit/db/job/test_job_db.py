@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import DBUtility
+from src.db.job import Job, JobDB, NewJob
+from src.db.job.mysql import MySQLJobDB
+from src.utils import DatabaseQueryError, ValidationError
+
+
+class _JobDBCoverageShim(JobDB):
+    def add_many(self, jobs):
+        return JobDB.add_many(self, jobs)
+
+    def claim(self, queue, worker_id, limit, lease_seconds):
+        return JobDB.claim(self, queue, worker_id, limit, lease_seconds)
+
+    def complete(self, job_id, attempts):
+        return JobDB.complete(self, job_id, attempts)
+
+    def fail(self, job_id, attempts, error, retry_in_seconds):
+        return JobDB.fail(self, job_id, attempts, error, retry_in_seconds)
+
+    def purge_finished(self, older_than_seconds, limit=1000):
+        return JobDB.purge_finished(self, older_than_seconds, limit)
+
+    def count_by_status(self):
+        return JobDB.count_by_status(self)
+
+
+class TestJobDB(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db_util: MagicMock = MagicMock(spec=DBUtility)
+        self.sut = MySQLJobDB(self.db_util)
+
+        self.conn: MagicMock = MagicMock()
+        self.connect_cm: MagicMock = MagicMock()
+        self.connect_cm.__enter__.return_value = self.conn
+        self.connect_cm.__exit__.return_value = False
+        self.tx_cm: MagicMock = MagicMock()
+        self.tx_cm.__enter__.return_value = self.conn
+        self.tx_cm.__exit__.return_value = False
+        self.db_util.connect.return_value = self.connect_cm
+        self.db_util.transaction.return_value = self.tx_cm
+
+    def _select_returns(self, rows) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = rows
+
+    # -----------------------------
+    # ABC
+    # -----------------------------
+    def test_abc_base_bodies_return_none(self) -> None:
+        shim = _JobDBCoverageShim(self.db_util)
+        self.assertIs(shim._db, self.db_util)
+        self.assertIsNone(shim.add_many([]))
+        self.assertIsNone(shim.claim("q", "w", 1, 60))
+        self.assertIsNone(shim.complete(1, 1))
+        self.assertIsNone(shim.fail(1, 1, "e", None))
+        self.assertIsNone(shim.purge_finished(60))
+        self.assertIsNone(shim.count_by_status())
+
+    # -----------------------------
+    # add_many
+    # -----------------------------
+    def test_add_many_inserts_all_rows_in_one_statement(self) -> None:
+        self.sut.add_many([
+            NewJob(queue="email", kind="k", payload={"a": 1}),
+            NewJob(queue="email", kind="k", payload={}, max_attempts=2, delay_seconds=1.5, unique_key="k@7"),
+        ])
+
+        self.db_util.transaction.assert_called_once()
+        self.conn.execute.assert_called_once()
+        sql, rows = self.conn.execute.call_args.args
+        self.assertIn("INSERT INTO job", str(sql))
+        self.assertIn("ON DUPLICATE KEY UPDATE id = id", str(sql))
+        self.assertEqual(rows, [
+            {"queue": "email", "kind": "k", "payload": '{"a":1}', "max_attempts": 5, "delay_us": 0,
+             "unique_key": None},
+            {"queue": "email", "kind": "k", "payload": "{}", "max_attempts": 2, "delay_us": 1_500_000,
+             "unique_key": "k@7"},
+        ])
+
+    def test_add_many_with_no_jobs_does_nothing(self) -> None:
+        self.sut.add_many([])
+
+        self.db_util.transaction.assert_not_called()
+
+    def test_add_many_validates_jobs(self) -> None:
+        for job in (
+            NewJob(queue="", kind="k"),
+            NewJob(queue="q", kind=""),
+            NewJob(queue="q", kind="k", max_attempts=0),
+            NewJob(queue="q", kind="k", unique_key=" "),
+            NewJob(queue="q", kind="k", payload=["not", "a", "dict"]),  # type: ignore[arg-type]
+        ):
+            with self.assertRaises(ValidationError):
+                self.sut.add_many([job])
+        self.conn.execute.assert_not_called()
+
+    def test_add_many_wraps_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.add_many([NewJob(queue="q", kind="k")])
+
+        self.assertEqual(ctx.exception.details, {"op": "add_many", "table": "job"})
+
+    # -----------------------------
+    # claim
+    # -----------------------------
+    def test_claim_skips_locked_rows_and_leases_the_claimed_ones(self) -> None:
+        self._select_returns([
+            {"id": 3, "kind": "k", "payload": '{"x": 1}', "status": "pending", "attempts": 0, "max_attempts": 5},
+            {"id": 4, "kind": "k", "payload": {"y": 2}, "status": "running", "attempts": 1, "max_attempts": 5},
+        ])
+
+        jobs = self.sut.claim("email", "host:1", 2, 30)
+
+        self.assertEqual(jobs, [
+            Job(id=3, queue="email", kind="k", payload={"x": 1}, attempts=1, max_attempts=5),
+            Job(id=4, queue="email", kind="k", payload={"y": 2}, attempts=2, max_attempts=5),
+        ])
+        (select_sql, select_params), (update_sql, update_params) = (
+            c.args for c in self.conn.execute.call_args_list
+        )
+        self.assertIn("FOR UPDATE SKIP LOCKED", str(select_sql))
+        self.assertEqual(select_params, {"queue": "email", "limit": 2})
+        self.assertIn("SET status = 'running'", str(update_sql))
+        self.assertEqual(update_params, {"ids": [3, 4], "worker_id": "host:1", "lease_us": 30_000_000})
+
+    def test_claim_fails_expired_rows_without_attempts_left(self) -> None:
+        self._select_returns([
+            {"id": 5, "kind": "k", "payload": "{}", "status": "running", "attempts": 3, "max_attempts": 3},
+        ])
+
+        self.assertEqual(self.sut.claim("email", "host:1", 5, 30), [])
+
+        self.assertEqual(self.conn.execute.call_count, 2)
+        expire_sql, expire_params = self.conn.execute.call_args.args
+        self.assertIn("SET status = 'failed'", str(expire_sql))
+        self.assertEqual(expire_params, {"ids": [5]})
+
+    def test_claim_with_nothing_runnable_only_selects(self) -> None:
+        self._select_returns([])
+
+        self.assertEqual(self.sut.claim("email", "host:1", 5, 30), [])
+        self.conn.execute.assert_called_once()
+
+    def test_claim_validates_arguments(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.claim("", "w", 1, 30)
+        with self.assertRaises(ValidationError):
+            self.sut.claim("q", "w", 0, 30)
+        self.db_util.transaction.assert_not_called()
+
+    def test_claim_wraps_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.claim("q", "w", 1, 30)
+
+        self.assertEqual(ctx.exception.details, {"op": "claim", "table": "job"})
+
+    # -----------------------------
+    # complete / fail
+    # -----------------------------
+    def test_complete_applies_only_to_the_current_claim(self) -> None:
+        self.conn.execute.return_value.rowcount = 1
+        self.assertTrue(self.sut.complete(7, 2))
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("SET status = 'done'", str(sql))
+        self.assertIn("attempts = :attempts", str(sql))
+        self.assertEqual(params, {"job_id": 7, "attempts": 2})
+
+        self.conn.execute.return_value.rowcount = 0
+        self.assertFalse(self.sut.complete(7, 2))
+
+    def test_fail_with_retry_makes_the_job_pending_again(self) -> None:
+        self.conn.execute.return_value.rowcount = 1
+
+        self.assertTrue(self.sut.fail(7, 2, "E" * 300, 4.0))
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("SET status = 'pending'", str(sql))
+        self.assertEqual(params, {"job_id": 7, "attempts": 2, "error": "E" * 255, "delay_us": 4_000_000})
+
+    def test_fail_without_retry_marks_the_job_failed(self) -> None:
+        self.conn.execute.return_value.rowcount = 0
+
+        self.assertFalse(self.sut.fail(7, 2, "boom", None))
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("SET status = 'failed'", str(sql))
+        self.assertEqual(params, {"job_id": 7, "attempts": 2, "error": "boom"})
+
+    def test_complete_and_fail_wrap_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.complete(1, 1)
+        self.assertEqual(ctx.exception.details, {"op": "complete", "table": "job"})
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.fail(1, 1, "e", 1.0)
+        self.assertEqual(ctx.exception.details, {"op": "fail", "table": "job"})
+
+    # -----------------------------
+    # purge_finished / count_by_status
+    # -----------------------------
+    def test_purge_finished_deletes_old_done_rows(self) -> None:
+        self.conn.execute.return_value.rowcount = 12
+
+        self.assertEqual(self.sut.purge_finished(3600, limit=50), 12)
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("DELETE FROM job", str(sql))
+        self.assertIn("status = 'done'", str(sql))
+        self.assertEqual(params, {"age_us": 3_600_000_000, "limit": 50})
+
+    def test_count_by_status_groups_per_queue(self) -> None:
+        self._select_returns([
+            {"queue": "email", "status": "pending", "n": 3},
+            {"queue": "email", "status": "failed", "n": 1},
+            {"queue": "media", "status": "running", "n": 2},
+        ])
+
+        self.assertEqual(self.sut.count_by_status(), {
+            "email": {"pending": 3, "failed": 1},
+            "media": {"running": 2},
+        })
+        self.db_util.connect.assert_called_once()
+
+    def test_purge_and_count_wrap_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.purge_finished(60)
+        self.assertEqual(ctx.exception.details, {"op": "purge_finished", "table": "job"})
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.count_by_status()
+        self.assertEqual(ctx.exception.details, {"op": "count_by_status", "table": "job"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,11 +39,41 @@ class _ListingDBCoverageShim(ListingDB):
     def get_unsold_by_location_and_max_price(self, location: str, max_price: float):
         return ListingDB.get_unsold_by_location_and_max_price(self, location, max_price)
 
+    def get_unsold_facets(self):
+        return ListingDB.get_unsold_facets(self)
+
+    def query_rows(self, query):
+        return ListingDB.query_rows(self, query)
+
+    def get_seller_dashboard(self, seller_id: int):
+        return ListingDB.get_seller_dashboard(self, seller_id)
+
+    def get_listing_detail(self, listing_id: int):
+        return ListingDB.get_listing_detail(self, listing_id)
+
     def find_unsold_by_title_keyword(
         self, keyword: str, limit: int = 50, offset: int = 0
     ):
         return ListingDB.find_unsold_by_title_keyword(self, keyword, limit, offset)
 
+    def get_all_rows(self):
+        return ListingDB.get_all_rows(self)
+
+    def get_rows_by_seller_id(self, seller_id: int):
+        return ListingDB.get_rows_by_seller_id(self, seller_id)
+
+    def get_all_projected(self, projection):
+        return ListingDB.get_all_projected(self, projection)
+
+    def get_projected_by_seller_id(self, seller_id: int, projection):
+        return ListingDB.get_projected_by_seller_id(self, seller_id, projection)
+
+    def iter_all(self):
+        return ListingDB.iter_all(self)
+
+    def iter_by_seller_id(self, seller_id: int):
+        return ListingDB.iter_by_seller_id(self, seller_id)
+
     def update(self, listing: Listing) -> Listing:
         return ListingDB.update(self, listing)
 
@@ -53,6 +83,9 @@ class _ListingDBCoverageShim(ListingDB):
     def set_price(self, listing_id: int, price: float) -> None:
         return ListingDB.set_price(self, listing_id, price)
 
+    def reconcile_activity_counts(self, after_id: int, limit: int) -> tuple[int, int | None]:
+        return ListingDB.reconcile_activity_counts(self, after_id, limit)
+
     def remove(self, listing_id: int) -> bool:
         return ListingDB.remove(self, listing_id)
 
@@ -127,6 +160,22 @@ class TestListingDBABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.get_unsold_by_location_and_max_price("Winnipeg", 50.0)
 
+    def test_get_unsold_facets_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_unsold_facets()
+
+    def test_query_rows_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.query_rows(object())
+
+    def test_get_seller_dashboard_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_seller_dashboard(1)
+
+    def test_get_listing_detail_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_listing_detail(1)
+
     def test_find_unsold_by_title_keyword_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.find_unsold_by_title_keyword("bike")
@@ -155,6 +204,34 @@ class TestListingDBABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.set_price(1, 99.99)
 
+    def test_reconcile_activity_counts_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.reconcile_activity_counts(0, 100)
+
     def test_remove_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.remove(1)
+
+    def test_get_all_rows_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_all_rows()
+
+    def test_get_rows_by_seller_id_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_rows_by_seller_id(1)
+
+    def test_get_all_projected_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_all_projected(None)
+
+    def test_get_projected_by_seller_id_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_projected_by_seller_id(1, None)
+
+    def test_iter_all_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.iter_all()
+
+    def test_iter_by_seller_id_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.iter_by_seller_id(1)
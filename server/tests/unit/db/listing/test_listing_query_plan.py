@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import itertools
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from src.db import LISTING_SORTS, ListingCursor, ListingQuery
+from src.db.listing.mysql.listing_query_plan import (
+    IDX_LOCATION,
+    IDX_SELLER_CREATED,
+    IDX_SOLD_CREATED,
+    IDX_SOLD_PRICE,
+    choose_index,
+    plan,
+)
+
+
+class TestListingQueryPlan(unittest.TestCase):
+    def test_choose_index_prefers_seller_then_location_then_price(self) -> None:
+        cases = [
+            (dict(seller_id=3, location="Winnipeg", max_price=10), IDX_SELLER_CREATED),
+            (dict(location="Winnipeg", max_price=10, sort="price_asc"), IDX_LOCATION),
+            (dict(min_price=10, keyword="bike"), IDX_SOLD_PRICE),
+            (dict(sort="price_desc"), IDX_SOLD_PRICE),
+            (dict(keyword="bike", is_sold=True), IDX_SOLD_CREATED),
+            (dict(), IDX_SOLD_CREATED),
+        ]
+        for kwargs, index in cases:
+            with self.subTest(**kwargs):
+                self.assertEqual(choose_index(ListingQuery.of(**kwargs)), index)
+
+    def test_plan_pins_the_index_and_selects_one_probe_row(self) -> None:
+        compiled = plan(ListingQuery.of(is_sold=False, limit=20))
+
+        self.assertEqual(compiled.index, IDX_SOLD_CREATED)
+        self.assertIn(f"FROM listing FORCE INDEX ({IDX_SOLD_CREATED})", compiled.sql)
+        self.assertIn("WHERE is_sold = :is_sold\n", compiled.sql)
+        self.assertIn("ORDER BY created_at DESC, id DESC\nLIMIT :limit", compiled.sql)
+        self.assertEqual(compiled.params, {"limit": 21, "is_sold": False})
+
+    def test_any_sold_state_is_spelled_as_an_index_range(self) -> None:
+        self.assertIn("is_sold IN (FALSE, TRUE)", plan(ListingQuery.of(max_price=5)).sql)
+        # seller_id already leads its index; no sold predicate is needed
+        self.assertNotIn("is_sold", plan(ListingQuery.of(seller_id=2)).sql.split("WHERE")[1])
+
+    def test_every_filter_is_a_bind_parameter(self) -> None:
+        query = ListingQuery.of(
+            min_price=1, max_price=99.5, location="St. Boniface", seller_id=7,
+            is_sold=False, keyword="50%_off\\", sort="price_desc",
+        )
+
+        compiled = plan(query)
+
+        self.assertEqual(compiled.params, {
+            "limit": 21, "seller_id": 7, "is_sold": False, "key_prefix": "st boniface%",
+            "min_price": Decimal("1.00"), "max_price": Decimal("99.50"),
+            "keyword": "%50\\%\\_off\\\\%",
+        })
+        self.assertNotIn("boniface", compiled.sql)
+        self.assertNotIn("50", compiled.sql)
+        self.assertIn("ORDER BY price DESC, id DESC", compiled.sql)
+
+    def test_cursor_becomes_a_keyset_predicate_per_sort(self) -> None:
+        expected = {
+            "newest": "(created_at < :cursor_value OR (created_at = :cursor_value AND id < :cursor_id))",
+            "price_asc": "(price > :cursor_value OR (price = :cursor_value AND id > :cursor_id))",
+            "price_desc": "(price < :cursor_value OR (price = :cursor_value AND id < :cursor_id))",
+        }
+        for sort, predicate in expected.items():
+            value = datetime(2026, 1, 2) if sort == "newest" else Decimal("3.00")
+            token = ListingCursor(sort=sort, value=value, id=11).encode()
+
+            compiled = plan(ListingQuery.of(sort=sort, cursor=token))
+
+            self.assertIn(predicate, compiled.sql)
+            self.assertEqual((compiled.params["cursor_value"], compiled.params["cursor_id"]), (value, 11))
+
+    def test_every_combination_compiles_to_one_statement(self) -> None:
+        for seller, location, price, sold, keyword, sort in itertools.product(
+            (None, 4), (None, "Winnipeg"), (None, 25), (None, False), (None, "bike"), LISTING_SORTS,
+        ):
+            query = ListingQuery.of(
+                seller_id=seller, location=location, max_price=price,
+                is_sold=sold, keyword=keyword, sort=sort,
+            )
+
+            compiled = plan(query)
+
+            self.assertEqual(compiled.index, choose_index(query))
+            self.assertEqual(compiled.sql.count("SELECT"), 1)
+            self.assertTrue(all(f":{name}" in compiled.sql for name in compiled.params))
+
+
+if __name__ == "__main__":
+    unittest.main()
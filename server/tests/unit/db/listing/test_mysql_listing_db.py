@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import unittest
 from datetime import datetime
+from decimal import Decimal
 from unittest.mock import MagicMock
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
-from src.db import DBUtility
+from src.db import DBUtility, ListingCursor, ListingProjection, ListingQuery, ListingRow
 from src.domain_models import Listing
-from src.utils import DatabaseQueryError, ListingNotFoundError
+from src.utils import DatabaseQueryError, ListingNotFoundError, ValidationError
+from src.db.listing import LocationFacet, PriceBucketFacet
 from src.db.listing.mysql.mysql_listing_db import MySQLListingDB
 
 
@@ -88,6 +90,15 @@ class TestMySQLListingDB(unittest.TestCase):
         self.assertFalse(bool(out.is_sold))
         self.assertIsNone(out.sold_to_id)
 
+    def test_add_writes_canonical_location_key(self) -> None:
+        self.conn.execute.return_value.lastrowid = 1
+
+        self.sut.add(self._listing(location=" Winnipeg,  MB "))
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn(":location_key", str(sql))
+        self.assertEqual((params["location"], params["location_key"]), ("Winnipeg,  MB", "winnipeg mb"))
+
     def test_add_raises_database_query_error_on_integrity_error(self) -> None:
         listing = self._listing(title="X", description="Y", price=1.0)
         self.conn.execute.side_effect = IntegrityError(
@@ -328,6 +339,22 @@ class TestMySQLListingDB(unittest.TestCase):
         self.assertEqual(len(out), 1)
         self.assertIn("Win", out[0].location)
 
+    def test_get_unsold_by_location_matches_canonical_key_prefix(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = []
+
+        self.sut.get_unsold_by_location(" WINNIPEG, m")
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("location_key LIKE :key_prefix", str(sql))
+        self.assertNotIn("location LIKE", str(sql))
+        self.assertEqual(params, {"key_prefix": "winnipeg m%"})
+
+    def test_get_unsold_by_location_without_letters_or_digits_skips_query(self) -> None:
+        self.assertEqual(self.sut.get_unsold_by_location("%_%"), [])
+        self.assertEqual(self.sut.get_unsold_by_location_and_max_price("--", 5.0), [])
+
+        self.db_util.connect.assert_not_called()
+
     def test_get_unsold_by_location_raises_database_query_error_on_sqlalchemy_error(
         self,
     ) -> None:
@@ -397,6 +424,255 @@ class TestMySQLListingDB(unittest.TestCase):
         out = self.sut.get_unsold_by_location_and_max_price("Win", 25.0)
         self.assertEqual(len(out), 1)
         self.assertLessEqual(out[0].price, 25.0)
+        _, params = self.conn.execute.call_args.args
+        self.assertEqual(params, {"key_prefix": "win%", "max_price": 25.0})
+
+    # -----------------------------
+    # get_unsold_facets
+    # -----------------------------
+    def test_get_unsold_facets_folds_grouped_cells(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = [
+            {"location_key": "winnipeg", "location": "Winnipeg", "price_bucket": 0, "n": 2},
+            {"location_key": "winnipeg", "location": "WINNIPEG", "price_bucket": 6, "n": 1},
+            {"location_key": "brandon", "location": "Brandon", "price_bucket": 0, "n": 3},
+            {"location_key": None, "location": None, "price_bucket": 2, "n": 4},
+        ]
+
+        out = self.sut.get_unsold_facets()
+
+        sql = str(self.conn.execute.call_args.args[0])
+        self.assertIn("GROUP BY location_key, price_bucket", sql)
+        self.assertIn("WHEN price < 25.00 THEN 0", sql)
+        self.assertEqual(self.conn.execute.call_count, 1)
+        self.assertEqual(out.total, 10)
+        self.assertEqual(
+            out.locations,
+            (
+                LocationFacet(key="brandon", location="Brandon", count=3),
+                LocationFacet(key="winnipeg", location="WINNIPEG", count=3),
+            ),
+        )
+        self.assertEqual(len(out.price_buckets), 7)
+        self.assertEqual(out.price_buckets[0], PriceBucketFacet(min_price=0.0, max_price=25.0, count=5))
+        self.assertEqual(out.price_buckets[2].count, 4)
+        self.assertEqual(out.price_buckets[-1], PriceBucketFacet(min_price=1000.0, max_price=None, count=1))
+
+    def test_get_unsold_facets_on_empty_table_has_empty_buckets(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = []
+
+        out = self.sut.get_unsold_facets()
+
+        self.assertEqual((out.total, out.locations), (0, ()))
+        self.assertTrue(all(b.count == 0 for b in out.price_buckets))
+
+    def test_get_unsold_facets_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_unsold_facets()
+
+        self.assertEqual(ctx.exception.details["op"], "get_unsold_facets")
+
+    # -----------------------------
+    # query_rows
+    # -----------------------------
+    def _query_row(self, listing_id: int, price: str = "10.00") -> dict:
+        return {
+            "id": listing_id, "seller_id": 1, "title": f"Bike {listing_id}", "description": "d",
+            "image_url": None, "price": Decimal(price), "location": "Winnipeg",
+            "created_at": datetime(2026, 1, listing_id), "is_sold": 0,
+            "comment_count": 0, "offer_count": 0, "pending_offer_count": 0,
+        }
+
+    def test_query_rows_runs_the_compiled_plan_once(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = [self._query_row(1)]
+
+        page = self.sut.query_rows(ListingQuery.of(location="Winn", max_price=50.0, limit=5))
+
+        self.assertEqual(self.conn.execute.call_count, 1)
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("FORCE INDEX (idx_listing_unsold_location)", str(sql))
+        self.assertEqual(params["key_prefix"], "winn%")
+        self.assertEqual(params["limit"], 6)
+        self.assertEqual([row.id for row in page.rows], [1])
+        self.assertIsInstance(page.rows[0], ListingRow)
+        self.assertIsNone(page.next_cursor)
+
+    def test_query_rows_trims_the_probe_row_and_returns_a_cursor(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = [
+            self._query_row(3, "5.00"), self._query_row(2, "7.50"), self._query_row(1, "9.00"),
+        ]
+
+        page = self.sut.query_rows(ListingQuery.of(sort="price_asc", limit=2))
+
+        self.assertEqual([row.id for row in page.rows], [3, 2])
+        self.assertEqual(
+            ListingCursor.decode(page.next_cursor, "price_asc"),
+            ListingCursor(sort="price_asc", value=Decimal("7.50"), id=2),
+        )
+
+    def test_query_rows_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.query_rows(ListingQuery.of())
+
+        self.assertEqual(ctx.exception.details["op"], "query_rows")
+        self.assertEqual(ctx.exception.details["index"], "idx_listing_sold_created")
+
+    # -----------------------------
+    # get_seller_dashboard
+    # -----------------------------
+    def _dashboard_row(self, listing_id: int | None, pending: int = 0, rating: int | None = None) -> dict:
+        row = {"account_id": 1, "email": "s@x.com", "fname": "Sam", "lname": "Seller", "verified": 1,
+               "transaction_rating": rating}
+        if listing_id is None:
+            row.update(dict.fromkeys(self._query_row(1), None))
+        else:
+            row.update(self._query_row(listing_id), pending_offer_count=pending, offer_count=pending)
+        return row
+
+    def test_get_seller_dashboard_reads_listings_and_pending_offers_on_one_connection(self) -> None:
+        listings = MagicMock()
+        listings.mappings.return_value.all.return_value = [
+            self._dashboard_row(2, pending=1), self._dashboard_row(1, rating=4),
+        ]
+        offers = MagicMock()
+        offers.mappings.return_value.all.return_value = [{
+            "id": 30, "listing_id": 2, "sender_id": 5, "fname": "Bo", "lname": "Buyer",
+            "offered_price": Decimal("8.50"), "location_offered": None,
+            "created_date": datetime(2026, 2, 1), "seen": 0,
+        }]
+        self.conn.execute.side_effect = [listings, offers]
+
+        dashboard = self.sut.get_seller_dashboard(1)
+
+        self.assertEqual(self.db_util.connect.call_count, 1)
+        self.assertEqual(self.conn.execute.call_count, 2)
+        for call in self.conn.execute.call_args_list:
+            self.assertEqual(call.args[1], {"seller_id": 1})
+        self.assertEqual((dashboard.account_id, dashboard.fname, dashboard.verified), (1, "Sam", True))
+        self.assertEqual([(item.row.id, item.rating) for item in dashboard.listings], [(2, None), (1, 4)])
+        [offer] = dashboard.pending_offers
+        self.assertEqual((offer.id, offer.sender_fname, offer.offered_price, offer.seen), (30, "Bo", 8.5, False))
+        self.assertEqual((dashboard.rating_count, dashboard.rating_sum, dashboard.average_rating), (1, 4, 4.0))
+
+    def test_get_seller_dashboard_reads_offers_even_when_pending_offer_count_is_zero(self) -> None:
+        listings = MagicMock()
+        listings.mappings.return_value.all.return_value = [self._dashboard_row(1, pending=0)]
+        offers = MagicMock()
+        offers.mappings.return_value.all.return_value = [{
+            "id": 31, "listing_id": 1, "sender_id": 5, "fname": "Bo", "lname": "Buyer",
+            "offered_price": Decimal("3.00"), "location_offered": None,
+            "created_date": datetime(2026, 2, 1), "seen": 1,
+        }]
+        self.conn.execute.side_effect = [listings, offers]
+
+        dashboard = self.sut.get_seller_dashboard(1)
+
+        # pending_offer_count is denormalized and may drift; the offers come from the offer table
+        self.assertEqual(self.conn.execute.call_count, 2)
+        self.assertEqual([offer.id for offer in dashboard.pending_offers], [31])
+        self.assertIsNone(dashboard.average_rating)
+
+    def test_get_seller_dashboard_of_seller_without_listings(self) -> None:
+        listings = MagicMock()
+        listings.mappings.return_value.all.return_value = [self._dashboard_row(None)]
+        offers = MagicMock()
+        offers.mappings.return_value.all.return_value = []
+        self.conn.execute.side_effect = [listings, offers]
+
+        dashboard = self.sut.get_seller_dashboard(1)
+
+        self.assertEqual((dashboard.email, dashboard.listings, dashboard.pending_offers), ("s@x.com", (), ()))
+        self.assertEqual(self.conn.execute.call_count, 2)
+
+    def test_get_seller_dashboard_returns_none_for_missing_account(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = []
+
+        self.assertIsNone(self.sut.get_seller_dashboard(99))
+
+    def test_get_seller_dashboard_validates_seller_id(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.get_seller_dashboard("1")  # type: ignore[arg-type]
+
+        self.db_util.connect.assert_not_called()
+
+    def test_get_seller_dashboard_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_seller_dashboard(1)
+
+        self.assertEqual(ctx.exception.details["op"], "get_seller_dashboard")
+
+    # -----------------------------
+    # get_listing_detail
+    # -----------------------------
+    def _detail_row(self, comments: int = 0, rated: bool = False) -> dict:
+        row = self._query_row(3)
+        row.update(comment_count=comments, rating_id=None, rater_id=None, transaction_rating=None)
+        if rated:
+            row.update(rating_id=8, rater_id=5, transaction_rating=4)
+        return row
+
+    def test_get_listing_detail_reads_listing_and_comments_on_one_connection(self) -> None:
+        listing = MagicMock()
+        listing.mappings.return_value.first.return_value = self._detail_row(comments=1, rated=True)
+        comments = MagicMock()
+        comments.mappings.return_value.all.return_value = [{
+            "id": 40, "listing_id": 3, "author_id": 6, "fname": "Al", "lname": "Asker",
+            "body": "Still available?", "created_date": datetime(2026, 2, 1),
+        }]
+        self.conn.execute.side_effect = [listing, comments]
+
+        detail = self.sut.get_listing_detail(3)
+
+        self.assertEqual(self.db_util.connect.call_count, 1)
+        self.assertEqual(self.conn.execute.call_count, 2)
+        for call in self.conn.execute.call_args_list:
+            self.assertEqual(call.args[1], {"listing_id": 3})
+        self.assertEqual((detail.row.id, detail.row.comment_count), (3, 1))
+        self.assertEqual((detail.rating.id, detail.rating.rater_id, detail.rating.transaction_rating), (8, 5, 4))
+        [comment] = detail.comments
+        self.assertEqual((comment.id, comment.author_fname, comment.body), (40, "Al", "Still available?"))
+
+    def test_get_listing_detail_reads_comments_even_when_comment_count_is_zero(self) -> None:
+        listing = MagicMock()
+        listing.mappings.return_value.first.return_value = self._detail_row(comments=0)
+        comments = MagicMock()
+        comments.mappings.return_value.all.return_value = [{
+            "id": 41, "listing_id": 3, "author_id": 6, "fname": "Al", "lname": "Asker",
+            "body": "Drifted counter", "created_date": datetime(2026, 2, 1),
+        }]
+        self.conn.execute.side_effect = [listing, comments]
+
+        detail = self.sut.get_listing_detail(3)
+
+        # comment_count is denormalized and may drift; the comments come from the comment table
+        self.assertEqual(self.conn.execute.call_count, 2)
+        self.assertEqual([comment.id for comment in detail.comments], [41])
+        self.assertIsNone(detail.rating)
+
+    def test_get_listing_detail_returns_none_for_missing_listing(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.first.return_value = None
+
+        self.assertIsNone(self.sut.get_listing_detail(404))
+        self.assertEqual(self.conn.execute.call_count, 1)
+
+    def test_get_listing_detail_validates_listing_id(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.get_listing_detail("3")  # type: ignore[arg-type]
+
+        self.db_util.connect.assert_not_called()
+
+    def test_get_listing_detail_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_listing_detail(3)
+
+        self.assertEqual(ctx.exception.details["op"], "get_listing_detail")
 
     def test_get_unsold_by_location_and_max_price_raises_database_query_error_on_sqlalchemy_error(
         self,
@@ -502,6 +778,8 @@ class TestMySQLListingDB(unittest.TestCase):
 
         self.assertEqual(out, refreshed)
         self.db_util.transaction.assert_called_once()
+        _, params = self.conn.execute.call_args.args
+        self.assertEqual(params["location_key"], "winnipeg")
 
     def test_update_raises_listing_not_found_when_rowcount_zero(self) -> None:
         listing = self._listing(listing_id=999, title="X", description="Y", price=1.0)
@@ -596,6 +874,46 @@ class TestMySQLListingDB(unittest.TestCase):
         with self.assertRaises(DatabaseQueryError):
             self.sut.set_price(1, 9.99)
 
+    # -----------------------------
+    # reconcile_activity_counts
+    # -----------------------------
+    def test_reconcile_activity_counts_locks_chunk_then_fixes_drifted_rows(self) -> None:
+        locked, fixed = MagicMock(), MagicMock()
+        locked.all.return_value = [(11,), (12,), (15,)]
+        fixed.rowcount = 1
+        self.conn.execute.side_effect = [locked, fixed]
+
+        out = self.sut.reconcile_activity_counts(10, 3)
+
+        self.assertEqual(out, (1, 15))
+        self.db_util.transaction.assert_called_once()
+        (lock_sql, lock_params), (fix_sql, fix_params) = [c.args for c in self.conn.execute.call_args_list]
+        self.assertIn("FOR UPDATE", str(lock_sql))
+        self.assertEqual(lock_params, {"after_id": 10, "limit": 3})
+        self.assertIn("SUM(accepted IS NULL)", str(fix_sql))
+        self.assertIn("l.comment_count <> COALESCE(c.n, 0)", str(fix_sql))
+        self.assertEqual(fix_params, {"ids": [11, 12, 15]})
+
+    def test_reconcile_activity_counts_past_the_last_listing_returns_none(self) -> None:
+        self.conn.execute.return_value.all.return_value = []
+
+        self.assertEqual(self.sut.reconcile_activity_counts(99, 500), (0, None))
+        self.conn.execute.assert_called_once()
+
+    def test_reconcile_activity_counts_validates_limit(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.reconcile_activity_counts(0, 0)
+
+        self.db_util.transaction.assert_not_called()
+
+    def test_reconcile_activity_counts_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.reconcile_activity_counts(0, 10)
+
+        self.assertEqual(ctx.exception.details["op"], "reconcile_activity_counts")
+
     # -----------------------------
     # remove
     # -----------------------------
@@ -620,3 +938,247 @@ class TestMySQLListingDB(unittest.TestCase):
 
         with self.assertRaises(DatabaseQueryError):
             self.sut.remove(1)
+
+    # -----------------------------
+    # streaming reads (exports)
+    # -----------------------------
+    def _stream_rows(self, rows) -> None:
+        self.conn.execution_options.return_value = self.conn
+        exec_result = MagicMock()
+        exec_result.mappings.return_value = iter(rows)
+        self.conn.execute.return_value = exec_result
+
+    def _listing_row(self, listing_id: int, seller_id: int = 1) -> dict:
+        return {
+            "id": listing_id,
+            "seller_id": seller_id,
+            "title": f"T{listing_id}",
+            "description": "D",
+            "image_url": None,
+            "price": 5.0,
+            "location": None,
+            "created_at": datetime.utcnow(),
+            "is_sold": 0,
+            "sold_to_id": None,
+        }
+
+    def test_iter_all_streams_with_server_side_cursor(self) -> None:
+        self._stream_rows([self._listing_row(1), self._listing_row(2)])
+
+        out = self.sut.iter_all()
+
+        # lazy: nothing runs until the iterator is consumed
+        self.db_util.connect.assert_not_called()
+
+        listings = list(out)
+        self.assertEqual([l.id for l in listings], [1, 2])
+        self.conn.execution_options.assert_called_once_with(
+            stream_results=True, yield_per=MySQLListingDB.STREAM_BATCH_SIZE
+        )
+
+    def test_iter_by_seller_id_binds_seller_and_maps_rows(self) -> None:
+        self._stream_rows([self._listing_row(3, seller_id=7)])
+
+        listings = list(self.sut.iter_by_seller_id(7))
+
+        self.assertEqual(listings[0].seller_id, 7)
+        _, params = self.conn.execute.call_args[0]
+        self.assertEqual(params, {"seller_id": 7})
+
+    def test_iter_by_seller_id_validates_eagerly(self) -> None:
+        from src.utils import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.sut.iter_by_seller_id("nope")  # type: ignore[arg-type]
+        self.db_util.connect.assert_not_called()
+
+    def test_iter_all_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execution_options.return_value = self.conn
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError):
+            list(self.sut.iter_all())
+
+    # -----------------------------
+    # read projections (get_all_rows / get_rows_by_seller_id)
+    # -----------------------------
+    def test_get_all_rows_returns_listing_rows(self) -> None:
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": 1,
+                "seller_id": 1,
+                "title": "A",
+                "description": "DA",
+                "image_url": None,
+                "price": Decimal("1.50"),
+                "location": None,
+                "created_at": now,
+                "is_sold": 0,
+                "comment_count": 3,
+                "offer_count": 5,
+                "pending_offer_count": 2,
+            },
+        ]
+
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.all.return_value = rows
+        self.conn.execute.return_value = exec_result
+
+        out = self.sut.get_all_rows()
+
+        self.assertEqual(
+            out,
+            [ListingRow(
+                id=1,
+                seller_id=1,
+                title="A",
+                description="DA",
+                price=1.5,
+                image_url=None,
+                location=None,
+                created_at=now,
+                is_sold=False,
+                comment_count=3,
+                offer_count=5,
+                pending_offer_count=2,
+            )],
+        )
+        self.assertIsInstance(out[0].price, float)
+        self.assertIs(out[0].is_sold, False)
+        self.db_util.connect.assert_called_once()
+
+    def test_get_all_rows_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_all_rows()
+
+        self.assertEqual(ctx.exception.details["op"], "get_all_rows")
+
+    def test_get_rows_by_seller_id_passes_seller_id(self) -> None:
+        rows = [
+            {
+                "id": 10,
+                "seller_id": 7,
+                "title": "X",
+                "description": "DX",
+                "image_url": "listings/x.png",
+                "price": 3.0,
+                "location": "Winnipeg",
+                "created_at": None,
+                "is_sold": 1,
+                "comment_count": 4,
+                "offer_count": 2,
+                "pending_offer_count": 1,
+            }
+        ]
+
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.all.return_value = rows
+        self.conn.execute.return_value = exec_result
+
+        out = self.sut.get_rows_by_seller_id(7)
+
+        self.assertEqual(len(out), 1)
+        self.assertEqual(out[0].seller_id, 7)
+        self.assertEqual(out[0].image_url, "listings/x.png")
+        self.assertIs(out[0].is_sold, True)
+        _, params = self.conn.execute.call_args.args
+        self.assertEqual(params, {"seller_id": 7})
+
+    def test_get_rows_by_seller_id_validates_seller_id(self) -> None:
+        from src.utils import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.sut.get_rows_by_seller_id("7")  # type: ignore[arg-type]
+
+        self.db_util.connect.assert_not_called()
+
+    def test_get_rows_by_seller_id_raises_database_query_error_on_sqlalchemy_error(
+        self,
+    ) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_rows_by_seller_id(1)
+
+        self.assertEqual(ctx.exception.details["op"], "get_rows_by_seller_id")
+
+    # -----------------------------
+    # sparse projections (get_all_projected / get_projected_by_seller_id)
+    # -----------------------------
+    def test_get_all_projected_selects_only_requested_columns(self) -> None:
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.all.return_value = [
+            {"id": 1, "title": "A", "price": Decimal("1.50")},
+        ]
+        self.conn.execute.return_value = exec_result
+
+        out = self.sut.get_all_projected(ListingProjection.of(["title", "price"]))
+
+        self.assertEqual(out, [{"id": 1, "title": "A", "price": 1.5}])
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("SELECT id, title, price", str(sql))
+        self.assertNotIn("description", str(sql))
+        self.assertEqual(params, {})
+        self.db_util.connect.assert_called_once()
+
+    def test_get_all_projected_truncates_description_in_sql(self) -> None:
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.all.return_value = []
+        self.conn.execute.return_value = exec_result
+
+        self.sut.get_all_projected(ListingProjection.summary(["description"]))
+
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("LEFT(description, :description_chars) AS description", str(sql))
+        self.assertEqual(params, {"description_chars": ListingProjection.SUMMARY_DESCRIPTION_CHARS})
+
+    def test_get_all_projected_rejects_unknown_columns_before_querying(self) -> None:
+        from src.utils import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.sut.get_all_projected(ListingProjection(fields=("id", "1; DROP TABLE listing")))
+        with self.assertRaises(ValidationError):
+            self.sut.get_all_projected(ListingProjection(fields=()))
+
+        self.db_util.connect.assert_not_called()
+
+    def test_get_all_projected_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_all_projected(ListingProjection.summary())
+
+        self.assertEqual(ctx.exception.details["op"], "get_all_projected")
+
+    def test_get_projected_by_seller_id_binds_seller_and_converts_flags(self) -> None:
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.all.return_value = [{"id": 10, "is_sold": 1}]
+        self.conn.execute.return_value = exec_result
+
+        out = self.sut.get_projected_by_seller_id(7, ListingProjection.summary(["is_sold"]))
+
+        self.assertEqual(out, [{"id": 10, "is_sold": True}])
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("WHERE seller_id = :seller_id", str(sql))
+        self.assertEqual(params, {"seller_id": 7})
+
+    def test_get_projected_by_seller_id_validates_seller_id(self) -> None:
+        from src.utils import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.sut.get_projected_by_seller_id("7", ListingProjection())  # type: ignore[arg-type]
+
+        self.db_util.connect.assert_not_called()
+
+    def test_get_projected_by_seller_id_raises_database_query_error_on_sqlalchemy_error(
+        self,
+    ) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_projected_by_seller_id(1, ListingProjection())
+
+        self.assertEqual(ctx.exception.details["op"], "get_projected_by_seller_id")
@@ -8,7 +8,9 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.db import DBUtility
 from src.domain_models import Offer
-from src.utils import DatabaseQueryError, OfferNotFoundError
+from src.db.utils.transaction_retry import TransactionRetrier
+from src.utils import DatabaseConflictError, DatabaseQueryError, OfferNotFoundError, ValidationError
+from src.db.offer import OfferCounts
 from src.db.offer.mysql.mysql_offer_db import MySQLOfferDB
 
 
@@ -87,12 +89,23 @@ class TestMySQLOfferDB(unittest.TestCase):
         out = self.sut.add(offer)
 
         self.db_util.transaction.assert_called_once()
-        self.conn.execute.assert_called_once()
+        self.assertEqual(self.conn.execute.call_count, 2)
         self.assertEqual(out.id, 42)
         self.assertEqual(out.listing_id, 1)
         self.assertEqual(out.sender_id, 2)
         self.assertEqual(out.offered_price, 75.0)
 
+    def test_add_counts_the_offer_on_its_listing_before_inserting(self) -> None:
+        self.conn.execute.return_value.lastrowid = 42
+
+        self.sut.add(self._offer(listing_id=1))
+
+        (count_sql, count_params), (insert_sql, _) = [c.args for c in self.conn.execute.call_args_list]
+        self.assertIn("UPDATE listing", str(count_sql))
+        self.assertIn("offer_count = offer_count + 1", str(count_sql))
+        self.assertEqual(count_params, {"listing_id": 1, "pending": 1})
+        self.assertIn("INSERT INTO offer", str(insert_sql))
+
     def test_add_raises_database_query_error_on_integrity_error(self) -> None:
         offer = self._offer()
         self.conn.execute.side_effect = IntegrityError("stmt", {}, Exception("fk"))
@@ -376,37 +389,107 @@ class TestMySQLOfferDB(unittest.TestCase):
         with self.assertRaises(DatabaseQueryError):
             self.sut.set_seen(1)
 
+    # -----------------------------
+    # set_seen_many
+    # -----------------------------
+    def test_set_seen_many_joins_listing_on_seller_in_lock_and_update(self) -> None:
+        select_result = MagicMock()
+        select_result.mappings.return_value.all.return_value = [
+            self._row(offer_id=4, listing_id=1, sender_id=7),
+            self._row(offer_id=9, listing_id=2, sender_id=8),
+        ]
+        self.conn.execute.side_effect = [select_result, MagicMock()]
+
+        out = self.sut.set_seen_many(3, [4, 9, 12])
+
+        self.db_util.transaction.assert_called_once()
+        select_sql, select_params = self.conn.execute.call_args_list[0].args
+        update_sql, update_params = self.conn.execute.call_args_list[1].args
+        self.assertIn("FOR UPDATE", str(select_sql))
+        for sql in (select_sql, update_sql):
+            self.assertIn("JOIN listing l ON l.id = o.listing_id", str(sql))
+            self.assertIn("l.seller_id = :seller_id AND o.seen = FALSE", str(sql))
+        self.assertTrue(str(update_sql).strip().startswith("UPDATE offer o"))
+        self.assertEqual(select_params, {"seller_id": 3, "offer_ids": [4, 9, 12]})
+        self.assertEqual(update_params, select_params)
+        self.assertEqual([(o.id, o.sender_id, o.seen) for o in out], [(4, 7, True), (9, 8, True)])
+
+    def test_set_seen_many_without_offer_ids_marks_all_unseen_of_the_seller(self) -> None:
+        select_result = MagicMock()
+        select_result.mappings.return_value.all.return_value = [self._row(offer_id=4)]
+        self.conn.execute.side_effect = [select_result, MagicMock()]
+
+        self.sut.set_seen_many(3)
+
+        for call in self.conn.execute.call_args_list:
+            sql, params = call.args
+            self.assertNotIn(":offer_ids", str(sql))
+            self.assertEqual(params, {"seller_id": 3})
+
+    def test_set_seen_many_skips_update_when_nothing_matches(self) -> None:
+        select_result = MagicMock()
+        select_result.mappings.return_value.all.return_value = []
+        self.conn.execute.return_value = select_result
+
+        self.assertEqual(self.sut.set_seen_many(3, [5]), [])
+        self.conn.execute.assert_called_once()
+
+    def test_set_seen_many_with_empty_ids_issues_no_statement(self) -> None:
+        self.assertEqual(self.sut.set_seen_many(3, []), [])
+        self.db_util.transaction.assert_not_called()
+
+    def test_set_seen_many_raises_validation_error_for_bad_ids(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.set_seen_many(None)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.sut.set_seen_many(3, ["x"])  # type: ignore[list-item]
+
+    def test_set_seen_many_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError):
+            self.sut.set_seen_many(3, [1])
+
     # -----------------------------
     # set_accepted
     # -----------------------------
     def test_set_accepted_true_updates_when_row_exists(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 1
-        self.conn.execute.return_value = exec_result
+        self._locked_offer(listing_id=10, accepted=None)
 
         self.sut.set_accepted(1, True)
 
         self.db_util.transaction.assert_called_once()
-        self.conn.execute.assert_called_once()
+        lock_sql, update_sql, count_sql = [c.args[0] for c in self.conn.execute.call_args_list]
+        self.assertIn("FOR UPDATE", str(lock_sql))
+        self.assertEqual(self.conn.execute.call_args_list[1].args[1], {"id": 1, "accepted": True})
+        self.assertIn("pending_offer_count = GREATEST(pending_offer_count, 1) - 1", str(count_sql))
 
     def test_set_accepted_false_updates_when_row_exists(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 1
-        self.conn.execute.return_value = exec_result
+        self._locked_offer(listing_id=10, accepted=None)
 
         self.sut.set_accepted(1, False)
 
         self.db_util.transaction.assert_called_once()
-        self.conn.execute.assert_called_once()
+        lock_sql, update_sql, count_sql = [c.args[0] for c in self.conn.execute.call_args_list]
+        self.assertIn("FOR UPDATE", str(lock_sql))
+        self.assertEqual(self.conn.execute.call_args_list[1].args[1], {"id": 1, "accepted": False})
+        self.assertIn("pending_offer_count = GREATEST(pending_offer_count, 1) - 1", str(count_sql))
 
-    def test_set_accepted_raises_offer_not_found_when_rowcount_zero(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 0
-        self.conn.execute.return_value = exec_result
+    def test_set_accepted_on_a_decided_offer_leaves_pending_count(self) -> None:
+        self._locked_offer(listing_id=10, accepted=False)
+
+        self.sut.set_accepted(1, True)
+
+        self.assertEqual(self.conn.execute.call_count, 2)
+
+    def test_set_accepted_raises_offer_not_found_when_missing(self) -> None:
+        self._locked_offer(None)
 
         with self.assertRaises(OfferNotFoundError):
             self.sut.set_accepted(999, True)
 
+        self.conn.execute.assert_called_once()
+
     def test_set_accepted_raises_database_query_error_on_sqlalchemy_error(
         self,
     ) -> None:
@@ -418,24 +501,137 @@ class TestMySQLOfferDB(unittest.TestCase):
     # -----------------------------
     # remove
     # -----------------------------
+    def _locked_offer(self, listing_id: int | None, accepted: bool | None = None) -> None:
+        row = None if listing_id is None else {"listing_id": listing_id, "accepted": accepted}
+        self.conn.execute.return_value.mappings.return_value.first.return_value = row
+
     def test_remove_returns_true_when_deleted(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 1
-        self.conn.execute.return_value = exec_result
+        self._locked_offer(listing_id=10, accepted=None)
 
         out = self.sut.remove(1)
         self.assertTrue(out)
 
+        _, delete_call, count_call = self.conn.execute.call_args_list
+        self.assertIn("DELETE FROM offer", str(delete_call.args[0]))
+        self.assertIn("offer_count = GREATEST(offer_count, 1) - 1", str(count_call.args[0]))
+        self.assertEqual(count_call.args[1], {"listing_id": 10, "pending": 1})
+
+    def test_remove_of_a_decided_offer_keeps_pending_count(self) -> None:
+        self._locked_offer(listing_id=10, accepted=True)
+
+        self.sut.remove(1)
+
+        self.assertEqual(self.conn.execute.call_args_list[-1].args[1], {"listing_id": 10, "pending": 0})
+
     def test_remove_returns_false_when_missing(self) -> None:
-        exec_result = MagicMock()
-        exec_result.rowcount = 0
-        self.conn.execute.return_value = exec_result
+        self._locked_offer(None)
 
         out = self.sut.remove(999)
         self.assertFalse(out)
+        self.conn.execute.assert_called_once()
 
     def test_remove_raises_database_query_error_on_sqlalchemy_error(self) -> None:
         self.conn.execute.side_effect = SQLAlchemyError("fail")
 
         with self.assertRaises(DatabaseQueryError):
             self.sut.remove(1)
+
+    # -----------------------------
+    # streaming reads (exports)
+    # -----------------------------
+    def _stream_rows(self, rows) -> None:
+        self.conn.execution_options.return_value = self.conn
+        exec_result = MagicMock()
+        exec_result.mappings.return_value = iter(rows)
+        self.conn.execute.return_value = exec_result
+
+    def test_iter_by_sender_id_streams_with_server_side_cursor(self) -> None:
+        self._stream_rows([self._row(offer_id=1), self._row(offer_id=2)])
+
+        offers = list(self.sut.iter_by_sender_id(2))
+
+        self.assertEqual([o.id for o in offers], [1, 2])
+        self.conn.execution_options.assert_called_once_with(
+            stream_results=True, yield_per=MySQLOfferDB.STREAM_BATCH_SIZE
+        )
+        _, params = self.conn.execute.call_args[0]
+        self.assertEqual(params, {"sender_id": 2})
+
+    def test_iter_by_listing_ids_uses_single_in_query(self) -> None:
+        self._stream_rows([self._row(offer_id=5, listing_id=10), self._row(offer_id=6, listing_id=11)])
+
+        offers = list(self.sut.iter_by_listing_ids([10, 11]))
+
+        self.assertEqual([o.listing_id for o in offers], [10, 11])
+        self.conn.execute.assert_called_once()
+        _, params = self.conn.execute.call_args[0]
+        self.assertEqual(params, {"listing_ids": [10, 11]})
+
+    def test_iter_by_listing_ids_empty_issues_no_query(self) -> None:
+        self.assertEqual(list(self.sut.iter_by_listing_ids([])), [])
+        self.db_util.connect.assert_not_called()
+
+    def test_iter_by_listing_ids_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execution_options.return_value = self.conn
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError):
+            list(self.sut.iter_by_listing_ids([1]))
+
+    def test_set_accepted_is_retried_after_a_lock_conflict(self) -> None:
+        self._locked_offer(listing_id=10, accepted=True)
+        self.tx_cm.__enter__.side_effect = [
+            DatabaseConflictError("Transaction was rolled back by a lock conflict."),
+            self.conn,
+        ]
+        TransactionRetrier._instance = TransactionRetrier(sleep=lambda seconds: None)
+        self.addCleanup(TransactionRetrier.reset)
+
+        self.sut.set_accepted(1, True)
+
+        self.assertEqual(self.db_util.transaction.call_count, 2)
+        self.assertEqual(self.conn.execute.call_count, 2)
+
+
+    # -----------------------------
+    # count_by_state
+    # -----------------------------
+    def test_count_by_state_returns_counts_from_one_statement(self) -> None:
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.one.return_value = {
+            "unseen": 3, "pending": 2, "sent_pending": 1,
+        }
+        self.conn.execute.return_value = exec_result
+
+        counts = self.sut.count_by_state(2)
+
+        self.assertEqual(counts, OfferCounts(unseen=3, pending=2, sent_pending=1))
+        self.conn.execute.assert_called_once()
+        sql, params = self.conn.execute.call_args[0]
+        self.assertEqual(params, {"account_id": 2})
+        self.assertIn("JOIN offer o ON o.listing_id = l.id", str(sql))
+        self.assertIn("WHERE l.seller_id = :account_id", str(sql))
+        self.assertNotIn("IN :", str(sql))
+
+    def test_count_by_state_with_no_listings_still_counts_sent(self) -> None:
+        exec_result = MagicMock()
+        exec_result.mappings.return_value.one.return_value = {
+            "unseen": 0, "pending": 0, "sent_pending": 4,
+        }
+        self.conn.execute.return_value = exec_result
+
+        self.assertEqual(self.sut.count_by_state(2).sent_pending, 4)
+
+    def test_count_by_state_validates_ids(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.count_by_state("x")
+        with self.assertRaises(ValidationError):
+            self.sut.count_by_state(None)
+        self.db_util.connect.assert_not_called()
+
+    def test_count_by_state_raises_database_query_error_on_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("fail")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.count_by_state(2)
+        self.assertEqual(ctx.exception.details, {"op": "count_by_state", "table": "offer"})
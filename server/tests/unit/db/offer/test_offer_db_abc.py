@@ -36,9 +36,21 @@ class _OfferDBCoverageShim(OfferDB):
     def get_by_sender_and_listing(self, sender_id: int, listing_id: int):
         return OfferDB.get_by_sender_and_listing(self, sender_id, listing_id)
 
+    def iter_by_sender_id(self, sender_id: int):
+        return OfferDB.iter_by_sender_id(self, sender_id)
+
+    def iter_by_listing_ids(self, listing_ids):
+        return OfferDB.iter_by_listing_ids(self, listing_ids)
+
+    def count_by_state(self, account_id: int):
+        return OfferDB.count_by_state(self, account_id)
+
     def set_seen(self, offer_id: int) -> None:
         return OfferDB.set_seen(self, offer_id)
 
+    def set_seen_many(self, seller_id, offer_ids=None):
+        return OfferDB.set_seen_many(self, seller_id, offer_ids)
+
     def set_accepted(self, offer_id: int, accepted: bool) -> None:
         return OfferDB.set_accepted(self, offer_id, accepted)
 
@@ -106,6 +118,10 @@ class TestOfferDBABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.get_by_sender_and_listing(2, 1)
 
+    def test_count_by_state_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.count_by_state(2)
+
     # -----------------------------
     # UPDATE
     # -----------------------------
@@ -113,6 +129,10 @@ class TestOfferDBABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.set_seen(1)
 
+    def test_set_seen_many_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.set_seen_many(1, [2])
+
     def test_set_accepted_true_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.set_accepted(1, True)
@@ -127,3 +147,11 @@ class TestOfferDBABC(unittest.TestCase):
     def test_remove_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.remove(1)
+
+    def test_iter_by_sender_id_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.iter_by_sender_id(1)
+
+    def test_iter_by_listing_ids_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.iter_by_listing_ids([1])
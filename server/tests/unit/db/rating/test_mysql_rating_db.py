@@ -249,6 +249,38 @@ class TestMySQLRatingDBUnit(unittest.TestCase):
 
         self.assertIsNone(out)
 
+    def test_get_by_listing_ids_runs_one_in_query(self) -> None:
+        rows = [self._sample_row(rating_id=1, listing_id=20), self._sample_row(rating_id=2, listing_id=21)]
+        conn = MagicMock()
+        conn.execute.return_value = self._make_mapping_result(all_rows=rows)
+        self.db.connect.return_value = self._mock_connect_ctx(conn)
+
+        out = self.repo.get_by_listing_ids([20, 21, 22])
+
+        conn.execute.assert_called_once()
+        sql, params = conn.execute.call_args.args
+        self.assertIn("listing_id IN", str(sql))
+        self.assertEqual(params, {"listing_ids": [20, 21, 22]})
+        self.assertEqual([(r.id, r.listing_id) for r in out], [(1, 20), (2, 21)])
+
+    def test_get_by_listing_ids_empty_issues_no_query(self) -> None:
+        self.assertEqual(self.repo.get_by_listing_ids([]), [])
+        self.db.connect.assert_not_called()
+
+    def test_get_by_listing_ids_validates_ids(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.repo.get_by_listing_ids(None)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.repo.get_by_listing_ids([1, "x"])  # type: ignore[list-item]
+
+    def test_get_by_listing_ids_wraps_sqlalchemy_error(self) -> None:
+        conn = MagicMock()
+        conn.execute.side_effect = SQLAlchemyError("fail")
+        self.db.connect.return_value = self._mock_connect_ctx(conn)
+
+        with self.assertRaises(DatabaseQueryError):
+            self.repo.get_by_listing_ids([1])
+
     @patch("src.db.rating.mysql.mysql_rating_db.RatingMapper.from_mapping")
     def test_get_by_rater_id_returns_list(self, mock_from_mapping: MagicMock) -> None:
         rows = [self._sample_row(rating_id=1), self._sample_row(rating_id=2)]
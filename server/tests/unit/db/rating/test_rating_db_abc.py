@@ -39,6 +39,9 @@ class _RatingDBCoverageShim(RatingDB):
     def get_by_id(self, rating_id: int) -> Rating | None:
         return RatingDB.get_by_id(self, rating_id)
 
+    def get_by_listing_ids(self, listing_ids):
+        return RatingDB.get_by_listing_ids(self, listing_ids)
+
     def get_all(self):
         return RatingDB.get_all(self)
 
@@ -117,6 +120,10 @@ class TestRatingDBABC(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.sut.get_by_listing_id(1)
 
+    def test_get_by_listing_ids_raises_not_implemented_error(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            self.sut.get_by_listing_ids([1])
+
     def test_get_by_rater_id_raises_not_implemented_error(self) -> None:
         with self.assertRaises(NotImplementedError):
             self.sut.get_by_rater_id(2)
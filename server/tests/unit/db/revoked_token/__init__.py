@@ -0,0 +1 @@
+from .test_revoked_token_db import TestRevokedTokenDB
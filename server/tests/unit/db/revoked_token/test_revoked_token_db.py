@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import DBUtility
+from src.db.revoked_token import RevokedToken, RevokedTokenDB
+from src.db.revoked_token.mysql import MySQLRevokedTokenDB
+from src.utils import DatabaseQueryError, ValidationError
+
+
+class _RevokedTokenDBCoverageShim(RevokedTokenDB):
+    def add(self, token_hash: str, account_id: int, expires_at: datetime) -> None:
+        return RevokedTokenDB.add(self, token_hash, account_id, expires_at)
+
+    def get_active_since(self, after_id: int, limit: int = 1000):
+        return RevokedTokenDB.get_active_since(self, after_id, limit)
+
+
+class TestRevokedTokenDB(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db_util: MagicMock = MagicMock(spec=DBUtility)
+        self.sut = MySQLRevokedTokenDB(self.db_util)
+
+        self.conn: MagicMock = MagicMock()
+        self.connect_cm: MagicMock = MagicMock()
+        self.connect_cm.__enter__.return_value = self.conn
+        self.connect_cm.__exit__.return_value = False
+        self.tx_cm: MagicMock = MagicMock()
+        self.tx_cm.__enter__.return_value = self.conn
+        self.tx_cm.__exit__.return_value = False
+        self.db_util.connect.return_value = self.connect_cm
+        self.db_util.transaction.return_value = self.tx_cm
+
+        self.expires_at = datetime(2026, 11, 1, 12, 0, 0)
+
+    # -----------------------------
+    # ABC
+    # -----------------------------
+    def test_abc_base_bodies_return_none(self) -> None:
+        shim = _RevokedTokenDBCoverageShim(self.db_util)
+        self.assertIs(shim._db, self.db_util)
+        self.assertIsNone(shim.add("a" * 64, 1, self.expires_at))
+        self.assertIsNone(shim.get_active_since(0))
+
+    # -----------------------------
+    # add
+    # -----------------------------
+    def test_add_inserts_ignoring_duplicates(self) -> None:
+        self.sut.add("a" * 64, 7, self.expires_at)
+
+        self.db_util.transaction.assert_called_once()
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("INSERT IGNORE INTO revoked_token", str(sql))
+        self.assertEqual(
+            params, {"token_hash": "a" * 64, "account_id": 7, "expires_at": self.expires_at}
+        )
+
+    def test_add_validates_arguments(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.add("", 7, self.expires_at)
+        with self.assertRaises(ValidationError):
+            self.sut.add("a" * 64, "7", self.expires_at)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.sut.add("a" * 64, 7, None)  # type: ignore[arg-type]
+        self.conn.execute.assert_not_called()
+
+    def test_add_wraps_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.add("a" * 64, 7, self.expires_at)
+
+        self.assertEqual(ctx.exception.details, {"op": "add", "table": "revoked_token"})
+
+    # -----------------------------
+    # get_active_since
+    # -----------------------------
+    def test_get_active_since_maps_rows(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = [
+            {"id": 3, "token_hash": "b" * 64, "account_id": 9, "expires_at": self.expires_at},
+        ]
+
+        out = self.sut.get_active_since(2, limit=10)
+
+        self.assertEqual(out, [RevokedToken(3, "b" * 64, 9, self.expires_at)])
+        sql, params = self.conn.execute.call_args.args
+        self.assertIn("id > :after_id", str(sql))
+        self.assertIn("expires_at > UTC_TIMESTAMP()", str(sql))
+        self.assertIn("ORDER BY id", str(sql))
+        self.assertEqual(params, {"after_id": 2, "limit": 10})
+
+    def test_get_active_since_empty(self) -> None:
+        self.conn.execute.return_value.mappings.return_value.all.return_value = []
+        self.assertEqual(self.sut.get_active_since(0), [])
+
+    def test_get_active_since_validates_arguments(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.sut.get_active_since(None)  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            self.sut.get_active_since(0, limit=0)
+
+    def test_get_active_since_wraps_sqlalchemy_error(self) -> None:
+        self.conn.execute.side_effect = SQLAlchemyError("boom")
+
+        with self.assertRaises(DatabaseQueryError) as ctx:
+            self.sut.get_active_since(0)
+
+        self.assertEqual(ctx.exception.details, {"op": "get_active_since", "table": "revoked_token"})
+
+
+if __name__ == "__main__":
+    unittest.main()
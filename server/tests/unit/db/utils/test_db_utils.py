@@ -5,7 +5,13 @@ from unittest.mock import MagicMock, patch
 
 from sqlalchemy.exc import OperationalError
 
-from src.utils import DatabaseUnavailableError, ConfigurationError
+from src.utils import (
+    DatabaseConflictError,
+    DatabaseUnavailableError,
+    ConfigurationError,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
 from src.db.utils.db_utils import DBUtility
 
 
@@ -15,9 +21,11 @@ PATCH_TARGET = "src.db.utils.db_utils.create_engine"
 class TestDBUtility(unittest.TestCase):
     def setUp(self) -> None:
         DBUtility.reset()
+        CircuitBreakerRegistry.reset()
 
     def tearDown(self) -> None:
         DBUtility.reset()
+        CircuitBreakerRegistry.reset()
 
     def _make_operational_error(self) -> OperationalError:
         return OperationalError("SELECT 1", {}, Exception("db down"))
@@ -272,3 +280,163 @@ class TestDBUtility(unittest.TestCase):
             self.assertIs(dbu.engine, fake_engine)
             self.assertEqual(dbu.database, "marketplace")
             self.assertEqual(dbu.url_database, "marketplace")
+
+    def test_pool_capacity_is_pool_size_plus_overflow(self) -> None:
+        with patch(PATCH_TARGET):
+            dbu = DBUtility(
+                host="localhost",
+                port=3306,
+                database="marketplace",
+                username="root",
+                password="pass",
+                pool_size=4,
+                max_overflow=6,
+            )
+
+            self.assertEqual(dbu.pool_capacity, 10)
+
+    # -----------------------------
+    # circuit breaker
+    # -----------------------------
+    def _dbu_with_breaker(self, fake_engine: MagicMock, **kwargs) -> DBUtility:
+        return DBUtility(
+            host="localhost",
+            port=3306,
+            database="marketplace",
+            username="root",
+            password="pass",
+            circuit_breaker=CircuitBreaker(
+                "mysql",
+                lambda: DatabaseUnavailableError("open", details={"circuit": "open"}),
+                failure_threshold=2,
+                probe_interval_seconds=60,
+            ),
+            **kwargs,
+        )
+
+    def test_checkout_failures_open_the_circuit_and_fail_fast(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            fake_engine.connect.return_value.__enter__.side_effect = self._make_operational_error()
+            dbu = self._dbu_with_breaker(fake_engine)
+
+            for _ in range(2):
+                with self.assertRaises(DatabaseUnavailableError):
+                    with dbu.connect():
+                        pass
+            fake_engine.connect.reset_mock()
+
+            with self.assertRaises(DatabaseUnavailableError) as ctx:
+                with dbu.transaction():
+                    pass
+
+            self.assertEqual(ctx.exception.details, {"circuit": "open"})
+            fake_engine.connect.assert_not_called()
+            fake_engine.begin.assert_not_called()
+            self.assertEqual(dbu.circuit_breaker.state, "open")
+
+    def test_operational_error_inside_the_block_does_not_count(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            fake_engine.begin.return_value.__exit__.return_value = False
+            dbu = self._dbu_with_breaker(fake_engine)
+
+            for _ in range(3):
+                with self.assertRaises(DatabaseUnavailableError):
+                    with dbu.transaction():
+                        raise self._make_operational_error()  # e.g. lock wait timeout
+
+            self.assertEqual(dbu.circuit_breaker.state, "closed")
+            self.assertEqual(dbu.circuit_breaker.stats()["consecutive_failures"], 0)
+
+    def test_default_breaker_is_the_shared_mysql_breaker(self) -> None:
+        with patch(PATCH_TARGET):
+            dbu = DBUtility(
+                host="localhost",
+                port=3306,
+                database="marketplace",
+                username="root",
+                password="pass",
+            )
+
+        self.assertIs(dbu.circuit_breaker, CircuitBreakerRegistry.instance().breaker("mysql", None))
+
+    def test_deadlock_inside_transaction_raises_conflict_error(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            fake_engine.begin.return_value.__exit__.return_value = False
+            dbu = self._dbu_with_breaker(fake_engine)
+            deadlock = OperationalError("UPDATE offer", {}, Exception(1213, "Deadlock found"))
+
+            with self.assertRaises(DatabaseConflictError) as ctx:
+                with dbu.transaction():
+                    raise deadlock
+
+            self.assertIs(ctx.exception.__cause__, deadlock)
+            self.assertEqual(ctx.exception.details, {"mysql_error": 1213})
+            self.assertEqual(dbu.circuit_breaker.stats()["consecutive_failures"], 0)
+
+    def test_lock_wait_timeout_on_connect_raises_conflict_error(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            fake_engine.connect.return_value.__exit__.return_value = False
+            dbu = self._dbu_with_breaker(fake_engine)
+
+            with self.assertRaises(DatabaseConflictError):
+                with dbu.connect():
+                    raise OperationalError("SELECT ... FOR UPDATE", {}, Exception(1205, "Lock wait timeout"))
+
+
+    # -----------------------------
+    # startup warm-up / readiness
+    # -----------------------------
+    def test_prewarm_opens_pool_size_connections_and_returns_them(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            connections = [MagicMock(name=f"conn{i}") for i in range(3)]
+            fake_engine.connect.side_effect = connections
+            dbu = self._dbu_with_breaker(fake_engine, pool_size=3)
+
+            self.assertEqual(dbu.prewarm(), 3)
+
+            self.assertEqual(dbu.pool_size, 3)
+            for conn in connections:
+                conn.close.assert_called_once_with()
+
+    def test_prewarm_stops_at_first_failure_and_counts_it(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            fake_engine.connect.side_effect = self._make_operational_error()
+            dbu = self._dbu_with_breaker(fake_engine)
+
+            self.assertEqual(dbu.prewarm(), 0)
+
+            self.assertEqual(fake_engine.connect.call_count, 1)
+            self.assertEqual(dbu.circuit_breaker.stats()["consecutive_failures"], 1)
+
+    def test_ping_runs_select_1(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            conn = fake_engine.connect.return_value.__enter__.return_value
+            dbu = self._dbu_with_breaker(fake_engine)
+
+            dbu.ping()
+
+            self.assertEqual(str(conn.execute.call_args.args[0]), "SELECT 1")
+
+    def test_ping_raises_database_unavailable_when_unreachable(self) -> None:
+        with patch(PATCH_TARGET) as create_engine_mock:
+            fake_engine = MagicMock()
+            create_engine_mock.return_value = fake_engine
+            fake_engine.connect.return_value.__enter__.side_effect = self._make_operational_error()
+            dbu = self._dbu_with_breaker(fake_engine)
+
+            with self.assertRaises(DatabaseUnavailableError):
+                dbu.ping()
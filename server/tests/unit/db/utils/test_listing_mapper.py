@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import unittest
+import datetime
+from decimal import Decimal
+
+from src.db import LISTING_ROW_FIELDS, ListingMapper, ListingProjection, ListingRow
+from src.utils import ValidationError
+
+
+class TestListingMapper(unittest.TestCase):
+    def test_row_from_mapping_maps_all_fields(self) -> None:
+        created = datetime.datetime(2026, 3, 4, 12, 0, 0)
+
+        row = {
+            "id": 10,
+            "seller_id": 7,
+            "title": "Bike",
+            "description": "Nice bike",
+            "price": Decimal("25.50"),
+            "image_url": "listings/bike.png",
+            "location": "Winnipeg",
+            "created_at": created,
+            "is_sold": 1,
+            "comment_count": 4,
+            "offer_count": 3,
+            "pending_offer_count": 1,
+        }
+
+        out = ListingMapper.row_from_mapping(row)
+
+        self.assertIsInstance(out, ListingRow)
+        self.assertEqual(out.id, 10)
+        self.assertEqual(out.seller_id, 7)
+        self.assertEqual(out.title, "Bike")
+        self.assertEqual(out.description, "Nice bike")
+        self.assertEqual(out.price, 25.5)
+        self.assertIsInstance(out.price, float)
+        self.assertEqual(out.image_url, "listings/bike.png")
+        self.assertEqual(out.location, "Winnipeg")
+        self.assertEqual(out.created_at, created)
+        self.assertIs(out.is_sold, True)
+        self.assertEqual((out.comment_count, out.offer_count, out.pending_offer_count), (4, 3, 1))
+
+    def test_row_from_mapping_keeps_nullable_columns_none(self) -> None:
+        row = {
+            "id": 1,
+            "seller_id": 2,
+            "title": "X",
+            "description": "Y",
+            "price": 1.0,
+            "image_url": None,
+            "location": None,
+            "created_at": None,
+            "is_sold": 0,
+            "comment_count": 0,
+            "offer_count": 0,
+            "pending_offer_count": 0,
+        }
+
+        out = ListingMapper.row_from_mapping(row)
+
+        self.assertIsNone(out.image_url)
+        self.assertIsNone(out.location)
+        self.assertIsNone(out.created_at)
+        self.assertIs(out.is_sold, False)
+
+    def test_listing_row_is_frozen_and_slotted(self) -> None:
+        out = ListingMapper.row_from_mapping({
+            "id": 1,
+            "seller_id": 2,
+            "title": "X",
+            "description": "Y",
+            "price": 1.0,
+            "image_url": None,
+            "location": None,
+            "created_at": None,
+            "is_sold": 0,
+            "comment_count": 0,
+            "offer_count": 0,
+            "pending_offer_count": 0,
+        })
+
+        self.assertFalse(hasattr(out, "__dict__"))
+        with self.assertRaises(AttributeError):
+            out.title = "changed"  # type: ignore[misc]
+
+    def test_projection_from_mapping_keeps_only_selected_columns(self) -> None:
+        out = ListingMapper.projection_from_mapping(
+            {"id": 3, "title": "Lamp", "price": Decimal("9.99"), "is_sold": 0}
+        )
+
+        self.assertEqual(out, {"id": 3, "title": "Lamp", "price": 9.99, "is_sold": False})
+        self.assertIsInstance(out["price"], float)
+
+    def test_projection_from_mapping_without_typed_columns_passes_through(self) -> None:
+        self.assertEqual(
+            ListingMapper.projection_from_mapping({"id": 3, "location": None}),
+            {"id": 3, "location": None},
+        )
+
+
+class TestListingProjection(unittest.TestCase):
+    def test_default_projection_selects_every_row_field(self) -> None:
+        projection = ListingProjection()
+
+        self.assertEqual(projection.fields, LISTING_ROW_FIELDS)
+        self.assertIsNone(projection.description_chars)
+
+    def test_of_always_includes_id_and_keeps_row_order(self) -> None:
+        projection = ListingProjection.of(["price", "title", "title"])
+
+        self.assertEqual(projection.fields, ("id", "title", "price"))
+
+    def test_of_rejects_unknown_fields(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            ListingProjection.of(["title", "password", "buyer_id"])
+
+        self.assertEqual(ctx.exception.details["fields"], ["buyer_id", "password"])
+
+    def test_of_rejects_non_positive_description_chars(self) -> None:
+        with self.assertRaises(ValidationError):
+            ListingProjection.of(None, description_chars=0)
+
+    def test_summary_truncates_description(self) -> None:
+        projection = ListingProjection.summary()
+
+        self.assertEqual(projection.fields, LISTING_ROW_FIELDS)
+        self.assertEqual(projection.description_chars, ListingProjection.SUMMARY_DESCRIPTION_CHARS)
+
+    def test_key_is_stable_and_comma_free(self) -> None:
+        self.assertEqual(ListingProjection.of(["title"]).key, "id+title")
+        self.assertEqual(
+            ListingProjection.summary(["description"]).key,
+            f"id+description~{ListingProjection.SUMMARY_DESCRIPTION_CHARS}",
+        )
+        self.assertNotIn(",", ListingProjection.summary().key)
+
+
+if __name__ == "__main__":
+    unittest.main()
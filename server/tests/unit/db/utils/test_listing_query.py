@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import base64
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from src.db import ListingCursor, ListingQuery, ListingRow
+from src.utils import ValidationError
+
+
+class TestListingQuery(unittest.TestCase):
+    def test_defaults_filter_nothing(self) -> None:
+        query = ListingQuery.of()
+
+        self.assertEqual(query, ListingQuery())
+        self.assertEqual((query.sort, query.limit), ("newest", ListingQuery.DEFAULT_LIMIT))
+
+    def test_of_normalizes_location_keyword_and_prices(self) -> None:
+        query = ListingQuery.of(location=" Winnipeg,  MB ", keyword="  road   bike ", min_price=5, max_price=19.999)
+
+        self.assertEqual(query.location_key, "winnipeg mb")
+        self.assertEqual(query.keyword, "road bike")
+        self.assertEqual((query.min_price, query.max_price), (Decimal("5.00"), Decimal("20.00")))
+
+    def test_of_reports_every_invalid_value(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            ListingQuery.of(
+                sort="cheapest", limit=0, min_price=-1, location="!!", seller_id=0, keyword="  ",
+            )
+
+        self.assertEqual(
+            sorted(ctx.exception.details),
+            ["keyword", "limit", "location", "min_price", "seller_id", "sort"],
+        )
+
+    def test_of_rejects_inverted_price_range_and_large_limit(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            ListingQuery.of(min_price=50, max_price=10, limit=ListingQuery.MAX_LIMIT + 1)
+
+        self.assertEqual(sorted(ctx.exception.details), ["limit", "max_price"])
+
+    def test_of_decodes_cursor_for_the_sort(self) -> None:
+        token = ListingCursor(sort="price_desc", value=Decimal("12.50"), id=4).encode()
+
+        query = ListingQuery.of(sort="price_desc", cursor=token)
+
+        self.assertEqual(query.after, ListingCursor(sort="price_desc", value=Decimal("12.50"), id=4))
+
+    def test_key_is_stable_and_differs_per_query(self) -> None:
+        first = ListingQuery.of(location="Winnipeg", max_price=50)
+
+        self.assertEqual(first.key, ListingQuery.of(location="winnipeg", max_price=50.0).key)
+        self.assertNotEqual(first.key, ListingQuery.of(location="Winnipeg", max_price=51).key)
+        self.assertNotEqual(first.key, ListingQuery.of(location="Winnipeg", max_price=50, limit=5).key)
+        self.assertRegex(first.key, r"^[0-9a-f]{16}$")
+
+
+class TestListingCursor(unittest.TestCase):
+    def _row(self) -> ListingRow:
+        return ListingRow(
+            id=9, seller_id=1, title="Bike", description="d", price=19.9,
+            image_url=None, location=None, created_at=datetime(2026, 3, 4, 5, 6, 7), is_sold=False,
+        )
+
+    def test_after_uses_the_sort_column(self) -> None:
+        row = self._row()
+
+        self.assertEqual(ListingCursor.after(row, "newest").value, datetime(2026, 3, 4, 5, 6, 7))
+        self.assertEqual(ListingCursor.after(row, "price_asc").value, Decimal("19.90"))
+
+    def test_encode_decode_round_trip_is_url_safe(self) -> None:
+        for sort in ("newest", "price_asc", "price_desc"):
+            cursor = ListingCursor.after(self._row(), sort)
+
+            token = cursor.encode()
+
+            self.assertRegex(token, r"^[A-Za-z0-9_-]+$")
+            self.assertEqual(ListingCursor.decode(token, sort), cursor)
+
+    def test_decode_rejects_other_sort_and_garbage(self) -> None:
+        token = ListingCursor.after(self._row(), "newest").encode()
+        forged = base64.urlsafe_b64encode(b'["newest", "yesterday", 1]').decode()
+
+        for bad, sort in ((token, "price_asc"), ("%%%", "newest"), ("bm9wZQ", "newest"), (forged, "newest")):
+            with self.assertRaises(ValidationError):
+                ListingCursor.decode(bad, sort)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import OperationalError
+
+from src.api.retry_budget import RetryBudgetMiddleware
+from src.db.account.mysql import MySQLAccountDB
+from src.db.comment.mysql import MySQLCommentDB
+from src.db.email_verification_token.mysql import MySQLEmailVerificationTokenDB
+from src.db.job.mysql import MySQLJobDB
+from src.db.listing.mysql import MySQLListingDB
+from src.db.offer.mysql import MySQLOfferDB
+from src.db.rating.mysql import MySQLRatingDB
+from src.db.revoked_token.mysql import MySQLRevokedTokenDB
+from src.db.utils.transaction_retry import (
+    TransactionRetrier,
+    is_retryable_conflict,
+    mysql_error_code,
+    transactional,
+)
+from src.utils import DatabaseConflictError
+
+
+def _conflict() -> DatabaseConflictError:
+    return DatabaseConflictError("Transaction was rolled back by a lock conflict.")
+
+
+def _operational_error(code: int) -> OperationalError:
+    return OperationalError("UPDATE ...", {}, Exception(code, "message"))
+
+
+class _Repo:
+    def __init__(self, outcomes) -> None:
+        self.calls = 0
+        self._outcomes = list(outcomes)
+
+    def _next(self):
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    @transactional(retry_safe=True)
+    def safe_write(self):
+        return self._next()
+
+    @transactional(retry_safe=False)
+    def unsafe_write(self):
+        return self._next()
+
+
+class TestTransactionRetry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sleep = MagicMock(name="sleep")
+        self.retrier = TransactionRetrier(
+            max_attempts=3,
+            base_delay_seconds=0.02,
+            max_delay_seconds=0.05,
+            request_retries=2,
+            sleep=self.sleep,
+            rng=lambda low, high: high,
+        )
+        TransactionRetrier._instance = self.retrier
+
+    def tearDown(self) -> None:
+        TransactionRetrier.reset()
+
+    def test_mysql_error_code_and_retryable_classification(self) -> None:
+        self.assertEqual(mysql_error_code(_operational_error(1213)), 1213)
+        self.assertTrue(is_retryable_conflict(_operational_error(1213)))
+        self.assertTrue(is_retryable_conflict(_operational_error(1205)))
+        self.assertFalse(is_retryable_conflict(_operational_error(2003)))
+        self.assertIsNone(mysql_error_code(OperationalError("x", {}, Exception("no code"))))
+
+    def test_retry_safe_write_is_rerun_after_conflict(self) -> None:
+        repo = _Repo([_conflict(), _conflict(), "ok"])
+
+        self.assertEqual(repo.safe_write(), "ok")
+
+        self.assertEqual(repo.calls, 3)
+        stats = self.retrier.stats()
+        self.assertEqual(stats["conflicts"], 2)
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["recovered"], 1)
+        self.assertEqual(stats["retries_by_op"], {"_Repo.safe_write": 2})
+
+    def test_backoff_is_exponential_and_capped(self) -> None:
+        repo = _Repo([_conflict(), _conflict(), "ok"])
+
+        repo.safe_write()
+
+        delays = [c.args[0] for c in self.sleep.call_args_list]
+        self.assertEqual(delays, [0.02, 0.04])
+
+        self.sleep.reset_mock()
+        retrier = TransactionRetrier(max_attempts=5, base_delay_seconds=0.02, max_delay_seconds=0.05,
+                                     sleep=self.sleep, rng=lambda low, high: high)
+        holder = _Repo([_conflict()] * 4 + ["ok"])
+        retrier.run(holder._next, "op")
+        self.assertEqual([c.args[0] for c in self.sleep.call_args_list], [0.02, 0.04, 0.05, 0.05])
+
+    def test_jitter_draws_from_zero_to_the_cap(self) -> None:
+        rng = MagicMock(return_value=0.001)
+        retrier = TransactionRetrier(sleep=self.sleep, rng=rng)
+        holder = _Repo([_conflict(), "ok"])
+
+        retrier.run(holder._next, "op")
+
+        rng.assert_called_once_with(0.0, 0.02)
+        self.sleep.assert_called_once_with(0.001)
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        repo = _Repo([_conflict()] * 3)
+
+        with self.assertRaises(DatabaseConflictError) as ctx:
+            repo.safe_write()
+
+        self.assertEqual(repo.calls, 3)
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(ctx.exception.retry_after_seconds, 1)
+        self.assertEqual(self.retrier.stats()["attempts_exhausted"], 1)
+
+    def test_not_retry_safe_raises_first_conflict(self) -> None:
+        repo = _Repo([_conflict(), "ok"])
+
+        with self.assertRaises(DatabaseConflictError):
+            repo.unsafe_write()
+
+        self.assertEqual(repo.calls, 1)
+        self.assertFalse(_Repo.unsafe_write.__retry_safe__)
+        self.assertTrue(_Repo.safe_write.__retry_safe__)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        repo = _Repo([RuntimeError("boom"), "ok"])
+
+        with self.assertRaises(RuntimeError):
+            repo.safe_write()
+
+        self.assertEqual(repo.calls, 1)
+
+    def test_request_budget_is_shared_across_transactions(self) -> None:
+        first = _Repo([_conflict(), "ok"])
+        second = _Repo([_conflict(), _conflict(), "ok"])
+
+        with self.retrier.request_budget() as budget:
+            first.safe_write()
+            with self.assertRaises(DatabaseConflictError):
+                second.safe_write()
+
+        self.assertEqual(budget.remaining, 0)
+        self.assertEqual(second.calls, 2)
+        self.assertEqual(self.retrier.stats()["budget_exhausted"], 1)
+
+        # outside a request only max_attempts applies
+        self.assertEqual(_Repo([_conflict(), _conflict(), "ok"]).safe_write(), "ok")
+
+    def test_rejects_invalid_configuration(self) -> None:
+        with self.assertRaises(ValueError):
+            TransactionRetrier(max_attempts=0)
+
+    def test_instance_reads_environment(self) -> None:
+        TransactionRetrier.reset()
+        env = {"DB_RETRY_MAX_ATTEMPTS": "1", "DB_RETRY_REQUEST_BUDGET": "0"}
+        with patch.dict(os.environ, env):
+            retrier = TransactionRetrier.instance()
+
+        self.assertIs(retrier, TransactionRetrier.instance())
+        with self.assertRaises(DatabaseConflictError):
+            retrier.run(_Repo([_conflict(), "ok"])._next, "op")
+
+    def test_middleware_gives_each_request_a_budget(self) -> None:
+        seen = []
+
+        async def app(scope, receive, send):
+            holder = _Repo([_conflict(), _conflict(), _conflict(), "ok"])
+            try:
+                holder.safe_write()
+            except DatabaseConflictError:
+                pass
+            seen.append(holder.calls)
+
+        middleware = RetryBudgetMiddleware(app, retrier=self.retrier)
+        self.retrier._max_attempts = 10
+
+        for _ in range(2):
+            asyncio.run(middleware({"type": "http"}, None, None))
+        asyncio.run(middleware({"type": "lifespan"}, None, None))
+
+        # budget of 2 retries per request: 3 calls each; lifespan is unbudgeted
+        self.assertEqual(seen, [3, 3, 4])
+
+    def test_every_mysql_write_declares_retry_safety(self) -> None:
+        undeclared = []
+        for cls in (MySQLAccountDB, MySQLCommentDB, MySQLEmailVerificationTokenDB, MySQLListingDB,
+                    MySQLOfferDB, MySQLRatingDB, MySQLRevokedTokenDB, MySQLJobDB):
+            for name, fn in vars(cls).items():
+                if callable(fn) and "transaction()" in inspect.getsource(inspect.unwrap(fn)):
+                    if not hasattr(fn, "__retry_safe__"):
+                        undeclared.append(f"{cls.__name__}.{name}")
+
+        self.assertEqual(undeclared, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
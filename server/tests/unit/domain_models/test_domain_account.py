@@ -216,3 +216,27 @@ class TestAccount(unittest.TestCase):
                 lname="Last",
                 sum_of_ratings_received=-1,
             )
+
+    # ==============================
+    # slots + lazy listings
+    # ==============================
+
+    def test_account_is_slotted(self):
+        account = Account("user@example.com", "hash", "F", "L")
+
+        self.assertFalse(hasattr(account, "__dict__"))
+        with self.assertRaises(AttributeError):
+            account.unknown_field = 1
+
+    def test_listings_list_is_allocated_on_first_add(self):
+        account = Account("user@example.com", "hash", "F", "L", account_id=10)
+
+        self.assertIsNone(account._listings)
+        self.assertEqual(account.listings, [])
+        self.assertIn("listings_count=0", repr(account))
+        with self.assertRaises(ValidationError):
+            account.remove_listing(1)
+
+        account.add_listing(Listing(10, "Title", "Desc", 9.99, listing_id=101))
+
+        self.assertEqual([l.id for l in account.listings], [101])
@@ -60,3 +60,10 @@ class TestComment(unittest.TestCase):
         comment.mark_persisted(9)
         with self.assertRaises(UnapprovedBehaviorError):
             comment.mark_persisted(10)
+
+    def test_comment_is_slotted(self):
+        comment = Comment(listing_id=1, author_id=2)
+
+        self.assertFalse(hasattr(comment, "__dict__"))
+        with self.assertRaises(AttributeError):
+            comment.unknown_field = 1
@@ -320,3 +320,69 @@ class TestListing(unittest.TestCase):
     def test_repr_includes_offers(self):
         listing = Listing(1, "t", "d", 1.0, listing_id=10)
         self.assertIn("offers=", repr(listing))
+
+    # ==============================
+    # slots + lazy relation collections
+    # ==============================
+
+    def test_listing_is_slotted(self):
+        listing = Listing(1, "Title", "Desc", 10.0)
+
+        self.assertFalse(hasattr(listing, "__dict__"))
+        with self.assertRaises(AttributeError):
+            listing.unknown_field = 1
+
+    def test_relation_lists_are_not_allocated_until_first_add(self):
+        listing = Listing(1, "Title", "Desc", 10.0, listing_id=5, comments=None)
+
+        self.assertIsNone(listing._comments)
+        self.assertIsNone(listing._offers)
+        self.assertEqual(listing.comments, [])
+        self.assertEqual(listing.offers, [])
+        self.assertIsNone(listing._comments)
+
+        listing.add_comment(Comment(listing_id=5, author_id=2, body="hi"))
+        listing.add_offer(Offer(listing_id=5, sender_id=2, offered_price=5.0))
+
+        self.assertEqual(len(listing.comments), 1)
+        self.assertEqual(len(listing.offers), 1)
+
+    def test_add_comments_allocates_list_lazily(self):
+        listing = Listing(1, "Title", "Desc", 10.0, listing_id=5)
+
+        listing.add_comments([Comment(listing_id=5, author_id=2, body="a")])
+
+        self.assertEqual(len(listing.comments), 1)
+
+    def test_setting_relations_to_none_releases_lists(self):
+        listing = Listing(
+            1,
+            "Title",
+            "Desc",
+            10.0,
+            listing_id=5,
+            comments=[Comment(listing_id=5, author_id=2, body="a")],
+            offers=[Offer(listing_id=5, sender_id=2, offered_price=5.0)],
+        )
+
+        listing.comments = None
+        listing.offers = None
+
+        self.assertIsNone(listing._comments)
+        self.assertIsNone(listing._offers)
+        self.assertEqual(listing.comments, [])
+        self.assertEqual(listing.offers, [])
+        self.assertIn("comments=[], offers=[]", repr(listing))
+
+    def test_location_key_is_canonical_form_of_location(self):
+        listing = Listing(1, "Title", "Desc", 10.0, location=" Winnipeg,  MB ")
+
+        self.assertEqual(listing.location_key, "winnipeg mb")
+        listing.location = None
+        self.assertIsNone(listing.location_key)
+
+    def test_location_key_of_strips_punctuation_wildcards_and_caps_length(self):
+        self.assertEqual(Listing.location_key_of("St. John's (NL)"), "st john s nl")
+        self.assertEqual(Listing.location_key_of("100%_north"), "100 north")
+        self.assertIsNone(Listing.location_key_of(" -- "))
+        self.assertEqual(len(Listing.location_key_of("a" * 300)), 120)
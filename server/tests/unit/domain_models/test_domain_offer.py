@@ -281,3 +281,10 @@ class TestOffer(unittest.TestCase):
         self.assertIn("Offer(id=None", out)
         self.assertIn("location_offered=None", out)
         self.assertIn("accepted=None", out)
+
+    def test_offer_is_slotted(self):
+        offer = Offer(listing_id=1, sender_id=2, offered_price=50.0)
+
+        self.assertFalse(hasattr(offer, "__dict__"))
+        with self.assertRaises(AttributeError):
+            offer.unknown_field = 1
@@ -143,3 +143,10 @@ class TestRating(unittest.TestCase):
         self.assertIn("rater_id=22", out)
         self.assertIn("transaction_rating=4", out)
         self.assertIn("created_at='2026-03-12'", out)
+
+    def test_rating_is_slotted(self):
+        rating = Rating(listing_id=1, rater_id=2, transaction_rating=4)
+
+        self.assertFalse(hasattr(rating, "__dict__"))
+        with self.assertRaises(AttributeError):
+            rating.unknown_field = 1
@@ -0,0 +1,3 @@
+from .test_job_queue import TestJobQueue
+from .test_email_token_sweeper import TestEmailTokenSweeper
+from .test_listing_counter_reconciler import TestListingCounterReconciler
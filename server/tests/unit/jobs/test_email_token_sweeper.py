@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.jobs import EmailTokenSweeper
+from src.utils import DatabaseQueryError
+
+
+class TestEmailTokenSweeper(unittest.TestCase):
+    """Unit tests for the chunked purge of expired and used verification tokens."""
+
+    def setUp(self) -> None:
+        self.token_db = MagicMock(name="token_db")
+        self.now = datetime(2026, 10, 19, 12, 0, 0)
+        self.sleeps = []
+
+    def _sweeper(self, **kwargs) -> EmailTokenSweeper:
+        options = dict(chunk_size=2, pause_seconds=0.25, grace_seconds=600,
+                       now=lambda: self.now, sleep=self.sleeps.append)
+        options.update(kwargs)
+        return EmailTokenSweeper(self.token_db, **options)
+
+    def test_walks_the_table_by_id_and_pauses_between_chunks(self) -> None:
+        self.token_db.purge_chunk.side_effect = [(2, 5), (1, 9), (0, None)]
+
+        report = self._sweeper().run()
+
+        cutoff = self.now - timedelta(seconds=600)
+        self.assertEqual(
+            [c.args for c in self.token_db.purge_chunk.call_args_list],
+            [(cutoff, 0, 2), (cutoff, 5, 2), (cutoff, 9, 2)],
+        )
+        self.assertEqual(self.sleeps, [0.25, 0.25])
+        self.assertEqual(report["purged"], 3)
+        self.assertEqual(report["chunks"], 2)
+        self.assertEqual(report["cutoff"], "2026-10-19T11:50:00")
+        self.assertTrue(report["complete"])
+
+    def test_empty_table_is_one_query(self) -> None:
+        self.token_db.purge_chunk.return_value = (0, None)
+
+        report = self._sweeper().run({})
+
+        self.assertEqual((report["purged"], report["chunks"]), (0, 0))
+        self.assertEqual(self.sleeps, [])
+
+    def test_stops_after_max_chunks(self) -> None:
+        self.token_db.purge_chunk.side_effect = [(2, 2), (2, 4), (2, 6)]
+
+        report = self._sweeper(max_chunks=2).run()
+
+        self.assertEqual(self.token_db.purge_chunk.call_count, 2)
+        self.assertEqual(report["purged"], 4)
+        self.assertFalse(report["complete"])
+
+    def test_chunk_failure_propagates_so_the_job_records_it(self) -> None:
+        self.token_db.purge_chunk.side_effect = [(2, 5), DatabaseQueryError(message="boom")]
+
+        with self.assertRaises(DatabaseQueryError):
+            self._sweeper().run()
+
+    def test_from_environment(self) -> None:
+        env = {"EMAIL_TOKEN_PURGE_CHUNK_SIZE": "50", "EMAIL_TOKEN_PURGE_PAUSE_SECONDS": "0",
+               "EMAIL_TOKEN_PURGE_GRACE_SECONDS": ""}
+        with patch.dict(os.environ, env):
+            sweeper = EmailTokenSweeper.from_environment(self.token_db)
+
+        self.assertEqual((sweeper._chunk_size, sweeper._pause, sweeper._grace), (50, 0.0, 3600.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
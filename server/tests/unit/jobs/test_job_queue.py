@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unittest
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from src.db.job import Job, JobDB, NewJob
+from src.jobs import JobQueue
+from src.utils import ConfigurationError, DatabaseUnavailableError
+
+
+class _FakeJobDB(JobDB):
+    """In-memory job table: pending rows are claimable at once, in insertion order; unique keys dedupe."""
+
+    def __init__(self) -> None:
+        super().__init__(MagicMock(name="db"))
+        self.lock = threading.Lock()
+        self.rows: Dict[int, dict] = {}
+        self.inserts: List[int] = []
+        self.claims: List[int] = []
+        self.fail_writes = False
+
+    def add_many(self, jobs):
+        if self.fail_writes:
+            raise DatabaseUnavailableError(message="down")
+        with self.lock:
+            self.inserts.append(len(jobs))
+            for job in jobs:
+                if job.unique_key is not None and any(
+                    row["job"].unique_key == job.unique_key for row in self.rows.values()
+                ):
+                    continue
+                job_id = len(self.rows) + 1
+                self.rows[job_id] = {"job": job, "status": "pending", "attempts": 0, "retry_in": None}
+
+    def claim(self, queue, worker_id, limit, lease_seconds):
+        with self.lock:
+            self.claims.append(limit)
+            claimed = []
+            for job_id, row in self.rows.items():
+                if len(claimed) == limit:
+                    break
+                if row["job"].queue == queue and row["status"] == "pending":
+                    row["status"] = "running"
+                    row["attempts"] += 1
+                    job = row["job"]
+                    claimed.append(Job(job_id, queue, job.kind, job.payload, row["attempts"], job.max_attempts))
+            return claimed
+
+    def complete(self, job_id, attempts):
+        with self.lock:
+            self.rows[job_id]["status"] = "done"
+            return True
+
+    def fail(self, job_id, attempts, error, retry_in_seconds):
+        with self.lock:
+            row = self.rows[job_id]
+            row["status"] = "failed" if retry_in_seconds is None else "pending"
+            row["retry_in"] = retry_in_seconds
+            row["error"] = error
+            return True
+
+    def purge_finished(self, older_than_seconds, limit=1000):
+        return 0
+
+    def count_by_status(self):
+        return {"email": {"pending": 1}}
+
+    def statuses(self) -> List[str]:
+        with self.lock:
+            return [row["status"] for row in self.rows.values()]
+
+
+class TestJobQueue(unittest.TestCase):
+    """Unit tests for the job queue (enqueue, dispatchers, retries, schedules)."""
+
+    def setUp(self) -> None:
+        self.db = _FakeJobDB()
+
+    def _queue(self, **kwargs) -> JobQueue:
+        options = dict(
+            poll_interval_seconds=0.02,
+            retry_base_seconds=0.0,
+            worker_id="test:1",
+        )
+        options.update(kwargs)
+        queue = JobQueue(self.db, **options)
+        self.addCleanup(queue.stop, 2.0)
+        return queue
+
+    def _wait_for(self, predicate, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                self.fail("condition not reached")
+            time.sleep(0.005)
+
+    def test_enqueue_writes_the_row_before_returning(self) -> None:
+        queue = self._queue()
+        queue.register("send", lambda payload: None, queue="email")
+
+        queue.enqueue("send", {"to": 1})
+        queue.enqueue("send", {"to": 2}, delay_seconds=5)
+
+        self.assertEqual(self.db.inserts, [1, 1])
+        jobs = [row["job"] for row in self.db.rows.values()]
+        self.assertEqual(jobs[0], NewJob(queue="email", kind="send", payload={"to": 1}))
+        self.assertEqual(jobs[1].delay_seconds, 5)
+        self.assertEqual(queue.stats()["enqueued"], 2)
+
+    def test_enqueue_unknown_kind_raises(self) -> None:
+        with self.assertRaises(ConfigurationError):
+            self._queue().enqueue("nope", {})
+
+    def test_enqueue_raises_when_the_row_cannot_be_written(self) -> None:
+        queue = self._queue()
+        queue.register("send", lambda payload: None)
+        self.db.fail_writes = True
+
+        with self.assertRaises(DatabaseUnavailableError):
+            queue.enqueue("send", {})
+
+        self.assertEqual(self.db.rows, {})
+        self.assertEqual((queue.stats()["enqueued"], queue.stats()["enqueue_failures"]), (0, 1))
+
+    def test_started_queue_runs_enqueued_jobs(self) -> None:
+        seen = []
+        queue = self._queue()
+        queue.register("send", lambda payload: seen.append(payload["to"]), queue="email")
+        queue.start()
+
+        for i in range(5):
+            queue.enqueue("send", {"to": i})
+
+        self._wait_for(lambda: self.db.statuses() == ["done"] * 5)
+        self.assertEqual(sorted(seen), [0, 1, 2, 3, 4])
+        stats = queue.stats()["queues"]["email"]
+        self.assertEqual((stats["claimed"], stats["succeeded"], stats["running"]), (5, 5, 0))
+
+    def test_concurrency_limit_per_queue(self) -> None:
+        release = threading.Event()
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def handler(payload):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            release.wait(2)
+            with lock:
+                active[0] -= 1
+
+        queue = self._queue(concurrency={"media": 2})
+        queue.register("resize", handler, queue="media")
+        queue.start()
+        for _ in range(6):
+            queue.enqueue("resize", {})
+
+        self._wait_for(lambda: queue.stats()["queues"]["media"]["running"] == 2)
+        time.sleep(0.05)
+        self.assertEqual(peak[0], 2)
+        self.assertTrue(all(limit <= 2 for limit in self.db.claims))
+        release.set()
+        self._wait_for(lambda: self.db.statuses() == ["done"] * 6)
+        self.assertEqual(peak[0], 2)
+
+    def test_failing_job_is_retried_then_marked_failed(self) -> None:
+        calls = []
+
+        def handler(payload):
+            calls.append(payload)
+            raise RuntimeError("smtp down")
+
+        queue = self._queue()
+        queue.register("send", handler, queue="email", max_attempts=3)
+        with self.assertLogs("src.jobs.job_queue", "WARNING") as logs:
+            queue.start()
+            queue.enqueue("send", {})
+            self._wait_for(lambda: self.db.statuses() == ["failed"])
+
+        self.assertIn("attempt 3/3 failed", logs.output[-1])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(self.db.rows[1]["error"], "RuntimeError: smtp down")
+        stats = queue.stats()["queues"]["email"]
+        self.assertEqual((stats["retried"], stats["failed"]), (2, 1))
+
+    def test_retry_delay_backs_off_exponentially(self) -> None:
+        queue = JobQueue(self.db, retry_base_seconds=2, retry_max_seconds=10)
+
+        self.assertEqual([queue._retry_delay(n) for n in (1, 2, 3, 4)], [2, 4, 8, 10])
+
+    def test_stop_waits_for_running_jobs(self) -> None:
+        finished = threading.Event()
+
+        def handler(payload):
+            time.sleep(0.05)
+            finished.set()
+
+        queue = self._queue(poll_interval_seconds=5.0)
+        queue.register("send", handler)
+        queue.start()
+        queue.enqueue("send", {})
+        self._wait_for(lambda: queue.stats()["queues"]["default"]["running"] == 1)
+        queue.enqueue("send", {"late": True})
+
+        queue.stop(timeout=2.0)
+
+        self.assertTrue(finished.is_set())
+        self.assertFalse(queue.started)
+        self.assertEqual(self.db.statuses(), ["done", "pending"])
+
+    def test_start_without_workers_only_writes_jobs(self) -> None:
+        queue = self._queue()
+        queue.register("send", lambda payload: None)
+        queue.start(run_workers=False)
+
+        queue.enqueue("send", {})
+
+        self._wait_for(lambda: self.db.statuses() == ["pending"])
+        time.sleep(0.05)
+        self.assertEqual(self.db.claims, [])
+
+    def test_backlog_reports_none_when_mysql_is_down(self) -> None:
+        queue = self._queue()
+        self.assertEqual(queue.backlog(), {"email": {"pending": 1}})
+
+        with patch.object(self.db, "count_by_status", side_effect=DatabaseUnavailableError(message="down")):
+            self.assertIsNone(queue.backlog())
+
+    def test_from_environment_reads_per_queue_concurrency(self) -> None:
+        with patch.dict(os.environ, {"JOB_CONCURRENCY": "email=3, media=1", "JOB_DEFAULT_CONCURRENCY": "4"}):
+            queue = JobQueue.from_environment(self.db)
+        for name in ("email", "media", "other"):
+            queue.register(name, lambda payload: None, queue=name)
+
+        self.assertEqual(
+            {name: q["concurrency"] for name, q in queue.stats()["queues"].items()},
+            {"email": 3, "media": 1, "other": 4},
+        )
+
+        for bad in ("email", "email=0", "=2"):
+            with patch.dict(os.environ, {"JOB_CONCURRENCY": bad}):
+                with self.assertRaises(ConfigurationError):
+                    JobQueue.from_environment(self.db)
+
+    def test_scheduled_job_is_enqueued_once_per_slot(self) -> None:
+        now = [110.0]
+        queue = self._queue(wall_clock=lambda: now[0])
+        queue.register("sweep", lambda payload: None, queue="maintenance")
+        queue.schedule("sweep", 60, {"full": True})
+
+        queue._enqueue_due()  # slot 1 (60..120)
+        queue._enqueue_due()
+        now[0] = 170.0  # slot 2
+        queue._enqueue_due()
+
+        self.assertEqual(self.db.inserts, [1, 1])
+        jobs = [row["job"] for row in self.db.rows.values()]
+        self.assertEqual([job.payload for job in jobs], [{"full": True}] * 2)
+        self.assertEqual([job.unique_key for job in jobs], ["sweep@1", "sweep@2"])
+
+        with self.assertRaises(ConfigurationError):
+            queue.schedule("unknown", 60)
+
+    def test_processes_sharing_the_job_table_enqueue_each_slot_once(self) -> None:
+        now = [110.0]
+        queues = [self._queue(wall_clock=lambda: now[0], worker_id=f"test:{i}") for i in range(3)]
+        for queue in queues:
+            queue.register("sweep", lambda payload: None, queue="maintenance")
+            queue.schedule("sweep", 60)
+
+        for _ in range(2):
+            for queue in queues:
+                queue._enqueue_due()
+            now[0] += 60
+
+        self.assertEqual([row["job"].unique_key for row in self.db.rows.values()], ["sweep@1", "sweep@2"])
+
+    def test_scheduled_job_survives_mysql_being_down(self) -> None:
+        now = [100.0]
+        queue = self._queue(wall_clock=lambda: now[0])
+        queue.register("sweep", lambda payload: None, queue="maintenance")
+        queue.schedule("sweep", 60)
+        self.db.fail_writes = True
+
+        with self.assertLogs("src.jobs.job_queue", "WARNING"):
+            queue._enqueue_due()
+        self.db.fail_writes = False
+        now[0] = 160.0
+        queue._enqueue_due()
+
+        self.assertEqual(self.db.inserts, [1])
+
+    def test_enqueue_with_a_taken_unique_key_adds_nothing(self) -> None:
+        queue = self._queue()
+        queue.register("send", lambda payload: None)
+
+        queue.enqueue("send", {"n": 1}, unique_key="k")
+        queue.enqueue("send", {"n": 2}, unique_key="k")
+
+        self.assertEqual([row["job"].payload for row in self.db.rows.values()], [{"n": 1}])
+
+    def test_stats_keep_the_last_result_of_each_kind(self) -> None:
+        queue = self._queue()
+        queue.register("sweep", lambda payload: {"purged": payload["n"]}, queue="maintenance")
+        queue.start()
+
+        queue.enqueue("sweep", {"n": 3})
+
+        self._wait_for(lambda: self.db.statuses() == ["done"])
+        self.assertEqual(queue.stats()["last_results"], {"sweep": {"purged": 3}})
+
+
+if __name__ == "__main__":
+    unittest.main()
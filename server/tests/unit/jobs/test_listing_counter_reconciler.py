@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.jobs import ListingCounterReconciler
+from src.utils import DatabaseQueryError
+
+
+class TestListingCounterReconciler(unittest.TestCase):
+    """Unit tests for the chunked repair of listing activity counters."""
+
+    def setUp(self) -> None:
+        self.listing_db = MagicMock(name="listing_db")
+        self.versions = MagicMock(name="change_versions")
+        self.sleeps = []
+
+    def _reconciler(self, **kwargs) -> ListingCounterReconciler:
+        options = dict(chunk_size=2, pause_seconds=0.25, change_versions=self.versions,
+                       sleep=self.sleeps.append)
+        options.update(kwargs)
+        return ListingCounterReconciler(self.listing_db, **options)
+
+    def test_walks_the_table_by_id_and_pauses_between_chunks(self) -> None:
+        self.listing_db.reconcile_activity_counts.side_effect = [(1, 4), (0, 7), (0, None)]
+
+        report = self._reconciler().run()
+
+        self.assertEqual(
+            [c.args for c in self.listing_db.reconcile_activity_counts.call_args_list],
+            [(0, 2), (4, 2), (7, 2)],
+        )
+        self.assertEqual(self.sleeps, [0.25, 0.25])
+        self.assertEqual((report["fixed"], report["chunks"]), (1, 2))
+        self.assertTrue(report["complete"])
+        self.versions.bump_listings.assert_called_once_with(None)
+
+    def test_consistent_counters_leave_versions_alone(self) -> None:
+        self.listing_db.reconcile_activity_counts.side_effect = [(0, 2), (0, None)]
+
+        report = self._reconciler().run({})
+
+        self.assertEqual(report["fixed"], 0)
+        self.versions.bump_listings.assert_not_called()
+
+    def test_stops_after_max_chunks(self) -> None:
+        self.listing_db.reconcile_activity_counts.side_effect = [(0, 2), (0, 4), (0, 6)]
+
+        report = self._reconciler(max_chunks=2).run()
+
+        self.assertEqual(self.listing_db.reconcile_activity_counts.call_count, 2)
+        self.assertFalse(report["complete"])
+
+    def test_chunk_failure_propagates_after_bumping_for_repaired_chunks(self) -> None:
+        self.listing_db.reconcile_activity_counts.side_effect = [(3, 2), DatabaseQueryError(message="boom")]
+
+        with self.assertRaises(DatabaseQueryError):
+            self._reconciler().run()
+
+        self.versions.bump_listings.assert_called_once_with(None)
+
+    def test_from_environment(self) -> None:
+        env = {"LISTING_COUNTER_RECONCILE_CHUNK_SIZE": "100", "LISTING_COUNTER_RECONCILE_PAUSE_SECONDS": ""}
+        with patch.dict(os.environ, env):
+            reconciler = ListingCounterReconciler.from_environment(self.listing_db, self.versions)
+
+        self.assertEqual((reconciler._chunk_size, reconciler._pause), (100, 0.05))
+        self.assertIs(reconciler._versions, self.versions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,10 +8,16 @@ from unittest.mock import MagicMock, patch
 from minio.error import S3Error
 
 from src.minio.media_storage_utility import MediaStorageUtility
-from src.utils import StorageUnavailableError
+from src.utils import CircuitBreaker, CircuitBreakerRegistry, StorageUnavailableError
 
 
 class TestMediaStorageUtility(unittest.TestCase):
+    def setUp(self) -> None:
+        CircuitBreakerRegistry.reset()
+
+    def tearDown(self) -> None:
+        CircuitBreakerRegistry.reset()
+
     def make_s3_error(self, code: str) -> S3Error:
         return S3Error(
             code=code,
@@ -416,6 +422,67 @@ class TestMediaStorageUtility(unittest.TestCase):
         with self.assertRaises(StorageUnavailableError):
             storage.public_url("images/a.png")
 
+    def _storage_with_breaker(self, mock_minio, client):
+        mock_minio.return_value = client
+        return MediaStorageUtility(
+            endpoint="localhost:9000",
+            access_key="a",
+            secret_key="b",
+            ensure_bucket_on_startup=False,
+            circuit_breaker=CircuitBreaker(
+                "minio",
+                lambda: StorageUnavailableError("open", details={"circuit": "open"}),
+                failure_threshold=2,
+                probe_interval_seconds=60,
+            ),
+        )
+
+    @patch("src.minio.media_storage_utility.Minio")
+    def test_unreachable_minio_opens_circuit_and_fails_fast(self, mock_minio):
+        client = MagicMock()
+        client.put_object.side_effect = ConnectionError("refused")
+        storage = self._storage_with_breaker(mock_minio, client)
+
+        for _ in range(2):
+            with self.assertRaises(StorageUnavailableError):
+                storage.upload_bytes("k", b"data")
+
+        with self.assertRaises(StorageUnavailableError):
+            storage.object_exists("k")
+        client.stat_object.assert_not_called()
+        self.assertEqual(client.put_object.call_count, 2)
+
+    @patch("src.minio.media_storage_utility.Minio")
+    def test_s3_errors_do_not_count_as_outage(self, mock_minio):
+        client = MagicMock()
+        client.stat_object.side_effect = self.make_s3_error("NoSuchKey")
+        storage = self._storage_with_breaker(mock_minio, client)
+
+        for _ in range(3):
+            self.assertFalse(storage.object_exists("missing"))
+
+        self.assertEqual(client.stat_object.call_count, 3)
+
+    @patch("src.minio.media_storage_utility.Minio")
+    def test_list_keys_goes_through_the_breaker(self, mock_minio):
+        client = MagicMock()
+        client.list_objects.side_effect = ConnectionError("refused")
+        storage = self._storage_with_breaker(mock_minio, client)
+
+        for _ in range(3):
+            with self.assertRaises(StorageUnavailableError):
+                storage.list_keys()
+
+        self.assertEqual(client.list_objects.call_count, 2)
+
+    @patch("src.minio.media_storage_utility.Minio")
+    def test_default_breaker_is_shared_across_instances(self, mock_minio):
+        mock_minio.return_value = MagicMock()
+        first = MediaStorageUtility(endpoint="e", access_key="a", secret_key="b", ensure_bucket_on_startup=False)
+        second = MediaStorageUtility(endpoint="e", access_key="a", secret_key="b", ensure_bucket_on_startup=False)
+
+        self.assertIs(first._breaker, second._breaker)
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
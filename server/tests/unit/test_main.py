@@ -1,29 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from fastapi import FastAPI
 
+from src.utils import ConfigurationError, StorageUnavailableError
+
 
 class TestMainUnit(unittest.TestCase):
     def tearDown(self) -> None:
         sys.modules.pop("src.main", None)
 
+    def _import_main(self):
+        with patch("pathlib.Path.mkdir", autospec=True):
+            sys.modules.pop("src.main", None)
+            return importlib.import_module("src.main")
+
     def test_main_create_app_smoke_for_coverage(self) -> None:
-        test_env = {
-            "DB_HOST": "test-host",
-            "DB_PORT": "3306",
-            "DB_NAME": "test-db",
-            "DB_USER": "test-user",
-            "DB_PASSWORD": "test-pass",
-        }
-        with patch.dict(os.environ, test_env, clear=False), patch(
-            "src.main.DBUtility.initialize"
-        ) as init_mock, patch("pathlib.Path.mkdir", autospec=True) as mkdir_mock:
+        with patch("src.db.DBUtility.initialize") as init_mock, patch(
+            "pathlib.Path.mkdir", autospec=True
+        ) as mkdir_mock:
             sys.modules.pop("src.main", None)
             mod = importlib.import_module("src.main")
 
@@ -31,14 +32,8 @@ class TestMainUnit(unittest.TestCase):
             self.assertIsInstance(app, FastAPI)
             self.assertEqual(app.title, "MarketSafe API")
 
-            init_mock.assert_called_once_with(
-                host="test-host",
-                port=3306,
-                database="test-db",
-                username="test-user",
-                password="test-pass",
-                driver="mysql+pymysql",
-            )
+            # the database is connected by the lifespan, not at import
+            init_mock.assert_not_called()
 
             self.assertTrue(mkdir_mock.called)
 
@@ -46,6 +41,19 @@ class TestMainUnit(unittest.TestCase):
             self.assertTrue(any(p.startswith("/accounts") for p in paths))
             self.assertTrue(any(p.startswith("/listings") for p in paths))
             self.assertTrue(any(p.startswith("/offers") for p in paths))
+            self.assertIn("/metrics/cache", paths)
+            self.assertIn("/metrics/admission", paths)
+            self.assertIn("/health/live", paths)
+            self.assertIn("/health/ready", paths)
+
+            from src.api.admission import AdmissionMiddleware
+            from src.api.retry_budget import RetryBudgetMiddleware
+            from fastapi.middleware.cors import CORSMiddleware
+
+            # CORS wraps admission control, so shed responses get CORS headers
+            middleware = [m.cls for m in app.user_middleware]
+            self.assertLess(middleware.index(CORSMiddleware), middleware.index(AdmissionMiddleware))
+            self.assertIn(RetryBudgetMiddleware, middleware)
             self.assertIn("/uploads", paths)
 
             from fastapi.exceptions import RequestValidationError
@@ -56,6 +64,105 @@ class TestMainUnit(unittest.TestCase):
             self.assertIn(AppError, app.exception_handlers)
             self.assertIn(RequestValidationError, app.exception_handlers)
 
+    def _run_lifespan(self, mod, env, db, media_storage_for=None) -> None:
+        async def run() -> None:
+            async with mod.lifespan(mod.app):
+                db.dispose.assert_not_called()
+
+        with patch.dict(os.environ, env, clear=False), patch(
+            "src.main.DBUtility.initialize"
+        ) as init_mock, patch("src.main.DBUtility.instance", return_value=db), patch(
+            "src.main.media_storage_for", media_storage_for or MagicMock()
+        ), patch("src.main.ServiceContainer.from_environment") as build_services, patch(
+            "src.main.PasswordHasher.reset"
+        ) as reset_hasher:
+            asyncio.run(run())
+        self.build_services = build_services
+        self.init_mock = init_mock
+        self.reset_hasher = reset_hasher
+
+    def test_lifespan_startup_initializes_and_prewarms_pool_and_media_client(self) -> None:
+        mod = self._import_main()
+        db = MagicMock(name="db", pool_size=4)
+        db.prewarm.return_value = 4
+        media_storage_for = MagicMock(name="media_storage_for")
+        env = {
+            "DB_HOST": "test-host",
+            "DB_PORT": "3306",
+            "DB_NAME": "test-db",
+            "DB_USER": "test-user",
+            "DB_PASSWORD": "test-pass",
+            "DB_POOL_SIZE": "4",
+            "DB_MAX_OVERFLOW": "8",
+            "STARTUP_WARMUP": "true",
+        }
+
+        self._run_lifespan(mod, env, db, media_storage_for)
+
+        self.init_mock.assert_called_once_with(
+            host="test-host",
+            port=3306,
+            database="test-db",
+            username="test-user",
+            password="test-pass",
+            pool_size=4,
+            max_overflow=8,
+            driver="mysql+pymysql",
+        )
+        db.prewarm.assert_called_once_with()
+        media_storage_for.assert_called_once_with(mod.app)
+        self.assertIs(mod.app.state.services, self.build_services.return_value)
+        self.assertGreaterEqual(mod.app.state.startup_seconds, 0)
+
+    def test_lifespan_shutdown_disposes_pool_and_password_workers(self) -> None:
+        mod = self._import_main()
+        db = MagicMock(name="db")
+
+        self._run_lifespan(mod, {"STARTUP_WARMUP": "false"}, db)
+
+        db.prewarm.assert_not_called()
+        db.dispose.assert_called_once_with()
+        self.reset_hasher.assert_called_once_with()
+
+    def test_lifespan_startup_tolerates_unavailable_media_storage(self) -> None:
+        mod = self._import_main()
+        db = MagicMock(name="db", pool_size=5)
+        db.prewarm.return_value = 5
+        media_storage_for = MagicMock(side_effect=StorageUnavailableError("down"))
+
+        self._run_lifespan(mod, {"STARTUP_WARMUP": "true"}, db, media_storage_for)
+
+        db.dispose.assert_called_once_with()
+
+    def test_lifespan_shutdown_tolerates_uninitialized_db(self) -> None:
+        mod = self._import_main()
+
+        async def run_lifespan() -> None:
+            async with mod.lifespan(mod.app):
+                pass
+
+        with patch.dict(os.environ, {"STARTUP_WARMUP": "false"}), patch(
+            "src.main.DBUtility.initialize"
+        ), patch("src.main.DBUtility.instance", side_effect=ConfigurationError("x")), patch(
+            "src.main.ServiceContainer.from_environment"
+        ):
+            asyncio.run(run_lifespan())
+
+    def test_lifespan_runs_job_workers_between_startup_and_shutdown(self) -> None:
+        mod = self._import_main()
+        db = MagicMock(name="db")
+
+        self._run_lifespan(mod, {"STARTUP_WARMUP": "false", "JOB_SHUTDOWN_TIMEOUT_SECONDS": "3"}, db)
+
+        jobs = self.build_services.return_value.job_queue
+        jobs.start.assert_called_once_with(run_workers=True)
+        jobs.stop.assert_called_once_with(3.0)
+        self.build_services.return_value.event_hub.close.assert_called_once_with()
+
+        self._run_lifespan(mod, {"STARTUP_WARMUP": "false", "JOB_WORKERS_ENABLED": "false"}, MagicMock())
+
+        self.build_services.return_value.job_queue.start.assert_called_once_with(run_workers=False)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
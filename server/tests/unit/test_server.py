@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.server import WorkerPlan, main, plan_workers, worker_environment
+from src.utils import ConfigurationError
+
+
+class TestServerEntrypoint(unittest.TestCase):
+    """Unit tests for the multi-process production entrypoint."""
+
+    def test_plan_defaults_to_one_worker_per_usable_cpu(self) -> None:
+        with patch("src.server.usable_cpus", return_value=4):
+            plan = plan_workers(None, 60)
+
+        self.assertEqual(plan, WorkerPlan(workers=4, pool_size=5, max_overflow=10))
+        self.assertEqual(plan.connections, 60)
+
+    def test_plan_never_exceeds_the_connection_budget(self) -> None:
+        for workers in range(1, 20):
+            plan = plan_workers(workers, 50)
+            self.assertLessEqual(plan.connections, 50)
+            self.assertGreaterEqual(plan.pool_size, 1)
+
+    def test_plan_rejects_budget_too_small_for_workers(self) -> None:
+        with self.assertRaises(ConfigurationError) as ctx:
+            plan_workers(8, 10)
+
+        self.assertEqual(ctx.exception.details["variable"], "DB_MAX_CONNECTIONS")
+
+        with self.assertRaises(ConfigurationError):
+            plan_workers(-1, 10)
+
+    def test_single_worker_keeps_process_local_state(self) -> None:
+        env = worker_environment(WorkerPlan(1, 20, 40), {})
+
+        self.assertEqual(env, {"DB_POOL_SIZE": "20", "DB_MAX_OVERFLOW": "40"})
+
+    def test_several_workers_avoid_per_process_caches(self) -> None:
+        plan = WorkerPlan(4, 5, 10)
+
+        self.assertEqual(worker_environment(plan, {})["REPO_CACHE_BACKEND"], "off")
+        self.assertEqual(worker_environment(plan, {})["PASSWORD_HASH_WORKERS"], "1")
+        shared = worker_environment(plan, {"REPO_CACHE_URL": "redis://cache:6379/0"})
+        self.assertEqual(shared["REPO_CACHE_BACKEND"], "shared")
+
+        explicit = worker_environment(plan, {"REPO_CACHE_BACKEND": "memory", "PASSWORD_HASH_WORKERS": "2"})
+        self.assertNotIn("REPO_CACHE_BACKEND", explicit)
+        self.assertNotIn("PASSWORD_HASH_WORKERS", explicit)
+
+    def test_main_runs_workers_with_graceful_shutdown_and_shared_versions(self) -> None:
+        uvicorn = MagicMock(name="uvicorn")
+        seen = {}
+
+        def run(*args, **kwargs):
+            path = os.environ["CHANGE_VERSIONS_PATH"]
+            seen["versions_file_existed"] = os.path.exists(path)
+            seen["path"] = path
+            seen["pool"] = (os.environ["DB_POOL_SIZE"], os.environ["DB_MAX_OVERFLOW"])
+
+        uvicorn.run.side_effect = run
+        with patch.dict(sys.modules, {"uvicorn": uvicorn}), patch.dict(os.environ, {}, clear=True):
+            main(["--workers", "3", "--db-max-connections", "30", "--graceful-shutdown-seconds", "7"])
+
+        uvicorn.run.assert_called_once_with(
+            "src.main:app", host="0.0.0.0", port=8000, workers=3, timeout_graceful_shutdown=7
+        )
+        self.assertTrue(seen["versions_file_existed"])
+        self.assertFalse(os.path.exists(seen["path"]))
+        self.assertEqual(seen["pool"], ("3", "7"))
+
+    def test_main_reads_worker_count_from_environment(self) -> None:
+        uvicorn = MagicMock(name="uvicorn")
+        env = {"WEB_CONCURRENCY": "1", "DB_MAX_CONNECTIONS": ""}
+        with patch.dict(sys.modules, {"uvicorn": uvicorn}), patch.dict(os.environ, env, clear=True):
+            main([])
+            self.assertNotIn("CHANGE_VERSIONS_PATH", os.environ)
+            self.assertEqual(os.environ["DB_POOL_SIZE"], "20")
+
+        self.assertEqual(uvicorn.run.call_args.kwargs["workers"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,2 +1,5 @@
 from .test_validation import TestValidation
 from .test_token_generator import TestTokenGenerator
+from .test_change_versions import TestChangeVersions
+from .test_circuit_breaker import TestCircuitBreaker
+from .test_event_hub import TestEventHub
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils import ChangeVersions
+
+
+class TestChangeVersions(unittest.TestCase):
+    """Unit tests for the ChangeVersions registry."""
+
+    def setUp(self) -> None:
+        self.versions = ChangeVersions()
+
+    def tearDown(self) -> None:
+        ChangeVersions.reset()
+
+    def test_bump_listings_changes_global_and_seller_scope_only(self) -> None:
+        before_all = self.versions.listings()
+        before_seller = self.versions.seller_listings(1)
+        before_other = self.versions.seller_listings(2)
+
+        self.versions.bump_listings(1)
+
+        self.assertNotEqual(self.versions.listings(), before_all)
+        self.assertNotEqual(self.versions.seller_listings(1), before_seller)
+        self.assertEqual(self.versions.seller_listings(2), before_other)
+
+    def test_bump_listings_without_seller_changes_global_only(self) -> None:
+        before_seller = self.versions.seller_listings(1)
+        before_all = self.versions.listings()
+
+        self.versions.bump_listings(None)
+
+        self.assertNotEqual(self.versions.listings(), before_all)
+        self.assertEqual(self.versions.seller_listings(1), before_seller)
+
+    def test_bump_offers_changes_each_account_once_and_ignores_none(self) -> None:
+        self.versions.bump_offers([3, 3, None, 4])
+
+        self.assertTrue(self.versions.account_offers(3).endswith(".1"))
+        self.assertTrue(self.versions.account_offers(4).endswith(".1"))
+        self.assertTrue(self.versions.account_offers(5).endswith(".0"))
+
+    def test_offer_bumps_do_not_touch_listing_versions(self) -> None:
+        before = self.versions.listings()
+
+        self.versions.bump_offers([1])
+
+        self.assertEqual(self.versions.listings(), before)
+
+    def test_new_registry_never_reuses_tokens_of_previous_one(self) -> None:
+        self.assertNotEqual(ChangeVersions().listings(), self.versions.listings())
+
+    def test_instance_is_shared_until_reset(self) -> None:
+        first = ChangeVersions.instance()
+
+        self.assertIs(ChangeVersions.instance(), first)
+
+        ChangeVersions.reset()
+        self.assertIsNot(ChangeVersions.instance(), first)
+
+
+    def test_shared_counters_are_seen_by_every_process(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "versions")
+            ChangeVersions.create_shared_file(path)
+            worker_a = ChangeVersions(path)
+            worker_b = ChangeVersions(path)
+            before = worker_b.seller_listings(7)
+
+            worker_a.bump_listings(7)
+            worker_a.bump_offers([3, 3])
+
+            self.assertEqual(worker_a.listings(), worker_b.listings())
+            self.assertNotEqual(worker_b.seller_listings(7), before)
+            self.assertTrue(worker_b.account_offers(3).endswith(".1"))
+
+    def test_new_shared_file_never_reuses_tokens_of_previous_one(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "versions")
+            ChangeVersions.create_shared_file(path)
+            before = ChangeVersions(path).listings()
+
+            ChangeVersions.create_shared_file(path)
+
+            self.assertNotEqual(ChangeVersions(path).listings(), before)
+
+    def test_instance_uses_shared_file_from_environment(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "versions")
+            ChangeVersions.create_shared_file(path)
+            ChangeVersions(path).bump_listings(None)
+
+            ChangeVersions.reset()
+            with patch.dict(os.environ, {"CHANGE_VERSIONS_PATH": path}):
+                self.assertTrue(ChangeVersions.instance().listings().endswith(".1"))
@@ -0,0 +1,126 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from src.utils import CircuitBreaker, CircuitBreakerRegistry, DatabaseUnavailableError
+from src.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _open_error() -> DatabaseUnavailableError:
+    return DatabaseUnavailableError("Database is unavailable.", details={"circuit": "open"})
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Unit tests for CircuitBreaker state transitions and the registry."""
+
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.breaker = CircuitBreaker(
+            "mysql", _open_error, failure_threshold=3, probe_interval_seconds=10, clock=self.clock
+        )
+
+    def tearDown(self) -> None:
+        CircuitBreakerRegistry.reset()
+
+    def _trip(self) -> None:
+        for _ in range(3):
+            self.breaker.allow()
+            self.breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_success_resets_the_failure_count(self) -> None:
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.stats()["consecutive_failures"], 1)
+
+    def test_open_circuit_fails_fast_with_the_dependency_error(self) -> None:
+        self._trip()
+
+        with self.assertRaises(DatabaseUnavailableError) as ctx:
+            self.breaker.allow()
+
+        self.assertEqual(ctx.exception.details, {"circuit": "open"})
+        self.assertEqual(self.breaker.stats()["rejected_calls"], 1)
+
+    def test_half_open_allows_one_probe_then_closes_on_success(self) -> None:
+        self._trip()
+        self.clock.now += 10
+
+        self.breaker.allow()  # the probe
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        with self.assertRaises(DatabaseUnavailableError):
+            self.breaker.allow()
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.allow()
+
+    def test_failed_probe_reopens_for_another_interval(self) -> None:
+        self._trip()
+        self.clock.now += 10
+        self.breaker.allow()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.clock.now += 9
+        with self.assertRaises(DatabaseUnavailableError):
+            self.breaker.allow()
+        self.clock.now += 1
+        self.breaker.allow()
+        self.assertEqual(self.breaker.stats()["times_opened"], 2)
+
+    def test_probe_that_never_reports_is_replaced_after_interval(self) -> None:
+        self._trip()
+        self.clock.now += 10
+        self.breaker.allow()
+
+        self.clock.now += 10
+        self.breaker.allow()
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+
+    def test_rejects_invalid_threshold(self) -> None:
+        with self.assertRaises(ValueError):
+            CircuitBreaker("x", _open_error, failure_threshold=0)
+
+    def test_registry_shares_one_breaker_per_name(self) -> None:
+        registry = CircuitBreakerRegistry.instance()
+
+        first = registry.breaker("minio", _open_error)
+
+        self.assertIs(first, CircuitBreakerRegistry.instance().breaker("minio", _open_error))
+        self.assertIsNot(first, registry.breaker("mysql", _open_error))
+        self.assertEqual(set(registry.stats()), {"minio", "mysql"})
+        self.assertEqual(registry.stats()["minio"]["state"], CLOSED)
+
+    def test_registry_reads_environment(self) -> None:
+        env = {"CIRCUIT_FAILURE_THRESHOLD": "2", "CIRCUIT_PROBE_INTERVAL_SECONDS": "0.5"}
+        with patch.dict(os.environ, env):
+            breaker = CircuitBreakerRegistry.instance().breaker("mysql", _open_error)
+
+        self.assertEqual(breaker.stats()["failure_threshold"], 2)
+        self.assertEqual(breaker.stats()["probe_interval_seconds"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
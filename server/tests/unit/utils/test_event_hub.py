@@ -0,0 +1,215 @@
+import asyncio
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from src.utils import (
+    ConfigurationError,
+    Event,
+    EventHub,
+    LocalEventBackend,
+    RateLimitedError,
+    RedisEventBackend,
+    ServiceOverloadedError,
+)
+
+
+class TestEventHub(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for EventHub, Subscription and the fan-out backends."""
+
+    def setUp(self) -> None:
+        self.backend = MagicMock()
+        self.hub = EventHub(backend=self.backend, max_subscribers=3, max_per_account=2, queue_size=2)
+
+    def tearDown(self) -> None:
+        EventHub.reset()
+
+    async def _drain(self) -> None:
+        # call_soon_threadsafe callbacks run on the next loop iteration
+        await asyncio.sleep(0)
+
+    async def test_publish_reaches_only_subscribers_of_given_accounts(self) -> None:
+        mine = self.hub.subscribe(1)
+        other = self.hub.subscribe(2)
+
+        self.hub.publish([1, None], "offer.created", {"offer_id": 7})
+        await self._drain()
+
+        self.assertEqual(await mine.next(0.1), Event("offer.created", {"offer_id": 7}))
+        self.assertIsNone(await other.next(0.01))
+
+    async def test_publish_from_another_thread_is_delivered_on_the_loop(self) -> None:
+        subscription = self.hub.subscribe(1)
+
+        thread = threading.Thread(target=self.hub.publish, args=([1], "offer.seen", {"offer_id": 1}))
+        thread.start()
+        thread.join()
+
+        event = await subscription.next(1.0)
+        self.assertEqual(event.type, "offer.seen")
+
+    async def test_publish_hands_event_to_backend_once_per_account_set(self) -> None:
+        self.hub.publish([4, 3, 4], "offer.seen", {"offer_id": 1})
+
+        accounts, event = self.backend.publish.call_args.args
+        self.assertEqual(sorted(accounts), [3, 4])
+        self.assertEqual(event, Event("offer.seen", {"offer_id": 1}))
+
+    async def test_publish_without_accounts_is_a_no_op(self) -> None:
+        self.hub.publish([None], "offer.seen", {})
+
+        self.backend.publish.assert_not_called()
+        self.assertEqual(self.hub.stats()["published"], 0)
+
+    async def test_slow_subscriber_overflows_instead_of_blocking(self) -> None:
+        subscription = self.hub.subscribe(1)
+
+        for offer_id in range(5):
+            self.hub.publish([1], "offer.seen", {"offer_id": offer_id})
+        await self._drain()
+
+        self.assertTrue(subscription.take_overflow())
+        self.assertFalse(subscription.take_overflow())
+        self.assertIsNone(await subscription.next(0.01))
+        stats = self.hub.stats()
+        self.assertEqual((stats["delivered"], stats["dropped"], stats["overflows"]), (2, 3, 1))
+
+    async def test_overflowed_subscription_receives_again_after_take_overflow(self) -> None:
+        subscription = self.hub.subscribe(1)
+        for offer_id in range(3):
+            self.hub.publish([1], "offer.seen", {"offer_id": offer_id})
+        await self._drain()
+        subscription.take_overflow()
+
+        self.hub.publish([1], "offer.seen", {"offer_id": 9})
+        await self._drain()
+
+        self.assertEqual((await subscription.next(0.1)).data, {"offer_id": 9})
+
+    async def test_subscribe_rejects_beyond_per_account_limit(self) -> None:
+        self.hub.subscribe(1)
+        self.hub.subscribe(1)
+
+        with self.assertRaises(RateLimitedError) as ctx:
+            self.hub.subscribe(1)
+        self.assertEqual(ctx.exception.retry_after_seconds, 5)
+
+    async def test_subscribe_rejects_beyond_process_limit(self) -> None:
+        for account_id in (1, 2, 3):
+            self.hub.subscribe(account_id)
+
+        with self.assertRaises(ServiceOverloadedError):
+            self.hub.subscribe(4)
+        self.assertEqual(self.hub.stats()["rejected"], 1)
+
+    async def test_close_frees_the_slot_and_is_idempotent(self) -> None:
+        subscription = self.hub.subscribe(1)
+
+        subscription.close()
+        subscription.close()
+
+        self.assertEqual((self.hub.stats()["subscribers"], self.hub.stats()["accounts"]), (0, 0))
+        self.hub.publish([1], "offer.seen", {})
+        await self._drain()
+        self.assertIsNone(await subscription.next(0.01))
+
+    async def test_remote_events_are_delivered_locally(self) -> None:
+        deliver = self.backend.start.call_args.args[0]
+        subscription = self.hub.subscribe(2)
+
+        deliver([2], Event("offer.created", {"offer_id": 3}))
+        await self._drain()
+
+        self.assertEqual((await subscription.next(0.1)).type, "offer.created")
+        self.assertEqual(self.hub.stats()["remote_received"], 1)
+
+    async def test_default_backend_is_local(self) -> None:
+        self.assertEqual(EventHub().stats()["backend"], "local")
+
+    async def test_instance_is_shared_until_reset(self) -> None:
+        first = EventHub.instance()
+
+        self.assertIs(EventHub.instance(), first)
+        EventHub.reset()
+        self.assertIsNot(EventHub.instance(), first)
+
+    async def test_backend_from_env(self) -> None:
+        with patch.dict(os.environ, {"EVENT_BACKEND": "local"}):
+            self.assertIsInstance(EventHub.backend_from_env(), LocalEventBackend)
+        with patch.dict(os.environ, {"EVENT_BACKEND": "carrier-pigeon"}):
+            with self.assertRaises(ConfigurationError):
+                EventHub.backend_from_env()
+        with patch.dict(os.environ, {"EVENT_BACKEND": "redis", "EVENT_URL": "", "REPO_CACHE_URL": ""}):
+            with self.assertRaises(ConfigurationError) as ctx:
+                EventHub.backend_from_env()
+        self.assertEqual(ctx.exception.details, {"variable": "EVENT_URL"})
+
+    # -----------------------------
+    # RedisEventBackend
+    # -----------------------------
+    async def test_redis_backend_publishes_tagged_json(self) -> None:
+        client = MagicMock()
+        backend = RedisEventBackend(client, channel="events")
+
+        backend.publish([1, 2], Event("offer.seen", {"offer_id": 3}))
+
+        channel, message = client.publish.call_args.args
+        decoded = orjson.loads(message)
+        self.assertEqual(channel, "events")
+        self.assertEqual(
+            {k: decoded[k] for k in ("accounts", "type", "data")},
+            {"accounts": [1, 2], "type": "offer.seen", "data": {"offer_id": 3}},
+        )
+
+    async def test_redis_backend_publish_failure_is_logged_not_raised(self) -> None:
+        client = MagicMock()
+        client.publish.side_effect = ConnectionError("down")
+
+        with self.assertLogs("src.utils.event_hub", "WARNING"):
+            RedisEventBackend(client).publish([1], Event("offer.seen", {}))
+
+    async def test_redis_backend_delivers_other_origins_only(self) -> None:
+        client = MagicMock()
+        backend = RedisEventBackend(client)
+        other = RedisEventBackend(client)
+        backend.publish([1], Event("offer.seen", {"offer_id": 1}))
+        own_message = client.publish.call_args.args[1]
+        other.publish([2], Event("offer.created", {"offer_id": 2}))
+        other_message = client.publish.call_args.args[1]
+        deliver = MagicMock()
+
+        backend._receive(own_message, deliver)
+        backend._receive(other_message, deliver)
+
+        deliver.assert_called_once_with([2], Event("offer.created", {"offer_id": 2}))
+
+    async def test_redis_backend_ignores_malformed_messages(self) -> None:
+        deliver = MagicMock()
+
+        with self.assertLogs("src.utils.event_hub", "WARNING"):
+            RedisEventBackend(MagicMock())._receive(b"not json", deliver)
+        deliver.assert_not_called()
+
+    async def test_redis_backend_listener_delivers_and_stops_on_close(self) -> None:
+        client = MagicMock()
+        sender = RedisEventBackend(client)
+        sender.publish([1], Event("offer.seen", {"offer_id": 1}))
+        message = client.publish.call_args.args[1]
+        pubsub = client.pubsub.return_value
+        pubsub.get_message.side_effect = lambda timeout: {"type": "message", "data": message}
+        received = threading.Event()
+        backend = RedisEventBackend(client)
+
+        backend.start(lambda accounts, event: received.set())
+        self.assertTrue(received.wait(1.0))
+        backend.close()
+
+        pubsub.subscribe.assert_called_with("marketsafe:events")
+        pubsub.close.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()